@@ -1,9 +1,19 @@
 from fastapi import APIRouter
 
-from .endpoints import auth, gigs, library, courses, mentorship, portfolio, talents
+from ...core.config import settings
+from .endpoints import auth, gigs, library, courses, mentorship, metrics, portfolio, talents
+from .endpoints import courses_async, gigs_async, talents_async
 
 
 api_router = APIRouter()
+
+if settings.DB_ASYNC:
+    # Async read paths are registered first so they shadow their sync twins;
+    # every other route keeps using the sync stack.
+    api_router.include_router(gigs_async.router, prefix="/gigs", tags=["gigs"])
+    api_router.include_router(courses_async.router, prefix="/courses", tags=["courses"])
+    api_router.include_router(talents_async.router, prefix="/talents", tags=["talents"])
+
 api_router.include_router(auth.router, prefix="/auth", tags=["auth"])
 api_router.include_router(gigs.router, prefix="/gigs", tags=["gigs"])
 api_router.include_router(library.router, prefix="/library", tags=["library"])
@@ -11,3 +21,4 @@ api_router.include_router(courses.router, prefix="/courses", tags=["courses"])
 api_router.include_router(mentorship.router, tags=["mentorship"])  # exposes /mentors
 api_router.include_router(portfolio.router, prefix="/portfolio", tags=["portfolio"])
 api_router.include_router(talents.router, prefix="/talents", tags=["talents"])
+api_router.include_router(metrics.router, prefix="/metrics", tags=["metrics"])
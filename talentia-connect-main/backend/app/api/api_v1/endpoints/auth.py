@@ -1,16 +1,35 @@
+from dataclasses import dataclass
+from typing import Optional
+import uuid
+
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy import Row, select
 from sqlalchemy.orm import Session
-import uuid
+from starlette.concurrency import run_in_threadpool
 
 from ....db.session import SessionLocal
 from ....models.user import User, UserRole
-from ....schemas.user import UserCreate, UserLogin, UserOut, TokenResponse
-from ....core.security import get_password_hash, verify_password, create_access_token, decode_token
+from ....schemas.user import RefreshRequest, UserCreate, UserLogin, UserOut, TokenResponse
+from ....core.security import (
+    create_access_token,
+    decode_token,
+    hash_password_async,
+    verify_and_update_password_async,
+)
+from ....services.token_store import (
+    InvalidRefreshToken,
+    issue_refresh_token,
+    revoke_refresh_token,
+    revoked_sessions,
+    rotate_refresh_token,
+)
+from ....services.user_cache import cache_user, get_cached_user
 
 router = APIRouter()
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
+optional_oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login", auto_error=False)
 
 
 def get_db():
@@ -21,28 +40,21 @@ def get_db():
       db.close()
 
 
-@router.post("/register", response_model=TokenResponse)
-def register_user(payload: UserCreate, db: Session = Depends(get_db)):
-    existing = db.query(User).filter(User.email == payload.email).first()
-    if existing:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Email already registered")
-
-    user = User(
-        id=str(uuid.uuid4()),
-        email=payload.email,
-        password_hash=get_password_hash(payload.password),
-        first_name=payload.firstName,
-        last_name=payload.lastName,
-        role=UserRole[payload.role],
+def _access_token_for(user: User, session_id: Optional[str] = None) -> str:
+    return create_access_token(
+        subject=user.id,
+        role=user.role.value,
+        first_name=user.first_name,
+        last_name=user.last_name,
+        email=user.email,
+        session_id=session_id,
     )
-    db.add(user)
-    db.commit()
-    db.refresh(user)
 
-    access_token = create_access_token(subject=user.id, role=user.role.value)
 
+def _token_response(user: User, refresh_token: str, session_id: str) -> TokenResponse:
     return TokenResponse(
-        accessToken=access_token,
+        accessToken=_access_token_for(user, session_id),
+        refreshToken=refresh_token,
         user=UserOut(
             id=user.id,
             email=user.email,
@@ -53,37 +65,178 @@ def register_user(payload: UserCreate, db: Session = Depends(get_db)):
     )
 
 
-@router.post("/login", response_model=TokenResponse)
-def login_user(payload: UserLogin, db: Session = Depends(get_db)):
-    user = db.query(User).filter(User.email == payload.email).first()
-    if not user or not verify_password(payload.password, user.password_hash):
+def _credentials_for(db: Session, email: str) -> Optional[Row]:
+    """``(id, password_hash)`` for ``email``, releasing the connection before hashing starts."""
+
+    row = db.execute(select(User.id, User.password_hash).where(User.email == email)).first()
+    db.rollback()
+    return row
+
+
+def _start_session(db: Session, user: User) -> TokenResponse:
+    """Commit ``user`` (and any pending change to it) together with a new refresh-token family."""
+
+    refresh_token, record = issue_refresh_token(db, user.id)
+    session_id = record.family_id
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    return _token_response(user, refresh_token, session_id)
+
+
+def _finish_login(db: Session, user_id: str, new_hash: Optional[str]) -> TokenResponse:
+    user = db.get(User, user_id)
+    if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
+    if new_hash is not None:
+        # Stored with outdated hashing parameters; upgrade while we know the password
+        user.password_hash = new_hash
+    return _start_session(db, user)
 
-    access_token = create_access_token(subject=user.id, role=user.role.value)
 
-    return TokenResponse(
-        accessToken=access_token,
-        user=UserOut(
-            id=user.id,
-            email=user.email,
-            firstName=user.first_name,
-            lastName=user.last_name,
-            role=user.role.value,
-        ),
+# register and login are async so that the pbkdf2 work is awaited in the
+# password worker pool. Their short database steps run in the threadpool and
+# give the connection back before hashing, so a login burst can't drain the
+# connection pool either.
+
+
+@router.post("/register", response_model=TokenResponse)
+async def register_user(payload: UserCreate, db: Session = Depends(get_db)):
+    existing = await run_in_threadpool(_credentials_for, db, payload.email)
+    if existing:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Email already registered")
+
+    user = User(
+        id=str(uuid.uuid4()),
+        email=payload.email,
+        password_hash=await hash_password_async(payload.password),
+        first_name=payload.firstName,
+        last_name=payload.lastName,
+        role=UserRole[payload.role],
     )
+    return await run_in_threadpool(_start_session, db, user)
 
 
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> User:
+@router.post("/login", response_model=TokenResponse)
+async def login_user(payload: UserLogin, db: Session = Depends(get_db)):
+    credentials = await run_in_threadpool(_credentials_for, db, payload.email)
+    if not credentials:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
+
+    valid, new_hash = await verify_and_update_password_async(payload.password, credentials.password_hash)
+    if not valid:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
+
+    return await run_in_threadpool(_finish_login, db, credentials.id, new_hash)
+
+
+@router.post("/refresh", response_model=TokenResponse)
+def refresh_session(payload: RefreshRequest, db: Session = Depends(get_db)):
+    """Trade a refresh token for a new access token and a new refresh token.
+
+    Each refresh token works once. Reusing one that was already exchanged
+    revokes the whole session.
+    """
+
+    try:
+        refresh_token, record = rotate_refresh_token(db, payload.refreshToken)
+    except InvalidRefreshToken:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token")
+    session_id = record.family_id
+    user = _load_user(db, record.user_id)
+    return _token_response(user, refresh_token, session_id)
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+def logout(payload: RefreshRequest, db: Session = Depends(get_db)):
+    """End the session ``refreshToken`` belongs to, including its outstanding access tokens."""
+
+    revoke_refresh_token(db, payload.refreshToken)
+
+
+@dataclass(frozen=True)
+class Principal:
+    """The caller as described by the signed claims of their access token."""
+
+    id: str
+    role: UserRole
+    first_name: str
+    last_name: str
+    email: Optional[str] = None
+
+
+def _token_claims(token: str) -> dict:
     try:
         payload = decode_token(token)
-        user_id: str = payload.get("sub")
     except Exception:  # noqa: BLE001
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
+    if not payload.get("sub"):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
+    # Logged out (or stolen-token detection) before this access token expired
+    if payload.get("sid") and payload["sid"] in revoked_sessions:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Session revoked")
+    return payload
+
 
-    user = db.query(User).filter(User.id == user_id).first()
+def _load_user(db: Session, user_id: str) -> User:
+    cached = get_cached_user(user_id)
+    if cached is not None:
+        # Attach a copy to this request's session without hitting the database
+        return db.merge(cached, load=False)
+
+    user = db.get(User, user_id)
     if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
-    return user
+    db.expunge(user)
+    cache_user(user)
+    return db.merge(user, load=False)
+
+
+def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> User:
+    """Load the full ``User`` row for endpoints that need more than the token claims."""
+
+    return _load_user(db, _token_claims(token)["sub"])
+
+
+def principal_from_token(db: Session, token: str) -> Principal:
+    """Authenticate from the token alone; no database round trip.
+
+    Role and name changes take effect when the user next receives a token.
+    Tokens issued before identity claims were added fall back to loading the
+    user.
+    """
+
+    payload = _token_claims(token)
+    try:
+        role = UserRole(payload.get("role"))
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
+
+    if "given_name" in payload and "family_name" in payload:
+        return Principal(
+            id=payload["sub"],
+            role=role,
+            first_name=payload["given_name"],
+            last_name=payload["family_name"],
+            email=payload.get("email"),
+        )
+
+    user = _load_user(db, payload["sub"])
+    return Principal(id=user.id, role=user.role, first_name=user.first_name, last_name=user.last_name, email=user.email)
+
+
+def get_current_principal(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> Principal:
+    return principal_from_token(db, token)
+
+
+def get_optional_principal(
+    token: Optional[str] = Depends(optional_oauth2_scheme), db: Session = Depends(get_db)
+) -> Optional[Principal]:
+    """The caller on endpoints that also serve anonymous visitors; a bad token is still a 401."""
+
+    if token is None:
+        return None
+    return principal_from_token(db, token)
 
 
 @router.get("/me", response_model=UserOut)
@@ -1,11 +1,13 @@
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy import Select, select
+from sqlalchemy.orm import Session, selectinload
 
 from ....db.session import SessionLocal
-from ....models.course import Course, CourseModule, Lesson
-from ....schemas.course import CourseSummaryOut, CourseDetailOut, CourseModuleOut, LessonOut
+from ....models.course import Course, CourseModule
+from ....schemas.course import CourseSummaryOut, CourseDetailOut
+from ....services.catalog_cache import get_course_detail, set_course_detail
 
 
 router = APIRouter()
@@ -19,42 +21,37 @@ def get_db():
         db.close()
 
 
+def courses_statement() -> Select:
+    return select(Course).order_by(Course.created_at.desc())
+
+
+def course_detail_statement(course_id: str) -> Select:
+    # Load the whole course tree in three fixed queries (course, modules, lessons)
+    return (
+        select(Course)
+        .options(selectinload(Course.modules).selectinload(CourseModule.lessons))
+        .where(Course.id == course_id)
+    )
+
+
+def render_course_detail(course: Optional[Course]) -> Response:
+    if not course:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Course not found")
+
+    body = CourseDetailOut.model_validate(course).model_dump_json().encode("utf-8")
+    set_course_detail(course.id, body)
+    return Response(content=body, media_type="application/json")
+
+
 @router.get("/", response_model=List[CourseSummaryOut])
 def list_courses(db: Session = Depends(get_db)):
-    return db.query(Course).order_by(Course.created_at.desc()).all()
+    return db.scalars(courses_statement()).all()
 
 
 @router.get("/{course_id}", response_model=CourseDetailOut)
 def get_course(course_id: str, db: Session = Depends(get_db)):
-    course = db.query(Course).filter(Course.id == course_id).first()
-    if not course:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Course not found")
-
-    # Eagerly load modules and lessons for the response
-    modules = (
-        db.query(CourseModule)
-        .filter(CourseModule.course_id == course.id)
-        .order_by(CourseModule.order)
-        .all()
-    )
+    cached = get_course_detail(course_id)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
 
-    module_outputs: list[CourseModuleOut] = []
-    for module in modules:
-        lessons = (
-            db.query(Lesson)
-            .filter(Lesson.module_id == module.id)
-            .order_by(Lesson.id)
-            .all()
-        )
-        module_outputs.append(
-            CourseModuleOut(
-                id=module.id,
-                title=module.title,
-                order=module.order,
-                lessons=[LessonOut.model_validate(lesson) for lesson in lessons],
-            )
-        )
-
-    detail = CourseDetailOut.model_validate(course)
-    detail.modules = module_outputs
-    return detail
+    return render_course_detail(db.scalars(course_detail_statement(course_id)).first())
@@ -0,0 +1,32 @@
+"""Async twins of the course catalog endpoints, mounted when ``DB_ASYNC`` is enabled."""
+
+from typing import List
+
+from fastapi import APIRouter, Depends, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ....db.session import AsyncSessionLocal
+from ....schemas.course import CourseSummaryOut, CourseDetailOut
+from ....services.catalog_cache import get_course_detail
+from .courses import course_detail_statement, courses_statement, render_course_detail
+
+router = APIRouter()
+
+
+async def get_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+@router.get("/", response_model=List[CourseSummaryOut])
+async def list_courses(db: AsyncSession = Depends(get_db)):
+    return (await db.scalars(courses_statement())).all()
+
+
+@router.get("/{course_id}", response_model=CourseDetailOut)
+async def get_course(course_id: str, db: AsyncSession = Depends(get_db)):
+    cached = get_course_detail(course_id)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    return render_course_detail((await db.scalars(course_detail_statement(course_id))).first())
@@ -1,29 +1,71 @@
-from typing import List
+from datetime import timedelta
+from typing import List, Optional, Sequence, Set, Tuple
+import asyncio
+import json
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, WebSocket, WebSocketDisconnect, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import Row, Select, and_, func, or_, select, tuple_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, aliased, selectinload
+
+from ....core.broadcast import broadcast
+from ....core.pagination import (
+    BEFORE_CURSOR_HEADER,
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    NEXT_CURSOR_HEADER,
+    SINCE_CURSOR_HEADER,
+    anchor_from_cursor,
+    encode_cursor,
+    offset_from_cursor,
+)
 from ....db.session import SessionLocal
-from ....models.marketplace import Gig, GigApplication, Conversation, Message, Contract, Payment, Payout
+from ....models.marketplace import (
+    Gig,
+    GigApplication,
+    Conversation,
+    ConversationRead,
+    Message,
+    Contract,
+    Payment,
+    Payout,
+)
 from ....models.portfolio import RatingReview
 from ....models.user import User, UserRole
 from ....schemas.gig import (
+    CandidateOut,
+    CandidateScoreOut,
     GigOut,
     GigCreate,
     GigApplicationCreate,
     GigApplicationOut,
     ConversationOut,
+    ConversationReadCreate,
+    ConversationSummaryOut,
     MessageCreate,
     MessageOut,
     ContractCreate,
     ContractOut,
     ReleaseContractRequest,
 )
-from .auth import get_current_user
+from ....services import candidate_ranking, gig_recommendations
+from ....services.chat_events import conversation_channel, message_event
+from ....services.gig_search import CORRECTED_QUERY_HEADER, search_statement, search_terms, vocabulary
+from ....services.talent_stats import record_contract_release
+from .auth import Principal, get_current_principal, principal_from_token
 
 router = APIRouter()
 
+COMPANY_LOGO_PLACEHOLDER = "https://images.unsplash.com/photo-1560179707-f14e90ef3623?w=100&h=100&fit=crop"
+
+# A message is stamped when it is flushed but only becomes visible when its
+# transaction commits, so a client may sync past a message that commits late
+# with an earlier stamp. Syncs therefore re-send the messages stamped this
+# long before the cursor; clients de-duplicate by id.
+SYNC_OVERLAP = timedelta(seconds=10)
+
 
 def get_db():
     db = SessionLocal()
@@ -33,140 +75,78 @@ def get_db():
         db.close()
 
 
-def _ensure_seed_company_and_gigs(db: Session) -> None:
-    """Seed a demo company and a set of creative gigs (singing, dancing, painting...).
+def _format_budget(gig: Gig) -> Optional[str]:
+    """Derive a budget label from min/max (XAF currency)."""
+
+    if gig.budget_min is not None and gig.budget_max is not None:
+        return f"XAF {gig.budget_min:,.0f} - XAF {gig.budget_max:,.0f}"
+    if gig.budget_min is not None:
+        return f"From XAF {gig.budget_min:,.0f}"
+    if gig.budget_max is not None:
+        return f"Up to XAF {gig.budget_max:,.0f}"
+    return None
+
+
+def _applicant_count():
+    """Correlated per-gig application count, evaluated only for the returned rows.
 
-    This only runs when there are no gigs yet, so it is safe to call from the
-    listing endpoint without duplicating data.
+    Backed by the index on ``gig_applications.gig_id`` so listing a page never
+    loads GigApplication rows.
     """
 
-    has_gigs = db.query(Gig).first()
-    if has_gigs:
-        return
+    return (
+        select(func.count(GigApplication.id))
+        .where(GigApplication.gig_id == Gig.id)
+        .correlate(Gig)
+        .scalar_subquery()
+        .label("applicant_count")
+    )
 
-    # Create a lightweight demo company account to own the seeded gigs.
-    seed_email = "creative-hub@talentia.local"
-    company = db.query(User).filter(User.email == seed_email).first()
-    if not company:
-        company = User(
-            id=str(uuid.uuid4()),
-            email=seed_email,
-            password_hash="SEED_USER_NO_LOGIN",
-            first_name="Creative",
-            last_name="Hub",
-            role=UserRole.COMPANY,
-        )
-        db.add(company)
-        db.flush()  # ensure company.id is available
 
-    gigs = [
-        Gig(
-            id=str(uuid.uuid4()),
-            company_id=company.id,
-            title="Afrobeats Singer for Campus Concert",
-            description="Faith-based youth concert needs a powerful lead singer to perform 3–4 Afrobeats worship songs.",
-            role="Lead Singer",
-            budget_min=50000,
-            budget_max=80000,
-            location="Douala, Cameroon (on-site)",
-            type="Gig",
-            category="Singing",
-        ),
-        Gig(
-            id=str(uuid.uuid4()),
-            company_id=company.id,
-            title="Gospel Choir for Youth Convention",
-            description="University gospel convention looking for a student choir to lead praise & worship sessions.",
-            role="Choir",
-            budget_min=80000,
-            budget_max=120000,
-            location="Yaounde, Cameroon (on-site)",
-            type="Contract",
-            category="Singing",
-        ),
-        Gig(
-            id=str(uuid.uuid4()),
-            company_id=company.id,
-            title="Afro Dance Crew for Cultural Night",
-            description="University cultural night needs an energetic Afro dance crew for a 20–30 minute performance.",
-            role="Dance Crew",
-            budget_min=60000,
-            budget_max=90000,
-            location="Buea, Cameroon (on-site)",
-            type="Gig",
-            category="Dance",
-        ),
-        Gig(
-            id=str(uuid.uuid4()),
-            company_id=company.id,
-            title="Contemporary Dance Performance for Conference Opening",
-            description="Faith and creativity conference opening act – looking for a contemporary dance duo.",
-            role="Dancer",
-            budget_min=70000,
-            budget_max=110000,
-            location="Online rehearsal + Yaounde performance",
-            type="Project",
-            category="Dance",
-        ),
-        Gig(
-            id=str(uuid.uuid4()),
-            company_id=company.id,
-            title="Live Painter for Youth Conference Stage",
-            description="Create a prophetic art piece live on stage during worship sessions.",
-            role="Painter",
-            budget_min=40000,
-            budget_max=70000,
-            location="Douala, Cameroon (on-site)",
-            type="Gig",
-            category="Painting",
-        ),
-        Gig(
-            id=str(uuid.uuid4()),
-            company_id=company.id,
-            title="Mural Artist for Campus Prayer Room",
-            description="Design and paint a mural that reflects hope, unity and excellence in the campus prayer room.",
-            role="Visual Artist",
-            budget_min=90000,
-            budget_max=150000,
-            location="Bamenda, Cameroon (on-site)",
-            type="Project",
-            category="Painting",
-        ),
-        Gig(
-            id=str(uuid.uuid4()),
-            company_id=company.id,
-            title="Spoken Word & Music Set for Youth Sunday",
-            description="Blend spoken word and soft acoustic music for a 10–15 minute youth service piece.",
-            role="Spoken Word Artist",
-            budget_min=30000,
-            budget_max=60000,
-            location="Hybrid (online prep, on-site performance)",
-            type="Gig",
-            category="Music",
-        ),
-        Gig(
-            id=str(uuid.uuid4()),
-            company_id=company.id,
-            title="Cultural Troupe for Inter-university Festival",
-            description="Showcase traditional Cameroonian dance and drumming at an inter-university cultural festival.",
-            role="Cultural Performer",
-            budget_min=100000,
-            budget_max=180000,
-            location="Limbe, Cameroon (on-site)",
-            type="Gig",
-            category="Cultural Performance",
-        ),
-    ]
+def _gig_out(gig: Gig, company_name: str, applicants: int) -> GigOut:
+    return GigOut(
+        id=gig.id,
+        title=gig.title,
+        company=company_name,
+        companyLogo=COMPANY_LOGO_PLACEHOLDER,
+        location=gig.location,
+        type=gig.type,
+        budget=_format_budget(gig),
+        deadline=gig.deadline,
+        posted=gig.created_at.isoformat() if gig.created_at else "",
+        description=gig.description,
+        skills=[],
+        applicants=applicants,
+        category=gig.category,
+    )
 
-    db.add_all(gigs)
-    db.commit()
+
+def _message_out(message: Message) -> MessageOut:
+    return MessageOut(
+        id=message.id,
+        senderId=message.sender_id,
+        content=message.content,
+        createdAt=message.created_at,
+    )
+
+
+def _conversation_out(conversation: Conversation) -> ConversationOut:
+    # Conversation.messages is ordered by (created_at, id) in SQL
+    return ConversationOut(
+        id=conversation.id,
+        gigId=conversation.gig_id,
+        applicationId=conversation.application_id,
+        companyId=conversation.company_id,
+        studentId=conversation.student_id,
+        messages=[_message_out(m) for m in conversation.messages],
+    )
 
 
 @router.post("/", response_model=GigOut, status_code=status.HTTP_201_CREATED)
 def create_gig(
     payload: GigCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ):
     # Only company users can create gigs
     if current_user.role != UserRole.COMPANY:
@@ -192,136 +172,419 @@ def create_gig(
     db.commit()
     db.refresh(gig)
 
-    # Derive budget label in the same way as list_gigs
-    if gig.budget_min is not None and gig.budget_max is not None:
-        budget = f"XAF {gig.budget_min:,.0f} - XAF {gig.budget_max:,.0f}"
-    elif gig.budget_min is not None:
-        budget = f"From XAF {gig.budget_min:,.0f}"
-    elif gig.budget_max is not None:
-        budget = f"Up to XAF {gig.budget_max:,.0f}"
-    else:
-        budget = None
-
     company_name = f"{current_user.first_name} {current_user.last_name}".strip() or "Company"
-    company_logo = "https://images.unsplash.com/photo-1560179707-f14e90ef3623?w=100&h=100&fit=crop"
+    return _gig_out(gig, company_name=company_name, applicants=0)
+
+
+def open_gigs_statement(
+    category: Optional[str],
+    gig_type: Optional[str],
+    location: Optional[str],
+    min_budget: Optional[float],
+    max_budget: Optional[float],
+    cursor: Optional[str],
+    limit: int,
+) -> Select:
+    """Build the keyset page query behind ``GET /api/gigs``.
+
+    Shared by the sync and async routers. Fetches one row past ``limit`` so
+    :func:`gig_page` can tell whether another page exists.
+    """
 
-    return GigOut(
-        id=gig.id,
-        title=gig.title,
-        company=company_name,
-        companyLogo=company_logo,
-        location=gig.location,
-        type=gig.type,
-        budget=budget,
-        deadline=gig.deadline,
-        posted=gig.created_at.isoformat() if gig.created_at else "",
-        description=gig.description,
-        skills=[],
-        applicants=0,
-        category=gig.category,
-    )
+    stmt = select(Gig, _applicant_count()).where(Gig.status == "OPEN")
+
+    if category:
+        stmt = stmt.where(Gig.category == category)
+    if gig_type:
+        stmt = stmt.where(Gig.type == gig_type)
+    if location:
+        stmt = stmt.where(Gig.location.ilike(f"%{location}%"))
+    # Budget filters match any gig whose budget range overlaps the requested one
+    if min_budget is not None:
+        stmt = stmt.where(func.coalesce(Gig.budget_max, Gig.budget_min) >= min_budget)
+    if max_budget is not None:
+        stmt = stmt.where(func.coalesce(Gig.budget_min, Gig.budget_max) <= max_budget)
+
+    if cursor:
+        anchor_id = anchor_from_cursor(cursor)
+        # Compare against the anchor row's stored timestamp rather than a
+        # round-tripped value so precision differences between drivers can't
+        # skip or repeat rows.
+        anchor_created_at = select(Gig.created_at).where(Gig.id == anchor_id).scalar_subquery()
+        stmt = stmt.where(tuple_(Gig.created_at, Gig.id) < tuple_(anchor_created_at, anchor_id))
+
+    return stmt.order_by(Gig.created_at.desc(), Gig.id.desc()).limit(limit + 1)
+
+
+def gig_page(rows: Sequence[Row], limit: int, response: Response) -> List[GigOut]:
+    if len(rows) > limit:
+        rows = rows[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(rows[-1][0].id)
+
+    # Placeholder company & logo for now (until we add richer company profiles)
+    return [_gig_out(gig, company_name="Company", applicants=applicants) for gig, applicants in rows]
 
 
 @router.get("/", response_model=List[GigOut])
-def list_gigs(db: Session = Depends(get_db)):
-    # Seed some creative demo gigs (singing, dancing, painting, etc.) the first
-    # time this endpoint is called so the Opportunities page is not empty in a
-    # fresh environment.
-    _ensure_seed_company_and_gigs(db)
-
-    # Only show gigs that are still open (or with no explicit status yet)
-    gigs = (
-        db.query(Gig)
-        .filter((Gig.status == "OPEN") | (Gig.status.is_(None)))
-        .order_by(Gig.created_at.desc())
-        .all()
-    )
+def list_gigs(
+    response: Response,
+    category: Optional[str] = None,
+    gig_type: Optional[str] = Query(None, alias="type"),
+    location: Optional[str] = None,
+    minBudget: Optional[float] = Query(None, ge=0),
+    maxBudget: Optional[float] = Query(None, ge=0),
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
+):
+    """List open gigs, newest first, one keyset page at a time.
 
-    results: List[GigOut] = []
-    for gig in gigs:
-        # Derive a budget label from min/max (XAF currency)
-        if gig.budget_min is not None and gig.budget_max is not None:
-            budget = f"XAF {gig.budget_min:,.0f} - XAF {gig.budget_max:,.0f}"
-        elif gig.budget_min is not None:
-            budget = f"From XAF {gig.budget_min:,.0f}"
-        elif gig.budget_max is not None:
-            budget = f"Up to XAF {gig.budget_max:,.0f}"
-        else:
-            budget = None
+    Pages are ordered by ``(created_at, id)`` so fetching page N costs the same
+    as fetching the first one. The cursor for the next page (if any) is
+    returned in the ``X-Next-Cursor`` response header.
+    """
 
-        # Placeholder company & logo for now (until we add richer company profiles)
-        company_name = "Company"
-        company_logo = "https://images.unsplash.com/photo-1560179707-f14e90ef3623?w=100&h=100&fit=crop"
+    stmt = open_gigs_statement(category, gig_type, location, minBudget, maxBudget, cursor, limit)
+    return gig_page(db.execute(stmt).all(), limit, response)
 
-        results.append(
-            GigOut(
-                id=gig.id,
-                title=gig.title,
-                company=company_name,
-                companyLogo=company_logo,
-                location=gig.location,
-                type=gig.type,
-                budget=budget,
-                deadline=gig.deadline,
-                posted=gig.created_at.isoformat() if gig.created_at else "",
-                description=gig.description,
-                skills=[],
-                applicants=len(gig.applications) if hasattr(gig, "applications") and gig.applications else 0,
-                category=gig.category,
-            )
+
+@router.get("/search", response_model=List[GigOut])
+def search_gigs(
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200),
+    category: Optional[str] = None,
+    gig_type: Optional[str] = Query(None, alias="type"),
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
+):
+    """Ranked full-text search over open gigs' title, role, category and description.
+
+    Each word matches as a prefix (``danc`` finds "dance"). When nothing
+    matches, misspelt words are corrected against the indexed vocabulary and
+    the corrected query is echoed in the ``X-Search-Corrected`` header.
+    Further pages are fetched with the ``X-Next-Cursor`` header.
+    """
+
+    terms = search_terms(q)
+    if not terms:
+        return []
+    offset = offset_from_cursor(cursor)
+
+    def run(search: List[str]) -> Sequence[Row]:
+        page = search_statement(
+            db.get_bind().dialect.name, search, category, gig_type, offset, limit + 1
+        ).subquery()
+        return db.execute(
+            select(Gig, _applicant_count())
+            .join(page, page.c.gig_id == Gig.id)
+            .order_by(page.c.rank.desc(), page.c.tiebreak)
+        ).all()
+
+    rows = run(terms)
+    if not rows and not cursor:
+        corrected = vocabulary.correct(db, terms)
+        if corrected != terms:
+            rows = run(corrected)
+            response.headers[CORRECTED_QUERY_HEADER] = " ".join(corrected)
+
+    if len(rows) > limit:
+        rows = rows[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(offset + limit)
+    return [_gig_out(gig, company_name="Company", applicants=applicants) for gig, applicants in rows]
+
+
+@router.get("/recommended", response_model=List[GigOut])
+def recommended_gigs(
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_principal),
+):
+    """Open gigs ranked by how well they fit the student's skills and assessment results.
+
+    Scored from the in-memory skill index (see ``services.gig_recommendations``);
+    the database is only asked for the student's skills and applications and
+    for the returned page. Each gig carries its ``matchScore`` (0-1) and the
+    student's skills it matched. Gigs already applied to are left out, and
+    a student without skills or assessment results gets an empty list.
+    """
+
+    if current_user.role != UserRole.STUDENT:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only students get gig recommendations",
         )
 
+    offset = offset_from_cursor(cursor)
+    matches = gig_recommendations.recommend(db, current_user.id, offset, limit + 1)
+    if len(matches) > limit:
+        matches = matches[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(offset + limit)
+    if not matches:
+        return []
+
+    rows = db.execute(
+        select(Gig, _applicant_count()).where(Gig.id.in_([m.gig_id for m in matches]), Gig.status == "OPEN")
+    ).all()
+    gigs_by_id = {gig.id: (gig, applicants) for gig, applicants in rows}
+
+    results = []
+    for match in matches:
+        if match.gig_id not in gigs_by_id:
+            continue  # closed since the index last saw it
+        gig, applicants = gigs_by_id[match.gig_id]
+        out = _gig_out(gig, company_name="Company", applicants=applicants)
+        out.skills = match.skills
+        out.matchScore = match.score
+        results.append(out)
     return results
 
 
 @router.get("/conversations/me", response_model=List[ConversationOut])
 def list_my_conversations(
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ):
-    conversations = (
-        db.query(Conversation)
-        .filter(
-            (Conversation.company_id == current_user.id)
-            | (Conversation.student_id == current_user.id)
-        )
+    """Every conversation with its full history.
+
+    Kept for existing clients; prefer ``/conversations/summaries`` plus
+    ``/conversations/{id}/messages``, which only transfer what changed.
+    """
+
+    conversations = db.scalars(
+        select(Conversation)
+        .where((Conversation.company_id == current_user.id) | (Conversation.student_id == current_user.id))
+        .options(selectinload(Conversation.messages))
         .order_by(Conversation.created_at.desc())
-        .all()
+    ).all()
+
+    return [_conversation_out(conv) for conv in conversations]
+
+
+@router.get("/conversations/summaries", response_model=List[ConversationSummaryOut])
+def list_my_conversation_summaries(
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_principal),
+):
+    """One row per conversation: gig title, last message and unread count.
+
+    Ordered by latest activity. Unread counts are messages from the other
+    participant after the caller's read marker (see ``POST .../read``).
+    """
+
+    last_message = aliased(Message)
+    read_anchor = aliased(Message)
+
+    last_message_id = (
+        select(Message.id)
+        .where(Message.conversation_id == Conversation.id)
+        .order_by(Message.created_at.desc(), Message.id.desc())
+        .limit(1)
+        .correlate(Conversation)
+        .scalar_subquery()
+    )
+    unread_count = (
+        select(func.count(Message.id))
+        .where(
+            Message.conversation_id == Conversation.id,
+            Message.sender_id != current_user.id,
+            or_(
+                read_anchor.id.is_(None),
+                tuple_(Message.created_at, Message.id) > tuple_(read_anchor.created_at, read_anchor.id),
+            ),
+        )
+        .correlate(Conversation, read_anchor)
+        .scalar_subquery()
     )
+    last_activity = func.coalesce(last_message.created_at, Conversation.created_at)
+
+    rows = db.execute(
+        select(Conversation, Gig.title, last_message, unread_count.label("unread_count"), last_activity)
+        .join(Gig, Gig.id == Conversation.gig_id)
+        .outerjoin(
+            ConversationRead,
+            and_(ConversationRead.conversation_id == Conversation.id, ConversationRead.user_id == current_user.id),
+        )
+        .outerjoin(read_anchor, read_anchor.id == ConversationRead.last_read_message_id)
+        .outerjoin(last_message, last_message.id == last_message_id)
+        .where((Conversation.company_id == current_user.id) | (Conversation.student_id == current_user.id))
+        .order_by(last_activity.desc(), Conversation.id.desc())
+    ).all()
+
+    return [
+        ConversationSummaryOut(
+            id=conv.id,
+            gigId=conv.gig_id,
+            gigTitle=gig_title,
+            applicationId=conv.application_id,
+            companyId=conv.company_id,
+            studentId=conv.student_id,
+            lastMessage=_message_out(message) if message is not None else None,
+            unreadCount=unread or 0,
+            lastActivityAt=activity_at,
+        )
+        for conv, gig_title, message, unread, activity_at in rows
+    ]
 
-    results: List[ConversationOut] = []
-    for conv in conversations:
-        messages_out: List[MessageOut] = []
-        if conv.messages:
-            for m in sorted(conv.messages, key=lambda x: x.created_at):
-                messages_out.append(
-                    MessageOut(
-                        id=m.id,
-                        senderId=m.sender_id,
-                        content=m.content,
-                        createdAt=m.created_at,
-                    )
-                )
 
-        results.append(
-            ConversationOut(
-                id=conv.id,
-                gigId=conv.gig_id,
-                applicationId=conv.application_id,
-                companyId=conv.company_id,
-                studentId=conv.student_id,
-                messages=messages_out,
-            )
+def _conversation_for_participant(db: Session, conversation_id: str, current_user: Principal) -> Conversation:
+    conversation = db.get(Conversation, conversation_id)
+    if not conversation:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Conversation not found")
+    if current_user.id not in (conversation.company_id, conversation.student_id) and (
+        current_user.role != UserRole.SUPER_ADMIN
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You are not allowed to view this conversation",
         )
+    return conversation
 
-    return results
+
+def _message_anchor(conversation_id: str, cursor: str):
+    """The cursor message's stored ``(created_at, id)``, as SQL for keyset comparisons."""
+
+    anchor_id = anchor_from_cursor(cursor)
+    anchor_created_at = (
+        select(Message.created_at)
+        .where(Message.id == anchor_id, Message.conversation_id == conversation_id)
+        .scalar_subquery()
+    )
+    return anchor_created_at, anchor_id
+
+
+def _messages_since(
+    db: Session, conversation_id: str, cursor: str, limit: int
+) -> Tuple[List[Message], List[Message]]:
+    """Up to ``limit`` messages after the cursor, and those within ``SYNC_OVERLAP`` before it.
+
+    Both lists are oldest first. The overlap (at most a full page, newest
+    kept) may hold messages the client already has.
+    """
+
+    stored_created_at, anchor_id = _message_anchor(conversation_id, cursor)
+    anchor_created_at = db.scalar(select(stored_created_at))
+    if anchor_created_at is None:
+        return [], []
+
+    position = tuple_(Message.created_at, Message.id)
+    anchor = tuple_(stored_created_at, anchor_id)
+    stmt = select(Message).where(Message.conversation_id == conversation_id)
+    newer = list(db.scalars(stmt.where(position > anchor).order_by(Message.created_at, Message.id).limit(limit)))
+    overlap = list(
+        db.scalars(
+            stmt.where(position < anchor, Message.created_at >= anchor_created_at - SYNC_OVERLAP)
+            .order_by(Message.created_at.desc(), Message.id.desc())
+            .limit(MAX_PAGE_SIZE)
+        )
+    )
+    overlap.reverse()
+    return overlap, newer
+
+
+@router.get("/conversations/{conversation_id}/messages", response_model=List[MessageOut])
+def list_conversation_messages(
+    conversation_id: str,
+    response: Response,
+    since: Optional[str] = None,
+    before: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_principal),
+):
+    """A page of messages, oldest first.
+
+    Without a cursor this is the newest ``limit`` messages. ``before`` pages
+    back through older history; ``since`` returns up to ``limit`` messages
+    newer than the cursor (a full page of them means more are waiting),
+    preceded by those stamped up to ``SYNC_OVERLAP`` before it, which may
+    repeat messages the client already has; de-duplicate by id.
+    ``X-Before-Cursor`` is set while older messages remain and
+    ``X-Since-Cursor`` is the cursor to poll with next.
+    """
+
+    if since and before:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Use either since or before, not both")
+
+    conversation = _conversation_for_participant(db, conversation_id, current_user)
+    position = tuple_(Message.created_at, Message.id)
+    stmt = select(Message).where(Message.conversation_id == conversation.id)
+
+    if since:
+        overlap, newer = _messages_since(db, conversation.id, since, limit)
+        response.headers[SINCE_CURSOR_HEADER] = encode_cursor(newer[-1].id) if newer else since
+        return [_message_out(m) for m in overlap + newer]
+
+    if before:
+        stmt = stmt.where(position < tuple_(*_message_anchor(conversation.id, before)))
+    messages = list(db.scalars(stmt.order_by(Message.created_at.desc(), Message.id.desc()).limit(limit + 1)))
+    if len(messages) > limit:
+        messages = messages[:limit]
+        response.headers[BEFORE_CURSOR_HEADER] = encode_cursor(messages[-1].id)
+    messages.reverse()
+
+    # Empty conversations have nothing to poll from yet; clients retry without a cursor
+    if not before and messages:
+        response.headers[SINCE_CURSOR_HEADER] = encode_cursor(messages[-1].id)
+    return [_message_out(m) for m in messages]
+
+
+@router.post("/conversations/{conversation_id}/read", status_code=status.HTTP_204_NO_CONTENT)
+def mark_conversation_read(
+    conversation_id: str,
+    payload: Optional[ConversationReadCreate] = None,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_principal),
+):
+    """Move the caller's read marker forward to ``messageId`` (default: newest message)."""
+
+    conversation = _conversation_for_participant(db, conversation_id, current_user)
+
+    stmt = select(Message).where(Message.conversation_id == conversation.id)
+    if payload and payload.messageId:
+        stmt = stmt.where(Message.id == payload.messageId)
+    else:
+        stmt = stmt.order_by(Message.created_at.desc(), Message.id.desc()).limit(1)
+    target = db.scalars(stmt).first()
+    if target is None:
+        if payload and payload.messageId:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Message not found")
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+    for attempt in range(2):
+        marker = db.get(ConversationRead, (conversation.id, current_user.id))
+        if marker is None:
+            db.add(
+                ConversationRead(
+                    conversation_id=conversation.id,
+                    user_id=current_user.id,
+                    last_read_message_id=target.id,
+                )
+            )
+        else:
+            current = db.get(Message, marker.last_read_message_id) if marker.last_read_message_id else None
+            # Never move the marker backwards
+            if current is None or (current.created_at, current.id) < (target.created_at, target.id):
+                marker.last_read_message_id = target.id
+        try:
+            db.commit()
+            break
+        except IntegrityError:
+            # A concurrent request created the marker first; update that one instead
+            db.rollback()
+            if attempt:
+                raise
+
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
 @router.post("/applications/{application_id}/approve", response_model=ConversationOut)
 def approve_application(
     application_id: str,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ):
     application = db.query(GigApplication).filter(GigApplication.id == application_id).first()
     if not application:
@@ -358,34 +621,12 @@ def approve_application(
     db.commit()
     db.refresh(conversation)
 
-    messages_out: List[MessageOut] = []
-    if conversation.messages:
-        for m in sorted(conversation.messages, key=lambda x: x.created_at):
-            messages_out.append(
-                MessageOut(
-                    id=m.id,
-                    senderId=m.sender_id,
-                    content=m.content,
-                    createdAt=m.created_at,
-                )
-            )
+    return _conversation_out(conversation)
 
-    return ConversationOut(
-        id=conversation.id,
-        gigId=conversation.gig_id,
-        applicationId=conversation.application_id,
-        companyId=conversation.company_id,
-        studentId=conversation.student_id,
-        messages=messages_out,
-    )
 
-
-@router.get("/applications/{application_id}/conversation", response_model=ConversationOut)
-def get_conversation_for_application(
-    application_id: str,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-):
+def _application_conversation(
+    db: Session, application_id: str, current_user: Principal, forbidden_detail: str
+) -> Conversation:
     application = db.query(GigApplication).filter(GigApplication.id == application_id).first()
     if not application:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Application not found")
@@ -394,16 +635,13 @@ def get_conversation_for_application(
     if not gig:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Gig not found")
 
-    # Only company, student or super admin can see the conversation
+    # Only company, student or super admin take part in the conversation
     if (
         gig.company_id != current_user.id
         and application.student_id != current_user.id
         and current_user.role != UserRole.SUPER_ADMIN
     ):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You are not allowed to view this conversation",
-        )
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=forbidden_detail)
 
     conversation = (
         db.query(Conversation)
@@ -412,27 +650,19 @@ def get_conversation_for_application(
     )
     if not conversation:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Conversation not found")
+    return conversation
 
-    messages_out: List[MessageOut] = []
-    if conversation.messages:
-        for m in sorted(conversation.messages, key=lambda x: x.created_at):
-            messages_out.append(
-                MessageOut(
-                    id=m.id,
-                    senderId=m.sender_id,
-                    content=m.content,
-                    createdAt=m.created_at,
-                )
-            )
 
-    return ConversationOut(
-        id=conversation.id,
-        gigId=conversation.gig_id,
-        applicationId=conversation.application_id,
-        companyId=conversation.company_id,
-        studentId=conversation.student_id,
-        messages=messages_out,
+@router.get("/applications/{application_id}/conversation", response_model=ConversationOut)
+def get_conversation_for_application(
+    application_id: str,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_principal),
+):
+    conversation = _application_conversation(
+        db, application_id, current_user, "You are not allowed to view this conversation"
     )
+    return _conversation_out(conversation)
 
 
 @router.post("/applications/{application_id}/messages", response_model=MessageOut)
@@ -440,34 +670,11 @@ def send_message_for_application(
     application_id: str,
     payload: MessageCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ):
-    application = db.query(GigApplication).filter(GigApplication.id == application_id).first()
-    if not application:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Application not found")
-
-    gig = db.query(Gig).filter(Gig.id == application.gig_id).first()
-    if not gig:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Gig not found")
-
-    # Only company, student or super admin can send messages
-    if (
-        gig.company_id != current_user.id
-        and application.student_id != current_user.id
-        and current_user.role != UserRole.SUPER_ADMIN
-    ):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You are not allowed to send messages in this conversation",
-        )
-
-    conversation = (
-        db.query(Conversation)
-        .filter(Conversation.application_id == application_id)
-        .first()
+    conversation = _application_conversation(
+        db, application_id, current_user, "You are not allowed to send messages in this conversation"
     )
-    if not conversation:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Conversation not found")
 
     message = Message(
         id=str(uuid.uuid4()),
@@ -476,21 +683,99 @@ def send_message_for_application(
         content=payload.content,
     )
     db.add(message)
+    # Live subscribers are notified once this commits (services.chat_events)
     db.commit()
     db.refresh(message)
 
-    return MessageOut(
-        id=message.id,
-        senderId=message.sender_id,
-        content=message.content,
-        createdAt=message.created_at,
-    )
+    return _message_out(message)
+
+
+def _authorize_conversation_stream(application_id: str, token: str) -> str:
+    with SessionLocal() as db:
+        current_user = principal_from_token(db, token)
+        conversation = _application_conversation(
+            db, application_id, current_user, "You are not allowed to view this conversation"
+        )
+        return conversation.id
+
+
+def _stream_backlog(conversation_id: str, since: str) -> Tuple[List[Message], bool]:
+    with SessionLocal() as db:
+        overlap, newer = _messages_since(db, conversation_id, since, MAX_PAGE_SIZE + 1)
+    return overlap + newer[:MAX_PAGE_SIZE], len(newer) > MAX_PAGE_SIZE
+
+
+async def _wait_for_disconnect(websocket: WebSocket) -> None:
+    # Clients have nothing to say on this socket; keep reading so a close is noticed
+    try:
+        while True:
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        return
+
+
+@router.websocket("/applications/{application_id}/conversation/ws")
+async def conversation_socket(
+    websocket: WebSocket,
+    application_id: str,
+    token: str = Query(...),
+    since: Optional[str] = None,
+):
+    """Push new messages of a conversation as they are committed.
+
+    Browsers cannot set headers on WebSocket requests, so the access token is
+    passed as ``?token=``. With ``since`` (a message cursor from the HTTP API)
+    anything missed while disconnected is replayed first; if that gap is
+    larger than one page a ``{"type": "resync"}`` event asks the client to
+    catch up over HTTP. Every other event is ``{"type": "message", ...}``.
+    A subscriber that falls too far behind is closed with code 1013.
+    """
+
+    try:
+        conversation_id = await run_in_threadpool(_authorize_conversation_stream, application_id, token)
+    except HTTPException as e:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason=str(e.detail))
+        return
+
+    await websocket.accept()
+    # Subscribe before reading the backlog so nothing committed in between is lost
+    async with broadcast.subscribe(conversation_channel(conversation_id)) as subscription:
+        replayed: Set[str] = set()
+        if since:
+            try:
+                backlog, truncated = await run_in_threadpool(_stream_backlog, conversation_id, since)
+            except HTTPException as e:
+                await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason=str(e.detail))
+                return
+            if truncated:
+                await websocket.send_text(json.dumps({"type": "resync"}))
+            for message in backlog:
+                replayed.add(message.id)
+                await websocket.send_text(message_event(message))
+
+        disconnected = asyncio.create_task(_wait_for_disconnect(websocket))
+        try:
+            while True:
+                next_event = asyncio.create_task(subscription.get())
+                await asyncio.wait({next_event, disconnected}, return_when=asyncio.FIRST_COMPLETED)
+                if disconnected.done():
+                    next_event.cancel()
+                    return
+                data = next_event.result()
+                if data is None:
+                    await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER, reason="Subscriber fell behind")
+                    return
+                if replayed and json.loads(data)["message"]["id"] in replayed:
+                    continue
+                await websocket.send_text(data)
+        finally:
+            disconnected.cancel()
 
 
 @router.get("/my", response_model=List[GigOut])
 def list_my_gigs(
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ):
     if current_user.role != UserRole.COMPANY:
         raise HTTPException(
@@ -498,46 +783,15 @@ def list_my_gigs(
             detail="Only company users can view their own opportunities",
         )
 
-    gigs = (
-        db.query(Gig)
+    rows = (
+        db.query(Gig, _applicant_count())
         .filter(Gig.company_id == current_user.id)
         .order_by(Gig.created_at.desc())
         .all()
     )
 
-    results: List[GigOut] = []
-    for gig in gigs:
-        if gig.budget_min is not None and gig.budget_max is not None:
-            budget = f"XAF {gig.budget_min:,.0f} - XAF {gig.budget_max:,.0f}"
-        elif gig.budget_min is not None:
-            budget = f"From XAF {gig.budget_min:,.0f}"
-        elif gig.budget_max is not None:
-            budget = f"Up to XAF {gig.budget_max:,.0f}"
-        else:
-            budget = None
-
-        company_name = f"{current_user.first_name} {current_user.last_name}".strip() or "Company"
-        company_logo = "https://images.unsplash.com/photo-1560179707-f14e90ef3623?w=100&h=100&fit=crop"
-
-        results.append(
-            GigOut(
-                id=gig.id,
-                title=gig.title,
-                company=company_name,
-                companyLogo=company_logo,
-                location=gig.location,
-                type=gig.type,
-                budget=budget,
-                deadline=gig.deadline,
-                posted=gig.created_at.isoformat() if gig.created_at else "",
-                description=gig.description,
-                skills=[],
-                applicants=len(gig.applications) if hasattr(gig, "applications") and gig.applications else 0,
-                category=gig.category,
-            )
-        )
-
-    return results
+    company_name = f"{current_user.first_name} {current_user.last_name}".strip() or "Company"
+    return [_gig_out(gig, company_name=company_name, applicants=applicants) for gig, applicants in rows]
 
 
 @router.post("/{gig_id}/apply", response_model=GigApplicationOut, status_code=status.HTTP_201_CREATED)
@@ -545,7 +799,7 @@ def apply_to_gig(
     gig_id: str,
     payload: GigApplicationCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ):
     if current_user.role != UserRole.STUDENT:
         raise HTTPException(
@@ -601,7 +855,7 @@ def create_contract_for_application(
     application_id: str,
     payload: ContractCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ):
     application = db.query(GigApplication).filter(GigApplication.id == application_id).first()
     if not application:
@@ -665,7 +919,7 @@ def create_contract_for_application(
 def get_contract_for_application(
     application_id: str,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ):
     application = db.query(GigApplication).filter(GigApplication.id == application_id).first()
     if not application:
@@ -710,7 +964,7 @@ def release_contract_payment(
     contract_id: str,
     payload: ReleaseContractRequest,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ):
     contract = db.query(Contract).filter(Contract.id == contract_id).first()
     if not contract:
@@ -747,6 +1001,7 @@ def release_contract_payment(
     )
     db.add(payout)
 
+    newly_completed = contract.status != "COMPLETED"
     contract.status = "COMPLETED"
 
     # Mark gig as filled so it no longer appears as an open opportunity
@@ -765,6 +1020,9 @@ def release_contract_payment(
         )
         db.add(review)
 
+    db.flush()
+    record_contract_release(db, application.student_id, payload.rating, newly_completed)
+
     db.commit()
     db.refresh(contract)
 
@@ -784,7 +1042,7 @@ def release_contract_payment(
 def list_applications_for_gig(
     gig_id: str,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ):
     gig = db.query(Gig).filter(Gig.id == gig_id).first()
     if not gig:
@@ -825,3 +1083,76 @@ def list_applications_for_gig(
         )
 
     return results
+
+
+@router.get("/{gig_id}/candidates", response_model=List[CandidateOut])
+def list_candidates_for_gig(
+    gig_id: str,
+    response: Response,
+    includePool: bool = False,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_principal),
+):
+    """The gig's applicants ranked as a shortlist, best first, with each score's breakdown.
+
+    With ``includePool`` students who have not applied but hold the gig's
+    skills are ranked alongside them (their application fields are unset).
+    See ``services.candidate_ranking`` for the scoring; the ranking is cached
+    per gig until its applications change. Paged with ``cursor`` and the
+    ``X-Next-Cursor`` header.
+    """
+
+    gig = db.get(Gig, gig_id)
+    if not gig:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Gig not found")
+    if gig.company_id != current_user.id and current_user.role != UserRole.SUPER_ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You are not allowed to view candidates for this opportunity",
+        )
+
+    offset = offset_from_cursor(cursor)
+    ranked = candidate_ranking.ranking(db, gig, include_pool=includePool)
+    page = ranked[offset : offset + limit]
+    if offset + limit < len(ranked):
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(offset + limit)
+    if not page:
+        return []
+
+    student_ids = [candidate.student_id for candidate in page]
+    names = {
+        user_id: f"{first_name} {last_name}".strip()
+        for user_id, first_name, last_name in db.execute(
+            select(User.id, User.first_name, User.last_name).where(User.id.in_(student_ids))
+        )
+    }
+    applications = {
+        application.student_id: application
+        for application in db.scalars(
+            select(GigApplication).where(GigApplication.gig_id == gig_id, GigApplication.student_id.in_(student_ids))
+        )
+    }
+
+    results: List[CandidateOut] = []
+    for candidate in page:
+        application = applications.get(candidate.student_id)
+        results.append(
+            CandidateOut(
+                studentId=candidate.student_id,
+                studentName=names.get(candidate.student_id, candidate.student_id),
+                score=candidate.score,
+                breakdown=CandidateScoreOut(
+                    skills=candidate.skills, rating=candidate.rating, experience=candidate.experience
+                ),
+                matchedSkills=candidate.matched_skills,
+                avgRating=candidate.avg_rating,
+                reviewsCount=candidate.reviews_count,
+                completedGigs=candidate.completed_gigs,
+                applicationId=application.id if application else None,
+                applicationStatus=application.status if application else None,
+                appliedAt=application.applied_at if application else None,
+            )
+        )
+    return results
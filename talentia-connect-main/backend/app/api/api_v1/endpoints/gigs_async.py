@@ -0,0 +1,35 @@
+"""Async twins of the hot gig read endpoints, mounted when ``DB_ASYNC`` is enabled."""
+
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ....core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from ....db.session import AsyncSessionLocal
+from ....schemas.gig import GigOut
+from .gigs import gig_page, open_gigs_statement
+
+router = APIRouter()
+
+
+async def get_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+@router.get("/", response_model=List[GigOut])
+async def list_gigs(
+    response: Response,
+    category: Optional[str] = None,
+    gig_type: Optional[str] = Query(None, alias="type"),
+    location: Optional[str] = None,
+    minBudget: Optional[float] = Query(None, ge=0),
+    maxBudget: Optional[float] = Query(None, ge=0),
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_db),
+):
+    stmt = open_gigs_statement(category, gig_type, location, minBudget, maxBudget, cursor, limit)
+    result = await db.execute(stmt)
+    return gig_page(result.all(), limit, response)
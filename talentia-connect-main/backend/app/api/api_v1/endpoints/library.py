@@ -1,12 +1,15 @@
-from typing import List
-import uuid
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy import or_, select, tuple_
 from sqlalchemy.orm import Session
 
+from ....core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER, anchor_from_cursor, encode_cursor
 from ....db.session import SessionLocal
-from ....models.library import LibraryCategory, LibraryResource
+from ....models.library import LibraryCategory, LibraryResource, LibraryResourceRole
+from ....models.user import UserRole
 from ....schemas.library import LibraryCategoryOut, LibraryResourceOut
+from .auth import Principal, get_optional_principal
 
 
 router = APIRouter()
@@ -20,145 +23,61 @@ def get_db():
         db.close()
 
 
-def _ensure_seed_data(db: Session) -> None:
-    """Seed a small curated e-library the first time the API is called.
-
-    This keeps things simple for now (no separate migration/seed script) and
-    only runs when the tables are still empty.
-    """
-
-    has_categories = db.query(LibraryCategory).first()
-    has_resources = db.query(LibraryResource).first()
-    if has_categories or has_resources:
-        return
-
-    # Categories
-    cameroon_culture = LibraryCategory(
-        id=str(uuid.uuid4()),
-        name="Cameroon Culture & Arts",
-    )
-    cameroon_history = LibraryCategory(
-        id=str(uuid.uuid4()),
-        name="Cameroon History",
-    )
-    professionalism = LibraryCategory(
-        id=str(uuid.uuid4()),
-        name="Professionalism & Career",
-    )
-    course_books = LibraryCategory(
-        id=str(uuid.uuid4()),
-        name="Course Books",
-    )
-
-    db.add_all([cameroon_culture, cameroon_history, professionalism, course_books])
-
-    # Resources – thumbnails use open images so that the current UI "just works".
-    resources = [
-        # Cameroon culture
-        LibraryResource(
-            id=str(uuid.uuid4()),
-            category_id=cameroon_culture.id,
-            title="Cameroon Cultural Heritage: Traditions & Festivals",
-            description="Overview of major Cameroonian cultural festivals, traditional dances and attire.",
-            type="PDF",
-            file_url="https://images.unsplash.com/photo-1545424273-61199678b3e1?w=600&h=400&fit=crop",
-            size_label="4.2 MB",
-            is_premium=False,
-            allowed_roles="STUDENT,COMPANY,MENTOR",
-        ),
-        LibraryResource(
-            id=str(uuid.uuid4()),
-            category_id=cameroon_culture.id,
-            title="Languages of Cameroon: A Practical Guide",
-            description="Short guide to the main national languages and how they shape everyday life.",
-            type="PDF",
-            file_url="https://images.unsplash.com/photo-1524504388940-b1c1722653e1?w=600&h=400&fit=crop",
-            size_label="3.1 MB",
-            is_premium=False,
-            allowed_roles="STUDENT,COMPANY,MENTOR",
-        ),
-        # Cameroon history
-        LibraryResource(
-            id=str(uuid.uuid4()),
-            category_id=cameroon_history.id,
-            title="A Short History of Cameroon (Colonial to Modern State)",
-            description="Timeline of key historical events from the colonial period to present-day Cameroon.",
-            type="PDF",
-            file_url="https://images.unsplash.com/photo-1509099863731-ef4bff19e808?w=600&h=400&fit=crop",
-            size_label="5.6 MB",
-            is_premium=False,
-            allowed_roles="STUDENT,COMPANY,MENTOR",
-        ),
-        LibraryResource(
-            id=str(uuid.uuid4()),
-            category_id=cameroon_history.id,
-            title="Cameroon in Central African Politics",
-            description="Introductory reading on Cameroon's role in the CEMAC and African Union.",
-            type="PDF",
-            file_url="https://images.unsplash.com/photo-1509099836639-18ba1795216d?w=600&h=400&fit=crop",
-            size_label="2.9 MB",
-            is_premium=False,
-            allowed_roles="STUDENT,COMPANY,MENTOR",
-        ),
-        # Professionalism
-        LibraryResource(
-            id=str(uuid.uuid4()),
-            category_id=professionalism.id,
-            title="Professionalism for Young Graduates in Cameroon",
-            description="Practical guide to workplace ethics, communication and dress code in the Cameroonian context.",
-            type="PDF",
-            file_url="https://images.unsplash.com/photo-1521737604893-d14cc237f11d?w=600&h=400&fit=crop",
-            size_label="3.8 MB",
-            is_premium=False,
-            allowed_roles="STUDENT",
-        ),
-        LibraryResource(
-            id=str(uuid.uuid4()),
-            category_id=professionalism.id,
-            title="CV & Cover Letter Templates for Cameroon Job Market",
-            description="Templates and examples adapted for local employers and international organizations.",
-            type="ZIP",
-            file_url="https://images.unsplash.com/photo-1512427691650-1e0c2f9a81b3?w=600&h=400&fit=crop",
-            size_label="1.4 MB",
-            is_premium=False,
-            allowed_roles="STUDENT",
-        ),
-        # Course books
-        LibraryResource(
-            id=str(uuid.uuid4()),
-            category_id=course_books.id,
-            title="Introductory Microeconomics (Level 200)",
-            description="Core notes and example questions for first courses in microeconomics.",
-            type="PDF",
-            file_url="https://images.unsplash.com/photo-1528207776546-365bb710ee93?w=600&h=400&fit=crop",
-            size_label="6.3 MB",
-            is_premium=False,
-            allowed_roles="STUDENT",
-        ),
-        LibraryResource(
-            id=str(uuid.uuid4()),
-            category_id=course_books.id,
-            title="Fundamentals of Programming with Python",
-            description="Beginner-friendly programming text used in many CS departments across Cameroon.",
-            type="PDF",
-            file_url="https://images.unsplash.com/photo-1517430816045-df4b7de11d1d?w=600&h=400&fit=crop",
-            size_label="7.8 MB",
-            is_premium=False,
-            allowed_roles="STUDENT",
-        ),
-    ]
-
-    db.add_all(resources)
-    db.commit()
-
-
 @router.get("/categories", response_model=List[LibraryCategoryOut])
 def list_categories(db: Session = Depends(get_db)):
-    _ensure_seed_data(db)
     return db.query(LibraryCategory).order_by(LibraryCategory.name).all()
 
 
 @router.get("/resources", response_model=List[LibraryResourceOut])
-def list_resources(db: Session = Depends(get_db)):
-    _ensure_seed_data(db)
-    return db.query(LibraryResource).order_by(LibraryResource.created_at.desc()).all()
+def list_resources(
+    response: Response,
+    category: Optional[str] = Query(None, description="Category id"),
+    resource_type: Optional[str] = Query(None, alias="type"),
+    premium: Optional[bool] = None,
+    q: Optional[str] = Query(None, min_length=1, max_length=200),
+    role: Optional[UserRole] = Query(None, description="Audience to list for (anonymous callers and admins)"),
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    principal: Optional[Principal] = Depends(get_optional_principal),
+    db: Session = Depends(get_db),
+):
+    """List library resources, newest first, one keyset page at a time.
+
+    Signed-in users only see resources open to their role; super admins and
+    anonymous callers see everything unless they pass ``role``. The cursor
+    for the next page (if any) is returned in the ``X-Next-Cursor`` header.
+    """
+
+    if principal is not None and principal.role != UserRole.SUPER_ADMIN:
+        role = principal.role
+
+    stmt = select(LibraryResource)
+    if role is not None:
+        # Served by the (role, resource_id) primary key of the join table
+        stmt = stmt.join(
+            LibraryResourceRole,
+            (LibraryResourceRole.resource_id == LibraryResource.id) & (LibraryResourceRole.role == role),
+        )
+    if category:
+        stmt = stmt.where(LibraryResource.category_id == category)
+    if resource_type:
+        stmt = stmt.where(LibraryResource.type == resource_type.upper())
+    if premium is not None:
+        stmt = stmt.where(LibraryResource.is_premium == premium)
+    if q:
+        # The catalogue is small enough that a substring match beats keeping a search index
+        stmt = stmt.where(or_(LibraryResource.title.ilike(f"%{q}%"), LibraryResource.description.ilike(f"%{q}%")))
+
+    if cursor:
+        anchor_id = anchor_from_cursor(cursor)
+        anchor_created_at = select(LibraryResource.created_at).where(LibraryResource.id == anchor_id).scalar_subquery()
+        stmt = stmt.where(
+            tuple_(LibraryResource.created_at, LibraryResource.id) < tuple_(anchor_created_at, anchor_id)
+        )
+
+    stmt = stmt.order_by(LibraryResource.created_at.desc(), LibraryResource.id.desc()).limit(limit + 1)
+    resources = db.execute(stmt).scalars().all()
+    if len(resources) > limit:
+        resources = resources[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(resources[-1].id)
+    return resources
@@ -1,12 +1,25 @@
-from typing import List
+from datetime import datetime, timedelta, timezone
+from typing import List, Literal, Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from ....core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER, encode_cursor, offset_from_cursor
 from ....db.session import SessionLocal
 from ....models.mentorship import MentorProfile
-from ....models.user import User
-from ....schemas.mentorship import MentorOut
+from ....models.user import User, UserRole
+from ....schemas.mentorship import (
+    FreeSlotOut,
+    MentorAvailabilityOut,
+    MentorOut,
+    MentorshipSessionCreate,
+    MentorshipSessionOut,
+)
+from ....services.mentor_availability import DEFAULT_SESSION_MINUTES, MAX_WINDOW, free_mentors
+from ....services.mentor_search import search_mentors
+from ....services.mentorship_booking import SlotUnavailable, book_session
+from .auth import Principal, get_current_principal
 
 
 router = APIRouter()
@@ -21,11 +34,57 @@ def get_db():
 
 
 @router.get("/mentors", response_model=List[MentorOut])
-def list_mentors(db: Session = Depends(get_db)):
-    profiles = db.query(MentorProfile, User).join(User, MentorProfile.user_id == User.id).all()
+def list_mentors(
+    response: Response,
+    tags: Optional[str] = None,
+    match: Literal["all", "any"] = "all",
+    minRate: Optional[float] = Query(None, ge=0),
+    maxRate: Optional[float] = Query(None, ge=0),
+    approvalStatus: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
+):
+    """Mentors filtered by expertise tags, hourly rate and approval status.
+
+    ``tags`` is comma-separated and case-insensitive; with ``match=all`` a
+    mentor needs every tag, with ``match=any`` one of them. A tag ending in
+    ``*`` matches by prefix (``photo*`` finds "Photography" and "Photo
+    editing"). Matching runs on the in-memory tag index (see
+    ``services.mentor_search``). The next page cursor is returned in the
+    ``X-Next-Cursor`` header.
+    """
+
+    offset = offset_from_cursor(cursor)
+    terms = [term for term in (tags or "").split(",") if term.strip()]
+    mentor_ids = search_mentors(
+        db,
+        terms,
+        match_any=match == "any",
+        min_rate=minRate,
+        max_rate=maxRate,
+        approval_status=approvalStatus,
+        offset=offset,
+        limit=limit + 1,
+    )
+    if len(mentor_ids) > limit:
+        mentor_ids = mentor_ids[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(offset + limit)
+    if not mentor_ids:
+        return []
+
+    rows = db.execute(
+        select(MentorProfile, User)
+        .join(User, MentorProfile.user_id == User.id)
+        .where(MentorProfile.id.in_(mentor_ids))
+    ).all()
+    by_id = {profile.id: (profile, user) for profile, user in rows}
 
     results: list[MentorOut] = []
-    for profile, user in profiles:
+    for mentor_id in mentor_ids:
+        if mentor_id not in by_id:
+            continue  # deleted since the index was built
+        profile, user = by_id[mentor_id]
         full_name = f"{user.first_name} {user.last_name}".strip()
         results.append(
             MentorOut(
@@ -42,3 +101,113 @@ def list_mentors(db: Session = Depends(get_db)):
         )
 
     return results
+
+
+@router.get("/mentors/availability", response_model=List[MentorAvailabilityOut])
+def list_available_mentors(
+    response: Response,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    minMinutes: int = Query(DEFAULT_SESSION_MINUTES, ge=1, le=24 * 60),
+    mentorId: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
+):
+    """Approved mentors free for at least ``minMinutes`` between ``start`` and ``end``.
+
+    The window defaults to the next seven days and may span up to 31 days;
+    times without an offset are UTC. Each mentor comes with their free
+    stretches (availability minus booked sessions, see
+    ``services.mentor_availability``), earliest first; mentors are ordered
+    by their first free moment. ``mentorId`` narrows the search to one
+    mentor. The next page cursor is returned in the ``X-Next-Cursor`` header.
+    """
+
+    start = start or datetime.now(timezone.utc)
+    end = end or start + timedelta(days=7)
+    if start.tzinfo is None:
+        start = start.replace(tzinfo=timezone.utc)
+    if end.tzinfo is None:
+        end = end.replace(tzinfo=timezone.utc)
+    if end <= start:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="end must be after start")
+    if end - start > MAX_WINDOW:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Window longer than 31 days")
+
+    offset = offset_from_cursor(cursor)
+    mentors = free_mentors(
+        db,
+        start,
+        end,
+        min_minutes=minMinutes,
+        mentor_ids=[mentorId] if mentorId else None,
+        offset=offset,
+        limit=limit + 1,
+    )
+    if len(mentors) > limit:
+        mentors = mentors[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(offset + limit)
+    if not mentors:
+        return []
+
+    rows = db.execute(
+        select(MentorProfile, User)
+        .join(User, MentorProfile.user_id == User.id)
+        .where(MentorProfile.id.in_([mentor.mentor_id for mentor in mentors]))
+    ).all()
+    by_id = {profile.id: (profile, user) for profile, user in rows}
+
+    results: list[MentorAvailabilityOut] = []
+    for mentor in mentors:
+        profile, user = by_id[mentor.mentor_id]
+        results.append(
+            MentorAvailabilityOut(
+                mentor_id=profile.id,
+                user_id=user.id,
+                full_name=f"{user.first_name} {user.last_name}".strip(),
+                headline=profile.headline,
+                hourly_rate=profile.hourly_rate,
+                free=[FreeSlotOut(start=slot_start, end=slot_end) for slot_start, slot_end in mentor.free],
+            )
+        )
+
+    return results
+
+
+@router.post(
+    "/mentors/{mentor_id}/sessions", response_model=MentorshipSessionOut, status_code=status.HTTP_201_CREATED
+)
+def book_mentorship_session(
+    mentor_id: str,
+    payload: MentorshipSessionCreate,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_principal),
+):
+    """Book a session with a mentor; it must fit in their free time (see ``/mentors/availability``).
+
+    Times without an offset are UTC. Answers 409 when the slot is taken or
+    being booked, or the student already has a session then.
+    """
+
+    if current_user.role != UserRole.STUDENT:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only students can book mentorship sessions",
+        )
+
+    mentor = db.get(MentorProfile, mentor_id)
+    if mentor is None or mentor.approval_status != "APPROVED":
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Mentor not found")
+
+    scheduled_at = payload.scheduled_at
+    if scheduled_at.tzinfo is None:
+        scheduled_at = scheduled_at.replace(tzinfo=timezone.utc)
+    if scheduled_at <= datetime.now(timezone.utc):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Sessions must be booked in the future")
+
+    try:
+        session = book_session(db, mentor, current_user.id, scheduled_at, payload.duration_minutes)
+    except SlotUnavailable as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    return session
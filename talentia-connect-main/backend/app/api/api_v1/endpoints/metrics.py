@@ -0,0 +1,33 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from ....core.instrumentation import render_metrics
+from ....db.pool import pool_stats, prometheus_pool_metrics
+
+
+router = APIRouter()
+
+
+@router.get("", response_class=PlainTextResponse)
+async def get_metrics():
+    """Request latency, per-request query counts / DB time and pool state, in Prometheus text format.
+
+    Values are per worker process; scrape every worker (or run one per
+    container) to see the whole service.
+    """
+
+    body = render_metrics() + "\n".join(prometheus_pool_metrics()) + "\n"
+    return PlainTextResponse(body, media_type="text/plain; version=0.0.4")
+
+
+@router.get("/pool")
+async def get_pool_metrics():
+    """Connection pool gauges and checkout counters for this worker process.
+
+    ``checkedOut``/``overflow`` are live gauges; ``checkoutWaitMs`` and the
+    counters accumulate since the worker started. Declared ``async`` so it
+    still answers when the threadpool is saturated by requests waiting on the
+    pool.
+    """
+
+    return pool_stats()
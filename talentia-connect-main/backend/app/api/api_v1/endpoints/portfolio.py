@@ -4,7 +4,7 @@ from sqlalchemy.orm import Session
 from ....db.session import SessionLocal
 from ....models.portfolio import Portfolio, PortfolioProject, Certification, Testimonial
 from ....schemas.portfolio import PortfolioOverviewOut
-from .auth import get_current_user
+from .auth import get_current_principal
 
 
 router = APIRouter()
@@ -21,7 +21,7 @@ def get_db():
 @router.get("/me", response_model=PortfolioOverviewOut)
 def get_my_portfolio(
     db: Session = Depends(get_db),
-    current_user=Depends(get_current_user),
+    current_user=Depends(get_current_principal),
 ):
     portfolio = db.query(Portfolio).filter(Portfolio.user_id == current_user.id).first()
     if not portfolio:
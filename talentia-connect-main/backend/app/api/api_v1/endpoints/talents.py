@@ -1,13 +1,20 @@
-from typing import List
+import math
+from typing import List, Optional, Sequence
 
-from fastapi import APIRouter, Depends
-from sqlalchemy import func
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import Row, Select, and_, exists, select, tuple_
 from sqlalchemy.orm import Session
 
+from ....core.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    NEXT_CURSOR_HEADER,
+    decode_cursor,
+    encode_cursor,
+)
 from ....db.session import SessionLocal
 from ....models.assessment import SkillTag, UserSkill
-from ....models.marketplace import Contract, GigApplication
-from ....models.portfolio import RatingReview
+from ....models.talent import TalentStats
 from ....models.university import University
 from ....models.user import User, UserRole
 from ....schemas.talent import TalentOut
@@ -24,70 +31,63 @@ def get_db():
         db.close()
 
 
-@router.get("/", response_model=List[TalentOut])
-def list_talents(db: Session = Depends(get_db)):
-    """Return student talents with aggregated ratings and completed gigs.
-
-    This powers the "View talents" marketplace so companies see live ratings
-    based on RatingReview entries created when contracts are completed.
-    """
-
-    # Aggregate reviews per student
-    review_stats = (
-        db.query(
-            RatingReview.to_user_id.label("user_id"),
-            func.avg(RatingReview.rating).label("avg_rating"),
-            func.count(RatingReview.id).label("reviews_count"),
-        )
-        .group_by(RatingReview.to_user_id)
-        .subquery()
-    )
-
-    # Count completed gigs per student via contracts
-    gig_stats = (
-        db.query(
-            GigApplication.student_id.label("user_id"),
-            func.count(Contract.id).label("completed_gigs"),
-        )
-        .join(Contract, Contract.application_id == GigApplication.id)
-        .filter(Contract.status == "COMPLETED")
-        .group_by(GigApplication.student_id)
-        .subquery()
-    )
+def talents_statement(min_rating: Optional[float], skill: Optional[str], cursor: Optional[str], limit: int) -> Select:
+    """Build the keyset page query behind ``GET /api/talents`` (shared by the sync and async routers)."""
 
-    # Base student query joined with stats
-    rows = (
-        db.query(
+    stmt = (
+        select(
             User.id,
             User.first_name,
             User.last_name,
             User.avatar_url,
             University.name.label("university_name"),
-            review_stats.c.avg_rating,
-            review_stats.c.reviews_count,
-            gig_stats.c.completed_gigs,
+            TalentStats.avg_rating,
+            TalentStats.reviews_count,
+            TalentStats.completed_gigs,
+            TalentStats.top_skills,
         )
-        .join(review_stats, review_stats.c.user_id == User.id)
-        .outerjoin(gig_stats, gig_stats.c.user_id == User.id)
+        .select_from(TalentStats)
+        .join(User, User.id == TalentStats.user_id)
         .outerjoin(University, University.id == User.university_id)
-        .filter(User.role == UserRole.STUDENT)
-        .order_by(review_stats.c.avg_rating.desc())
-        .all()
+        .where(TalentStats.reviews_count > 0, User.role == UserRole.STUDENT)
     )
 
+    if min_rating is not None:
+        stmt = stmt.where(TalentStats.avg_rating >= min_rating)
+    if skill:
+        stmt = stmt.where(
+            exists().where(
+                and_(
+                    UserSkill.user_id == TalentStats.user_id,
+                    UserSkill.skill_id == SkillTag.id,
+                    SkillTag.name.ilike(f"%{skill}%"),
+                )
+            )
+        )
+    if cursor:
+        try:
+            last_rating, last_id = decode_cursor(cursor)
+            if type(last_rating) not in (int, float) or not isinstance(last_id, str):
+                raise TypeError("Invalid cursor")
+            last_rating = float(last_rating)
+            if not math.isfinite(last_rating):
+                raise ValueError("Invalid cursor")
+        except (TypeError, ValueError):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+        stmt = stmt.where(tuple_(TalentStats.avg_rating, TalentStats.user_id) < tuple_(last_rating, last_id))
+
+    return stmt.order_by(TalentStats.avg_rating.desc(), TalentStats.user_id.desc()).limit(limit + 1)
+
+
+def talent_page(rows: Sequence[Row], limit: int, response: Response) -> List[TalentOut]:
+    if len(rows) > limit:
+        rows = rows[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(rows[-1].avg_rating, rows[-1].id)
+
     talents: List[TalentOut] = []
 
     for row in rows:
-        # Fetch up to 5 strongest skills for each student (by level)
-        skill_rows = (
-            db.query(SkillTag.name)
-            .join(UserSkill, UserSkill.skill_id == SkillTag.id)
-            .filter(UserSkill.user_id == row.id)
-            .order_by(UserSkill.level.desc())
-            .limit(5)
-            .all()
-        )
-        skills = [s.name for s in skill_rows]
+        skills = list(row.top_skills or [])
         primary_skill = skills[0] if skills else None
 
         display_name = f"{row.first_name} {row.last_name}".strip() or "Student"
@@ -110,4 +110,26 @@ def list_talents(db: Session = Depends(get_db)):
             )
         )
 
-    return talents
\ No newline at end of file
+    return talents
+
+
+@router.get("/", response_model=List[TalentOut])
+def list_talents(
+    response: Response,
+    minRating: Optional[float] = Query(None, ge=0, le=5),
+    skill: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
+):
+    """Return student talents with aggregated ratings and completed gigs.
+
+    This powers the "View talents" marketplace so companies see live ratings
+    based on RatingReview entries created when contracts are completed. The
+    aggregates come from the materialized ``talent_stats`` table, so a page is
+    a single scan of its (avg_rating, user_id) index. The next page cursor is
+    returned in the ``X-Next-Cursor`` header.
+    """
+
+    stmt = talents_statement(minRating, skill, cursor, limit)
+    return talent_page(db.execute(stmt).all(), limit, response)
@@ -0,0 +1,31 @@
+"""Async twin of ``GET /api/talents``, mounted when ``DB_ASYNC`` is enabled."""
+
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ....core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from ....db.session import AsyncSessionLocal
+from ....schemas.talent import TalentOut
+from .talents import talent_page, talents_statement
+
+router = APIRouter()
+
+
+async def get_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+@router.get("/", response_model=List[TalentOut])
+async def list_talents(
+    response: Response,
+    minRating: Optional[float] = Query(None, ge=0, le=5),
+    skill: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_db),
+):
+    result = await db.execute(talents_statement(minRating, skill, cursor, limit))
+    return talent_page(result.all(), limit, response)
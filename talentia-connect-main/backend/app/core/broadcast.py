@@ -0,0 +1,157 @@
+import asyncio
+import logging
+import threading
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Dict, Optional, Set
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+# Events a subscriber may fall behind by before it is disconnected (clients
+# then resync over HTTP with their last cursor)
+SUBSCRIBER_QUEUE_SIZE = 256
+
+
+class Subscription:
+    """One listener's queue, bound to the event loop it was created on."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self._loop = loop
+        self.queue: "asyncio.Queue[Optional[str]]" = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self.overflowed = False
+
+    def _put(self, data: Optional[str]) -> None:
+        if self.overflowed:
+            return
+        try:
+            self.queue.put_nowait(data)
+        except asyncio.QueueFull:
+            self.overflowed = True
+            # Make room for the sentinel that ends the subscriber's loop
+            self.queue.get_nowait()
+            self.queue.put_nowait(None)
+
+    def push(self, data: str) -> None:
+        """Thread-safe: may be called from worker threads as well as the loop."""
+
+        try:
+            self._loop.call_soon_threadsafe(self._put, data)
+        except RuntimeError:
+            pass  # loop already closed; the subscriber is going away
+
+    async def get(self) -> Optional[str]:
+        """Next event, or ``None`` once the subscriber has been dropped for lagging."""
+
+        return await self.queue.get()
+
+
+class BroadcastBackend:
+    """Transport between publishers and the hub(s) of every worker process."""
+
+    def start(self, deliver: Callable[[str, str], None]) -> None:
+        """Begin handing incoming ``(channel, data)`` events to ``deliver``."""
+
+        self._deliver = deliver
+
+    def publish(self, channel: str, data: str) -> None:
+        raise NotImplementedError
+
+
+class MemoryBroadcastBackend(BroadcastBackend):
+    """Single-process fan-out; events never leave this worker."""
+
+    def publish(self, channel: str, data: str) -> None:
+        self._deliver(channel, data)
+
+
+class RedisBroadcastBackend(BroadcastBackend):
+    """Fan-out across worker processes through Redis pub/sub."""
+
+    def __init__(self, url: str, prefix: str = "talentia:broadcast:"):
+        try:
+            import redis
+        except ImportError as e:  # pragma: no cover - optional dependency
+            raise RuntimeError("BROADCAST_BACKEND=redis requires the 'redis' package") from e
+
+        self.prefix = prefix
+        self._client = redis.Redis.from_url(url)
+
+    def start(self, deliver: Callable[[str, str], None]) -> None:
+        super().start(deliver)
+        pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+        pubsub.psubscribe(f"{self.prefix}*")
+        threading.Thread(target=self._listen, args=(pubsub,), name="broadcast-listener", daemon=True).start()
+
+    def _listen(self, pubsub) -> None:
+        for message in pubsub.listen():
+            try:
+                channel = message["channel"].decode("utf-8")[len(self.prefix):]
+                self._deliver(channel, message["data"].decode("utf-8"))
+            except Exception:  # noqa: BLE001 - keep the listener alive
+                logger.exception("Failed to deliver broadcast event")
+
+    def publish(self, channel: str, data: str) -> None:
+        self._client.publish(self.prefix + channel, data)
+
+
+class Broadcast:
+    """In-process pub/sub hub for pushing events to WebSocket clients.
+
+    ``publish`` may be called from any thread (sync endpoints run in the
+    threadpool); subscribers receive events on their own event loop. The
+    backend decides whether events also reach other worker processes.
+    """
+
+    def __init__(self, backend: BroadcastBackend):
+        self.backend = backend
+        self._subscribers: Dict[str, Set[Subscription]] = {}
+        self._lock = threading.Lock()
+        self._started = False
+
+    def _ensure_started(self) -> None:
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+        self.backend.start(self._deliver)
+
+    def _deliver(self, channel: str, data: str) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers.get(channel, ()))
+        for subscription in subscribers:
+            subscription.push(data)
+
+    def publish(self, channel: str, data: str) -> None:
+        self._ensure_started()
+        self.backend.publish(channel, data)
+
+    @asynccontextmanager
+    async def subscribe(self, channel: str) -> AsyncIterator[Subscription]:
+        self._ensure_started()
+        subscription = Subscription(asyncio.get_running_loop())
+        with self._lock:
+            self._subscribers.setdefault(channel, set()).add(subscription)
+        try:
+            yield subscription
+        finally:
+            with self._lock:
+                subscribers = self._subscribers.get(channel)
+                if subscribers is not None:
+                    subscribers.discard(subscription)
+                    if not subscribers:
+                        del self._subscribers[channel]
+
+
+def create_broadcast() -> Broadcast:
+    if settings.BROADCAST_BACKEND == "redis":
+        url = settings.BROADCAST_URL or settings.CACHE_URL
+        if not url:
+            raise RuntimeError("BROADCAST_BACKEND=redis requires BROADCAST_URL (or CACHE_URL)")
+        return Broadcast(RedisBroadcastBackend(url))
+    if settings.BROADCAST_BACKEND == "memory":
+        return Broadcast(MemoryBroadcastBackend())
+    raise RuntimeError(f"Unknown BROADCAST_BACKEND {settings.BROADCAST_BACKEND!r}")
+
+
+broadcast = create_broadcast()
@@ -0,0 +1,125 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+from .config import settings
+
+
+class CacheBackend:
+    """Minimal key/value interface shared by the in-process and out-of-process caches.
+
+    Values stored by the response cache are always ``bytes`` so any backend
+    that can hold opaque blobs with a TTL can be plugged in.
+    """
+
+    # Local backends are cheap enough to call directly from the event loop;
+    # remote ones are pushed to a worker thread.
+    is_local = True
+
+    def get(self, key: str) -> Optional[Any]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def delete_prefix(self, prefix: str) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        self.delete_prefix("")
+
+
+class MemoryCache(CacheBackend):
+    """Thread-safe in-process LRU cache with a per-entry TTL."""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def delete_prefix(self, prefix: str) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if key.startswith(prefix)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class RedisCache(CacheBackend):
+    """Shared cache for multi-worker deployments (Redis or any protocol-compatible server)."""
+
+    is_local = False
+
+    def __init__(self, url: str, ttl: float = 300.0, key_prefix: str = "talentia:"):
+        try:
+            import redis
+        except ImportError as e:  # pragma: no cover - optional dependency
+            raise RuntimeError("CACHE_BACKEND=redis requires the 'redis' package") from e
+
+        self.ttl = ttl
+        self.key_prefix = key_prefix
+        self._client = redis.Redis.from_url(url)
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._client.get(self.key_prefix + key)
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        self._client.set(self.key_prefix + key, value, px=int((self.ttl if ttl is None else ttl) * 1000))
+
+    def delete(self, key: str) -> None:
+        self._client.delete(self.key_prefix + key)
+
+    def delete_prefix(self, prefix: str) -> None:
+        batch = []
+        for key in self._client.scan_iter(match=f"{self.key_prefix}{prefix}*", count=500):
+            batch.append(key)
+            if len(batch) >= 500:
+                self._client.delete(*batch)
+                batch = []
+        if batch:
+            self._client.delete(*batch)
+
+
+def create_cache_backend() -> CacheBackend:
+    if settings.CACHE_BACKEND == "redis":
+        if not settings.CACHE_URL:
+            raise RuntimeError("CACHE_BACKEND=redis requires CACHE_URL")
+        return RedisCache(settings.CACHE_URL, ttl=settings.CACHE_DEFAULT_TTL)
+    if settings.CACHE_BACKEND == "memory":
+        return MemoryCache(maxsize=settings.CACHE_MAX_ENTRIES, ttl=settings.CACHE_DEFAULT_TTL)
+    raise RuntimeError(f"Unknown CACHE_BACKEND {settings.CACHE_BACKEND!r}")
+
+
+# Shared application cache (response bodies, rendered catalog payloads)
+cache_backend = create_cache_backend()
@@ -1,3 +1,5 @@
+from typing import Literal, Optional
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -6,9 +8,51 @@ class Settings(BaseSettings):
     SECRET_KEY: str
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    # Seconds a loaded User stays in the per-process auth cache (0 disables it)
+    AUTH_USER_CACHE_TTL: float = 60.0
+    # pbkdf2_sha256 iterations; hashes made with other values are upgraded on login.
+    # Hashing runs in PASSWORD_HASH_WORKERS processes per worker (0 = in the threadpool).
+    PASSWORD_HASH_ROUNDS: int = 29000
+    PASSWORD_HASH_WORKERS: int = 2
     CLIENT_ORIGIN: str = "http://localhost:5173"
     PORT: int = 4000
 
+    # Connection pool, sized per worker process: each worker can hold up to
+    # DB_POOL_SIZE + DB_MAX_OVERFLOW connections. DB_POOL_PRE_PING is
+    # "always" (ping on every checkout), "idle" (only connections idle for
+    # DB_POOL_PRE_PING_IDLE_SECONDS or longer) or "never".
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: Literal["always", "idle", "never"] = "idle"
+    DB_POOL_PRE_PING_IDLE_SECONDS: float = 30.0
+
+    # Serve the hot read endpoints (gigs, talents, courses) from an AsyncSession.
+    # ASYNC_DATABASE_URL defaults to DATABASE_URL with an async driver
+    # (postgresql -> asyncpg, sqlite -> aiosqlite).
+    DB_ASYNC: bool = False
+    ASYNC_DATABASE_URL: Optional[str] = None
+
+    # Queries at least this slow are logged (app.sql.slow) with their fingerprint.
+    # SERVER_TIMING adds per-request app/db timings to every response.
+    SLOW_QUERY_MS: float = 200.0
+    SERVER_TIMING: bool = True
+
+    # Response / catalog cache: in-process LRU by default, Redis for multi-worker setups
+    CACHE_BACKEND: Literal["memory", "redis"] = "memory"
+    CACHE_URL: Optional[str] = None
+    CACHE_DEFAULT_TTL: float = 300.0
+    CACHE_MAX_ENTRIES: int = 2048
+
+    # Live chat fan-out: in-process by default, Redis pub/sub across workers
+    # (BROADCAST_URL defaults to CACHE_URL)
+    BROADCAST_BACKEND: Literal["memory", "redis"] = "memory"
+    BROADCAST_URL: Optional[str] = None
+
+    # Mentor availability is entered as wall-clock times in this zone
+    MENTORSHIP_TIMEZONE: str = "Africa/Douala"
+
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
 
 
@@ -0,0 +1,256 @@
+"""Request timing, per-request database accounting and slow-query logging.
+
+``InstrumentationMiddleware`` times every HTTP request and, through the
+``before/after_cursor_execute`` hooks below, counts the queries it ran and the
+time spent in them. Each response gets a ``Server-Timing`` header (visible in
+the browser's network panel), each request is logged as one JSON line on the
+``app.requests`` logger, and the totals feed the Prometheus histograms served
+at ``GET /api/metrics``. Queries slower than ``SLOW_QUERY_MS`` are logged on
+``app.sql.slow`` with a fingerprint that is the same for every execution of
+the same statement shape, so they can be grouped.
+
+Like the pool metrics, everything here is per worker process.
+"""
+
+import bisect
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .config import settings
+
+request_logger = logging.getLogger("app.requests")
+slow_query_logger = logging.getLogger("app.sql.slow")
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 250)
+
+_UNMATCHED_ROUTE = "<unmatched>"
+
+
+class Histogram:
+    """Prometheus-style cumulative histogram, keyed by a tuple of label values."""
+
+    def __init__(self, name: str, documentation: str, buckets: Sequence[float], labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.buckets = tuple(buckets)
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        # labels -> (per-bucket counts with +Inf last, sum)
+        self._series: Dict[Tuple[str, ...], Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, labels: Tuple[str, ...] = ()) -> None:
+        with self._lock:
+            counts, total = self._series.setdefault(labels, ([0] * (len(self.buckets) + 1), [0.0]))
+            counts[bisect.bisect_left(self.buckets, value)] += 1
+            total[0] += value
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            series = [(labels, list(counts), total[0]) for labels, (counts, total) in self._series.items()]
+        for labels, counts, total in sorted(series):
+            base = list(zip(self.labelnames, labels))
+            cumulative = 0
+            for bound, count in zip((*self.buckets, "+Inf"), counts):
+                cumulative += count
+                lines.append(f"{self.name}_bucket{format_labels(base + [('le', _format_bound(bound))])} {cumulative}")
+            lines.append(f"{self.name}_sum{format_labels(base)} {total}")
+            lines.append(f"{self.name}_count{format_labels(base)} {cumulative}")
+        return lines
+
+
+class Counter:
+    def __init__(self, name: str, documentation: str):
+        self.name = name
+        self.documentation = documentation
+        self._lock = threading.Lock()
+        self._value = 0
+
+    def inc(self) -> None:
+        with self._lock:
+            self._value += 1
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter", f"{self.name} {self._value}"]
+
+
+def _format_bound(bound) -> str:
+    return bound if isinstance(bound, str) else repr(float(bound))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_labels(pairs: Sequence[Tuple[str, str]]) -> str:
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds", "Time to the response headers.", LATENCY_BUCKETS, ("method", "route", "status")
+)
+REQUEST_DB_QUERIES = Histogram(
+    "http_request_db_queries", "Database queries per request.", QUERY_COUNT_BUCKETS, ("method", "route")
+)
+REQUEST_DB_DURATION = Histogram(
+    "http_request_db_duration_seconds", "Time spent in database queries per request.", LATENCY_BUCKETS, ("method", "route")
+)
+QUERY_DURATION = Histogram("db_query_duration_seconds", "Duration of single database queries.", LATENCY_BUCKETS)
+SLOW_QUERIES = Counter("db_slow_queries_total", "Queries slower than SLOW_QUERY_MS.")
+
+
+class RequestStats:
+    __slots__ = ("scope", "queries", "db_seconds", "route")
+
+    def __init__(self, scope: Scope):
+        self.scope = scope
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.route = _UNMATCHED_ROUTE
+
+
+# Shared by reference with the threadpool (and the async driver's greenlets),
+# which run with a copy of the request's context.
+_current_request: ContextVar[Optional[RequestStats]] = ContextVar("current_request", default=None)
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"%\([^)]+\)s|\$\d+|(?<!:):\w+|\?|%s")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_statement(statement: str) -> str:
+    """The statement with literals and bind parameters replaced by ``?`` and ``IN`` lists collapsed."""
+
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _PLACEHOLDER.sub("?", normalized)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _PLACEHOLDER_LIST.sub("(?+)", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+def fingerprint(statement: str) -> str:
+    return hashlib.sha1(normalize_statement(statement).encode("utf-8")).hexdigest()[:12]
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_query_timer(_conn, _cursor, _statement, _parameters, context, _executemany) -> None:
+    if context is not None:
+        context._query_started_at = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _record_query(_conn, _cursor, statement, _parameters, context, _executemany) -> None:
+    started_at = getattr(context, "_query_started_at", None)
+    if started_at is None:
+        return
+    elapsed = time.perf_counter() - started_at
+    QUERY_DURATION.observe(elapsed)
+
+    stats = _current_request.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.db_seconds += elapsed
+
+    if elapsed * 1000 >= settings.SLOW_QUERY_MS:
+        SLOW_QUERIES.inc()
+        normalized = normalize_statement(statement)
+        # Parameters are left out on purpose: they may carry personal data
+        slow_query_logger.warning(
+            json.dumps(
+                {
+                    "fingerprint": fingerprint(statement),
+                    "durationMs": round(elapsed * 1000, 2),
+                    "route": _route_label(stats.scope, None) if stats is not None else None,
+                    "statement": normalized[:2000],
+                }
+            )
+        )
+
+
+class InstrumentationMiddleware:
+    """Times HTTP requests and attaches their database cost (see module docstring)."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats(scope)
+        token = _current_request.set(stats)
+        started_at = time.perf_counter()
+        status_code = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                stats.route = _route_label(scope, message)
+                if settings.SERVER_TIMING:
+                    app_ms = (time.perf_counter() - started_at) * 1000
+                    timing = (
+                        f'app;dur={app_ms:.1f}, db;dur={stats.db_seconds * 1000:.1f};desc="{stats.queries} queries"'
+                    )
+                    message["headers"] = [*message.get("headers", []), (b"server-timing", timing.encode("latin-1"))]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current_request.reset(token)
+            elapsed = time.perf_counter() - started_at
+            if stats.route == _UNMATCHED_ROUTE:
+                stats.route = _route_label(scope, None)
+            method = scope["method"]
+            REQUEST_DURATION.observe(elapsed, (method, stats.route, str(status_code)))
+            REQUEST_DB_QUERIES.observe(stats.queries, (method, stats.route))
+            REQUEST_DB_DURATION.observe(stats.db_seconds, (method, stats.route))
+            if request_logger.isEnabledFor(logging.INFO):
+                request_logger.info(
+                    json.dumps(
+                        {
+                            "method": method,
+                            "route": stats.route,
+                            "path": scope["path"],
+                            "status": status_code,
+                            "durationMs": round(elapsed * 1000, 2),
+                            "dbQueries": stats.queries,
+                            "dbMs": round(stats.db_seconds * 1000, 2),
+                        }
+                    )
+                )
+
+
+def _route_label(scope: Scope, start_message: Optional[Message]) -> str:
+    # Label by route template, never by raw path, to keep series bounded
+    route = scope.get("route")
+    if route is not None and getattr(route, "path", None):
+        return route.path
+    # Served by the response cache before routing; those paths are a fixed set
+    if start_message is not None and any(k.lower() == b"x-cache" for k, _ in start_message.get("headers", [])):
+        return scope["path"]
+    return _UNMATCHED_ROUTE
+
+
+def render_metrics() -> str:
+    lines: List[str] = []
+    for metric in (REQUEST_DURATION, REQUEST_DB_QUERIES, REQUEST_DB_DURATION, QUERY_DURATION, SLOW_QUERIES):
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,72 @@
+"""Half-open ``[start, end)`` intervals: a static interval tree and subtraction."""
+
+from typing import Generic, List, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class IntervalTree(Generic[T]):
+    """Static interval tree: which of a fixed set of intervals overlap a range.
+
+    The intervals, sorted by start, form an implicit balanced binary search
+    tree (each range's middle element is its root). Every node also holds
+    the latest end in its subtree, so a query skips whole subtrees that end
+    before the range and, past the range's end, every right subtree: it
+    costs O(log n + matches).
+    """
+
+    def __init__(self, intervals: Sequence[Tuple[T, T]]):
+        self._order = sorted(range(len(intervals)), key=lambda i: intervals[i][0])
+        self._starts = [intervals[i][0] for i in self._order]
+        self._ends = [intervals[i][1] for i in self._order]
+        self._max_end: List[T] = list(self._ends)
+        self._fill(0, len(self._order))
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def _fill(self, lo: int, hi: int) -> None:
+        # Bottom-up: depth stays at log2(n)
+        if hi - lo <= 1:
+            return
+        mid = (lo + hi) // 2
+        self._fill(lo, mid)
+        self._fill(mid + 1, hi)
+        if lo < mid:
+            self._max_end[mid] = max(self._max_end[mid], self._max_end[(lo + mid) // 2])
+        if mid + 1 < hi:
+            self._max_end[mid] = max(self._max_end[mid], self._max_end[(mid + 1 + hi) // 2])
+
+    def overlapping(self, start: T, end: T) -> List[int]:
+        """Positions (in construction order) of the intervals overlapping ``[start, end)``, ascending."""
+
+        found: List[int] = []
+        stack = [(0, len(self._order))]
+        while stack:
+            lo, hi = stack.pop()
+            if lo >= hi:
+                continue
+            mid = (lo + hi) // 2
+            if self._max_end[mid] <= start:
+                continue  # everything below ends before the range
+            stack.append((lo, mid))
+            if self._starts[mid] < end:
+                if self._ends[mid] > start:
+                    found.append(self._order[mid])
+                stack.append((mid + 1, hi))
+        return sorted(found)
+
+
+def subtract(start: T, end: T, cuts: Sequence[Tuple[T, T]]) -> List[Tuple[T, T]]:
+    """What is left of ``[start, end)`` after removing ``cuts``, in order."""
+
+    left: List[Tuple[T, T]] = []
+    for cut_start, cut_end in sorted(cuts):
+        if cut_start > start:
+            left.append((start, min(cut_start, end)))
+        if cut_end > start:
+            start = cut_end
+        if start >= end:
+            return left
+    left.append((start, end))
+    return left
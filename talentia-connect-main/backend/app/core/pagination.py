@@ -0,0 +1,65 @@
+import base64
+import binascii
+import json
+from typing import Any, List, Optional
+
+from fastapi import HTTPException, status
+
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+# Listing endpoints keep returning plain JSON arrays (that is what the frontend
+# expects) and advertise the cursor for the following page in this header.
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# Message history pages in both directions: BEFORE fetches older messages,
+# SINCE polls for anything newer than what the client already holds.
+BEFORE_CURSOR_HEADER = "X-Before-Cursor"
+SINCE_CURSOR_HEADER = "X-Since-Cursor"
+
+
+def encode_cursor(*values: Any) -> str:
+    """Pack the keyset values of the last row of a page into an opaque token."""
+
+    raw = json.dumps(list(values), separators=(",", ":"), default=str)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> List[Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, binascii.Error) as e:
+        raise ValueError("Invalid cursor") from e
+
+    if not isinstance(values, list) or not values:
+        raise ValueError("Invalid cursor")
+    return values
+
+
+def anchor_from_cursor(cursor: str) -> str:
+    """Keyset listings ordered by ``(created_at, id)`` carry just the last row's id."""
+
+    try:
+        (anchor_id,) = decode_cursor(cursor)
+    except ValueError:
+        anchor_id = None
+    if not isinstance(anchor_id, str):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    return anchor_id
+
+
+def offset_from_cursor(cursor: Optional[str]) -> int:
+    """Ranked results page by position; their cursor is an encoded offset."""
+
+    if not cursor:
+        return 0
+    try:
+        (offset,) = decode_cursor(cursor)
+    except ValueError:
+        offset = None
+    # bool is an int too, and a float offset would slice arrays unpredictably
+    if type(offset) is not int or offset < 0:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    return offset
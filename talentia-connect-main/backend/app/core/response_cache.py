@@ -0,0 +1,220 @@
+import hashlib
+import json
+import uuid
+from dataclasses import dataclass
+from itertools import chain
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+from urllib.parse import parse_qsl, urlencode
+
+import anyio
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .cache import CacheBackend
+
+# Headers that are recomputed per response and must not be replayed from the cache
+_UNCACHED_HEADERS = {b"content-length", b"date", b"server", b"set-cookie", b"etag", b"cache-control"}
+
+_PENDING_KEY = "response_cache_invalidations"
+
+# Entry keys embed their namespace's current generation, so a response read
+# from the database before an invalidation is stored under a key nobody asks
+# for any more. Generations outlive every route TTL.
+_GENERATION_PREFIX = "response_cache_generation:"
+_GENERATION_TTL = 24 * 3600.0
+
+
+@dataclass(frozen=True)
+class CachedRoute:
+    """Cache policy for one public GET path."""
+
+    namespace: str
+    ttl: float
+
+
+def _etag(body: bytes) -> str:
+    return '"' + hashlib.sha1(body).hexdigest() + '"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [value.strip() for value in if_none_match.split(",")]
+    return "*" in candidates or any(value.removeprefix("W/") == etag for value in candidates)
+
+
+def _pack(headers: List[Tuple[bytes, bytes]], etag: str, body: bytes) -> bytes:
+    meta = {"etag": etag, "headers": [[k.decode("latin-1"), v.decode("latin-1")] for k, v in headers]}
+    return json.dumps(meta).encode("utf-8") + b"\n" + body
+
+
+def _unpack(entry: bytes) -> Tuple[List[Tuple[bytes, bytes]], str, bytes]:
+    meta, _, body = entry.partition(b"\n")
+    data = json.loads(meta)
+    headers = [(k.encode("latin-1"), v.encode("latin-1")) for k, v in data["headers"]]
+    return headers, data["etag"], body
+
+
+class ResponseCache:
+    """Caches successful anonymous GET responses for a fixed set of routes.
+
+    Entries are keyed by namespace, namespace generation, path and normalized
+    query string, carry a content ETag, and are answered with ``304 Not
+    Modified`` when the client already holds the current body. Namespaces are
+    invalidated explicitly (see :meth:`invalidate_on_commit`) so writes are
+    visible immediately.
+    """
+
+    def __init__(self, backend: CacheBackend, routes: Dict[str, CachedRoute]):
+        self.backend = backend
+        self.routes = {self._normalize(path): route for path, route in routes.items()}
+
+    @staticmethod
+    def _normalize(path: str) -> str:
+        return path.rstrip("/") or "/"
+
+    def _generation(self, namespace: str) -> str:
+        generation = self.backend.get(_GENERATION_PREFIX + namespace)
+        if generation is None:
+            # Never reuse a generation: a fresh one orphans whatever is still stored
+            generation = uuid.uuid4().hex.encode("ascii")
+            self.backend.set(_GENERATION_PREFIX + namespace, generation, _GENERATION_TTL)
+        return generation.decode("ascii")
+
+    def _key(self, route: CachedRoute, path: str, query_string: bytes) -> str:
+        query = urlencode(sorted(parse_qsl(query_string.decode("latin-1"), keep_blank_values=True)))
+        return f"{route.namespace}:{self._generation(route.namespace)}:{self._normalize(path)}?{query}"
+
+    async def _call_backend(self, fn, *args):
+        if self.backend.is_local:
+            return fn(*args)
+        return await anyio.to_thread.run_sync(fn, *args)
+
+    def invalidate(self, namespace: str) -> None:
+        # Bump the generation first: responses being built right now are then
+        # stored under the old one instead of outliving this invalidation.
+        self.backend.set(_GENERATION_PREFIX + namespace, uuid.uuid4().hex.encode("ascii"), _GENERATION_TTL)
+        self.backend.delete_prefix(f"{namespace}:")
+
+    def invalidate_on_commit(
+        self, namespace: str, *models: type, edits: Optional[Dict[type, Sequence[str]]] = None
+    ) -> None:
+        """Drop ``namespace`` whenever a transaction touching any of ``models`` commits.
+
+        ``edits`` maps further models to attribute names: those only count
+        when an existing row has one of the attributes changed.
+        """
+
+        edited = list((edits or {}).items())
+
+        def _touches(session: Session) -> bool:
+            if any(isinstance(obj, models) for obj in chain(session.new, session.dirty, session.deleted)):
+                return True
+            for obj in session.dirty:
+                for model, attributes in edited:
+                    if isinstance(obj, model):
+                        state = inspect(obj)
+                        if any(state.attrs[name].history.has_changes() for name in attributes):
+                            return True
+            return False
+
+        @event.listens_for(Session, "after_flush")
+        def _collect(session: Session, _flush_context) -> None:
+            if _touches(session):
+                pending: Set[str] = session.info.setdefault(_PENDING_KEY, set())
+                pending.add(namespace)
+
+        @event.listens_for(Session, "after_commit")
+        def _invalidate(session: Session) -> None:
+            pending = session.info.get(_PENDING_KEY)
+            if pending and namespace in pending:
+                pending.discard(namespace)
+                self.invalidate(namespace)
+
+        @event.listens_for(Session, "after_rollback")
+        def _discard(session: Session) -> None:
+            pending = session.info.get(_PENDING_KEY)
+            if pending:
+                pending.discard(namespace)
+
+
+class ResponseCacheMiddleware:
+    def __init__(self, app: ASGIApp, cache: ResponseCache):
+        self.app = app
+        self.cache = cache
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        route = self.cache.routes.get(self.cache._normalize(scope["path"]))
+        request_headers = Headers(scope=scope)
+        # Authenticated responses may be tailored to the caller; never share them.
+        if route is None or "authorization" in request_headers:
+            await self.app(scope, receive, send)
+            return
+
+        # The key fixes the generation before the app reads the database
+        key = await self.cache._call_backend(self.cache._key, route, scope["path"], scope["query_string"])
+        entry = await self.cache._call_backend(self.cache.backend.get, key)
+        if entry is not None:
+            headers, etag, body = _unpack(entry)
+            await self._reply(send, request_headers, 200, headers, etag, body, hit=True)
+            return
+
+        start: Dict[str, Message] = {}
+        chunks: List[bytes] = []
+
+        async def capture(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                start["message"] = message
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        await self.app(scope, receive, capture)
+
+        status_code = start["message"]["status"]
+        headers = [(k, v) for k, v in start["message"].get("headers", []) if k.lower() not in _UNCACHED_HEADERS]
+        body = b"".join(chunks)
+
+        if status_code != 200:
+            await send({"type": "http.response.start", "status": status_code, "headers": start["message"]["headers"]})
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        etag = _etag(body)
+        await self.cache._call_backend(self.cache.backend.set, key, _pack(headers, etag, body), route.ttl)
+        await self._reply(send, request_headers, status_code, headers, etag, body, hit=False)
+
+    @staticmethod
+    async def _reply(
+        send: Send,
+        request_headers: Headers,
+        status_code: int,
+        headers: List[Tuple[bytes, bytes]],
+        etag: str,
+        body: bytes,
+        hit: bool,
+    ) -> None:
+        # Clients revalidate on every use; unchanged payloads cost a bodiless 304.
+        common = [
+            (b"etag", etag.encode("latin-1")),
+            (b"cache-control", b"no-cache"),
+            (b"x-cache", b"HIT" if hit else b"MISS"),
+        ]
+        if _etag_matches(request_headers.get("if-none-match"), etag):
+            await send({"type": "http.response.start", "status": 304, "headers": common})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status_code,
+                "headers": headers + common + [(b"content-length", str(len(body)).encode("latin-1"))],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
@@ -1,14 +1,27 @@
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any, Optional
+from typing import Any, Optional, Tuple
 
 from jose import JWTError, jwt
 from passlib.context import CryptContext
+from starlette.concurrency import run_in_threadpool
 
 from .config import settings
 
 
 # Use pbkdf2_sha256 to avoid bcrypt's 72-byte password length limitation and backend issues.
-pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
+# Pinning min and max rounds to the configured value makes verify_and_update
+# flag every hash made with other parameters, so they are upgraded on login.
+pwd_context = CryptContext(
+    schemes=["pbkdf2_sha256"],
+    deprecated="auto",
+    pbkdf2_sha256__default_rounds=settings.PASSWORD_HASH_ROUNDS,
+    pbkdf2_sha256__min_rounds=settings.PASSWORD_HASH_ROUNDS,
+    pbkdf2_sha256__max_rounds=settings.PASSWORD_HASH_ROUNDS,
+)
 ALGORITHM = "HS256"
 
 
@@ -20,7 +33,65 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
-def create_access_token(subject: str, role: str, expires_delta: Optional[timedelta] = None) -> str:
+def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """``(valid, new_hash)``; ``new_hash`` is set when the stored hash uses outdated parameters."""
+
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
+_hasher: Optional[Executor] = None
+_hasher_lock = threading.Lock()
+
+
+def _password_hasher() -> Optional[Executor]:
+    global _hasher
+    if settings.PASSWORD_HASH_WORKERS <= 0:
+        return None
+    with _hasher_lock:
+        if _hasher is None:
+            # spawn, not fork: the server process has threads (and possibly an event loop) running.
+            # Scripts that log users in must therefore guard their entry point with __main__.
+            _hasher = ProcessPoolExecutor(
+                max_workers=settings.PASSWORD_HASH_WORKERS, mp_context=multiprocessing.get_context("spawn")
+            )
+        return _hasher
+
+
+async def _run_hashing(fn, *args):
+    hasher = _password_hasher()
+    if hasher is None:
+        return await run_in_threadpool(fn, *args)
+    return await asyncio.get_running_loop().run_in_executor(hasher, fn, *args)
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash in the password worker pool so the request thread and the GIL stay free."""
+
+    return await _run_hashing(get_password_hash, password)
+
+
+async def verify_and_update_password_async(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    return await _run_hashing(verify_and_update_password, plain_password, hashed_password)
+
+
+def shutdown_password_hasher() -> None:
+    global _hasher
+    with _hasher_lock:
+        hasher, _hasher = _hasher, None
+    if hasher is not None:
+        hasher.shutdown(wait=False, cancel_futures=True)
+
+
+def create_access_token(
+    subject: str,
+    role: str,
+    expires_delta: Optional[timedelta] = None,
+    *,
+    first_name: Optional[str] = None,
+    last_name: Optional[str] = None,
+    email: Optional[str] = None,
+    session_id: Optional[str] = None,
+) -> str:
     if expires_delta is None:
         expires_delta = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
 
@@ -29,6 +100,17 @@ def create_access_token(subject: str, role: str, expires_delta: Optional[timedel
         "role": role,
         "exp": datetime.now(timezone.utc) + expires_delta,
     }
+    # Identity claims let authorization checks skip the users table; see
+    # get_current_principal in the auth endpoints.
+    if first_name is not None:
+        to_encode["given_name"] = first_name
+    if last_name is not None:
+        to_encode["family_name"] = last_name
+    if email is not None:
+        to_encode["email"] = email
+    # The refresh-token family this token was issued for, so logging out revokes it
+    if session_id is not None:
+        to_encode["sid"] = session_id
     return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=ALGORITHM)
 
 
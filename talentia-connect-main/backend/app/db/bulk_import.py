@@ -0,0 +1,465 @@
+"""Bulk import of universities, users, enrolments, gigs and skills.
+
+Streams a CSV or JSON Lines file (picked by extension) and writes it in
+chunks of batched ``INSERT ... ON CONFLICT DO NOTHING``, so a university with
+tens of thousands of students loads in minutes instead of the hours that
+``get_or_create`` per row would take. Run from the backend directory, parents
+before children:
+
+  python -m app.db.bulk_import universities universities.csv
+  python -m app.db.bulk_import users students.jsonl --workers 8
+  python -m app.db.bulk_import university_students enrolments.csv
+  python -m app.db.bulk_import skill_tags skills.csv
+  python -m app.db.bulk_import user_skills user_skills.csv
+  python -m app.db.bulk_import gigs gigs.jsonl
+
+Records refer to each other by natural key (university ``slug``, user
+``email``, skill ``name``); unknown references are reported and skipped.
+Re-running a file never duplicates rows. After every committed chunk the
+number of records done is written to ``<file>.checkpoint``, and an
+interrupted import resumes from there (``--restart`` ignores it).
+
+Passwords are hashed in a process pool. Users without a ``password`` get a
+random one and have to reset it before signing in.
+"""
+
+import argparse
+import csv
+import json
+import os
+import secrets
+import sys
+import time
+import uuid
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import Table, select, tuple_
+from sqlalchemy.engine import Connection
+
+from .. import models  # noqa: F401  # ensure all models are registered on Base
+from ..core.security import get_password_hash
+from ..db.session import SessionLocal, engine
+from ..models.assessment import SkillTag, UserSkill
+from ..models.marketplace import Gig
+from ..models.university import SubscriptionStatus, University, UniversityStudent
+from ..models.user import User, UserRole
+
+DEFAULT_BATCH_SIZE = 1000
+
+# Ids of imported rows are derived from their natural key, so a chunk that is
+# replayed after a crash inserts nothing new.
+_ID_NAMESPACE = uuid.UUID("5b0c1a52-6f5e-4c0e-9a44-7d1f3c2b8e61")
+
+
+class RecordError(ValueError):
+    """A record that cannot be imported (missing field, unknown reference, bad value)."""
+
+
+def _stable_id(*parts: str) -> str:
+    return str(uuid.uuid5(_ID_NAMESPACE, "\x1f".join(parts)))
+
+
+def _value(record: Dict[str, Any], key: str) -> Optional[str]:
+    value = record.get(key)
+    if value is None:
+        return None
+    value = str(value).strip()
+    return value or None
+
+
+def _required(record: Dict[str, Any], key: str) -> str:
+    value = _value(record, key)
+    if value is None:
+        raise RecordError(f"missing {key!r}")
+    return value
+
+
+def _number(record: Dict[str, Any], key: str, cast: Callable = float):
+    value = _value(record, key)
+    if value is None:
+        return None
+    try:
+        return cast(value)
+    except ValueError:
+        raise RecordError(f"{key!r} is not a number: {value!r}")
+
+
+def _datetime(record: Dict[str, Any], key: str) -> Optional[datetime]:
+    value = _value(record, key)
+    if value is None:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        raise RecordError(f"{key!r} is not an ISO 8601 date: {value!r}")
+
+
+def _enum(record: Dict[str, Any], key: str, enum_type, default=None):
+    value = _value(record, key)
+    if value is None:
+        return default
+    try:
+        return enum_type(value.upper())
+    except ValueError:
+        raise RecordError(f"unknown {key} {value!r}")
+
+
+def _ids(connection: Connection, key_column, id_column, keys: Iterable[str]) -> Dict[str, str]:
+    """Map natural keys to ids with one query per chunk."""
+
+    keys = list(set(keys))
+    if not keys:
+        return {}
+    return dict(connection.execute(select(key_column, id_column).where(key_column.in_(keys))).all())
+
+
+def _existing_pairs(connection: Connection, first, second, pairs: Iterable[Tuple[str, str]]) -> Set[Tuple[str, str]]:
+    pairs = list(set(pairs))
+    if not pairs:
+        return set()
+    rows = connection.execute(select(first, second).where(tuple_(first, second).in_(pairs)))
+    return {tuple(row) for row in rows}
+
+
+@dataclass
+class ChunkContext:
+    connection: Connection
+    hasher: Executor
+    workers: int
+    errors: List[str] = field(default_factory=list)
+
+    def reject(self, position: int, error: RecordError) -> None:
+        self.errors.append(f"record {position}: {error}")
+
+
+Record = Tuple[int, Dict[str, Any]]
+
+
+def _university_rows(ctx: ChunkContext, records: Sequence[Record]) -> List[dict]:
+    rows = []
+    for position, record in records:
+        try:
+            slug = _required(record, "slug")
+            rows.append(
+                {
+                    "id": _stable_id("university", slug),
+                    "slug": slug,
+                    "name": _required(record, "name"),
+                    "logo_url": _value(record, "logo_url"),
+                    "country": _value(record, "country"),
+                    "city": _value(record, "city"),
+                    "subscription_plan": _value(record, "subscription_plan"),
+                    "subscription_status": _enum(record, "subscription_status", SubscriptionStatus),
+                }
+            )
+        except RecordError as e:
+            ctx.reject(position, e)
+    return rows
+
+
+def _user_rows(ctx: ChunkContext, records: Sequence[Record]) -> List[dict]:
+    universities = _ids(
+        ctx.connection, University.slug, University.id, filter(None, (_value(r, "university") for _, r in records))
+    )
+    rows, passwords = [], []
+    for position, record in records:
+        try:
+            email = _required(record, "email").lower()
+            university = _value(record, "university")
+            if university is not None and university not in universities:
+                raise RecordError(f"unknown university {university!r}")
+            rows.append(
+                {
+                    "id": _stable_id("user", email),
+                    "email": email,
+                    "first_name": _required(record, "first_name"),
+                    "last_name": _required(record, "last_name"),
+                    "role": _enum(record, "role", UserRole, UserRole.STUDENT),
+                    "university_id": universities.get(university),
+                    "department": _value(record, "department"),
+                    "matric_number": _value(record, "matric_number"),
+                    "avatar_url": _value(record, "avatar_url"),
+                    "bio": _value(record, "bio"),
+                }
+            )
+            passwords.append(_value(record, "password") or secrets.token_urlsafe(24))
+        except RecordError as e:
+            ctx.reject(position, e)
+
+    # Hashing dominates user imports; spread it over every core
+    chunksize = max(1, len(passwords) // (ctx.workers * 4))
+    for row, password_hash in zip(rows, ctx.hasher.map(get_password_hash, passwords, chunksize=chunksize)):
+        row["password_hash"] = password_hash
+    return rows
+
+
+def _university_student_rows(ctx: ChunkContext, records: Sequence[Record]) -> List[dict]:
+    universities = _ids(ctx.connection, University.slug, University.id, (_value(r, "university") or "" for _, r in records))
+    users = _ids(ctx.connection, User.email, User.id, ((_value(r, "email") or "").lower() for _, r in records))
+    rows = []
+    for position, record in records:
+        try:
+            university_id = universities.get(_required(record, "university"))
+            user_id = users.get(_required(record, "email").lower())
+            if university_id is None or user_id is None:
+                raise RecordError("unknown university or user")
+            rows.append(
+                {
+                    "id": _stable_id("university_student", university_id, user_id),
+                    "university_id": university_id,
+                    "user_id": user_id,
+                    "faculty": _value(record, "faculty"),
+                    "department": _value(record, "department"),
+                    "cohort_year": _value(record, "cohort_year"),
+                }
+            )
+        except RecordError as e:
+            ctx.reject(position, e)
+
+    # Enrolments made through the app have random ids; skip pairs that already exist
+    existing = _existing_pairs(
+        ctx.connection,
+        UniversityStudent.university_id,
+        UniversityStudent.user_id,
+        ((row["university_id"], row["user_id"]) for row in rows),
+    )
+    return [row for row in rows if (row["university_id"], row["user_id"]) not in existing]
+
+
+def _skill_tag_rows(ctx: ChunkContext, records: Sequence[Record]) -> List[dict]:
+    rows = []
+    for position, record in records:
+        try:
+            name = _required(record, "name")
+            rows.append({"id": _stable_id("skill_tag", name), "name": name, "category": _value(record, "category")})
+        except RecordError as e:
+            ctx.reject(position, e)
+    return rows
+
+
+def _user_skill_rows(ctx: ChunkContext, records: Sequence[Record]) -> List[dict]:
+    users = _ids(ctx.connection, User.email, User.id, ((_value(r, "email") or "").lower() for _, r in records))
+    skills = _ids(ctx.connection, SkillTag.name, SkillTag.id, (_value(r, "skill") or "" for _, r in records))
+    rows = []
+    for position, record in records:
+        try:
+            user_id = users.get(_required(record, "email").lower())
+            skill_id = skills.get(_required(record, "skill"))
+            if user_id is None or skill_id is None:
+                raise RecordError("unknown user or skill")
+            level = _number(record, "level", int)
+            if level is None:
+                raise RecordError("missing 'level'")
+            rows.append(
+                {
+                    "id": _stable_id("user_skill", user_id, skill_id),
+                    "user_id": user_id,
+                    "skill_id": skill_id,
+                    "level": level,
+                    "source": _value(record, "source") or "IMPORT",
+                }
+            )
+        except RecordError as e:
+            ctx.reject(position, e)
+
+    existing = _existing_pairs(
+        ctx.connection, UserSkill.user_id, UserSkill.skill_id, ((row["user_id"], row["skill_id"]) for row in rows)
+    )
+    return [row for row in rows if (row["user_id"], row["skill_id"]) not in existing]
+
+
+def _gig_rows(ctx: ChunkContext, records: Sequence[Record]) -> List[dict]:
+    companies = _ids(ctx.connection, User.email, User.id, ((_value(r, "company") or "").lower() for _, r in records))
+    rows = []
+    for position, record in records:
+        try:
+            company = _required(record, "company").lower()
+            company_id = companies.get(company)
+            if company_id is None:
+                raise RecordError(f"unknown company {company!r}")
+            title = _required(record, "title")
+            row = {
+                # Source systems usually have their own id; otherwise company + title identify a gig
+                "id": _stable_id("gig", _value(record, "external_id") or f"{company}\x1f{title}"),
+                "company_id": company_id,
+                "title": title,
+                "description": _value(record, "description"),
+                "role": _value(record, "role"),
+                "budget_min": _number(record, "budget_min"),
+                "budget_max": _number(record, "budget_max"),
+                "location": _value(record, "location"),
+                "type": _value(record, "type"),
+                "category": _value(record, "category"),
+                "deadline": _datetime(record, "deadline"),
+                "status": (_value(record, "status") or "OPEN").upper(),
+            }
+            created_at = _datetime(record, "created_at")
+            if created_at is not None:
+                row["created_at"] = created_at
+            rows.append(row)
+        except RecordError as e:
+            ctx.reject(position, e)
+    # Executemany needs every row to have the same keys
+    if any("created_at" in row for row in rows):
+        now = datetime.now().astimezone()
+        for row in rows:
+            row.setdefault("created_at", now)
+    return rows
+
+
+@dataclass(frozen=True)
+class Importer:
+    table: Table
+    conflict_columns: Tuple[str, ...]
+    build_rows: Callable[[ChunkContext, Sequence[Record]], List[dict]]
+
+
+IMPORTERS: Dict[str, Importer] = {
+    "universities": Importer(University.__table__, ("slug",), _university_rows),
+    "users": Importer(User.__table__, ("email",), _user_rows),
+    "university_students": Importer(UniversityStudent.__table__, ("id",), _university_student_rows),
+    "skill_tags": Importer(SkillTag.__table__, ("name",), _skill_tag_rows),
+    "user_skills": Importer(UserSkill.__table__, ("id",), _user_skill_rows),
+    "gigs": Importer(Gig.__table__, ("id",), _gig_rows),
+}
+
+
+def _insert_ignoring_conflicts(connection: Connection, importer: Importer, rows: List[dict]) -> int:
+    dialect_name = connection.dialect.name
+    if dialect_name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect_name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise RuntimeError(f"Bulk import does not support {dialect_name!r} databases")
+
+    # RETURNING counts what was actually inserted; executemany rowcounts vary by driver
+    stmt = (
+        insert(importer.table)
+        .on_conflict_do_nothing(index_elements=list(importer.conflict_columns))
+        .returning(importer.table.c.id)
+    )
+    return len(connection.execute(stmt, rows).all())
+
+
+def read_records(path: str) -> Iterator[Dict[str, Any]]:
+    """Stream records from a ``.csv`` (header row) or ``.jsonl`` file."""
+
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        if path.endswith((".jsonl", ".ndjson")):
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        elif path.endswith(".csv"):
+            yield from csv.DictReader(f)
+        else:
+            raise SystemExit(f"Unsupported file type: {path} (expected .csv or .jsonl)")
+
+
+def _read_checkpoint(path: str, entity: str) -> int:
+    try:
+        with open(path, encoding="utf-8") as f:
+            checkpoint = json.load(f)
+    except FileNotFoundError:
+        return 0
+    if checkpoint.get("entity") != entity:
+        raise SystemExit(f"{path} belongs to a {checkpoint.get('entity')!r} import; pass --restart to ignore it")
+    return int(checkpoint["done"])
+
+
+def _write_checkpoint(path: str, entity: str, done: int) -> None:
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"entity": entity, "done": done}, f)
+    os.replace(tmp, path)
+
+
+def run_import(
+    entity: str,
+    path: str,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    workers: Optional[int] = None,
+    restart: bool = False,
+) -> Dict[str, int]:
+    importer = IMPORTERS[entity]
+    checkpoint_path = path + ".checkpoint"
+    done = 0 if restart else _read_checkpoint(checkpoint_path, entity)
+    workers = workers or os.cpu_count() or 1
+    resumed_from = done
+    totals = {"records": done, "inserted": 0, "skipped": 0, "rejected": 0}
+
+    records = enumerate(read_records(path), start=1)
+    if done:
+        print(f"Resuming {entity} after record {done}", file=sys.stderr)
+        records = islice(records, done, None)
+
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as hasher:
+        while True:
+            chunk = list(islice(records, batch_size))
+            if not chunk:
+                break
+            with engine.begin() as connection:
+                ctx = ChunkContext(connection, hasher, workers)
+                rows = importer.build_rows(ctx, chunk)
+                inserted = _insert_ignoring_conflicts(connection, importer, rows) if rows else 0
+
+            done = chunk[-1][0]
+            _write_checkpoint(checkpoint_path, entity, done)
+            for error in ctx.errors:
+                print(f"  skipped {error}", file=sys.stderr)
+            totals["records"] = done
+            totals["inserted"] += inserted
+            totals["rejected"] += len(ctx.errors)
+            totals["skipped"] += len(chunk) - len(ctx.errors) - inserted
+            rate = (done - resumed_from) / max(time.perf_counter() - started, 1e-9)
+            print(
+                f"{entity}: {done} records ({totals['inserted']} inserted, {totals['skipped']} already present, "
+                f"{totals['rejected']} rejected) {rate:,.0f}/s",
+                file=sys.stderr,
+            )
+
+    _after_import(entity)
+    if os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    return totals
+
+
+def _after_import(entity: str) -> None:
+    """Refresh the derived tables that ORM hooks would have kept current."""
+
+    if entity == "gigs":
+        from ..services.gig_search import rebuild_search_index
+
+        with engine.begin() as connection:
+            rebuild_search_index(connection)
+    elif entity == "user_skills":
+        from ..services.talent_stats import rebuild_talent_stats
+
+        with SessionLocal() as db:
+            rebuild_talent_stats(db)
+            db.commit()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Bulk import Talentia data from CSV or JSON Lines.")
+    parser.add_argument("entity", choices=sorted(IMPORTERS))
+    parser.add_argument("path")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--workers", type=int, default=None, help="password hashing processes (default: CPUs)")
+    parser.add_argument("--restart", action="store_true", help="ignore an existing checkpoint")
+    args = parser.parse_args(argv)
+
+    totals = run_import(args.entity, args.path, args.batch_size, args.workers, args.restart)
+    print(
+        f"Imported {args.entity}: {totals['inserted']} inserted, {totals['skipped']} already present, "
+        f"{totals['rejected']} rejected."
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Schema migrations (Alembic; revisions live in ``backend/migrations``).
+
+The API never creates or alters tables on startup. Bring a database up to
+date before starting (or after deploying) the server, from the backend
+directory:
+
+    python -m app.db.migrations
+
+This is ``alembic upgrade head``, except that a database created by the old
+``create_all`` at startup (tables present, no ``alembic_version``) is first
+stamped at the baseline revision. It has at least the baseline's tables, and
+``0006_create_all_catch_up`` adds whatever it lacks of those ``create_all``
+picked up later. A database missing any baseline table is not stamped; the
+upgrade stops and names them instead. Plain ``alembic`` commands work too,
+e.g. ``alembic revision --autogenerate -m "..."`` after changing a model.
+"""
+
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import inspect
+
+from .session import engine
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+BASELINE_REVISION = "0001_baseline"
+# The tables 0001_baseline creates; create_all made all of them from day one
+BASELINE_TABLES = frozenset(
+    {
+        "activity_logs", "assessment_answers", "assessment_attempts", "assessment_categories",
+        "assessment_questions", "assessment_results", "certifications", "contracts", "conversations",
+        "course_categories", "course_certificates", "course_enrollments", "course_modules", "courses",
+        "gig_applications", "gigs", "lessons", "library_categories", "library_resources",
+        "mentor_availabilities", "mentor_profiles", "mentorship_feedback", "mentorship_sessions", "messages",
+        "payments", "payouts", "portfolio_projects", "portfolios", "quiz_answer_options", "quiz_questions",
+        "quiz_submission_answers", "quiz_submissions", "rating_reviews", "skill_tags", "testimonials",
+        "universities", "university_students", "user_skills", "users", "work_submissions",
+    }
+)
+
+
+def alembic_config() -> Config:
+    # No ini file: callers keep their own logging setup
+    config = Config()
+    config.set_main_option("script_location", str(BACKEND_DIR / "migrations"))
+    return config
+
+
+def upgrade_database(revision: str = "head") -> None:
+    config = alembic_config()
+    with engine.connect() as connection:
+        tables = set(inspect(connection).get_table_names())
+        # End the inspection's implicit transaction; Alembic manages its own
+        connection.rollback()
+        config.attributes["connection"] = connection
+        if "alembic_version" not in tables and tables & BASELINE_TABLES:
+            missing = BASELINE_TABLES - tables
+            if missing:
+                raise RuntimeError(
+                    f"Refusing to stamp {BASELINE_REVISION}: the database has no alembic_version and lacks "
+                    f"baseline tables {', '.join(sorted(missing))}"
+                )
+            command.stamp(config, BASELINE_REVISION)
+        command.upgrade(config, revision)
+
+
+if __name__ == "__main__":
+    upgrade_database()
+    print("Database schema is up to date.")
@@ -0,0 +1,237 @@
+"""Connection pool configuration and instrumentation.
+
+Both engines (sync and, when enabled, async) use a ``QueuePool`` subclass that
+times every checkout, so slow checkouts and ``QueuePool limit`` timeouts show
+up in ``GET /api/metrics/pool`` before they show up as failed requests.
+"""
+
+import bisect
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+from ..core.config import settings
+
+# Upper bounds (ms) of the checkout wait histogram; the last bucket is +Inf
+WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+_LAST_CHECKIN = "last_checkin"
+
+
+class PoolMetrics:
+    """Per-process counters for one engine's pool."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.pings = 0
+        self.ping_failures = 0
+        self.wait_total_ms = 0.0
+        self.wait_max_ms = 0.0
+        self.wait_buckets = [0] * (len(WAIT_BUCKETS_MS) + 1)
+
+    def record_wait(self, elapsed_ms: float, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.wait_total_ms += elapsed_ms
+            self.wait_max_ms = max(self.wait_max_ms, elapsed_ms)
+            self.wait_buckets[bisect.bisect_left(WAIT_BUCKETS_MS, elapsed_ms)] += 1
+
+    def incr(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+
+class InstrumentedQueuePool(QueuePool):
+    """``QueuePool`` that reports how long each checkout waited for a connection."""
+
+    metrics: Optional[PoolMetrics] = None
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            record = super()._do_get()
+        except exc.TimeoutError:
+            if self.metrics is not None:
+                self.metrics.record_wait((time.perf_counter() - start) * 1000, timed_out=True)
+            raise
+        if self.metrics is not None:
+            self.metrics.record_wait((time.perf_counter() - start) * 1000)
+        return record
+
+    def recreate(self):
+        # engine.dispose() swaps in a fresh pool; keep reporting into the same metrics
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+class InstrumentedAsyncQueuePool(InstrumentedQueuePool, AsyncAdaptedQueuePool):
+    pass
+
+
+_instrumented: Dict[str, Tuple[Engine, PoolMetrics]] = {}
+
+
+def _is_memory_sqlite(url: str) -> bool:
+    parsed = make_url(url)
+    database = parsed.database or ""
+    return parsed.get_backend_name() == "sqlite" and (
+        database in ("", ":memory:") or "mode=memory" in database or parsed.query.get("mode") == "memory"
+    )
+
+
+def pool_options(url: str, is_async: bool = False) -> Dict[str, Any]:
+    """Keyword arguments for ``create_engine`` / ``create_async_engine`` from settings."""
+
+    options: Dict[str, Any] = {"pool_pre_ping": settings.DB_POOL_PRE_PING == "always"}
+    # In-memory SQLite needs its single shared connection; leave its pool alone.
+    if _is_memory_sqlite(url):
+        return options
+    options.update(
+        poolclass=InstrumentedAsyncQueuePool if is_async else InstrumentedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_use_lifo=True,
+    )
+    return options
+
+
+def instrument_engine(name: str, engine: Engine) -> PoolMetrics:
+    """Attach metrics and the idle pre-ping strategy to ``engine``'s pool."""
+
+    pool = engine.pool
+    metrics = PoolMetrics(name)
+    if isinstance(pool, InstrumentedQueuePool):
+        pool.metrics = metrics
+    dialect = engine.dialect
+
+    @event.listens_for(pool, "connect")
+    def _on_connect(_dbapi_connection, connection_record) -> None:
+        metrics.incr("connects")
+        connection_record.info[_LAST_CHECKIN] = time.monotonic()
+
+    @event.listens_for(pool, "checkin")
+    def _on_checkin(_dbapi_connection, connection_record) -> None:
+        if connection_record is not None:
+            connection_record.info[_LAST_CHECKIN] = time.monotonic()
+
+    @event.listens_for(pool, "invalidate")
+    def _on_invalidate(_dbapi_connection, _connection_record, _exception) -> None:
+        metrics.incr("invalidations")
+
+    if settings.DB_POOL_PRE_PING == "idle":
+
+        @event.listens_for(pool, "checkout")
+        def _ping_if_idle(dbapi_connection, connection_record, _connection_proxy) -> None:
+            # Only connections that sat unused long enough to be dropped by a
+            # firewall or server timeout pay for the extra round trip.
+            idle_for = time.monotonic() - connection_record.info.get(_LAST_CHECKIN, 0.0)
+            if idle_for < settings.DB_POOL_PRE_PING_IDLE_SECONDS:
+                return
+            metrics.incr("pings")
+            try:
+                dialect.do_ping(dbapi_connection)
+            except Exception as e:
+                metrics.incr("ping_failures")
+                # The pool discards this connection and retries with a fresh one
+                raise exc.DisconnectionError() from e
+
+    _instrumented[name] = (engine, metrics)
+    return metrics
+
+
+def pool_snapshot(name: str, engine: Engine, metrics: PoolMetrics) -> Dict[str, Any]:
+    pool: Pool = engine.pool
+    snapshot: Dict[str, Any] = {"name": name, "poolClass": type(pool).__name__, "prePing": settings.DB_POOL_PRE_PING}
+
+    if isinstance(pool, QueuePool):
+        snapshot.update(
+            size=pool.size(),
+            maxOverflow=pool._max_overflow,
+            timeout=pool.timeout(),
+            recycle=pool._recycle,
+            checkedOut=pool.checkedout(),
+            checkedIn=pool.checkedin(),
+            overflow=max(pool.overflow(), 0),
+        )
+
+    with metrics._lock:
+        completed = metrics.checkouts + metrics.timeouts
+        snapshot.update(
+            checkouts=metrics.checkouts,
+            timeouts=metrics.timeouts,
+            connects=metrics.connects,
+            invalidations=metrics.invalidations,
+            pings=metrics.pings,
+            pingFailures=metrics.ping_failures,
+            checkoutWaitMs={
+                "total": round(metrics.wait_total_ms, 3),
+                "avg": round(metrics.wait_total_ms / completed, 3) if completed else 0.0,
+                "max": round(metrics.wait_max_ms, 3),
+                "buckets": {
+                    **{str(bound): count for bound, count in zip(WAIT_BUCKETS_MS, metrics.wait_buckets)},
+                    "+Inf": metrics.wait_buckets[-1],
+                },
+            },
+        )
+    return snapshot
+
+
+def pool_stats() -> Dict[str, Any]:
+    """Current pool state for every instrumented engine in this worker process."""
+
+    pools: List[Dict[str, Any]] = [
+        pool_snapshot(name, engine, metrics) for name, (engine, metrics) in _instrumented.items()
+    ]
+    return {"pid": os.getpid(), "pools": pools}
+
+
+def prometheus_pool_metrics() -> List[str]:
+    """``pool_stats`` in the Prometheus text format, for ``GET /api/metrics``."""
+
+    gauges = {
+        "checkedOut": ("db_pool_checked_out", "Connections currently checked out."),
+        "checkedIn": ("db_pool_checked_in", "Idle connections in the pool."),
+        "overflow": ("db_pool_overflow", "Connections open beyond pool_size."),
+        "size": ("db_pool_size", "Configured pool_size."),
+    }
+    counters = {
+        "checkouts": ("db_pool_checkouts_total", "Successful connection checkouts."),
+        "timeouts": ("db_pool_timeouts_total", "Checkouts that timed out waiting for a connection."),
+        "connects": ("db_pool_connects_total", "New database connections opened."),
+        "invalidations": ("db_pool_invalidations_total", "Connections invalidated."),
+    }
+    pools = pool_stats()["pools"]
+    lines: List[str] = []
+    for kind, metrics in (("gauge", gauges), ("counter", counters)):
+        for key, (name, documentation) in metrics.items():
+            lines += [f"# HELP {name} {documentation}", f"# TYPE {name} {kind}"]
+            lines += [f'{name}{{pool="{pool["name"]}"}} {pool[key]}' for pool in pools if key in pool]
+
+    name = "db_pool_checkout_wait_seconds"
+    lines += [f"# HELP {name} Time spent waiting for a pooled connection.", f"# TYPE {name} histogram"]
+    for pool in pools:
+        wait = pool["checkoutWaitMs"]
+        cumulative = 0
+        for bound, count in zip((*WAIT_BUCKETS_MS, None), (*wait["buckets"].values(),)):
+            cumulative += count
+            le = "+Inf" if bound is None else repr(bound / 1000)
+            lines.append(f'{name}_bucket{{pool="{pool["name"]}",le="{le}"}} {cumulative}')
+        lines.append(f'{name}_sum{{pool="{pool["name"]}"}} {wait["total"] / 1000}')
+        lines.append(f'{name}_count{{pool="{pool["name"]}"}} {cumulative}')
+    return lines
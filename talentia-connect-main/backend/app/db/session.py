@@ -1,12 +1,47 @@
+from typing import Optional
+
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, DeclarativeBase
 
 from ..core.config import settings
+from .pool import instrument_engine, pool_options
 
 
 class Base(DeclarativeBase):
     pass
 
 
-engine = create_engine(settings.DATABASE_URL, pool_pre_ping=True)
+engine = create_engine(settings.DATABASE_URL, **pool_options(settings.DATABASE_URL))
+instrument_engine("sync", engine)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def async_database_url(url: str) -> str:
+    """Map a sync DATABASE_URL onto the matching async driver."""
+
+    for sync_prefix, async_prefix in (
+        ("postgresql+psycopg2://", "postgresql+asyncpg://"),
+        ("postgresql://", "postgresql+asyncpg://"),
+        ("postgres://", "postgresql+asyncpg://"),
+        ("sqlite+pysqlite://", "sqlite+aiosqlite://"),
+        ("sqlite://", "sqlite+aiosqlite://"),
+    ):
+        if url.startswith(sync_prefix):
+            return async_prefix + url[len(sync_prefix):]
+    return url
+
+
+def build_async_engine(url: Optional[str] = None) -> AsyncEngine:
+    url = url or settings.ASYNC_DATABASE_URL or async_database_url(settings.DATABASE_URL)
+    return create_async_engine(url, **pool_options(url, is_async=True))
+
+
+# Only built when enabled so deployments without an async driver installed
+# keep working on the sync stack.
+async_engine: Optional[AsyncEngine] = build_async_engine() if settings.DB_ASYNC else None
+if async_engine is not None:
+    instrument_engine("async", async_engine.sync_engine)
+AsyncSessionLocal = (
+    async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False) if async_engine is not None else None
+)
@@ -5,14 +5,27 @@ import os
 
 from .api.api_v1.api import api_router
 from .core.config import settings
-from .db.session import Base, engine
+from .core.instrumentation import InstrumentationMiddleware
+from .core.pagination import BEFORE_CURSOR_HEADER, NEXT_CURSOR_HEADER, SINCE_CURSOR_HEADER
+from .core.response_cache import ResponseCacheMiddleware
+from .core.security import shutdown_password_hasher
 from . import models  # noqa: F401  # ensure all models are imported
+from .services.catalog_cache import response_cache
+from .services.gig_search import CORRECTED_QUERY_HEADER
 
 load_dotenv()
 
-Base.metadata.create_all(bind=engine)
-
+# The schema is managed by migrations (see db.migrations); startup never runs DDL.
 app = FastAPI(title="TALENTIA API", openapi_url="/api/openapi.json")
+app.add_event_handler("shutdown", shutdown_password_hasher)
+
+# Public catalog responses (courses, e-library, mentors) are served from cache
+# with ETag revalidation; registered before CORS so CORS stays outermost.
+app.add_middleware(ResponseCacheMiddleware, cache=response_cache)
+
+# Request timing, DB query accounting and Server-Timing; wraps the response
+# cache so cache hits are measured too.
+app.add_middleware(InstrumentationMiddleware)
 
 # CORS configuration for development: allow any origin (no credentials)
 # This works because we are not using cookies for auth, only Bearer tokens.
@@ -22,6 +35,7 @@ app.add_middleware(
     allow_credentials=False,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, BEFORE_CURSOR_HEADER, SINCE_CURSOR_HEADER, CORRECTED_QUERY_HEADER],
 )
 
 app.include_router(api_router, prefix="/api")
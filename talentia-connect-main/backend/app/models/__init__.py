@@ -1,5 +1,5 @@
-# Import all models so that Base.metadata.create_all() can see them
-from .user import User, UserRole
+# Import all models so that Base.metadata (migrations, autogenerate) can see them
+from .user import User, UserRole, RefreshToken
 from .university import University, UniversityStudent
 from .assessment import (
     AssessmentCategory,
@@ -11,6 +11,7 @@ from .assessment import (
     UserSkill,
 )
 from .portfolio import Portfolio, PortfolioProject, Certification, Testimonial, RatingReview
+from .talent import TalentStats
 from .course import (
     CourseCategory,
     Course,
@@ -32,7 +33,8 @@ from .marketplace import (
     Payout,
     Conversation,
     Message,
+    ConversationRead,
 )
-from .mentorship import MentorProfile, MentorAvailability, MentorshipSession, MentorshipFeedback
-from .library import LibraryCategory, LibraryResource
+from .mentorship import MentorProfile, MentorExpertiseTag, MentorAvailability, MentorshipSession, MentorshipFeedback
+from .library import LibraryCategory, LibraryResource, LibraryResourceRole
 from .analytics import ActivityLog
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, func, ForeignKey, Text, JSON
+from sqlalchemy import Column, String, DateTime, func, ForeignKey, Text, JSON, Index
 
 from ..db.session import Base
 
@@ -13,3 +13,5 @@ class ActivityLog(Base):
     meta = Column("metadata", JSON, nullable=True)
 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (Index("ix_activity_logs_user_id_created_at", "user_id", "created_at"),)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, func, ForeignKey, Integer, Float, Text, JSON
+from sqlalchemy import Column, String, DateTime, func, ForeignKey, Integer, Float, Text, JSON, Index
 from sqlalchemy.orm import relationship
 
 from ..db.session import Base
@@ -20,7 +20,7 @@ class AssessmentQuestion(Base):
     __tablename__ = "assessment_questions"
 
     id = Column(String, primary_key=True, index=True)
-    category_id = Column(String, ForeignKey("assessment_categories.id"), nullable=False)
+    category_id = Column(String, ForeignKey("assessment_categories.id"), nullable=False, index=True)
     text = Column(Text, nullable=False)
     type = Column(String, nullable=False)  # e.g. MULTIPLE_CHOICE, SCALE
     options = Column(JSON, nullable=True)  # for multiple choice
@@ -33,7 +33,7 @@ class AssessmentAttempt(Base):
     __tablename__ = "assessment_attempts"
 
     id = Column(String, primary_key=True, index=True)
-    user_id = Column(String, ForeignKey("users.id"), nullable=False)
+    user_id = Column(String, ForeignKey("users.id"), nullable=False, index=True)
     started_at = Column(DateTime(timezone=True), server_default=func.now())
     completed_at = Column(DateTime(timezone=True), nullable=True)
 
@@ -46,7 +46,7 @@ class AssessmentAnswer(Base):
     __tablename__ = "assessment_answers"
 
     id = Column(String, primary_key=True, index=True)
-    attempt_id = Column(String, ForeignKey("assessment_attempts.id"), nullable=False)
+    attempt_id = Column(String, ForeignKey("assessment_attempts.id"), nullable=False, index=True)
     question_id = Column(String, ForeignKey("assessment_questions.id"), nullable=False)
     selected_option = Column(String, nullable=True)
     score = Column(Float, nullable=True)
@@ -59,8 +59,8 @@ class AssessmentResult(Base):
     __tablename__ = "assessment_results"
 
     id = Column(String, primary_key=True, index=True)
-    attempt_id = Column(String, ForeignKey("assessment_attempts.id"), nullable=False)
-    user_id = Column(String, ForeignKey("users.id"), nullable=False)
+    attempt_id = Column(String, ForeignKey("assessment_attempts.id"), nullable=False, index=True)
+    user_id = Column(String, ForeignKey("users.id"), nullable=False, index=True)
     overall_score = Column(Float, nullable=False)
     category_scores = Column(JSON, nullable=True)  # {categoryId: score}
 
@@ -85,7 +85,7 @@ class UserSkill(Base):
 
     id = Column(String, primary_key=True, index=True)
     user_id = Column(String, ForeignKey("users.id"), nullable=False)
-    skill_id = Column(String, ForeignKey("skill_tags.id"), nullable=False)
+    skill_id = Column(String, ForeignKey("skill_tags.id"), nullable=False, index=True)
     level = Column(Integer, nullable=False)  # e.g. 1-100 or 1-5
     source = Column(String, nullable=True)  # e.g. ASSESSMENT, MANUAL
 
@@ -93,3 +93,5 @@ class UserSkill(Base):
 
     user = relationship("User")
     skill = relationship("SkillTag")
+
+    __table_args__ = (Index("ix_user_skills_user_id_skill_id", "user_id", "skill_id"),)
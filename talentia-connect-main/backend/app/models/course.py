@@ -8,6 +8,7 @@ from sqlalchemy import (
     Boolean,
     Integer,
     Float,
+    Index,
 )
 from sqlalchemy.orm import relationship
 
@@ -27,7 +28,7 @@ class Course(Base):
     __tablename__ = "courses"
 
     id = Column(String, primary_key=True, index=True)
-    category_id = Column(String, ForeignKey("course_categories.id"), nullable=True)
+    category_id = Column(String, ForeignKey("course_categories.id"), nullable=True, index=True)
     title = Column(String, nullable=False)
     description = Column(Text, nullable=True)
     level = Column(String, nullable=True)  # BEGINNER, INTERMEDIATE, ADVANCED
@@ -38,26 +39,30 @@ class Course(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     category = relationship("CourseCategory")
-    modules = relationship("CourseModule", back_populates="course")
+    modules = relationship(
+        "CourseModule",
+        back_populates="course",
+        order_by="[CourseModule.order, CourseModule.id]",
+    )
 
 
 class CourseModule(Base):
     __tablename__ = "course_modules"
 
     id = Column(String, primary_key=True, index=True)
-    course_id = Column(String, ForeignKey("courses.id"), nullable=False)
+    course_id = Column(String, ForeignKey("courses.id"), nullable=False, index=True)
     title = Column(String, nullable=False)
     order = Column(Integer, nullable=False, default=0)
 
     course = relationship("Course", back_populates="modules")
-    lessons = relationship("Lesson", back_populates="module")
+    lessons = relationship("Lesson", back_populates="module", order_by="Lesson.id")
 
 
 class Lesson(Base):
     __tablename__ = "lessons"
 
     id = Column(String, primary_key=True, index=True)
-    module_id = Column(String, ForeignKey("course_modules.id"), nullable=False)
+    module_id = Column(String, ForeignKey("course_modules.id"), nullable=False, index=True)
     title = Column(String, nullable=False)
     type = Column(String, nullable=False)  # VIDEO, PDF, QUIZ
     content_url = Column(String, nullable=True)
@@ -70,7 +75,7 @@ class QuizQuestion(Base):
     __tablename__ = "quiz_questions"
 
     id = Column(String, primary_key=True, index=True)
-    lesson_id = Column(String, ForeignKey("lessons.id"), nullable=False)
+    lesson_id = Column(String, ForeignKey("lessons.id"), nullable=False, index=True)
     text = Column(Text, nullable=False)
 
     lesson = relationship("Lesson")
@@ -81,7 +86,7 @@ class QuizAnswerOption(Base):
     __tablename__ = "quiz_answer_options"
 
     id = Column(String, primary_key=True, index=True)
-    question_id = Column(String, ForeignKey("quiz_questions.id"), nullable=False)
+    question_id = Column(String, ForeignKey("quiz_questions.id"), nullable=False, index=True)
     text = Column(Text, nullable=False)
     is_correct = Column(Boolean, default=False, nullable=False)
 
@@ -99,12 +104,14 @@ class QuizSubmission(Base):
 
     answers = relationship("QuizSubmissionAnswer", back_populates="submission")
 
+    __table_args__ = (Index("ix_quiz_submissions_user_id_lesson_id", "user_id", "lesson_id"),)
+
 
 class QuizSubmissionAnswer(Base):
     __tablename__ = "quiz_submission_answers"
 
     id = Column(String, primary_key=True, index=True)
-    submission_id = Column(String, ForeignKey("quiz_submissions.id"), nullable=False)
+    submission_id = Column(String, ForeignKey("quiz_submissions.id"), nullable=False, index=True)
     question_id = Column(String, ForeignKey("quiz_questions.id"), nullable=False)
     selected_option_id = Column(String, ForeignKey("quiz_answer_options.id"), nullable=True)
 
@@ -122,11 +129,13 @@ class CourseEnrollment(Base):
 
     enrolled_at = Column(DateTime(timezone=True), server_default=func.now())
 
+    __table_args__ = (Index("ix_course_enrollments_user_id_course_id", "user_id", "course_id"),)
+
 
 class CourseCertificate(Base):
     __tablename__ = "course_certificates"
 
     id = Column(String, primary_key=True, index=True)
-    enrollment_id = Column(String, ForeignKey("course_enrollments.id"), nullable=False)
+    enrollment_id = Column(String, ForeignKey("course_enrollments.id"), nullable=False, index=True)
     certificate_url = Column(String, nullable=False)
     issued_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -1,6 +1,26 @@
-from sqlalchemy import Column, String, DateTime, func, Text, Boolean
+from typing import List, Optional
+
+from sqlalchemy import Boolean, Column, DateTime, Enum, ForeignKey, Index, String, Text, func
+from sqlalchemy.orm import relationship, validates
 
 from ..db.session import Base
+from .user import UserRole
+
+
+def parse_allowed_roles(value: Optional[str]) -> List[UserRole]:
+    """Roles named in a comma-separated ``allowed_roles`` value; empty means every role."""
+
+    if not value or not value.strip():
+        return list(UserRole)
+    roles = []
+    for name in value.split(","):
+        try:
+            role = UserRole(name.strip().upper())
+        except ValueError:
+            continue  # unknown role names grant nothing
+        if role not in roles:
+            roles.append(role)
+    return roles
 
 
 class LibraryCategory(Base):
@@ -14,6 +34,11 @@ class LibraryCategory(Base):
 
 class LibraryResource(Base):
     __tablename__ = "library_resources"
+    __table_args__ = (
+        # Keyset pages over everything, or within one category
+        Index("ix_library_resources_created_at_id", "created_at", "id"),
+        Index("ix_library_resources_category_created_at_id", "category_id", "created_at", "id"),
+    )
 
     id = Column(String, primary_key=True, index=True)
     category_id = Column(String, nullable=True)
@@ -23,6 +48,25 @@ class LibraryResource(Base):
     file_url = Column(String, nullable=False)
     size_label = Column(String, nullable=True)
     is_premium = Column(Boolean, default=False, nullable=False)
-    allowed_roles = Column(Text, nullable=True)  # comma-separated roles
+    allowed_roles = Column(Text, nullable=True)  # comma-separated roles, mirrored into `roles`
 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    roles = relationship("LibraryResourceRole", cascade="all, delete-orphan")
+
+    @validates("allowed_roles")
+    def _sync_roles(self, _key, value):
+        self.roles = [LibraryResourceRole(role=role) for role in parse_allowed_roles(value)]
+        return value
+
+
+class LibraryResourceRole(Base):
+    """One role allowed to see a library resource, so listings filter by role in SQL."""
+
+    __tablename__ = "library_resource_roles"
+
+    # Role first: listings look up every resource visible to one role
+    role = Column(Enum(UserRole), primary_key=True)
+    resource_id = Column(
+        String, ForeignKey("library_resources.id", ondelete="CASCADE"), primary_key=True, index=True
+    )
@@ -1,11 +1,16 @@
+from datetime import datetime, timezone
+
 from sqlalchemy import (
+    DDL,
     Column,
     String,
     DateTime,
+    event,
     func,
     ForeignKey,
     Text,
     Float,
+    Index,
 )
 from sqlalchemy.orm import relationship
 
@@ -33,12 +38,60 @@ class Gig(Base):
     company = relationship("User")
     applications = relationship("GigApplication", back_populates="gig")
 
+    # Keyset pagination for the public listing walks (created_at, id) within
+    # the OPEN status, optionally narrowed by category or type first.
+    __table_args__ = (
+        Index("ix_gigs_status_created_at_id", "status", "created_at", "id"),
+        Index("ix_gigs_status_category_created_at_id", "status", "category", "created_at", "id"),
+        Index("ix_gigs_status_type_created_at_id", "status", "type", "created_at", "id"),
+        # A company's own gigs, newest first
+        Index("ix_gigs_company_id_created_at", "company_id", "created_at"),
+    )
+
+
+# Full-text search over open gigs (see services.gig_search). On PostgreSQL a
+# stored generated tsvector column keeps itself in sync with the row; title
+# ranks above role/category, which rank above the description. It is created
+# outside the ORM mapping because SQLite has no equivalent.
+GIG_SEARCH_DOCUMENT_COLUMN = "search_document"
+GIG_SEARCH_DOCUMENT_SQL = (
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(role, '') || ' ' || coalesce(category, '')), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(description, '')), 'C')"
+)
+GIG_SEARCH_PG_DDL = (
+    DDL(
+        f"ALTER TABLE gigs ADD COLUMN IF NOT EXISTS {GIG_SEARCH_DOCUMENT_COLUMN} tsvector "
+        f"GENERATED ALWAYS AS ({GIG_SEARCH_DOCUMENT_SQL}) STORED"
+    ),
+    DDL(
+        f"CREATE INDEX IF NOT EXISTS ix_gigs_search_document ON gigs "
+        f"USING gin ({GIG_SEARCH_DOCUMENT_COLUMN}) WHERE status = 'OPEN'"
+    ),
+)
+for _ddl in GIG_SEARCH_PG_DDL:
+    event.listen(Gig.__table__, "after_create", _ddl.execute_if(dialect="postgresql"))
+
+# SQLite stands in with an FTS5 table of the open gigs, kept up to date by
+# services.gig_search.
+GIG_FTS_TABLE = "gigs_fts"
+GIG_FTS_DDL = (
+    DDL(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {GIG_FTS_TABLE} USING fts5("
+        "gig_id UNINDEXED, title, role, category, description, "
+        "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+    ),
+    DDL(f"CREATE VIRTUAL TABLE IF NOT EXISTS {GIG_FTS_TABLE}_vocab USING fts5vocab({GIG_FTS_TABLE}, 'row')"),
+)
+for _ddl in GIG_FTS_DDL:
+    event.listen(Gig.__table__, "after_create", _ddl.execute_if(dialect="sqlite"))
+
 
 class GigApplication(Base):
     __tablename__ = "gig_applications"
 
     id = Column(String, primary_key=True, index=True)
-    gig_id = Column(String, ForeignKey("gigs.id"), nullable=False)
+    gig_id = Column(String, ForeignKey("gigs.id"), nullable=False, index=True)
     student_id = Column(String, ForeignKey("users.id"), nullable=False)
     proposal = Column(Text, nullable=True)
     status = Column(String, nullable=False, default="APPLIED")
@@ -48,13 +101,16 @@ class GigApplication(Base):
     gig = relationship("Gig", back_populates="applications")
     student = relationship("User")
 
+    # A student's applications, and the "already applied?" check
+    __table_args__ = (Index("ix_gig_applications_student_id_gig_id", "student_id", "gig_id"),)
+
 
 class Contract(Base):
     __tablename__ = "contracts"
 
     id = Column(String, primary_key=True, index=True)
-    gig_id = Column(String, ForeignKey("gigs.id"), nullable=False)
-    application_id = Column(String, ForeignKey("gig_applications.id"), nullable=False)
+    gig_id = Column(String, ForeignKey("gigs.id"), nullable=False, index=True)
+    application_id = Column(String, ForeignKey("gig_applications.id"), nullable=False, index=True)
     agreed_amount = Column(Float, nullable=True)
     status = Column(String, nullable=False, default="PENDING_PAYMENT")
 
@@ -65,7 +121,7 @@ class WorkSubmission(Base):
     __tablename__ = "work_submissions"
 
     id = Column(String, primary_key=True, index=True)
-    contract_id = Column(String, ForeignKey("contracts.id"), nullable=False)
+    contract_id = Column(String, ForeignKey("contracts.id"), nullable=False, index=True)
     notes = Column(Text, nullable=True)
     files = Column(Text, nullable=True)  # could hold URLs
     status = Column(String, nullable=False, default="SUBMITTED")
@@ -77,7 +133,7 @@ class Payment(Base):
     __tablename__ = "payments"
 
     id = Column(String, primary_key=True, index=True)
-    contract_id = Column(String, ForeignKey("contracts.id"), nullable=False)
+    contract_id = Column(String, ForeignKey("contracts.id"), nullable=False, index=True)
     provider = Column(String, nullable=True)
     reference = Column(String, nullable=True)
     amount = Column(Float, nullable=False)
@@ -90,7 +146,7 @@ class Payout(Base):
     __tablename__ = "payouts"
 
     id = Column(String, primary_key=True, index=True)
-    user_id = Column(String, ForeignKey("users.id"), nullable=False)
+    user_id = Column(String, ForeignKey("users.id"), nullable=False, index=True)
     amount = Column(Float, nullable=False)
     status = Column(String, nullable=False, default="PENDING")
 
@@ -102,12 +158,14 @@ class Conversation(Base):
 
     id = Column(String, primary_key=True, index=True)
     gig_id = Column(String, ForeignKey("gigs.id"), nullable=False)
-    application_id = Column(String, ForeignKey("gig_applications.id"), nullable=False)
-    company_id = Column(String, ForeignKey("users.id"), nullable=False)
-    student_id = Column(String, ForeignKey("users.id"), nullable=False)
+    application_id = Column(String, ForeignKey("gig_applications.id"), nullable=False, index=True)
+    company_id = Column(String, ForeignKey("users.id"), nullable=False, index=True)
+    student_id = Column(String, ForeignKey("users.id"), nullable=False, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
-    messages = relationship("Message", back_populates="conversation")
+    messages = relationship(
+        "Message", back_populates="conversation", order_by="[Message.created_at, Message.id]"
+    )
 
 
 class Message(Base):
@@ -117,6 +175,24 @@ class Message(Base):
     conversation_id = Column(String, ForeignKey("conversations.id"), nullable=False)
     sender_id = Column(String, ForeignKey("users.id"), nullable=False)
     content = Column(Text, nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # Set client-side with microseconds: message cursors order by
+    # (created_at, id) and SQLite's CURRENT_TIMESTAMP only has whole seconds.
+    created_at = Column(
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), server_default=func.now()
+    )
 
     conversation = relationship("Conversation", back_populates="messages")
+
+    # Message history is always read per conversation in (created_at, id) order
+    __table_args__ = (Index("ix_messages_conversation_created_at_id", "conversation_id", "created_at", "id"),)
+
+
+class ConversationRead(Base):
+    """How far each participant has read a conversation (drives unread counts)."""
+
+    __tablename__ = "conversation_reads"
+
+    conversation_id = Column(String, ForeignKey("conversations.id"), primary_key=True)
+    user_id = Column(String, ForeignKey("users.id"), primary_key=True)
+    last_read_message_id = Column(String, ForeignKey("messages.id"), nullable=True)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -1,33 +1,84 @@
-from sqlalchemy import Column, String, DateTime, func, ForeignKey, Text, Float, Boolean
-from sqlalchemy.orm import relationship
+from datetime import timedelta
+from typing import List, Optional, Tuple
+
+from sqlalchemy import Column, String, Date, DateTime, func, ForeignKey, SmallInteger, Text, Time, Float, Boolean
+from sqlalchemy.orm import relationship, validates
 
 from ..db.session import Base
 
+# Length of a session booked without a duration
+DEFAULT_SESSION_MINUTES = 60
+
+
+def normalize_tag(name: str) -> str:
+    """The form tags are stored and searched in: lower case, single spaces."""
+
+    return " ".join(name.lower().split())
+
+
+def parse_expertise_tags(value: Optional[str]) -> List[Tuple[str, str]]:
+    """``(tag, name)`` pairs from a comma-separated ``expertise_tags`` value, first spelling wins."""
+
+    tags: List[Tuple[str, str]] = []
+    seen = set()
+    for name in (value or "").split(","):
+        name = " ".join(name.split())
+        tag = normalize_tag(name)
+        if tag and tag not in seen:
+            seen.add(tag)
+            tags.append((tag, name))
+    return tags
+
 
 class MentorProfile(Base):
     __tablename__ = "mentor_profiles"
 
     id = Column(String, primary_key=True, index=True)
-    user_id = Column(String, ForeignKey("users.id"), nullable=False)
+    user_id = Column(String, ForeignKey("users.id"), nullable=False, index=True)
     headline = Column(String, nullable=True)
     bio = Column(Text, nullable=True)
     hourly_rate = Column(Float, nullable=True)
-    expertise_tags = Column(Text, nullable=True)  # comma-separated
+    expertise_tags = Column(Text, nullable=True)  # comma-separated, mirrored into `tags`
     approval_status = Column(String, nullable=False, default="PENDING")
 
     user = relationship("User")
     availabilities = relationship("MentorAvailability", back_populates="mentor")
+    tags = relationship("MentorExpertiseTag", cascade="all, delete-orphan")
+
+    @validates("expertise_tags")
+    def _sync_tags(self, _key, value):
+        self.tags = [MentorExpertiseTag(tag=tag, name=name) for tag, name in parse_expertise_tags(value)]
+        return value
+
+
+class MentorExpertiseTag(Base):
+    """One expertise tag of a mentor, normalized so mentor search can look tags up."""
+
+    __tablename__ = "mentor_expertise_tags"
+
+    # Tag first: searches look up every mentor with one tag
+    tag = Column(String, primary_key=True)
+    mentor_id = Column(
+        String, ForeignKey("mentor_profiles.id", ondelete="CASCADE"), primary_key=True, index=True
+    )
+    name = Column(String, nullable=False)  # as the mentor spelled it
 
 
 class MentorAvailability(Base):
+    """A slot a mentor can be booked in: every week on ``weekday``, or once on ``date``.
+
+    Times are wall-clock times in ``settings.MENTORSHIP_TIMEZONE``; an
+    ``end_time`` at or before ``start_time`` runs past midnight.
+    """
+
     __tablename__ = "mentor_availabilities"
 
     id = Column(String, primary_key=True, index=True)
-    mentor_id = Column(String, ForeignKey("mentor_profiles.id"), nullable=False)
-    weekday = Column(String, nullable=True)  # e.g. MONDAY, TUESDAY
-    date = Column(DateTime(timezone=True), nullable=True)
-    start_time = Column(String, nullable=True)  # HH:MM
-    end_time = Column(String, nullable=True)
+    mentor_id = Column(String, ForeignKey("mentor_profiles.id"), nullable=False, index=True)
+    weekday = Column(SmallInteger, nullable=True)  # 0 = Monday ... 6 = Sunday
+    date = Column(Date, nullable=True)
+    start_time = Column(Time, nullable=True)
+    end_time = Column(Time, nullable=True)
 
     mentor = relationship("MentorProfile", back_populates="availabilities")
 
@@ -36,21 +87,33 @@ class MentorshipSession(Base):
     __tablename__ = "mentorship_sessions"
 
     id = Column(String, primary_key=True, index=True)
-    mentor_id = Column(String, ForeignKey("users.id"), nullable=False)
-    student_id = Column(String, ForeignKey("users.id"), nullable=False)
+    mentor_id = Column(String, ForeignKey("users.id"), nullable=False, index=True)
+    student_id = Column(String, ForeignKey("users.id"), nullable=False, index=True)
     scheduled_at = Column(DateTime(timezone=True), nullable=False)
     duration_minutes = Column(Float, nullable=True)
+    # scheduled_at + duration, kept by _sync_ends_at; on PostgreSQL the
+    # mentorship_sessions_no_overlap exclusion constraint keeps a mentor's
+    # sessions (other than CANCELLED ones) from overlapping
+    ends_at = Column(DateTime(timezone=True), nullable=False)
     meeting_link = Column(String, nullable=True)
     status = Column(String, nullable=False, default="SCHEDULED")
 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+    @validates("scheduled_at", "duration_minutes")
+    def _sync_ends_at(self, key, value):
+        scheduled_at = value if key == "scheduled_at" else self.scheduled_at
+        minutes = value if key == "duration_minutes" else self.duration_minutes
+        if scheduled_at is not None:
+            self.ends_at = scheduled_at + timedelta(minutes=minutes or DEFAULT_SESSION_MINUTES)
+        return value
+
 
 class MentorshipFeedback(Base):
     __tablename__ = "mentorship_feedback"
 
     id = Column(String, primary_key=True, index=True)
-    session_id = Column(String, ForeignKey("mentorship_sessions.id"), nullable=False)
+    session_id = Column(String, ForeignKey("mentorship_sessions.id"), nullable=False, index=True)
     rating = Column(Float, nullable=False)
     comments = Column(Text, nullable=True)
 
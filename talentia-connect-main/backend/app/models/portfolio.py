@@ -8,7 +8,7 @@ class Portfolio(Base):
     __tablename__ = "portfolios"
 
     id = Column(String, primary_key=True, index=True)
-    user_id = Column(String, ForeignKey("users.id"), nullable=False)
+    user_id = Column(String, ForeignKey("users.id"), nullable=False, index=True)
     headline = Column(String, nullable=True)
     bio = Column(Text, nullable=True)
     public_slug = Column(String, unique=True, index=True, nullable=True)
@@ -27,7 +27,7 @@ class PortfolioProject(Base):
     __tablename__ = "portfolio_projects"
 
     id = Column(String, primary_key=True, index=True)
-    portfolio_id = Column(String, ForeignKey("portfolios.id"), nullable=False)
+    portfolio_id = Column(String, ForeignKey("portfolios.id"), nullable=False, index=True)
     title = Column(String, nullable=False)
     description = Column(Text, nullable=True)
     media_urls = Column(Text, nullable=True)  # could be JSON stringified
@@ -42,7 +42,7 @@ class Certification(Base):
     __tablename__ = "certifications"
 
     id = Column(String, primary_key=True, index=True)
-    portfolio_id = Column(String, ForeignKey("portfolios.id"), nullable=False)
+    portfolio_id = Column(String, ForeignKey("portfolios.id"), nullable=False, index=True)
     name = Column(String, nullable=False)
     issuer = Column(String, nullable=True)
     issue_date = Column(DateTime(timezone=True), nullable=True)
@@ -55,7 +55,7 @@ class Testimonial(Base):
     __tablename__ = "testimonials"
 
     id = Column(String, primary_key=True, index=True)
-    portfolio_id = Column(String, ForeignKey("portfolios.id"), nullable=False)
+    portfolio_id = Column(String, ForeignKey("portfolios.id"), nullable=False, index=True)
     author_name = Column(String, nullable=False)
     relation = Column(String, nullable=True)
     text = Column(Text, nullable=False)
@@ -68,7 +68,7 @@ class RatingReview(Base):
 
     id = Column(String, primary_key=True, index=True)
     from_user_id = Column(String, ForeignKey("users.id"), nullable=True)
-    to_user_id = Column(String, ForeignKey("users.id"), nullable=False)
+    to_user_id = Column(String, ForeignKey("users.id"), nullable=False, index=True)
     rating = Column(Float, nullable=False)
     comment = Column(Text, nullable=True)
     context = Column(String, nullable=True)  # e.g. GIG, MENTORSHIP
@@ -0,0 +1,27 @@
+from sqlalchemy import Column, String, DateTime, func, ForeignKey, Integer, Float, JSON, Index
+from sqlalchemy.orm import relationship
+
+from ..db.session import Base
+
+
+class TalentStats(Base):
+    """Materialized per-student marketplace stats backing the talents listing.
+
+    Maintained incrementally when contracts are released; rebuild it from the
+    source tables with ``python -m app.services.talent_stats``.
+    """
+
+    __tablename__ = "talent_stats"
+
+    user_id = Column(String, ForeignKey("users.id"), primary_key=True)
+    rating_total = Column(Float, nullable=False, default=0.0)
+    reviews_count = Column(Integer, nullable=False, default=0)
+    avg_rating = Column(Float, nullable=False, default=0.0)
+    completed_gigs = Column(Integer, nullable=False, default=0)
+    top_skills = Column(JSON, nullable=True)  # up to 5 skill names, strongest first
+
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    user = relationship("User")
+
+    __table_args__ = (Index("ix_talent_stats_avg_rating_user_id", "avg_rating", "user_id"),)
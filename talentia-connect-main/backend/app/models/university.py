@@ -34,8 +34,8 @@ class UniversityStudent(Base):
     __tablename__ = "university_students"
 
     id = Column(String, primary_key=True, index=True)
-    university_id = Column(String, ForeignKey("universities.id"), nullable=False)
-    user_id = Column(String, ForeignKey("users.id"), nullable=False)
+    university_id = Column(String, ForeignKey("universities.id"), nullable=False, index=True)
+    user_id = Column(String, ForeignKey("users.id"), nullable=False, index=True)
     faculty = Column(String, nullable=True)
     department = Column(String, nullable=True)
     cohort_year = Column(String, nullable=True)
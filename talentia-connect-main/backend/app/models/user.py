@@ -25,7 +25,7 @@ class User(Base):
     bio = Column(String, nullable=True)
     role = Column(Enum(UserRole), default=UserRole.STUDENT, nullable=False)
 
-    university_id = Column(String, ForeignKey("universities.id"), nullable=True)
+    university_id = Column(String, ForeignKey("universities.id"), nullable=True, index=True)
     department = Column(String, nullable=True)
     matric_number = Column(String, nullable=True)
     is_verified = Column(Boolean, default=False, nullable=False)
@@ -35,3 +35,24 @@ class User(Base):
 
     # Relationships (optional; mainly for ORM convenience)
     university = relationship("University", back_populates="users", lazy="joined", uselist=False)
+
+
+class RefreshToken(Base):
+    """A refresh token, stored as its SHA-256 so a database leak can't be replayed.
+
+    Every login starts a family; each refresh revokes the presented token and
+    issues its successor in the same family. Presenting a token that was
+    already rotated revokes the whole family (the token was likely stolen).
+    """
+
+    __tablename__ = "refresh_tokens"
+
+    id = Column(String, primary_key=True, index=True)
+    user_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    family_id = Column(String, nullable=False, index=True)
+    token_hash = Column(String(64), unique=True, index=True, nullable=False)
+    expires_at = Column(DateTime(timezone=True), nullable=False)
+    revoked_at = Column(DateTime(timezone=True), nullable=True)
+    replaced_by_id = Column(String, nullable=True)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -30,6 +30,27 @@ class GigApplicationOut(BaseModel):
     appliedAt: datetime
 
 
+class CandidateScoreOut(BaseModel):
+    skills: float
+    rating: float
+    experience: float
+
+
+class CandidateOut(BaseModel):
+    studentId: str
+    studentName: str
+    score: float
+    breakdown: CandidateScoreOut
+    matchedSkills: List[str] = []
+    avgRating: float = 0.0
+    reviewsCount: int = 0
+    completedGigs: int = 0
+    # Unset for students from the wider pool who have not applied
+    applicationId: Optional[str] = None
+    applicationStatus: Optional[str] = None
+    appliedAt: Optional[datetime] = None
+
+
 class MessageCreate(BaseModel):
     content: str
 
@@ -50,6 +71,23 @@ class ConversationOut(BaseModel):
     messages: List[MessageOut] = []
 
 
+class ConversationSummaryOut(BaseModel):
+    id: str
+    gigId: str
+    gigTitle: Optional[str] = None
+    applicationId: str
+    companyId: str
+    studentId: str
+    lastMessage: Optional[MessageOut] = None
+    unreadCount: int = 0
+    lastActivityAt: Optional[datetime] = None
+
+
+class ConversationReadCreate(BaseModel):
+    # Defaults to the newest message in the conversation
+    messageId: Optional[str] = None
+
+
 class ContractCreate(BaseModel):
     agreedAmount: float
 
@@ -84,6 +122,8 @@ class GigOut(BaseModel):
     skills: List[str] = []
     applicants: int = 0
     category: Optional[str] = None
+    # Set on recommendations only
+    matchScore: Optional[float] = None
 
     class Config:
         from_attributes = True
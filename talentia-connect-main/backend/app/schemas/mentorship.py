@@ -1,6 +1,7 @@
-from typing import Optional
+from datetime import datetime
+from typing import List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class MentorOut(BaseModel):
@@ -16,3 +17,36 @@ class MentorOut(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class FreeSlotOut(BaseModel):
+    start: datetime
+    end: datetime
+
+
+class MentorAvailabilityOut(BaseModel):
+    mentor_id: str
+    user_id: str
+    full_name: str
+    headline: Optional[str] = None
+    hourly_rate: Optional[float] = None
+    free: List[FreeSlotOut]
+
+
+class MentorshipSessionCreate(BaseModel):
+    scheduled_at: datetime
+    duration_minutes: int = Field(60, ge=15, le=240)
+
+
+class MentorshipSessionOut(BaseModel):
+    id: str
+    mentor_id: str
+    student_id: str
+    scheduled_at: datetime
+    ends_at: datetime
+    duration_minutes: Optional[float] = None
+    meeting_link: Optional[str] = None
+    status: str
+
+    class Config:
+        from_attributes = True
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, EmailStr
-from typing import Literal
+from typing import Literal, Optional
 
 
 UserRoleLiteral = Literal["STUDENT", "COMPANY", "MENTOR", "UNIVERSITY_ADMIN", "SUPER_ADMIN"]
@@ -38,4 +38,9 @@ class UserOut(BaseModel):
 
 class TokenResponse(BaseModel):
     accessToken: str
+    refreshToken: Optional[str] = None
     user: UserOut
+
+
+class RefreshRequest(BaseModel):
+    refreshToken: str
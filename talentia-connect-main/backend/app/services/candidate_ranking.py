@@ -0,0 +1,214 @@
+"""Ranked candidate shortlists for a gig.
+
+A candidate's score is a weighted sum of three components, each in [0, 1]:
+
+* ``skills``: how much of the gig's skill demand the student covers. The
+  demand is the gig's vector over skill tags (see ``gig_recommendations``);
+  each skill counts at the student's level relative to their strongest one.
+* ``rating``: the average review rating over 5, shrunk towards
+  ``PRIOR_RATING`` while a student has few reviews.
+* ``experience``: completed contracts on a log scale, full at
+  ``EXPERIENCE_CAP``.
+
+Ratings and completed contracts come from the materialized ``talent_stats``
+table. All candidates are scored at once over NumPy arrays: the applicants
+and, for the wider pool, every student with at least one of the gig's
+skills. The ranked list is cached per gig in ``cache_backend`` and dropped
+when an application to the gig, or the gig itself, changes; skill and rating
+changes show up within ``RANKING_TTL``.
+"""
+
+import json
+from dataclasses import asdict, dataclass
+from itertools import chain
+from typing import Dict, Iterator, List, Sequence, Set, Tuple
+
+import numpy as np
+from sqlalchemy import Row, event, func, select
+from sqlalchemy.orm import Session
+
+from ..core.cache import cache_backend
+from ..models.assessment import UserSkill
+from ..models.marketplace import Gig, GigApplication
+from ..models.talent import TalentStats
+from ..models.user import User, UserRole
+from .gig_recommendations import load_features
+
+RANKING_TTL = 300
+# Longest list kept per gig; pages past it are empty
+MAX_RANKED = 1000
+MAX_MATCHED_SKILLS = 5
+
+SKILLS_WEIGHT = 0.6
+RATING_WEIGHT = 0.25
+EXPERIENCE_WEIGHT = 0.15
+PRIOR_RATING = 3.5
+PRIOR_REVIEWS = 3
+EXPERIENCE_CAP = 10
+
+_PREFIX = "gig_candidates:"
+_PENDING_KEY = "gig_candidate_invalidations"
+# Keeps IN lists under SQLite's bound-parameter limit
+_CHUNK = 5000
+
+
+@dataclass(frozen=True)
+class Candidate:
+    student_id: str
+    applied: bool
+    score: float
+    skills: float
+    rating: float
+    experience: float
+    matched_skills: List[str]
+    avg_rating: float
+    reviews_count: int
+    completed_gigs: int
+
+
+def _cache_key(gig_id: str, include_pool: bool) -> str:
+    return f"{_PREFIX}{gig_id}:{'pool' if include_pool else 'applicants'}"
+
+
+def _chunks(ids: Sequence[str]) -> Iterator[Sequence[str]]:
+    for start in range(0, len(ids), _CHUNK):
+        yield ids[start : start + _CHUNK]
+
+
+def _demand(db: Session, gig: Gig) -> Dict[str, Tuple[float, str]]:
+    """Skill id -> (weight, name) for the skills the gig asks for; weights sum to 1."""
+
+    features = load_features(db)
+    _, columns, weights = features.vectorize([(gig.title, gig.role, gig.category, gig.description)])
+    skill = features.is_skill[columns]
+    columns, weights = columns[skill], weights[skill]
+    total = float(weights.sum())
+    return {
+        features.ids[column]: (float(weight) / total, features.names[column])
+        for column, weight in zip(columns, weights)
+    }
+
+
+def _stats_columns():
+    return (
+        func.coalesce(TalentStats.rating_total, 0.0),
+        func.coalesce(TalentStats.reviews_count, 0),
+        func.coalesce(TalentStats.completed_gigs, 0),
+    )
+
+
+def _rank(db: Session, gig: Gig, include_pool: bool) -> List[Candidate]:
+    demand = _demand(db, gig)
+    applicants = set(db.scalars(select(GigApplication.student_id).where(GigApplication.gig_id == gig.id)))
+
+    # (user, skill, level, strongest level, rating total, reviews, completed) per matching skill
+    skill_rows: Sequence[Row] = []
+    if demand:
+        holders = select(UserSkill.user_id).where(UserSkill.skill_id.in_(demand))
+        if include_pool:
+            holders = holders.join(User, User.id == UserSkill.user_id).where(User.role == UserRole.STUDENT)
+        else:
+            holders = holders.where(UserSkill.user_id.in_(list(applicants)))
+        top = (
+            select(UserSkill.user_id, func.max(UserSkill.level).label("top_level"))
+            .where(UserSkill.user_id.in_(holders))
+            .group_by(UserSkill.user_id)
+            .subquery()
+        )
+        skill_rows = db.execute(
+            select(UserSkill.user_id, UserSkill.skill_id, UserSkill.level, top.c.top_level, *_stats_columns())
+            .join(top, top.c.user_id == UserSkill.user_id)
+            .outerjoin(TalentStats, TalentStats.user_id == UserSkill.user_id)
+            .where(UserSkill.skill_id.in_(demand), UserSkill.level > 0)
+        ).all()
+    # Applicants without any of the gig's skills still get ranked
+    unmatched = sorted(applicants - {row[0] for row in skill_rows})
+    stats_rows = []
+    for chunk in _chunks(unmatched):
+        stats_rows += db.execute(
+            select(User.id, *_stats_columns())
+            .outerjoin(TalentStats, TalentStats.user_id == User.id)
+            .where(User.id.in_(chunk))
+        ).all()
+    if not skill_rows and not stats_rows:
+        return []
+
+    student_ids, positions = np.unique(
+        np.array([row[0] for row in skill_rows] + [row[0] for row in stats_rows], dtype=object),
+        return_inverse=True,
+    )
+    count = len(student_ids)
+    rows_of = positions[: len(skill_rows)]
+
+    # skills: demand covered, level-weighted
+    coverage = np.array([demand[row[1]][0] * row[2] / row[3] for row in skill_rows], dtype=np.float64)
+    skills = np.minimum(np.bincount(rows_of, weights=coverage, minlength=count), 1.0)
+
+    # Stats repeat on every skill row of a student; any copy will do
+    stats = np.zeros((count, 3))
+    stats[positions] = np.array([row[4:] for row in skill_rows] + [row[1:] for row in stats_rows], dtype=np.float64)
+    rating_total, reviews, completed = stats.T
+    rating = (rating_total + PRIOR_RATING * PRIOR_REVIEWS) / (reviews + PRIOR_REVIEWS) / 5.0
+    experience = np.minimum(np.log1p(completed) / np.log1p(EXPERIENCE_CAP), 1.0)
+    score = SKILLS_WEIGHT * skills + RATING_WEIGHT * rating + EXPERIENCE_WEIGHT * experience
+
+    # Best first; ties broken by student id (positions follow id order)
+    order = np.lexsort((np.arange(count), -score))[:MAX_RANKED]
+
+    # Matched skill names, for the ranked students only
+    ranked = np.zeros(count, dtype=bool)
+    ranked[order] = True
+    matched: Dict[int, List[Tuple[float, str]]] = {}
+    for row in np.flatnonzero(ranked[rows_of]):
+        matched.setdefault(int(rows_of[row]), []).append((-coverage[row], demand[skill_rows[row][1]][1]))
+
+    return [
+        Candidate(
+            student_id=student_ids[i],
+            applied=student_ids[i] in applicants,
+            score=round(float(score[i]), 4),
+            skills=round(float(skills[i]), 4),
+            rating=round(float(rating[i]), 4),
+            experience=round(float(experience[i]), 4),
+            matched_skills=[name for _, name in sorted(matched.get(int(i), []))][:MAX_MATCHED_SKILLS],
+            avg_rating=round(float(rating_total[i] / reviews[i]), 2) if reviews[i] else 0.0,
+            reviews_count=int(reviews[i]),
+            completed_gigs=int(completed[i]),
+        )
+        for i in order
+    ]
+
+
+def ranking(db: Session, gig: Gig, include_pool: bool = False) -> List[Candidate]:
+    """The gig's candidates, best first: its applicants, plus the wider student pool if asked."""
+
+    key = _cache_key(gig.id, include_pool)
+    cached = cache_backend.get(key)
+    if cached is not None:
+        return [Candidate(**fields) for fields in json.loads(cached)]
+
+    candidates = _rank(db, gig, include_pool)
+    cache_backend.set(key, json.dumps([asdict(c) for c in candidates]).encode(), RANKING_TTL)
+    return candidates
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changes(session: Session, _flush_context) -> None:
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, GigApplication):
+            session.info.setdefault(_PENDING_KEY, set()).add(obj.gig_id)
+        elif isinstance(obj, Gig) and obj not in session.new:
+            session.info.setdefault(_PENDING_KEY, set()).add(obj.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_rankings(session: Session) -> None:
+    gig_ids: Set[str] = session.info.pop(_PENDING_KEY, None) or set()
+    for gig_id in gig_ids:
+        cache_backend.delete(_cache_key(gig_id, False))
+        cache_backend.delete(_cache_key(gig_id, True))
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changes(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,92 @@
+"""Caching for the public, mostly static catalog endpoints.
+
+``response_cache`` covers whole GET responses (course list, e-library,
+mentors) with per-route TTLs and ETags; ``main.py`` mounts its middleware.
+Course detail bodies are cached separately, per course id, by
+``GET /api/courses/{course_id}``. Every namespace is invalidated as soon as a
+transaction touching its models commits.
+"""
+
+from itertools import chain
+from typing import Optional, Set
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from ..core.cache import cache_backend
+from ..core.response_cache import CachedRoute, ResponseCache
+from ..models.course import Course, CourseCategory, CourseModule, Lesson
+from ..models.library import LibraryCategory, LibraryResource, LibraryResourceRole
+from ..models.mentorship import MentorExpertiseTag, MentorProfile
+from ..models.user import User
+
+response_cache = ResponseCache(
+    cache_backend,
+    {
+        "/api/courses": CachedRoute(namespace="courses", ttl=300),
+        "/api/library/categories": CachedRoute(namespace="library", ttl=3600),
+        "/api/library/resources": CachedRoute(namespace="library", ttl=600),
+        "/api/mentors": CachedRoute(namespace="mentors", ttl=300),
+    },
+)
+
+response_cache.invalidate_on_commit("courses", Course, CourseCategory)
+response_cache.invalidate_on_commit("library", LibraryCategory, LibraryResource, LibraryResourceRole)
+# Mentor cards embed the mentor's name, so renaming a user counts too; logins
+# and token refreshes also write users and must not empty the cache.
+response_cache.invalidate_on_commit(
+    "mentors", MentorProfile, MentorExpertiseTag, edits={User: ("first_name", "last_name")}
+)
+
+
+COURSE_DETAIL_TTL = 600
+_COURSE_DETAIL_PREFIX = "course_detail:"
+_PENDING_KEY = "course_detail_invalidations"
+_ALL = "*"
+
+
+def get_course_detail(course_id: str) -> Optional[bytes]:
+    return cache_backend.get(_COURSE_DETAIL_PREFIX + course_id)
+
+
+def set_course_detail(course_id: str, body: bytes) -> None:
+    cache_backend.set(_COURSE_DETAIL_PREFIX + course_id, body, COURSE_DETAIL_TTL)
+
+
+def _course_id_for(obj) -> Optional[str]:
+    if isinstance(obj, Course):
+        return obj.id
+    if isinstance(obj, CourseModule):
+        return obj.course_id
+    if isinstance(obj, Lesson):
+        module = inspect(obj).attrs.module.loaded_value
+        if isinstance(module, CourseModule):
+            return module.course_id
+        return _ALL  # module not loaded; don't query mid-flush, drop everything
+    return None
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_course_changes(session: Session, _flush_context) -> None:
+    affected: Set[str] = session.info.setdefault(_PENDING_KEY, set())
+    for obj in chain(session.new, session.dirty, session.deleted):
+        course_id = _course_id_for(obj)
+        if course_id is not None:
+            affected.add(course_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_course_details(session: Session) -> None:
+    affected = session.info.pop(_PENDING_KEY, None)
+    if not affected:
+        return
+    if _ALL in affected:
+        cache_backend.delete_prefix(_COURSE_DETAIL_PREFIX)
+        return
+    for course_id in affected:
+        cache_backend.delete(_COURSE_DETAIL_PREFIX + course_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_course_changes(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
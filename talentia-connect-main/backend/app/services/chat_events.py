@@ -0,0 +1,55 @@
+"""Push committed chat messages to live WebSocket subscribers.
+
+Messages are collected when flushed and published only once their
+transaction commits, so subscribers never see a message that was rolled
+back.
+"""
+
+import json
+from typing import List
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from ..core.broadcast import broadcast
+from ..models.marketplace import Message
+
+_PENDING_KEY = "chat_events_pending"
+
+
+def conversation_channel(conversation_id: str) -> str:
+    return f"conversation:{conversation_id}"
+
+
+def message_event(message: Message) -> str:
+    return json.dumps(
+        {
+            "type": "message",
+            "message": {
+                "id": message.id,
+                "senderId": message.sender_id,
+                "content": message.content,
+                "createdAt": message.created_at.isoformat() if message.created_at else None,
+            },
+        }
+    )
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_new_messages(session: Session, _flush_context) -> None:
+    new_messages = [obj for obj in session.new if isinstance(obj, Message)]
+    if new_messages:
+        pending: List[tuple] = session.info.setdefault(_PENDING_KEY, [])
+        # Serialize now: attributes are expired once the commit completes
+        pending.extend((m.conversation_id, message_event(m)) for m in new_messages)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_new_messages(session: Session) -> None:
+    for conversation_id, data in session.info.pop(_PENDING_KEY, ()):
+        broadcast.publish(conversation_channel(conversation_id), data)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_new_messages(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,513 @@
+"""Gig recommendations: open gigs ranked against a student's skills.
+
+Every open gig is described by a sparse vector over *features*: the skill
+tags and the assessment categories. A feature's weight is how much of its
+name (and, for skills, its category) shows up in the gig's title, role,
+category and description, with simple stemming so "singer" matches
+"singing". Rows are L2-normalized. A student is a vector over the same
+features, taken from their ``UserSkill`` levels and their latest
+``AssessmentResult.category_scores``. A gig's score is the cosine of the two.
+
+The matrix lives in memory, per worker process, as NumPy arrays: one copy
+by feature (CSC) for scoring, where a student with a handful of features
+only touches those columns, and one by gig (CSR) to explain matches. Gigs
+written through the ORM are patched in after commit. They go into a small
+delta area that is folded into the main arrays once it grows. Skill or
+category edits, and ``INDEX_MAX_AGE`` (which catches bulk loads and other
+workers' writes), rebuild the index from the ``gigs`` table. Requests never
+scan the table themselves.
+"""
+
+import re
+import threading
+from functools import lru_cache
+import time
+from dataclasses import dataclass
+from itertools import chain
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+from sqlalchemy import event, inspect, select, true
+from sqlalchemy.orm import Session
+
+from ..models.assessment import AssessmentCategory, AssessmentResult, SkillTag, UserSkill
+from ..models.marketplace import Gig, GigApplication
+
+INDEX_MAX_AGE = 300.0
+# Delta rows folded into the main arrays past this many (or an eighth of the index)
+DELTA_LIMIT = 512
+MAX_MATCHED_SKILLS = 5
+
+# How much a term counts depending on where in the gig it appears
+_FIELD_WEIGHTS = (("title", 1.0), ("role", 0.8), ("category", 0.8), ("description", 0.5))
+# A skill's category, and assessment categories, say less than a skill's own name
+_CATEGORY_SHARE = 0.5
+_ASSESSMENT_SHARE = 0.5
+
+_INDEXED = ("title", "role", "category", "description", "status")
+# Gigs are vectorized in blocks of at most this many (gig, feature) cells
+_BLOCK_CELLS = 1 << 22
+_TERM_RE = re.compile(r"[^\W\d_]+", re.UNICODE)
+_SUFFIXES = ("ings", "ing", "ers", "er", "es", "s")
+_STOPWORDS = {"and", "the", "for", "with", "from", "into", "your", "our", "all"}
+
+_PENDING_GIGS_KEY = "gig_recommendation_gigs"
+_PENDING_FEATURES_KEY = "gig_recommendation_features"
+
+
+@lru_cache(maxsize=65536)
+def _stem(word: str) -> str:
+    for suffix in _SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            word = word[: -len(suffix)]
+            break
+    return word[:-1] if word.endswith("e") and len(word) > 3 else word
+
+
+def terms(text: Optional[str]) -> Set[str]:
+    if not text:
+        return set()
+    return {_stem(word) for word in _TERM_RE.findall(text.lower()) if len(word) >= 3 and word not in _STOPWORDS}
+
+
+class Features:
+    """The feature columns and which gig terms feed them."""
+
+    def __init__(self, skills: Sequence[Tuple[str, str, Optional[str]]], categories: Sequence[Tuple[str, str]]):
+        self.names: List[str] = []
+        # Skill tag or assessment category id of each column
+        self.ids: List[str] = []
+        self.skill_column: Dict[str, int] = {}
+        self.category_column: Dict[str, int] = {}
+        # term -> [(column, share of the column's weight)]
+        term_map: Dict[str, List[Tuple[int, float]]] = {}
+
+        for skill_id, name, category in skills:
+            column = self._add(skill_id, name)
+            self.skill_column[skill_id] = column
+            self._map(term_map, column, terms(name), 1.0)
+            self._map(term_map, column, terms(category), _CATEGORY_SHARE)
+        for category_id, name in categories:
+            column = self._add(category_id, name)
+            self.category_column[category_id] = column
+            self._map(term_map, column, terms(name), 1.0)
+        self.is_skill = np.zeros(len(self.names), dtype=bool)
+        self.is_skill[list(self.skill_column.values())] = True
+
+        # The term map as CSR arrays, so whole batches of gigs expand at once
+        self.term_ids = {term: i for i, term in enumerate(term_map)}
+        self.term_ptr = np.zeros(len(term_map) + 1, dtype=np.int64)
+        np.cumsum([len(entries) for entries in term_map.values()], out=self.term_ptr[1:])
+        self.term_columns = np.array([c for entries in term_map.values() for c, _ in entries], dtype=np.int64)
+        self.term_shares = np.array([s for entries in term_map.values() for _, s in entries], dtype=np.float32)
+        # Raw word -> term id (or None); gig text repeats the same words a lot
+        self._word_terms: Dict[str, Optional[int]] = {}
+
+    def _term(self, word: str) -> Optional[int]:
+        term = None
+        if len(word) >= 3 and word not in _STOPWORDS:
+            term = self.term_ids.get(_stem(word))
+        if len(self._word_terms) < 100_000:
+            self._word_terms[word] = term
+        return term
+
+    def _add(self, feature_id: str, name: str) -> int:
+        self.ids.append(feature_id)
+        self.names.append(name)
+        return len(self.names) - 1
+
+    @staticmethod
+    def _map(term_map: Dict[str, List[Tuple[int, float]]], column: int, words: Set[str], share: float) -> None:
+        for word in words:
+            term_map.setdefault(word, []).append((column, share / len(words)))
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def vectorize(self, gigs: Iterable[Tuple[str, str, str, str]]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """CSR ``(row_ptr, columns, weights)`` of ``(title, role, category, description)`` rows.
+
+        Rows are L2-normalized; a gig that matches no feature gets an empty row.
+        """
+
+        # A term counts once per gig, at the weight of the best field it is in
+        entry_gigs: List[int] = []
+        entry_terms: List[int] = []
+        entry_weights: List[float] = []
+        word_terms = self._word_terms
+        count = 0
+        for count, fields in enumerate(gigs, 1):
+            best: Dict[int, float] = {}
+            for value, (_, field_weight) in zip(fields, _FIELD_WEIGHTS):
+                if not value:
+                    continue
+                for word in _TERM_RE.findall(value.lower()):
+                    term = word_terms[word] if word in word_terms else self._term(word)
+                    if term is not None and best.get(term, 0.0) < field_weight:
+                        best[term] = field_weight
+            entry_gigs.extend([count - 1] * len(best))
+            entry_terms.extend(best.keys())
+            entry_weights.extend(best.values())
+
+        row_ptr = np.zeros(count + 1, dtype=np.int64)
+        if not entry_terms:
+            return row_ptr, np.empty(0, dtype=np.int32), np.empty(0, dtype=np.float32)
+
+        # Expand each (gig, term) into the term's columns...
+        term_ids = np.array(entry_terms, dtype=np.int64)
+        counts = self.term_ptr[term_ids + 1] - self.term_ptr[term_ids]
+        positions = _positions(self.term_ptr[term_ids], counts)
+        gigs_of = np.repeat(np.array(entry_gigs, dtype=np.int64), counts)
+        columns_of = self.term_columns[positions]
+        weights_of = self.term_shares[positions] * np.repeat(np.array(entry_weights, dtype=np.float32), counts)
+
+        # ...then add up per (gig, column) in a dense block of gigs at a time,
+        # which also leaves every row's columns sorted
+        width = len(self)
+        block = max(1, _BLOCK_CELLS // width)
+        bounds = np.searchsorted(gigs_of, np.arange(0, count + block, block))
+        parts = []
+        for first, (start, end) in zip(range(0, count, block), zip(bounds[:-1], bounds[1:])):
+            cells = (gigs_of[start:end] - first) * width + columns_of[start:end]
+            dense = np.bincount(cells, weights=weights_of[start:end], minlength=min(block, count - first) * width)
+            nonzero = np.flatnonzero(dense)
+            parts.append((nonzero + first * width, dense[nonzero]))
+        keys = np.concatenate([key for key, _ in parts])
+        weights = np.concatenate([weight for _, weight in parts])
+        rows, columns = np.divmod(keys, width)
+
+        norms = np.sqrt(np.bincount(rows, weights=weights * weights, minlength=count))
+        np.cumsum(np.bincount(rows, minlength=count), out=row_ptr[1:])
+        return row_ptr, columns.astype(np.int32), (weights / norms[rows]).astype(np.float32)
+
+
+def _positions(starts: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """Indexes of the ranges ``starts[i] : starts[i] + counts[i]``, concatenated."""
+
+    offsets = np.arange(int(counts.sum()), dtype=np.int64) - np.repeat(np.cumsum(counts) - counts, counts)
+    return np.repeat(starts, counts) + offsets
+
+
+@dataclass
+class _Rows:
+    """Open gigs with a non-empty vector, as CSR arrays."""
+
+    gig_ids: List[str]
+    created: np.ndarray
+    row_ptr: np.ndarray
+    columns: np.ndarray
+    weights: np.ndarray
+
+
+class _Snapshot:
+    """An immutable gig x feature matrix; updates produce a new snapshot."""
+
+    def __init__(
+        self,
+        features: Features,
+        gig_ids: List[str],
+        created: np.ndarray,
+        row_ptr: np.ndarray,
+        row_columns: np.ndarray,
+        row_weights: np.ndarray,
+        alive: Optional[np.ndarray] = None,
+        base_rows: Optional[int] = None,
+        built_at: Optional[float] = None,
+        csc: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None,
+    ):
+        self.features = features
+        self.gig_ids = gig_ids
+        self.slots = {gig_id: slot for slot, gig_id in enumerate(gig_ids)}
+        self.created = created
+        # CSR over all slots: the base rows, then the delta rows
+        self.row_ptr = row_ptr
+        self.row_columns = row_columns
+        self.row_weights = row_weights
+        self.alive = alive if alive is not None else np.ones(len(gig_ids), dtype=bool)
+        self.base_rows = len(gig_ids) if base_rows is None else base_rows
+        self.built_at = time.monotonic() if built_at is None else built_at
+
+        # CSC copy of the base rows for scoring; delta updates reuse it as is
+        base_nnz = int(row_ptr[self.base_rows])
+        if csc is None:
+            counts = np.diff(row_ptr[: self.base_rows + 1])
+            base_slots = np.repeat(np.arange(self.base_rows, dtype=np.int32), counts)
+            order = np.argsort(row_columns[:base_nnz], kind="stable")
+            col_ptr = np.zeros(len(features) + 1, dtype=np.int64)
+            np.cumsum(np.bincount(row_columns[:base_nnz], minlength=len(features)), out=col_ptr[1:])
+            csc = (col_ptr, base_slots[order], row_weights[:base_nnz][order])
+        self.col_ptr, self.col_slots, self.col_weights = csc
+        # The delta rows stay row-major; there are few of them
+        delta_counts = np.diff(row_ptr[self.base_rows :])
+        self.delta_slots = np.repeat(np.arange(self.base_rows, len(gig_ids), dtype=np.int32), delta_counts)
+        self.delta_columns = row_columns[base_nnz:]
+        self.delta_weights = row_weights[base_nnz:]
+
+    @property
+    def delta_rows(self) -> int:
+        return len(self.gig_ids) - self.base_rows
+
+    def scores(self, student: np.ndarray) -> np.ndarray:
+        scores = np.zeros(len(self.gig_ids), dtype=np.float32)
+        for column in np.flatnonzero(student):
+            start, end = self.col_ptr[column], self.col_ptr[column + 1]
+            # Each gig appears at most once per column, so plain fancy-index += is safe
+            scores[self.col_slots[start:end]] += self.col_weights[start:end] * student[column]
+        if self.delta_rows:
+            scores += np.bincount(
+                self.delta_slots,
+                weights=self.delta_weights * student[self.delta_columns],
+                minlength=len(self.gig_ids),
+            ).astype(np.float32)
+        scores[~self.alive] = 0.0
+        return scores
+
+    def row(self, slot: int) -> Tuple[np.ndarray, np.ndarray]:
+        start, end = self.row_ptr[slot], self.row_ptr[slot + 1]
+        return self.row_columns[start:end], self.row_weights[start:end]
+
+    def with_changes(self, changed: Iterable[str], rows: _Rows) -> "_Snapshot":
+        """A snapshot with the ``changed`` gigs replaced by ``rows`` (gigs not in it are dropped)."""
+
+        alive = self.alive.copy()
+        for gig_id in changed:
+            slot = self.slots.get(gig_id)
+            if slot is not None:
+                alive[slot] = False
+        gig_ids = self.gig_ids + rows.gig_ids
+        alive = np.concatenate([alive, np.ones(len(rows.gig_ids), dtype=bool)])
+
+        snapshot = _Snapshot(
+            self.features,
+            gig_ids,
+            np.concatenate([self.created, rows.created]),
+            np.concatenate([self.row_ptr, self.row_ptr[-1] + rows.row_ptr[1:]]),
+            np.concatenate([self.row_columns, rows.columns]),
+            np.concatenate([self.row_weights, rows.weights]),
+            alive,
+            self.base_rows,
+            self.built_at,
+            (self.col_ptr, self.col_slots, self.col_weights),
+        )
+        dead = len(gig_ids) - int(alive.sum())
+        if snapshot.delta_rows > max(DELTA_LIMIT, self.base_rows // 8) or dead > len(gig_ids) // 4:
+            snapshot = snapshot.compacted()
+        return snapshot
+
+    def compacted(self) -> "_Snapshot":
+        """Fold the delta rows into the main arrays and drop dead rows."""
+
+        keep = np.flatnonzero(self.alive)
+        counts = np.diff(self.row_ptr)[keep]
+        positions = _positions(self.row_ptr[keep], counts)
+        row_ptr = np.zeros(len(keep) + 1, dtype=np.int64)
+        np.cumsum(counts, out=row_ptr[1:])
+        return _Snapshot(
+            self.features,
+            [self.gig_ids[slot] for slot in keep],
+            self.created[keep],
+            row_ptr,
+            self.row_columns[positions],
+            self.row_weights[positions],
+            built_at=self.built_at,
+        )
+
+
+@dataclass(frozen=True)
+class Recommendation:
+    gig_id: str
+    score: float
+    skills: List[str]
+
+
+def _timestamp(value) -> float:
+    return value.timestamp() if value is not None else 0.0
+
+
+def load_features(db: Session) -> Features:
+    skills = db.execute(select(SkillTag.id, SkillTag.name, SkillTag.category).order_by(SkillTag.id)).all()
+    categories = db.execute(
+        select(AssessmentCategory.id, AssessmentCategory.name).order_by(AssessmentCategory.id)
+    ).all()
+    return Features(skills, categories)
+
+
+def _gig_rows(db: Session, features: Features, where) -> _Rows:
+    rows = db.execute(
+        select(Gig.id, Gig.created_at, Gig.title, Gig.role, Gig.category, Gig.description).where(
+            where, Gig.status == "OPEN"
+        )
+    ).all()
+    row_ptr, columns, weights = features.vectorize(row[2:] for row in rows)
+    # Gigs matching no feature can never be recommended; leave them out
+    keep = np.flatnonzero(np.diff(row_ptr))
+    return _Rows(
+        [rows[i].id for i in keep],
+        np.array([_timestamp(rows[i].created_at) for i in keep], dtype=np.float64),
+        np.concatenate([[0], row_ptr[keep + 1]]).astype(np.int64),
+        columns,
+        weights,
+    )
+
+
+def _build(db: Session) -> _Snapshot:
+    features = load_features(db)
+    rows = _gig_rows(db, features, true())
+    return _Snapshot(features, rows.gig_ids, rows.created, rows.row_ptr, rows.columns, rows.weights)
+
+
+class _RecommendationIndex:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+        self._snapshot: Optional[_Snapshot] = None
+        self._stale = True
+        self._changed_gigs: Set[str] = set()
+
+    def mark_gigs(self, gig_ids: Iterable[str]) -> None:
+        with self._lock:
+            self._changed_gigs.update(gig_ids)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._stale = True
+
+    def _needs_rebuild(self) -> bool:
+        snapshot = self._snapshot
+        return self._stale or snapshot is None or time.monotonic() - snapshot.built_at > INDEX_MAX_AGE
+
+    def _rebuild(self, db: Session) -> None:
+        with self._lock:
+            # Changes committed from here on are applied on top of the new snapshot
+            self._stale = False
+            self._changed_gigs.clear()
+        try:
+            self._snapshot = _build(db)
+        except Exception:
+            self._stale = True
+            raise
+
+    def snapshot(self, db: Session) -> _Snapshot:
+        if self._needs_rebuild():
+            if self._snapshot is None:
+                with self._build_lock:
+                    if self._needs_rebuild():
+                        self._rebuild(db)
+            # Someone else is rebuilding: keep serving the current snapshot meanwhile
+            elif self._build_lock.acquire(blocking=False):
+                try:
+                    self._rebuild(db)
+                finally:
+                    self._build_lock.release()
+
+        if self._changed_gigs:
+            with self._build_lock:
+                with self._lock:
+                    changed, self._changed_gigs = self._changed_gigs, set()
+                if changed:
+                    snapshot = self._snapshot
+                    # Closed and deleted gigs are not in the result, so they drop out
+                    rows = _gig_rows(db, snapshot.features, Gig.id.in_(changed))
+                    self._snapshot = snapshot.with_changes(changed, rows)
+        return self._snapshot
+
+    def clear(self) -> None:
+        with self._build_lock:
+            self._snapshot = None
+            self.invalidate()
+
+
+index = _RecommendationIndex()
+
+
+def student_vector(db: Session, features: Features, user_id: str) -> np.ndarray:
+    """The student's weight on each feature, from skill levels and the latest assessment."""
+
+    vector = np.zeros(len(features), dtype=np.float32)
+    skills = db.execute(select(UserSkill.skill_id, UserSkill.level).where(UserSkill.user_id == user_id)).all()
+    # Levels and scores come on different scales; only their proportions matter
+    top_level = max((level for _, level in skills), default=0)
+    for skill_id, level in skills:
+        column = features.skill_column.get(skill_id)
+        if column is not None and top_level > 0:
+            vector[column] = max(vector[column], level / top_level)
+
+    category_scores = db.execute(
+        select(AssessmentResult.category_scores)
+        .where(AssessmentResult.user_id == user_id)
+        .order_by(AssessmentResult.created_at.desc())
+        .limit(1)
+    ).scalar_one_or_none() or {}
+    numeric = {key: float(value) for key, value in category_scores.items() if isinstance(value, (int, float))}
+    top_score = max(numeric.values(), default=0.0)
+    for category_id, score in numeric.items():
+        column = features.category_column.get(category_id)
+        if column is not None and top_score > 0:
+            vector[column] = _ASSESSMENT_SHARE * score / top_score
+    return vector
+
+
+def recommend(db: Session, user_id: str, offset: int, limit: int) -> List[Recommendation]:
+    """Open gigs the student has not applied to, best match first, ``offset`` to ``offset + limit``."""
+
+    snapshot = index.snapshot(db)
+    student = student_vector(db, snapshot.features, user_id)
+    norm = float(np.linalg.norm(student))
+    if norm == 0.0 or not snapshot.gig_ids:
+        return []
+
+    scores = snapshot.scores(student) / norm
+    applied = db.scalars(select(GigApplication.gig_id).where(GigApplication.student_id == user_id)).all()
+    applied_slots = [snapshot.slots[gig_id] for gig_id in applied if gig_id in snapshot.slots]
+    scores[applied_slots] = 0.0
+
+    candidates = np.flatnonzero(scores > 0)
+    wanted = offset + limit
+    if len(candidates) > wanted:
+        candidates = candidates[np.argpartition(-scores[candidates], wanted - 1)[:wanted]]
+    # Best score first, newest gig first among equals
+    ordered = candidates[np.lexsort((-snapshot.created[candidates], -scores[candidates]))][offset:wanted]
+
+    recommendations = []
+    for slot in ordered:
+        columns, weights = snapshot.row(slot)
+        contributions = weights * student[columns]
+        matched = [
+            snapshot.features.names[column]
+            for column, contribution in sorted(zip(columns, contributions), key=lambda item: -item[1])
+            if contribution > 0 and snapshot.features.is_skill[column]
+        ]
+        recommendations.append(
+            Recommendation(snapshot.gig_ids[slot], round(float(scores[slot]), 4), matched[:MAX_MATCHED_SKILLS])
+        )
+    return recommendations
+
+
+def _needs_reindex(gig: Gig) -> bool:
+    state = inspect(gig)
+    return any(state.attrs[name].history.has_changes() for name in _INDEXED)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changes(session: Session, _flush_context) -> None:
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, Gig):
+            if obj in session.new or obj in session.deleted or _needs_reindex(obj):
+                session.info.setdefault(_PENDING_GIGS_KEY, set()).add(obj.id)
+        elif isinstance(obj, (SkillTag, AssessmentCategory)):
+            session.info[_PENDING_FEATURES_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_changes(session: Session) -> None:
+    gig_ids = session.info.pop(_PENDING_GIGS_KEY, None)
+    if session.info.pop(_PENDING_FEATURES_KEY, False):
+        index.invalidate()
+    elif gig_ids:
+        index.mark_gigs(gig_ids)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changes(session: Session) -> None:
+    session.info.pop(_PENDING_GIGS_KEY, None)
+    session.info.pop(_PENDING_FEATURES_KEY, None)
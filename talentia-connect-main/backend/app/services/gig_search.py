@@ -0,0 +1,255 @@
+"""Ranked full-text search over open gigs.
+
+PostgreSQL matches against the GIN-indexed ``gigs.search_document``
+generated column; SQLite (local development and tests) uses the ``gigs_fts`` FTS5
+table, which the ORM hooks below keep in step with gig inserts, edits and
+status changes. Every query term is a prefix, and a query that matches
+nothing is retried once with each unknown term replaced by its closest word
+from the index vocabulary.
+
+Bulk loads that bypass the ORM should finish with
+``python -m app.services.gig_search`` to rebuild the SQLite index.
+"""
+
+import bisect
+import difflib
+import re
+import threading
+import time
+from itertools import chain
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import Select, bindparam, column, event, func, inspect, literal_column, select, table, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from ..models.marketplace import GIG_FTS_DDL, GIG_FTS_TABLE, GIG_SEARCH_DOCUMENT_COLUMN, GIG_SEARCH_PG_DDL, Gig
+
+MAX_TERMS = 8
+VOCABULARY_TTL = 600.0
+
+# Set on responses whose results come from a spelling-corrected query
+CORRECTED_QUERY_HEADER = "X-Search-Corrected"
+
+_SEARCHABLE = ("title", "role", "category", "description", "status")
+_TERM_RE = re.compile(r"\w+", re.UNICODE)
+
+_fts = table(GIG_FTS_TABLE, column("gig_id"))
+
+
+def search_terms(query: str) -> List[str]:
+    return _TERM_RE.findall(query.lower())[:MAX_TERMS]
+
+
+def search_statement(
+    dialect_name: str,
+    terms: List[str],
+    category: Optional[str],
+    gig_type: Optional[str],
+    offset: int,
+    limit: int,
+) -> Select:
+    """One page of ``(gig_id, rank, tiebreak)`` for open gigs matching every term.
+
+    Ordered by ``rank`` (higher is better), then ``tiebreak``. Paging happens
+    here, against the index alone, so callers only join the rows they return.
+    """
+
+    if dialect_name == "postgresql":
+        query = func.to_tsquery(text("'simple'"), " & ".join(f"{term}:*" for term in terms))
+        document = literal_column(f"gigs.{GIG_SEARCH_DOCUMENT_COLUMN}")
+        rank = func.ts_rank_cd(document, query).label("rank")
+        tiebreak = Gig.id.label("tiebreak")
+        stmt = select(Gig.id.label("gig_id"), rank, tiebreak).where(
+            # Same predicate as the partial index
+            Gig.status == text("'OPEN'"),
+            document.op("@@")(query),
+        )
+    elif dialect_name == "sqlite":
+        match = " AND ".join(f'"{term}"*' for term in terms)
+        # bm25 weights per column: gig_id, title, role, category, description.
+        # bm25 is lower-is-better, so negate it.
+        rank = (-func.bm25(text(GIG_FTS_TABLE), 0.0, 10.0, 4.0, 4.0, 1.0)).label("rank")
+        tiebreak = literal_column(f"{GIG_FTS_TABLE}.rowid").label("tiebreak")
+        stmt = select(_fts.c.gig_id, rank, tiebreak).where(
+            text(f"{GIG_FTS_TABLE} MATCH :match").bindparams(match=match)
+        )
+        if category or gig_type:
+            stmt = stmt.join(Gig, Gig.id == _fts.c.gig_id)
+    else:
+        # Other databases: unranked substring match
+        rank = literal_column("0").label("rank")
+        tiebreak = Gig.id.label("tiebreak")
+        stmt = select(Gig.id.label("gig_id"), rank, tiebreak).where(
+            Gig.status == "OPEN",
+            *[
+                Gig.title.ilike(f"%{term}%")
+                | Gig.description.ilike(f"%{term}%")
+                | Gig.role.ilike(f"%{term}%")
+                | Gig.category.ilike(f"%{term}%")
+                for term in terms
+            ],
+        )
+
+    if category:
+        stmt = stmt.where(Gig.category == category)
+    if gig_type:
+        stmt = stmt.where(Gig.type == gig_type)
+    return stmt.order_by(rank.desc(), tiebreak).offset(offset).limit(limit)
+
+
+class _Vocabulary:
+    """Indexed words, refreshed at most every ``VOCABULARY_TTL`` seconds, for typo correction."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._words: List[str] = []
+        self._by_initial: Dict[str, List[str]] = {}
+        self._loaded_at = 0.0
+
+    @staticmethod
+    def _load(db: Session) -> Tuple[List[str], Dict[str, List[str]]]:
+        dialect_name = db.get_bind().dialect.name
+        if dialect_name == "sqlite":
+            rows = db.execute(text(f"SELECT term FROM {GIG_FTS_TABLE}_vocab"))
+        elif dialect_name == "postgresql":
+            # Titles, roles and categories carry the words people search for;
+            # descriptions would multiply the vocabulary for little gain.
+            rows = db.execute(
+                text(
+                    "SELECT word FROM ts_stat($$SELECT to_tsvector('simple', coalesce(title, '') || ' ' || "
+                    "coalesce(role, '') || ' ' || coalesce(category, '')) FROM gigs WHERE status = 'OPEN'$$)"
+                )
+            )
+        else:
+            rows = []
+        words = sorted({row[0] for row in rows if row[0] and not row[0].isdigit()})
+        by_initial: Dict[str, List[str]] = {}
+        for word in words:
+            by_initial.setdefault(word[0], []).append(word)
+        return words, by_initial
+
+    def correct(self, db: Session, terms: List[str]) -> List[str]:
+        with self._lock:
+            # One request reloads; the others keep correcting against the old words
+            reload = time.monotonic() - self._loaded_at > VOCABULARY_TTL
+            if reload:
+                self._loaded_at = time.monotonic()
+            words, by_initial = self._words, self._by_initial
+
+        if reload:
+            try:
+                words, by_initial = self._load(db)
+            except Exception:
+                self.clear()
+                raise
+            with self._lock:
+                self._words, self._by_initial = words, by_initial
+
+        corrected = []
+        for term in terms:
+            i = bisect.bisect_left(words, term)
+            if i < len(words) and words[i].startswith(term):
+                corrected.append(term)  # already a prefix of an indexed word
+                continue
+            # Typos rarely hit the first letter; comparing within it keeps this cheap
+            candidates = [w for w in by_initial.get(term[0], ()) if abs(len(w) - len(term)) <= 2]
+            match = difflib.get_close_matches(term, candidates, n=1, cutoff=0.75)
+            corrected.append(match[0] if match else term)
+        return corrected
+
+    def clear(self) -> None:
+        with self._lock:
+            self._loaded_at = 0.0
+
+
+vocabulary = _Vocabulary()
+
+# SQLite databases created before search existed get their FTS table on first write
+_checked_databases: set = set()
+
+
+def _fts_row(gig: Gig) -> Dict[str, str]:
+    return {
+        "gig_id": gig.id,
+        "title": gig.title or "",
+        "role": gig.role or "",
+        "category": gig.category or "",
+        "description": gig.description or "",
+    }
+
+
+def _needs_reindex(gig: Gig) -> bool:
+    state = inspect(gig)
+    return any(state.attrs[name].history.has_changes() for name in _SEARCHABLE)
+
+
+@event.listens_for(Session, "after_flush")
+def _sync_sqlite_index(session: Session, _flush_context) -> None:
+    changed = [
+        obj
+        for obj in chain(session.new, session.dirty, session.deleted)
+        if isinstance(obj, Gig) and (obj in session.new or obj in session.deleted or _needs_reindex(obj))
+    ]
+    if not changed:
+        return
+    connection = session.connection()
+    if connection.dialect.name != "sqlite":
+        return
+    if connection.engine.url not in _checked_databases:
+        exists = connection.execute(
+            text("SELECT 1 FROM sqlite_master WHERE name = :name"), {"name": GIG_FTS_TABLE}
+        ).first()
+        if not exists:
+            rebuild_search_index(connection)
+        _checked_databases.add(connection.engine.url)
+        if not exists:
+            # The flushed changes are in gigs already, so the rebuild covered them
+            return
+
+    deleted = [gig.id for gig in changed if gig not in session.new]
+    if deleted:
+        connection.execute(
+            text(f"DELETE FROM {GIG_FTS_TABLE} WHERE gig_id IN :ids").bindparams(bindparam("ids", expanding=True)),
+            {"ids": deleted},
+        )
+    rows = [_fts_row(gig) for gig in changed if gig not in session.deleted and gig.status == "OPEN"]
+    if rows:
+        connection.execute(
+            text(
+                f"INSERT INTO {GIG_FTS_TABLE} (gig_id, title, role, category, description) "
+                "VALUES (:gig_id, :title, :role, :category, :description)"
+            ),
+            rows,
+        )
+
+
+def rebuild_search_index(connection: Connection) -> None:
+    """Create the search index on an existing database and (SQLite) refill it from the gigs table."""
+
+    if connection.dialect.name == "postgresql":
+        # Idempotent; the generated column fills itself for existing rows
+        for ddl in GIG_SEARCH_PG_DDL:
+            connection.execute(ddl)
+        return
+    if connection.dialect.name != "sqlite":
+        return
+    for ddl in GIG_FTS_DDL:
+        connection.execute(ddl)
+    connection.execute(text(f"DELETE FROM {GIG_FTS_TABLE}"))
+    connection.execute(
+        text(
+            f"INSERT INTO {GIG_FTS_TABLE} (gig_id, title, role, category, description) "
+            "SELECT id, coalesce(title, ''), coalesce(role, ''), coalesce(category, ''), coalesce(description, '') "
+            "FROM gigs WHERE status = 'OPEN'"
+        )
+    )
+    vocabulary.clear()
+
+
+if __name__ == "__main__":
+    from ..db.session import engine
+
+    with engine.begin() as conn:
+        rebuild_search_index(conn)
+    print("Gig search index rebuilt.")
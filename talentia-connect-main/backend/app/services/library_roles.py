@@ -0,0 +1,40 @@
+"""Backfill of ``library_resource_roles`` from the ``allowed_roles`` column.
+
+Resources created or edited through the ORM keep both in step (see
+``LibraryResource._sync_roles``). Rows written before the join table existed,
+or by raw SQL, are not listed for any role until this runs:
+
+    python -m app.services.library_roles
+"""
+
+from sqlalchemy import exists, insert, select
+from sqlalchemy.engine import Connection
+
+from ..models.library import LibraryResource, LibraryResourceRole, parse_allowed_roles
+
+
+def backfill_resource_roles(connection: Connection) -> int:
+    """Create role rows for every resource that has none; returns how many resources were filled."""
+
+    missing = connection.execute(
+        select(LibraryResource.id, LibraryResource.allowed_roles).where(
+            ~exists().where(LibraryResourceRole.resource_id == LibraryResource.id)
+        )
+    ).all()
+    rows = [
+        {"resource_id": resource_id, "role": role}
+        for resource_id, allowed_roles in missing
+        for role in parse_allowed_roles(allowed_roles)
+    ]
+    if rows:
+        connection.execute(insert(LibraryResourceRole), rows)
+    return len(missing)
+
+
+if __name__ == "__main__":
+    from .. import models  # noqa: F401  # ensure all models are registered on Base
+    from ..db.session import engine
+
+    with engine.begin() as conn:
+        filled = backfill_resource_roles(conn)
+    print(f"Backfilled roles for {filled} library resources.")
@@ -0,0 +1,307 @@
+"""Free time of mentors: weekly and one-off availability minus booked sessions.
+
+Availability rows are wall-clock slots in ``settings.MENTORSHIP_TIMEZONE``,
+every week on a weekday or once on a date. Each worker keeps the approved
+mentors' rows as arrays, rebuilt after a commit that touches availability or
+mentor profiles and every ``INDEX_MAX_AGE`` seconds. For a query window the
+weekly rows are expanded over the window's days with NumPy and each
+mentor's overlapping slots are joined; the sessions booked around the window
+are read in a single query, whatever the number of mentors, and cut out of
+the slots through a per-mentor ``IntervalTree``. Times are seconds since the
+epoch until a page of results is returned. ``mentor_free_time`` does the
+same for one mentor from freshly read rows, for booking.
+
+Each local day converts to UTC at its own offset (taken at noon), so on a
+day the zone changes offset its slots can be off by the change.
+"""
+
+import threading
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta, timezone
+from itertools import chain
+from time import monotonic
+from typing import Dict, List, Optional, Sequence, Tuple
+from zoneinfo import ZoneInfo
+
+import numpy as np
+from sqlalchemy import event, or_, select
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+from ..core.intervals import IntervalTree, subtract
+from ..models.mentorship import DEFAULT_SESSION_MINUTES, MentorAvailability, MentorProfile, MentorshipSession
+
+INDEX_MAX_AGE = 300.0
+MAX_WINDOW = timedelta(days=31)
+CANCELLED = "CANCELLED"
+
+_PENDING_KEY = "mentor_availability_changes"
+_DAY = 86_400
+_NOON = 43_200
+
+
+@dataclass(frozen=True)
+class FreeMentor:
+    mentor_id: str
+    free: List[Tuple[datetime, datetime]]
+
+
+def _utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)  # SQLite returns timestamps naive, in UTC
+    return value.astimezone(timezone.utc)
+
+
+def _epoch(value: datetime) -> int:
+    return int(_utc(value).timestamp())
+
+
+def _datetime(seconds: int) -> datetime:
+    return datetime.fromtimestamp(seconds, timezone.utc)
+
+
+def _seconds(value: time) -> int:
+    return value.hour * 3600 + value.minute * 60 + value.second
+
+
+def _days(start: datetime, end: datetime) -> Tuple[int, np.ndarray, np.ndarray]:
+    """The local days a slot in the window can start on: the first one's ordinal, midnights (epoch) and weekdays."""
+
+    zone = ZoneInfo(settings.MENTORSHIP_TIMEZONE)
+    # From the day before: its slots may run past midnight into the window
+    first = start.astimezone(zone).date() - timedelta(days=1)
+    days = [first + timedelta(days=i) for i in range((end.astimezone(zone).date() - first).days + 1)]
+    midnights = np.array(
+        [int(datetime.combine(day, time(12), zone).timestamp()) - _NOON for day in days], dtype=np.int64
+    )
+    weekdays = np.array([day.weekday() for day in days], dtype=np.int64)
+    return first.toordinal(), midnights, weekdays
+
+
+class _Snapshot:
+    """The approved mentors' availability rows (or those of ``mentor_ids``), one array entry per row."""
+
+    def __init__(self, db: Session, mentor_ids: Optional[Sequence[str]] = None):
+        query = (
+            select(
+                MentorAvailability.mentor_id,
+                MentorAvailability.weekday,
+                MentorAvailability.date,
+                MentorAvailability.start_time,
+                MentorAvailability.end_time,
+            )
+            .join(MentorProfile, MentorProfile.id == MentorAvailability.mentor_id)
+            .where(
+                MentorProfile.approval_status == "APPROVED",
+                MentorAvailability.start_time.is_not(None),
+                MentorAvailability.end_time.is_not(None),
+                or_(MentorAvailability.date.is_not(None), MentorAvailability.weekday.is_not(None)),
+            )
+        )
+        if mentor_ids is not None:
+            query = query.where(MentorAvailability.mentor_id.in_(mentor_ids))
+        rows = db.connection().execute(query).all()
+        self.codes: Dict[str, int] = {}
+        self.mentor = np.fromiter(
+            (self.codes.setdefault(row.mentor_id, len(self.codes)) for row in rows), np.int64, len(rows)
+        )
+        self.mentor_ids: List[str] = list(self.codes)
+        self.begin = np.fromiter((_seconds(row.start_time) for row in rows), np.int64, len(rows))
+        # An end at or before the start runs past midnight; equal times span the whole day
+        self.length = (np.fromiter((_seconds(row.end_time) for row in rows), np.int64, len(rows)) - self.begin) % _DAY
+        self.length[self.length == 0] = _DAY
+        # A row with a date is a one-off slot on that date, whatever its weekday
+        self.date = np.fromiter((row.date.toordinal() if row.date else -1 for row in rows), np.int64, len(rows))
+        self.weekday = np.fromiter((-1 if row.date else row.weekday for row in rows), np.int64, len(rows))
+        self.built_at = monotonic()
+
+    def slots(
+        self, start: datetime, end: datetime, mentor_ids: Optional[Sequence[str]]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """The slots in the window, sorted by mentor and start: mentor positions, starts and ends."""
+
+        first, midnights, weekdays = _days(start, end)
+        rows = np.arange(len(self.mentor))
+        if mentor_ids is not None:
+            wanted = [self.codes[mentor_id] for mentor_id in mentor_ids if mentor_id in self.codes]
+            rows = rows[np.isin(self.mentor, wanted)]
+
+        # (row, day) pairs: weekly rows on every day of their weekday, dated rows on their date
+        weekly, weekly_days = np.nonzero(self.weekday[rows][:, None] == weekdays[None, :])
+        day = self.date[rows] - first
+        dated = np.flatnonzero((self.date[rows] >= 0) & (day >= 0) & (day < len(midnights)))
+        slot_rows = rows[np.concatenate([weekly, dated])]
+        slot_days = np.concatenate([weekly_days, day[dated]])
+
+        starts = midnights[slot_days] + self.begin[slot_rows]
+        ends = starts + self.length[slot_rows]
+        starts, ends = np.maximum(starts, _epoch(start)), np.minimum(ends, _epoch(end))
+        keep = ends > starts
+        mentors, starts, ends = self.mentor[slot_rows][keep], starts[keep], ends[keep]
+        order = np.lexsort((starts, mentors))
+        return mentors[order], starts[order], ends[order]
+
+
+class _AvailabilityIndex:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._snapshot: Optional[_Snapshot] = None
+        self._stale = True
+
+    def invalidate(self) -> None:
+        self._stale = True
+
+    def _needs_rebuild(self) -> bool:
+        snapshot = self._snapshot
+        return self._stale or snapshot is None or monotonic() - snapshot.built_at > INDEX_MAX_AGE
+
+    def snapshot(self, db: Session) -> _Snapshot:
+        if self._needs_rebuild():
+            with self._lock:
+                if self._needs_rebuild():
+                    # Commits from here on mark the new snapshot stale again
+                    self._stale = False
+                    try:
+                        self._snapshot = _Snapshot(db)
+                    except Exception:
+                        self._stale = True
+                        raise
+        return self._snapshot
+
+
+index = _AvailabilityIndex()
+
+
+def _booked(
+    db: Session, start: datetime, end: datetime, mentor_ids: Optional[Sequence[str]]
+) -> Dict[str, List[Tuple[int, int]]]:
+    """Mentor profile id -> the (start, end) of their sessions overlapping the window."""
+
+    # Sessions reference the mentor's user; slots reference the profile
+    query = (
+        select(MentorProfile.id, MentorshipSession.scheduled_at, MentorshipSession.ends_at)
+        .join(MentorProfile, MentorProfile.user_id == MentorshipSession.mentor_id)
+        .where(
+            MentorshipSession.status != CANCELLED,
+            MentorshipSession.scheduled_at < end,
+            MentorshipSession.ends_at > start,
+        )
+    )
+    if mentor_ids is not None:
+        query = query.where(MentorProfile.id.in_(mentor_ids))
+    booked: Dict[str, List[Tuple[int, int]]] = {}
+    for mentor_id, scheduled_at, ends_at in db.connection().execute(query):
+        booked.setdefault(mentor_id, []).append((_epoch(scheduled_at), _epoch(ends_at)))
+    return booked
+
+
+def _free(
+    db: Session,
+    snapshot: _Snapshot,
+    start: datetime,
+    end: datetime,
+    min_seconds: int,
+    mentor_ids: Optional[Sequence[str]],
+) -> Dict[str, List[Tuple[int, int]]]:
+    """Mentor id -> their free stretches of at least ``min_seconds`` in the (UTC) window, in order."""
+
+    ids = snapshot.mentor_ids
+    mentors, starts, ends = snapshot.slots(start, end, mentor_ids)
+    if not len(mentors):
+        return {}
+    booked = _booked(db, start, end, mentor_ids)
+
+    # Join each mentor's overlapping or touching slots. Offset per mentor, the
+    # slots are sorted on one line; a slot opens a new stretch when it starts
+    # after every earlier one has ended.
+    base = _epoch(start)
+    width = _epoch(end) - base + 1
+    reach = np.maximum.accumulate(mentors * width + (ends - base))
+    opens = np.ones(len(mentors), dtype=bool)
+    opens[1:] = mentors[1:] * width + (starts[1:] - base) > reach[:-1]
+    firsts = np.flatnonzero(opens)
+    mentors, starts, ends = mentors[firsts], starts[firsts], np.maximum.reduceat(ends, firsts)
+    keep = ends - starts >= min_seconds
+    mentors, starts, ends = mentors[keep], starts[keep], ends[keep]
+
+    # Cut each mentor's sessions out, through an interval tree built on first use
+    trees: Dict[str, IntervalTree] = {}
+    free: Dict[str, List[Tuple[int, int]]] = {}
+    for code, slot_start, slot_end in zip(mentors.tolist(), starts.tolist(), ends.tolist()):
+        mentor_id = ids[code]
+        pieces = [(slot_start, slot_end)]
+        if mentor_id in booked:
+            if mentor_id not in trees:
+                trees[mentor_id] = IntervalTree(booked[mentor_id])
+            sessions = booked[mentor_id]
+            cuts = [sessions[i] for i in trees[mentor_id].overlapping(slot_start, slot_end)]
+            pieces = subtract(slot_start, slot_end, cuts) if cuts else pieces
+        for piece in pieces:
+            if piece[1] - piece[0] >= min_seconds:
+                free.setdefault(mentor_id, []).append(piece)
+    return free
+
+
+def free_mentors(
+    db: Session,
+    start: datetime,
+    end: datetime,
+    min_minutes: int = DEFAULT_SESSION_MINUTES,
+    mentor_ids: Optional[Sequence[str]] = None,
+    offset: int = 0,
+    limit: int = 20,
+) -> List[FreeMentor]:
+    """Approved mentors with free time in ``[start, end)``, ``offset`` to ``offset + limit``.
+
+    Only free stretches of at least ``min_minutes`` count. Mentors are
+    ordered by their first free moment, then by id. ``mentor_ids`` limits
+    the search to those mentors.
+    """
+
+    # UTC throughout: SQLite compares timestamps as stored, without their offset
+    start, end = _utc(start), _utc(end)
+    if end <= start:
+        return []
+
+    free = _free(db, index.snapshot(db), start, end, min_minutes * 60, mentor_ids)
+    # (first free moment, mentor id, free stretches)
+    found = [(stretches[0][0], mentor_id, stretches) for mentor_id, stretches in free.items()]
+    found.sort(key=lambda entry: entry[:2])
+    return [
+        FreeMentor(mentor_id=mentor_id, free=[(_datetime(a), _datetime(b)) for a, b in stretches])
+        for _, mentor_id, stretches in found[offset : offset + limit]
+    ]
+
+
+def mentor_free_time(db: Session, mentor_id: str, start: datetime, end: datetime) -> List[Tuple[datetime, datetime]]:
+    """One approved mentor's free stretches in ``[start, end)``.
+
+    Reads the mentor's availability from the database instead of the
+    worker's snapshot, so changes made through other workers count at once;
+    bookings are checked with it.
+    """
+
+    start, end = _utc(start), _utc(end)
+    if end <= start:
+        return []
+    free = _free(db, _Snapshot(db, [mentor_id]), start, end, 1, [mentor_id])
+    return [(_datetime(a), _datetime(b)) for a, b in free.get(mentor_id, [])]
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changes(session: Session, _flush_context) -> None:
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, (MentorProfile, MentorAvailability)):
+            session.info[_PENDING_KEY] = True
+            return
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_changes(session: Session) -> None:
+    if session.info.pop(_PENDING_KEY, False):
+        index.invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changes(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
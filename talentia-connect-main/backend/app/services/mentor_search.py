@@ -0,0 +1,180 @@
+"""Mentor discovery: an in-memory inverted index over expertise tags.
+
+Mentors get positions in id order. Per normalized tag the index keeps the
+sorted positions of the mentors carrying it, and per mentor the hourly rate
+and approval status as arrays. A query intersects (``all``) or merges
+(``any``) the posting lists of its tags. A tag ending in ``*`` stands for
+every tag starting with the rest, found by bisecting the sorted tag list.
+Rate and status filters are then masks over the matching positions. The
+database is only read to load the returned page.
+
+Each worker rebuilds its index from ``mentor_profiles`` and
+``mentor_expertise_tags`` after a commit that touches either, and every
+``INDEX_MAX_AGE`` seconds to pick up other workers' writes. A rebuild
+reads two narrow tables: tens of milliseconds for a few thousand mentors.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from itertools import chain
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from ..models.mentorship import MentorExpertiseTag, MentorProfile, normalize_tag
+
+INDEX_MAX_AGE = 300.0
+
+_PENDING_KEY = "mentor_search_changes"
+_EMPTY = np.empty(0, dtype=np.int32)
+
+
+class _Snapshot:
+    def __init__(self, db: Session):
+        # Core rows: thousands of mentors and several tags each, no ORM needed
+        connection = db.connection()
+        profiles = connection.execute(
+            select(MentorProfile.id, MentorProfile.hourly_rate, MentorProfile.approval_status).order_by(
+                MentorProfile.id
+            )
+        ).all()
+        self.mentor_ids: List[str] = [row.id for row in profiles]
+        # NaN for mentors without a rate: every range comparison drops them
+        self.rates = np.array([row.hourly_rate for row in profiles], dtype=np.float64)
+        self.statuses = np.array([row.approval_status for row in profiles], dtype=str)
+
+        positions = {mentor_id: i for i, mentor_id in enumerate(self.mentor_ids)}
+        rows = connection.execute(select(MentorExpertiseTag.tag, MentorExpertiseTag.mentor_id)).all()
+        # The two reads need not share a snapshot (READ COMMITTED on PostgreSQL):
+        # tags of a mentor committed in between wait for the next rebuild
+        rows = [row for row in rows if row.mentor_id in positions]
+        tag_ids: Dict[str, int] = {}
+        tag_of = np.fromiter(
+            (tag_ids.setdefault(row.tag, len(tag_ids)) for row in rows), dtype=np.int32, count=len(rows)
+        )
+        mentor_of = np.fromiter((positions[row.mentor_id] for row in rows), dtype=np.int32, count=len(rows))
+        # Group by tag, mentors ascending within each tag
+        order = np.lexsort((mentor_of, tag_of))
+        bounds = np.searchsorted(tag_of[order], np.arange(len(tag_ids) + 1))
+        mentor_of = mentor_of[order]
+        self.postings: Dict[str, np.ndarray] = {
+            tag: mentor_of[bounds[i] : bounds[i + 1]] for tag, i in tag_ids.items()
+        }
+        self.tags: List[str] = sorted(tag_ids)
+        self.built_at = time.monotonic()
+
+    def term(self, term: str) -> np.ndarray:
+        """Positions of the mentors matching one query term."""
+
+        if not term.endswith("*"):
+            return self.postings.get(normalize_tag(term), _EMPTY)
+        prefix = normalize_tag(term[:-1])
+        start = bisect_left(self.tags, prefix)
+        end = start
+        while end < len(self.tags) and self.tags[end].startswith(prefix):
+            end += 1
+        if end - start == 1:
+            return self.postings[self.tags[start]]
+        return np.unique(np.concatenate([_EMPTY, *(self.postings[tag] for tag in self.tags[start:end])]))
+
+    def search(
+        self,
+        terms: Sequence[str],
+        match_any: bool,
+        min_rate: Optional[float],
+        max_rate: Optional[float],
+        approval_status: Optional[str],
+    ) -> np.ndarray:
+        if not terms:
+            matches = np.arange(len(self.mentor_ids), dtype=np.int32)
+        elif match_any:
+            matches = np.unique(np.concatenate([_EMPTY, *(self.term(term) for term in terms)]))
+        else:
+            # Rarest first, so the running intersection stays small
+            postings = sorted((self.term(term) for term in terms), key=len)
+            matches = postings[0]
+            for other in postings[1:]:
+                if not len(matches):
+                    break
+                matches = np.intersect1d(matches, other, assume_unique=True)
+
+        if min_rate is not None:
+            matches = matches[self.rates[matches] >= min_rate]
+        if max_rate is not None:
+            matches = matches[self.rates[matches] <= max_rate]
+        if approval_status is not None:
+            matches = matches[self.statuses[matches] == approval_status]
+        return matches
+
+
+class _MentorIndex:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._snapshot: Optional[_Snapshot] = None
+        self._stale = True
+
+    def invalidate(self) -> None:
+        self._stale = True
+
+    def _needs_rebuild(self) -> bool:
+        snapshot = self._snapshot
+        return self._stale or snapshot is None or time.monotonic() - snapshot.built_at > INDEX_MAX_AGE
+
+    def snapshot(self, db: Session) -> _Snapshot:
+        if self._needs_rebuild():
+            with self._lock:
+                if self._needs_rebuild():
+                    # Commits from here on mark the new snapshot stale again
+                    self._stale = False
+                    try:
+                        self._snapshot = _Snapshot(db)
+                    except Exception:
+                        self._stale = True
+                        raise
+        return self._snapshot
+
+
+index = _MentorIndex()
+
+
+def search_mentors(
+    db: Session,
+    tags: Sequence[str] = (),
+    match_any: bool = False,
+    min_rate: Optional[float] = None,
+    max_rate: Optional[float] = None,
+    approval_status: Optional[str] = None,
+    offset: int = 0,
+    limit: int = 20,
+) -> List[str]:
+    """Ids of the matching mentors, in id order, ``offset`` to ``offset + limit``.
+
+    ``tags`` must all match, or with ``match_any`` at least one; a tag ending
+    in ``*`` matches by prefix.
+    """
+
+    snapshot = index.snapshot(db)
+    matches = snapshot.search(tags, match_any, min_rate, max_rate, approval_status)
+    return [snapshot.mentor_ids[position] for position in matches[offset : offset + limit]]
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changes(session: Session, _flush_context) -> None:
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, (MentorProfile, MentorExpertiseTag)):
+            session.info[_PENDING_KEY] = True
+            return
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_changes(session: Session) -> None:
+    if session.info.pop(_PENDING_KEY, False):
+        index.invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changes(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,136 @@
+"""Booking mentorship sessions without double-booking a mentor.
+
+A booking must fit in the mentor's free time (their availability minus
+their other sessions, see ``mentor_availability.mentor_free_time``) and not
+overlap another session of the student. The checks and the insert run in
+one transaction that first locks the mentor: ``SELECT ... FOR UPDATE`` on
+their profile row, or on SQLite, which has no row locks, a no-op write that
+takes the database write lock. Concurrent bookings of a mentor therefore
+queue, and each one checks against the sessions committed before it. On
+PostgreSQL the ``mentorship_sessions_no_overlap`` exclusion constraint also
+rejects overlapping sessions however they are written.
+
+Before touching the database a booking holds its slot in a per-worker
+table for ``HOLD_SECONDS``; a request for an overlapping slot of the same
+mentor is turned away at once instead of queueing on the lock. A failed
+booking releases its hold; a successful one keeps it until it expires, so
+repeated requests for the slot just taken are turned away the same way.
+"""
+
+import threading
+import uuid
+from datetime import datetime, timedelta, timezone
+from time import monotonic
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from ..models.mentorship import MentorProfile, MentorshipSession
+from .mentor_availability import CANCELLED, mentor_free_time
+
+HOLD_SECONDS = 30.0
+# Sweep expired holds of every mentor once this many mentors have some
+_SWEEP_AT = 1024
+
+_Hold = Tuple[float, float, float]  # start, end (epoch seconds), expiry (monotonic)
+
+
+class SlotUnavailable(Exception):
+    """The slot is taken, being booked, or outside the mentor's free time."""
+
+
+class _SlotHolds:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._holds: Dict[str, List[_Hold]] = {}
+
+    def acquire(self, mentor_id: str, start: float, end: float) -> Optional[_Hold]:
+        """Hold ``[start, end)`` of the mentor, or None if it overlaps a live hold."""
+
+        now = monotonic()
+        with self._lock:
+            if len(self._holds) >= _SWEEP_AT:
+                self._holds = {
+                    key: kept for key, held in self._holds.items() if (kept := [h for h in held if h[2] > now])
+                }
+            live = [hold for hold in self._holds.get(mentor_id, ()) if hold[2] > now]
+            if any(hold_start < end and hold_end > start for hold_start, hold_end, _ in live):
+                self._holds[mentor_id] = live
+                return None
+            hold = (start, end, now + HOLD_SECONDS)
+            self._holds[mentor_id] = live + [hold]
+            return hold
+
+    def release(self, mentor_id: str, hold: _Hold) -> None:
+        with self._lock:
+            kept = [other for other in self._holds.get(mentor_id, ()) if other is not hold]
+            if kept:
+                self._holds[mentor_id] = kept
+            else:
+                self._holds.pop(mentor_id, None)
+
+
+holds = _SlotHolds()
+
+
+def _lock_mentor(db: Session, mentor_id: str) -> None:
+    """Serialize bookings of the mentor until the transaction ends."""
+
+    if db.get_bind().dialect.name == "sqlite":
+        db.execute(update(MentorProfile).where(MentorProfile.id == mentor_id).values(id=MentorProfile.id))
+    else:
+        db.execute(select(MentorProfile.id).where(MentorProfile.id == mentor_id).with_for_update())
+
+
+def book_session(
+    db: Session, mentor: MentorProfile, student_id: str, start: datetime, minutes: int
+) -> MentorshipSession:
+    """Book and commit a session of ``minutes`` from ``start``, or raise ``SlotUnavailable``."""
+
+    if start.tzinfo is None:
+        start = start.replace(tzinfo=timezone.utc)
+    start = start.astimezone(timezone.utc).replace(second=0, microsecond=0)
+    end = start + timedelta(minutes=minutes)
+    hold = holds.acquire(mentor.id, start.timestamp(), end.timestamp())
+    if hold is None:
+        raise SlotUnavailable("This slot has just been booked or is being booked")
+
+    try:
+        _lock_mentor(db, mentor.id)
+        if mentor_free_time(db, mentor.id, start, end) != [(start, end)]:
+            raise SlotUnavailable("The mentor is not free at that time")
+        clash = db.scalar(
+            select(MentorshipSession.id)
+            .where(
+                MentorshipSession.student_id == student_id,
+                MentorshipSession.status != CANCELLED,
+                MentorshipSession.scheduled_at < end,
+                MentorshipSession.ends_at > start,
+            )
+            .limit(1)
+        )
+        if clash is not None:
+            raise SlotUnavailable("You already have a session at that time")
+
+        session = MentorshipSession(
+            id=str(uuid.uuid4()),
+            mentor_id=mentor.user_id,
+            student_id=student_id,
+            scheduled_at=start,
+            duration_minutes=minutes,
+            status="SCHEDULED",
+        )
+        db.add(session)
+        db.commit()
+    except IntegrityError:
+        # The exclusion constraint caught an overlap the checks could not see
+        db.rollback()
+        holds.release(mentor.id, hold)
+        raise SlotUnavailable("The mentor is not free at that time") from None
+    except BaseException:
+        db.rollback()
+        holds.release(mentor.id, hold)
+        raise
+    return session
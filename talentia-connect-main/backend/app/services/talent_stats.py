@@ -0,0 +1,218 @@
+"""Maintenance of the materialized ``talent_stats`` table.
+
+Contract releases update a student's row incrementally, and flushed
+``user_skills`` changes refresh the ``top_skills`` of existing rows. A full
+rebuild from
+``rating_reviews``, ``contracts`` and ``user_skills`` is available for
+backfills:
+
+    python -m app.services.talent_stats
+"""
+
+from itertools import chain
+from typing import Dict, Iterable, List, Optional, Set
+
+from sqlalchemy import delete, event, func, insert, inspect, select, update
+from sqlalchemy.orm import Session
+
+from .. import models  # noqa: F401  # ensure all models are registered on Base
+from ..db.session import SessionLocal
+from ..models.assessment import SkillTag, UserSkill
+from ..models.marketplace import Contract, GigApplication
+from ..models.portfolio import RatingReview
+from ..models.talent import TalentStats
+
+TOP_SKILLS_PER_USER = 5
+
+_PENDING_KEY = "talent_stats_skill_changes"
+
+
+def top_skills_by_user(
+    db: Session,
+    user_ids: Optional[Iterable[str]] = None,
+    per_user: int = TOP_SKILLS_PER_USER,
+) -> Dict[str, List[str]]:
+    """Fetch the strongest skills (by level) for many users in one windowed query.
+
+    With ``user_ids=None`` every user with skills is included.
+    """
+
+    ranked = (
+        select(
+            UserSkill.user_id.label("user_id"),
+            SkillTag.name.label("name"),
+            func.row_number()
+            .over(partition_by=UserSkill.user_id, order_by=(UserSkill.level.desc(), SkillTag.name))
+            .label("position"),
+        )
+        .join(SkillTag, SkillTag.id == UserSkill.skill_id)
+    )
+    if user_ids is not None:
+        user_ids = list(user_ids)
+        if not user_ids:
+            return {}
+        ranked = ranked.where(UserSkill.user_id.in_(user_ids))
+    ranked = ranked.subquery()
+
+    rows = db.execute(
+        select(ranked.c.user_id, ranked.c.name)
+        .where(ranked.c.position <= per_user)
+        .order_by(ranked.c.user_id, ranked.c.position)
+    )
+
+    skills: Dict[str, List[str]] = {}
+    for user_id, name in rows:
+        skills.setdefault(user_id, []).append(name)
+    return skills
+
+
+def _review_totals(db: Session, user_id: Optional[str] = None):
+    query = select(
+        RatingReview.to_user_id,
+        func.coalesce(func.sum(RatingReview.rating), 0.0),
+        func.count(RatingReview.id),
+    ).group_by(RatingReview.to_user_id)
+    if user_id is not None:
+        query = query.where(RatingReview.to_user_id == user_id)
+    return {row[0]: (float(row[1]), int(row[2])) for row in db.execute(query)}
+
+
+def _completed_gigs(db: Session, user_id: Optional[str] = None):
+    query = (
+        select(GigApplication.student_id, func.count(Contract.id))
+        .join(Contract, Contract.application_id == GigApplication.id)
+        .where(Contract.status == "COMPLETED")
+        .group_by(GigApplication.student_id)
+    )
+    if user_id is not None:
+        query = query.where(GigApplication.student_id == user_id)
+    return {row[0]: int(row[1]) for row in db.execute(query)}
+
+
+def _stats_row(user_id: str, rating_total: float, reviews_count: int, completed_gigs: int, skills: List[str]) -> dict:
+    return {
+        "user_id": user_id,
+        "rating_total": rating_total,
+        "reviews_count": reviews_count,
+        "avg_rating": rating_total / reviews_count if reviews_count else 0.0,
+        "completed_gigs": completed_gigs,
+        "top_skills": skills,
+    }
+
+
+def _upsert_first_stats(db: Session, user_id: str, rating: Optional[float], newly_completed: bool) -> None:
+    """Create a student's row from the source tables (pending changes must be flushed).
+
+    Another transaction may insert the row first (two releases for a new
+    student at once); the conflict branch then folds this release into its
+    row the way :func:`record_contract_release` does.
+    """
+
+    rating_total, reviews_count = _review_totals(db, user_id).get(user_id, (0.0, 0))
+    completed = _completed_gigs(db, user_id).get(user_id, 0)
+    skills = top_skills_by_user(db, [user_id]).get(user_id, [])
+
+    dialect_name = db.get_bind().dialect.name
+    if dialect_name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as upsert
+    else:
+        from sqlalchemy.dialects.sqlite import insert as upsert
+
+    stmt = upsert(TalentStats).values(**_stats_row(user_id, rating_total, reviews_count, completed, skills))
+    changes = {"top_skills": stmt.excluded.top_skills, "updated_at": func.now()}
+    if rating is not None:
+        changes["rating_total"] = TalentStats.rating_total + rating
+        changes["reviews_count"] = TalentStats.reviews_count + 1
+        changes["avg_rating"] = (TalentStats.rating_total + rating) / (TalentStats.reviews_count + 1)
+    if newly_completed:
+        changes["completed_gigs"] = TalentStats.completed_gigs + 1
+    db.execute(stmt.on_conflict_do_update(index_elements=[TalentStats.user_id], set_=changes))
+
+
+def record_contract_release(db: Session, user_id: str, rating: Optional[float], newly_completed: bool) -> None:
+    """Fold a released contract (and its optional review) into the student's stats.
+
+    Must run inside the release transaction after the new review/contract
+    state has been flushed, so a first-time student can be computed from
+    scratch.
+    """
+
+    stats = db.get(TalentStats, user_id, with_for_update=True)
+    if stats is None:
+        _upsert_first_stats(db, user_id, rating, newly_completed)
+        return
+
+    if rating is not None:
+        stats.rating_total += rating
+        stats.reviews_count += 1
+        stats.avg_rating = stats.rating_total / stats.reviews_count
+    if newly_completed:
+        stats.completed_gigs += 1
+    stats.top_skills = top_skills_by_user(db, [user_id]).get(user_id, [])
+
+
+@event.listens_for(UserSkill.user_id, "set", active_history=True)
+def _load_previous_owner(_target, _value, _oldvalue, _initiator) -> None:
+    # Registered for active_history alone: reassigning a skill loads its old
+    # owner, so the flush below finds it in the attribute history
+    pass
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_skill_changes(session: Session, _flush_context) -> None:
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, UserSkill):
+            # A skill moved to another user changes both users' lists
+            history = inspect(obj).attrs.user_id.history
+            changed: Set[str] = session.info.setdefault(_PENDING_KEY, set())
+            changed.update(user_id for user_id in history.sum() if user_id)
+
+
+@event.listens_for(Session, "after_flush_postexec")
+def _refresh_top_skills(session: Session, _flush_context) -> None:
+    user_ids = session.info.pop(_PENDING_KEY, None)
+    if not user_ids:
+        return
+    skills = top_skills_by_user(session, user_ids)
+    for user_id in user_ids:
+        # Students without a row yet get one with their skills on their first release
+        session.execute(
+            update(TalentStats).where(TalentStats.user_id == user_id).values(top_skills=skills.get(user_id, []))
+        )
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_skill_changes(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+def rebuild_talent_stats(db: Session) -> int:
+    """Rebuild the whole table from the source tables; returns the number of rows written."""
+
+    reviews = _review_totals(db)
+    completed = _completed_gigs(db)
+    user_ids = set(reviews) | set(completed)
+    skills = top_skills_by_user(db)
+
+    rows = [
+        _stats_row(
+            user_id,
+            reviews.get(user_id, (0.0, 0))[0],
+            reviews.get(user_id, (0.0, 0))[1],
+            completed.get(user_id, 0),
+            skills.get(user_id, []),
+        )
+        for user_id in user_ids
+    ]
+
+    db.execute(delete(TalentStats))
+    if rows:
+        db.execute(insert(TalentStats), rows)
+    return len(rows)
+
+
+if __name__ == "__main__":
+    with SessionLocal() as session:
+        written = rebuild_talent_stats(session)
+        session.commit()
+    print(f"Rebuilt talent_stats for {written} users")
@@ -0,0 +1,167 @@
+"""Server-side store of refresh tokens, and revocation of the sessions they back.
+
+Refresh tokens are random 256-bit strings; only their SHA-256 is stored, so
+renewing a session is a single indexed lookup (no password KDF). Access
+tokens carry their session (token family) id as the ``sid`` claim. When a
+session is revoked its id is remembered for the lifetime of an access token,
+so access tokens already handed out stop working too instead of lingering
+until they expire. Expired rows can be purged with:
+
+    python -m app.services.token_store
+"""
+
+import hashlib
+import secrets
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import delete, or_, select, update
+from sqlalchemy.orm import Session
+
+from ..core.cache import cache_backend
+from ..core.config import settings
+from ..models.user import RefreshToken
+
+_REVOKED_PREFIX = "revoked_session:"
+
+
+class InvalidRefreshToken(Exception):
+    """The refresh token is unknown, expired, revoked or was already used."""
+
+
+class _RevokedSessions:
+    """Session ids revoked in the last access-token lifetime.
+
+    Unlike the LRU caches, entries are never evicted early: forgetting one
+    would revive a revoked session's access tokens. With a shared cache
+    backend (Redis) revocations also reach the other worker processes.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._expires: Dict[str, float] = {}
+
+    @staticmethod
+    def _ttl() -> float:
+        return settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60.0
+
+    def add(self, session_id: str) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self._expires = {sid: expires for sid, expires in self._expires.items() if expires > now}
+            self._expires[session_id] = now + self._ttl()
+        if not cache_backend.is_local:
+            cache_backend.set(_REVOKED_PREFIX + session_id, b"1", self._ttl())
+
+    def __contains__(self, session_id: str) -> bool:
+        with self._lock:
+            expires = self._expires.get(session_id)
+        if expires is not None and expires > time.monotonic():
+            return True
+        return not cache_backend.is_local and cache_backend.get(_REVOKED_PREFIX + session_id) is not None
+
+
+revoked_sessions = _RevokedSessions()
+
+
+def _hash(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def issue_refresh_token(db: Session, user_id: str, family_id: Optional[str] = None) -> Tuple[str, RefreshToken]:
+    """Add a new refresh token (starting a new session unless ``family_id`` is given); caller commits."""
+
+    token = secrets.token_urlsafe(32)
+    record = RefreshToken(
+        id=str(uuid.uuid4()),
+        user_id=user_id,
+        family_id=family_id or str(uuid.uuid4()),
+        token_hash=_hash(token),
+        expires_at=_now() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+    )
+    db.add(record)
+    return token, record
+
+
+def _as_aware(value: datetime) -> datetime:
+    # SQLite hands timezone-aware columns back naive
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
+def rotate_refresh_token(db: Session, token: str) -> Tuple[str, RefreshToken]:
+    """Exchange ``token`` for its successor in the same session; commits."""
+
+    record = db.execute(select(RefreshToken).where(RefreshToken.token_hash == _hash(token))).scalar_one_or_none()
+    if record is None:
+        raise InvalidRefreshToken()
+    if record.revoked_at is not None:
+        if record.replaced_by_id is not None:
+            # A rotated token came back: someone else holds the family
+            revoke_session(db, record.family_id)
+        raise InvalidRefreshToken()
+    if _as_aware(record.expires_at) <= _now():
+        raise InvalidRefreshToken()
+
+    new_token, successor = issue_refresh_token(db, record.user_id, record.family_id)
+    # Conditional update: of two concurrent refreshes with the same token only one wins
+    claimed = db.execute(
+        update(RefreshToken)
+        .where(RefreshToken.id == record.id, RefreshToken.revoked_at.is_(None))
+        .values(revoked_at=_now(), replaced_by_id=successor.id)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    if claimed != 1:
+        db.rollback()
+        raise InvalidRefreshToken()
+    db.commit()
+    return new_token, successor
+
+
+def revoke_session(db: Session, family_id: str) -> None:
+    """Revoke every token of a session and reject its outstanding access tokens; commits."""
+
+    db.execute(
+        update(RefreshToken)
+        .where(RefreshToken.family_id == family_id, RefreshToken.revoked_at.is_(None))
+        .values(revoked_at=_now())
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    revoked_sessions.add(family_id)
+
+
+def revoke_refresh_token(db: Session, token: str) -> None:
+    """Log out the session ``token`` belongs to; unknown tokens are ignored."""
+
+    family_id = db.execute(
+        select(RefreshToken.family_id).where(RefreshToken.token_hash == _hash(token))
+    ).scalar_one_or_none()
+    if family_id is not None:
+        revoke_session(db, family_id)
+
+
+def purge_expired_tokens(db: Session) -> int:
+    """Delete tokens that expired, or were revoked more than a token lifetime ago."""
+
+    cutoff = _now() - timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+    deleted = db.execute(
+        delete(RefreshToken).where(or_(RefreshToken.expires_at < _now(), RefreshToken.revoked_at < cutoff))
+    ).rowcount
+    db.commit()
+    return deleted
+
+
+if __name__ == "__main__":
+    from .. import models  # noqa: F401  # ensure all models are registered on Base
+    from ..db.session import SessionLocal
+
+    with SessionLocal() as session:
+        purged = purge_expired_tokens(session)
+    print(f"Purged {purged} refresh tokens.")
@@ -0,0 +1,56 @@
+"""Per-process cache of authenticated ``User`` rows.
+
+``get_current_user`` keeps detached ``User`` instances here for
+``AUTH_USER_CACHE_TTL`` seconds and merges them into the request session
+without a query. Any committed change to a user drops its entry in this
+process; other worker processes pick the change up when their entry expires.
+"""
+
+from itertools import chain
+from typing import Optional, Set
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from ..core.cache import MemoryCache
+from ..core.config import settings
+from ..models.user import User
+
+_users = MemoryCache(maxsize=4096, ttl=settings.AUTH_USER_CACHE_TTL)
+_PENDING_KEY = "user_cache_invalidations"
+
+
+def get_cached_user(user_id: str) -> Optional[User]:
+    if settings.AUTH_USER_CACHE_TTL <= 0:
+        return None
+    return _users.get(user_id)
+
+
+def cache_user(user: User) -> None:
+    """Store a detached, fully loaded ``user``."""
+
+    if settings.AUTH_USER_CACHE_TTL > 0:
+        _users.set(user.id, user)
+
+
+def invalidate_user(user_id: str) -> None:
+    _users.delete(user_id)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_user_changes(session: Session, _flush_context) -> None:
+    changed: Set[str] = session.info.setdefault(_PENDING_KEY, set())
+    for obj in chain(session.dirty, session.deleted):
+        if isinstance(obj, User) and obj.id is not None:
+            changed.add(obj.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_users(session: Session) -> None:
+    for user_id in session.info.pop(_PENDING_KEY, ()):
+        invalidate_user(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_user_changes(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
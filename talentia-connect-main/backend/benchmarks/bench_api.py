@@ -0,0 +1,510 @@
+"""Mixed-traffic load test of the whole API against a seeded database.
+
+Seeds a synthetic dataset (companies, students, gigs, applications,
+contracts, reviews, conversations with messages, courses) whose size is set
+on the command line, then drives the real ``app.main.app`` in-process with
+``--concurrency`` virtual users. Each user loops over a weighted mix of
+requests, Locust style: gig listing and search, talent listing, course
+detail, login, and the conversation endpoints (summaries, a page of
+messages, sending a message). After ``--warmup`` seconds, every request in
+the next ``--duration`` seconds is recorded.
+
+Prints p50/p95/p99 latency and throughput per endpoint and, with
+``--output``, writes them as JSON together with the commit, the dataset
+size and the run parameters. ``--compare`` prints the change against such a
+file, so a baseline can be taken on one commit and checked on the next:
+
+    python -m benchmarks.bench_api --output before.json
+    git checkout my-branch
+    python -m benchmarks.bench_api --compare before.json --output after.json
+
+The dataset is generated from ``--seed``, so two runs with the same sizes
+seed the same rows. SQLite (a fresh file per run) is the default; pass
+``--database-url`` to use an empty local Postgres database instead.
+
+Run from the backend directory (needs ``httpx``).
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+
+def _configure_env() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--companies", type=int, default=100)
+    parser.add_argument("--students", type=int, default=2_000)
+    parser.add_argument("--gigs", type=int, default=5_000)
+    parser.add_argument("--applications-per-gig", type=int, default=4)
+    parser.add_argument("--conversations", type=int, default=1_000, help="approved applications with a chat")
+    parser.add_argument("--messages-per-conversation", type=int, default=30)
+    parser.add_argument("--courses", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=20.0, help="measured seconds")
+    parser.add_argument("--warmup", type=float, default=3.0, help="unmeasured seconds before that")
+    parser.add_argument("--personas", type=int, default=50, help="signed-in users for the conversation requests")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--cold-cache", action="store_true", help="clear the catalog cache before every request")
+    parser.add_argument("--output", default=None, help="write the JSON report here ('-' for stdout)")
+    parser.add_argument("--compare", default=None, help="JSON report of an earlier run to compare against")
+    args = parser.parse_args()
+
+    if args.database_url is None:
+        db_file = os.path.join(tempfile.mkdtemp(prefix="talentia-bench-"), "bench.db")
+        args.database_url = f"sqlite:///{db_file}"
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+    return args
+
+
+ARGS = _configure_env() if __name__ == "__main__" else None
+
+import httpx  # noqa: E402
+from sqlalchemy import insert  # noqa: E402
+from sqlalchemy.engine import make_url  # noqa: E402
+
+from app.core import security  # noqa: E402
+from app.core.config import settings  # noqa: E402
+from app.db.migrations import upgrade_database  # noqa: E402
+from app.db.session import SessionLocal, engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.assessment import SkillTag, UserSkill  # noqa: E402
+from app.models.course import Course, CourseModule, Lesson  # noqa: E402
+from app.models.marketplace import Contract, Conversation, Gig, GigApplication, Message  # noqa: E402
+from app.models.portfolio import RatingReview  # noqa: E402
+from app.models.user import User, UserRole  # noqa: E402
+from app.services.catalog_cache import cache_backend  # noqa: E402
+from app.services.gig_search import rebuild_search_index  # noqa: E402
+from app.services.talent_stats import rebuild_talent_stats  # noqa: E402
+
+PASSWORD = "benchmark-password"
+CATEGORIES = ["Music", "Dance", "Design", "Photography", "Writing", "Video", "Development", "Marketing"]
+TITLE_WORDS = [
+    "wedding", "singer", "logo", "brand", "portrait", "event", "website", "mobile", "editor", "dancer",
+    "choreography", "copywriter", "translator", "tutor", "animation", "podcast", "drummer", "social", "media", "campaign",
+]
+SKILLS = ["Dance", "Singing", "Guitar", "Photography", "Illustration", "Python", "React", "Video Editing", "Copywriting", "Marketing"]
+CHUNK = 5_000
+
+Task = Callable[[httpx.AsyncClient, random.Random], Awaitable[httpx.Response]]
+
+
+def _uuid(rng: random.Random) -> str:
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
+def _insert(db, model, rows: List[dict]) -> None:
+    for start in range(0, len(rows), CHUNK):
+        db.execute(insert(model), rows[start : start + CHUNK])
+
+
+class Dataset:
+    """Ids of the seeded rows that the request mix picks from."""
+
+    def __init__(self):
+        self.counts: Dict[str, int] = {}
+        self.emails: List[str] = []
+        self.course_ids: List[str] = []
+        # participant id -> [(conversation id, application id)]
+        self.chats: Dict[str, List[Tuple[str, str]]] = {}
+        self.emails_by_persona: Dict[str, str] = {}
+        self.tokens: Dict[str, str] = {}
+
+
+def seed(args: argparse.Namespace) -> Dataset:
+    upgrade_database()
+    rng = random.Random(args.seed)
+    now = datetime.now(timezone.utc)
+    data = Dataset()
+    # One hash for everyone, made with the current parameters so logins never rehash
+    password_hash = security.get_password_hash(PASSWORD)
+
+    companies = [_uuid(rng) for _ in range(args.companies)]
+    students = [_uuid(rng) for _ in range(args.students)]
+    users = [(user_id, UserRole.COMPANY, "Company", i) for i, user_id in enumerate(companies)]
+    users += [(user_id, UserRole.STUDENT, "Student", i) for i, user_id in enumerate(students)]
+    user_rows = [
+        {
+            "id": user_id,
+            "email": f"{label.lower()}-{i}-{user_id[:8]}@bench.talentia.cm",
+            "password_hash": password_hash,
+            "first_name": label,
+            "last_name": str(i),
+            "role": role,
+        }
+        for user_id, role, label, i in users
+    ]
+    data.emails = [row["email"] for row in user_rows]
+    email_by_id = {row["id"]: row["email"] for row in user_rows}
+
+    skill_ids = {name: _uuid(rng) for name in SKILLS}
+    user_skill_rows = [
+        {
+            "id": _uuid(rng),
+            "user_id": student_id,
+            "skill_id": skill_ids[name],
+            "level": rng.randint(1, 100),
+            "source": "MANUAL",
+        }
+        for student_id in students
+        for name in rng.sample(SKILLS, 3)
+    ]
+
+    gig_rows = []
+    for i in range(args.gigs):
+        budget = rng.randrange(5_000, 200_000, 5_000)
+        gig_rows.append(
+            {
+                "id": _uuid(rng),
+                "company_id": rng.choice(companies),
+                "title": " ".join(rng.sample(TITLE_WORDS, 3)).capitalize(),
+                "description": " ".join(rng.choices(TITLE_WORDS, k=30)),
+                "budget_min": budget,
+                "budget_max": budget * 2,
+                "category": rng.choice(CATEGORIES),
+                "type": rng.choice(["GIG", "CONTRACT", "PROJECT"]),
+                "status": "OPEN" if rng.random() < 0.8 else "CLOSED",
+                "created_at": now - timedelta(minutes=i),
+            }
+        )
+
+    application_rows = []
+    for gig in gig_rows:
+        for student_id in rng.sample(students, min(args.applications_per_gig, len(students))):
+            application_rows.append(
+                {
+                    "id": _uuid(rng),
+                    "gig_id": gig["id"],
+                    "student_id": student_id,
+                    "proposal": "I would love to work on this.",
+                    "status": "APPLIED",
+                    "applied_at": gig["created_at"] + timedelta(minutes=rng.randint(1, 600)),
+                }
+            )
+    company_by_gig = {gig["id"]: gig["company_id"] for gig in gig_rows}
+
+    contract_rows, review_rows, conversation_rows, message_rows = [], [], [], []
+    chatting = rng.sample(application_rows, min(args.conversations, len(application_rows)))
+    for application in chatting:
+        application["status"] = "APPROVED"
+        company_id = company_by_gig[application["gig_id"]]
+        conversation_id = _uuid(rng)
+        started = application["applied_at"] + timedelta(hours=1)
+        conversation_rows.append(
+            {
+                "id": conversation_id,
+                "gig_id": application["gig_id"],
+                "application_id": application["id"],
+                "company_id": company_id,
+                "student_id": application["student_id"],
+                "created_at": started,
+            }
+        )
+        for j in range(args.messages_per_conversation):
+            message_rows.append(
+                {
+                    "id": _uuid(rng),
+                    "conversation_id": conversation_id,
+                    "sender_id": company_id if j % 2 == 0 else application["student_id"],
+                    "content": " ".join(rng.choices(TITLE_WORDS, k=12)),
+                    "created_at": started + timedelta(minutes=j),
+                }
+            )
+        for participant in (company_id, application["student_id"]):
+            data.chats.setdefault(participant, []).append((conversation_id, application["id"]))
+        # Half of the chats ended in a completed, reviewed contract
+        if rng.random() < 0.5:
+            contract_rows.append(
+                {
+                    "id": _uuid(rng),
+                    "gig_id": application["gig_id"],
+                    "application_id": application["id"],
+                    "agreed_amount": 50_000,
+                    "status": "COMPLETED",
+                }
+            )
+            review_rows.append(
+                {
+                    "id": _uuid(rng),
+                    "from_user_id": company_id,
+                    "to_user_id": application["student_id"],
+                    "rating": rng.choice([3.0, 3.5, 4.0, 4.5, 5.0]),
+                    "comment": "Great work.",
+                    "context": "GIG",
+                }
+            )
+
+    course_rows, module_rows, lesson_rows = [], [], []
+    for i in range(args.courses):
+        course_id = _uuid(rng)
+        course_rows.append({"id": course_id, "title": f"Course {i}", "level": "BEGINNER", "is_premium": i % 3 == 0})
+        for m in range(8):
+            module_id = _uuid(rng)
+            module_rows.append({"id": module_id, "course_id": course_id, "title": f"Module {m}", "order": m})
+            lesson_rows.extend(
+                {"id": _uuid(rng), "module_id": module_id, "title": f"Lesson {n}", "type": "VIDEO", "duration_minutes": 10}
+                for n in range(6)
+            )
+    data.course_ids = [row["id"] for row in course_rows]
+
+    with SessionLocal() as db:
+        _insert(db, User, user_rows)
+        _insert(db, SkillTag, [{"id": skill_id, "name": name} for name, skill_id in skill_ids.items()])
+        _insert(db, UserSkill, user_skill_rows)
+        _insert(db, Gig, gig_rows)
+        _insert(db, GigApplication, application_rows)
+        _insert(db, Conversation, conversation_rows)
+        _insert(db, Message, message_rows)
+        _insert(db, Contract, contract_rows)
+        _insert(db, RatingReview, review_rows)
+        _insert(db, Course, course_rows)
+        _insert(db, CourseModule, module_rows)
+        _insert(db, Lesson, lesson_rows)
+        rebuild_talent_stats(db)
+        db.commit()
+    with engine.begin() as connection:
+        rebuild_search_index(connection)
+
+    data.counts = {
+        "users": len(user_rows),
+        "gigs": len(gig_rows),
+        "applications": len(application_rows),
+        "conversations": len(conversation_rows),
+        "messages": len(message_rows),
+        "contracts": len(contract_rows),
+        "reviews": len(review_rows),
+        "courses": len(course_rows),
+        "lessons": len(lesson_rows),
+    }
+    personas = rng.sample(sorted(data.chats), min(args.personas, len(data.chats)))
+    data.chats = {user_id: data.chats[user_id] for user_id in personas}
+    data.emails_by_persona = {user_id: email_by_id[user_id] for user_id in personas}
+    return data
+
+
+async def sign_in(client: httpx.AsyncClient, data: Dataset) -> None:
+    for user_id, email in data.emails_by_persona.items():
+        response = await client.post("/api/auth/login", json={"email": email, "password": PASSWORD})
+        response.raise_for_status()
+        data.tokens[user_id] = response.json()["accessToken"]
+
+
+def build_tasks(data: Dataset) -> List[Tuple[str, int, Task]]:
+    """``(endpoint label, weight, request)`` for the traffic mix."""
+
+    personas = sorted(data.chats)
+
+    def auth(user_id: str) -> dict:
+        return {"Authorization": f"Bearer {data.tokens[user_id]}"}
+
+    async def list_gigs(client, rng):
+        params = {"limit": 20}
+        if rng.random() < 0.3:
+            params["category"] = rng.choice(CATEGORIES)
+        return await client.get("/api/gigs/", params=params)
+
+    async def search_gigs(client, rng):
+        return await client.get("/api/gigs/search", params={"q": " ".join(rng.sample(TITLE_WORDS, rng.randint(1, 2)))})
+
+    async def list_talents(client, rng):
+        params = {"limit": 20}
+        if rng.random() < 0.3:
+            params["skill"] = rng.choice(SKILLS)
+        return await client.get("/api/talents/", params=params)
+
+    async def course_detail(client, rng):
+        return await client.get(f"/api/courses/{rng.choice(data.course_ids)}")
+
+    async def login(client, rng):
+        return await client.post("/api/auth/login", json={"email": rng.choice(data.emails), "password": PASSWORD})
+
+    async def conversation_summaries(client, rng):
+        return await client.get("/api/gigs/conversations/summaries", headers=auth(rng.choice(personas)))
+
+    async def conversation_messages(client, rng):
+        user_id = rng.choice(personas)
+        conversation_id, _ = rng.choice(data.chats[user_id])
+        return await client.get(
+            f"/api/gigs/conversations/{conversation_id}/messages", params={"limit": 50}, headers=auth(user_id)
+        )
+
+    async def send_message(client, rng):
+        user_id = rng.choice(personas)
+        _, application_id = rng.choice(data.chats[user_id])
+        return await client.post(
+            f"/api/gigs/applications/{application_id}/messages", json={"content": "Any update?"}, headers=auth(user_id)
+        )
+
+    return [
+        ("GET /api/gigs", 25, list_gigs),
+        ("GET /api/gigs/search", 10, search_gigs),
+        ("GET /api/talents", 15, list_talents),
+        ("GET /api/courses/{id}", 15, course_detail),
+        ("POST /api/auth/login", 3, login),
+        ("GET /api/gigs/conversations/summaries", 12, conversation_summaries),
+        ("GET /api/gigs/conversations/{id}/messages", 15, conversation_messages),
+        ("POST /api/gigs/applications/{id}/messages", 5, send_message),
+    ]
+
+
+def _percentile(ordered: List[float], q: float) -> float:
+    # Nearest rank
+    return ordered[max(int(len(ordered) * q + 0.999999) - 1, 0)]
+
+
+def summarize(latencies: List[float], errors: int, seconds: float) -> dict:
+    ordered = sorted(latencies)
+    if not ordered:
+        return {"requests": 0, "errors": errors, "rps": 0.0}
+    return {
+        "requests": len(ordered),
+        "errors": errors,
+        "rps": round(len(ordered) / seconds, 2),
+        "meanMs": round(sum(ordered) / len(ordered), 2),
+        "p50Ms": round(_percentile(ordered, 0.50), 2),
+        "p95Ms": round(_percentile(ordered, 0.95), 2),
+        "p99Ms": round(_percentile(ordered, 0.99), 2),
+        "maxMs": round(ordered[-1], 2),
+    }
+
+
+async def run(args: argparse.Namespace, data: Dataset) -> Dict[str, dict]:
+    tasks = build_tasks(data)
+    labels = [label for label, _, _ in tasks]
+    weights = [weight for _, weight, _ in tasks]
+    latencies: Dict[str, List[float]] = {label: [] for label in labels}
+    errors: Dict[str, int] = {label: 0 for label in labels}
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=60.0) as client:
+        await sign_in(client, data)
+        measure_from = time.perf_counter() + args.warmup
+        stop_at = measure_from + args.duration
+
+        async def virtual_user(index: int) -> None:
+            rng = random.Random(args.seed * 1_000 + index)
+            while True:
+                (label, _, task), = rng.choices(tasks, weights=weights)
+                if args.cold_cache:
+                    cache_backend.clear()
+                start = time.perf_counter()
+                if start >= stop_at:
+                    return
+                try:
+                    failed = (await task(client, rng)).status_code >= 400
+                except Exception:  # noqa: BLE001  # count it and keep the user going
+                    failed = True
+                if start >= measure_from:
+                    latencies[label].append((time.perf_counter() - start) * 1000)
+                    errors[label] += failed
+
+        await asyncio.gather(*(virtual_user(i) for i in range(args.concurrency)))
+
+    endpoints = {label: summarize(latencies[label], errors[label], args.duration) for label in labels}
+    endpoints["total"] = summarize(
+        [value for values in latencies.values() for value in values], sum(errors.values()), args.duration
+    )
+    return endpoints
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], capture_output=True, text=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return commit + ("-dirty" if dirty.stdout.strip() else "")
+
+
+def build_report(args: argparse.Namespace, data: Dataset, endpoints: Dict[str, dict]) -> dict:
+    return {
+        "commit": _git_commit(),
+        "startedAt": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "database": make_url(args.database_url).render_as_string(hide_password=True),
+        "python": platform.python_version(),
+        "cpus": os.cpu_count(),
+        "config": {
+            "concurrency": args.concurrency,
+            "durationS": args.duration,
+            "warmupS": args.warmup,
+            "seed": args.seed,
+            "coldCache": args.cold_cache,
+            "passwordHashWorkers": settings.PASSWORD_HASH_WORKERS,
+        },
+        "dataset": data.counts,
+        "endpoints": endpoints,
+    }
+
+
+def _change(before: Optional[float], after: Optional[float]) -> str:
+    if not before or after is None:
+        return "n/a"
+    return f"{(after - before) / before * 100:+.1f}%"
+
+
+def print_table(endpoints: Dict[str, dict]) -> None:
+    print(f"{'endpoint':<44} | {'req/s':>8} | {'p50 ms':>8} | {'p95 ms':>8} | {'p99 ms':>8} | {'errors':>6}")
+    for label, stats in endpoints.items():
+        print(
+            f"{label:<44} | {stats['rps']:>8.1f} | {stats.get('p50Ms', 0):>8.2f} | {stats.get('p95Ms', 0):>8.2f} | "
+            f"{stats.get('p99Ms', 0):>8.2f} | {stats['errors']:>6}"
+        )
+
+
+def print_comparison(baseline: dict, report: dict) -> None:
+    print(f"\nchange vs. {baseline.get('commit') or 'baseline'} (negative latency change is better)")
+    print(f"{'endpoint':<44} | {'req/s':>8} | {'p50':>8} | {'p95':>8} | {'p99':>8}")
+    for label, stats in report["endpoints"].items():
+        before = baseline.get("endpoints", {}).get(label)
+        if before is None:
+            print(f"{label:<44} | {'new':>8}")
+            continue
+        print(
+            f"{label:<44} | {_change(before.get('rps'), stats.get('rps')):>8} | "
+            f"{_change(before.get('p50Ms'), stats.get('p50Ms')):>8} | "
+            f"{_change(before.get('p95Ms'), stats.get('p95Ms')):>8} | "
+            f"{_change(before.get('p99Ms'), stats.get('p99Ms')):>8}"
+        )
+    if baseline.get("dataset") != report["dataset"] or baseline.get("config", {}).get("concurrency") != report["config"]["concurrency"]:
+        print("note: dataset size or concurrency differ from the baseline", file=sys.stderr)
+
+
+async def main(args: argparse.Namespace) -> None:
+    started = time.perf_counter()
+    data = seed(args)
+    print(
+        f"database: {args.database_url}  seeded in {time.perf_counter() - started:.1f}s  "
+        f"concurrency: {args.concurrency}  cpus: {os.cpu_count()}",
+        file=sys.stderr,
+    )
+    print("dataset: " + ", ".join(f"{name}={count}" for name, count in data.counts.items()), file=sys.stderr)
+
+    endpoints = await run(args, data)
+    security.shutdown_password_hasher()
+    report = build_report(args, data, endpoints)
+
+    print_table(endpoints)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as fh:
+            print_comparison(json.load(fh), report)
+    if args.output == "-":
+        print(json.dumps(report, indent=2))
+    elif args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2)
+            fh.write("\n")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(ARGS))
@@ -0,0 +1,204 @@
+"""Sync (threadpool) vs. async (AsyncSession) read endpoints under concurrency.
+
+Seeds a throwaway database, mounts the sync and the async routers for
+``/api/gigs``, ``/api/talents`` and ``/api/courses/{id}`` in two separate
+FastAPI apps and drives both in-process with the same number of concurrent
+clients. SQLite + aiosqlite is the local stand-in; pass ``--database-url`` to
+point both stacks at a local Postgres (asyncpg) instead.
+
+Run from the backend directory (needs ``httpx``):
+
+    python -m benchmarks.bench_async_vs_sync --concurrency 64 --requests 2000
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+
+def _configure_env() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--gigs", type=int, default=5_000)
+    parser.add_argument("--students", type=int, default=2_000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=2_000, help="requests per endpoint per stack")
+    args = parser.parse_args()
+
+    if args.database_url is None:
+        db_file = os.path.join(tempfile.mkdtemp(prefix="talentia-bench-"), "bench.db")
+        args.database_url = f"sqlite:///{db_file}"
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ["DB_ASYNC"] = "true"
+    os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+    return args
+
+
+ARGS = _configure_env() if __name__ == "__main__" else None
+
+import httpx  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+from sqlalchemy import insert  # noqa: E402
+
+from app import models  # noqa: E402,F401
+from app.api.api_v1.endpoints import courses, courses_async, gigs, gigs_async, talents, talents_async  # noqa: E402
+from app.db.migrations import upgrade_database  # noqa: E402
+from app.db.session import SessionLocal, async_engine  # noqa: E402
+from app.models.course import Course, CourseModule, Lesson  # noqa: E402
+from app.models.marketplace import Gig  # noqa: E402
+from app.models.talent import TalentStats  # noqa: E402
+from app.models.user import User, UserRole  # noqa: E402
+from app.services.catalog_cache import cache_backend  # noqa: E402
+
+
+def _seed(gig_count: int, student_count: int) -> str:
+    upgrade_database()
+    now = datetime.now(timezone.utc)
+    company_id = str(uuid.uuid4())
+    students = [str(uuid.uuid4()) for _ in range(student_count)]
+    course_id = str(uuid.uuid4())
+    modules = [str(uuid.uuid4()) for _ in range(12)]
+
+    with SessionLocal() as db:
+        db.execute(
+            insert(User),
+            [
+                {
+                    "id": company_id,
+                    "email": f"bench-{company_id}@talentia.local",
+                    "password_hash": "BENCHMARK_NO_LOGIN",
+                    "first_name": "Bench",
+                    "last_name": "Company",
+                    "role": UserRole.COMPANY,
+                }
+            ]
+            + [
+                {
+                    "id": student_id,
+                    "email": f"bench-{student_id}@talentia.local",
+                    "password_hash": "BENCHMARK_NO_LOGIN",
+                    "first_name": "Student",
+                    "last_name": str(i),
+                    "role": UserRole.STUDENT,
+                }
+                for i, student_id in enumerate(students)
+            ],
+        )
+        db.execute(
+            insert(Gig),
+            [
+                {
+                    "id": str(uuid.uuid4()),
+                    "company_id": company_id,
+                    "title": f"Benchmark gig {i}",
+                    "budget_min": 10_000,
+                    "budget_max": 50_000,
+                    "status": "OPEN",
+                    "created_at": now - timedelta(minutes=i),
+                }
+                for i in range(gig_count)
+            ],
+        )
+        db.execute(
+            insert(TalentStats),
+            [
+                {
+                    "user_id": student_id,
+                    "rating_total": 4.0 + (i % 10) / 10,
+                    "reviews_count": 1,
+                    "avg_rating": 4.0 + (i % 10) / 10,
+                    "completed_gigs": i % 5,
+                    "top_skills": ["Dance"],
+                }
+                for i, student_id in enumerate(students)
+            ],
+        )
+        db.execute(insert(Course), [{"id": course_id, "title": "Benchmark course", "is_premium": False}])
+        db.execute(
+            insert(CourseModule),
+            [{"id": module_id, "course_id": course_id, "title": f"Module {i}", "order": i} for i, module_id in enumerate(modules)],
+        )
+        db.execute(
+            insert(Lesson),
+            [
+                {"id": str(uuid.uuid4()), "module_id": module_id, "title": f"Lesson {j}", "type": "VIDEO"}
+                for module_id in modules
+                for j in range(8)
+            ],
+        )
+        db.commit()
+    return course_id
+
+
+def _build_app(gigs_router, talents_router, courses_router) -> FastAPI:
+    app = FastAPI()
+    app.include_router(gigs_router, prefix="/api/gigs")
+    app.include_router(talents_router, prefix="/api/talents")
+    app.include_router(courses_router, prefix="/api/courses")
+    return app
+
+
+async def _drive(app: FastAPI, path: str, total: int, concurrency: int) -> dict:
+    latencies: list[float] = []
+    queue: asyncio.Queue = asyncio.Queue()
+    for _ in range(total):
+        queue.put_nowait(None)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def worker() -> None:
+            while True:
+                try:
+                    queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                # Measure database work, not the course detail cache.
+                cache_backend.clear()
+                start = time.perf_counter()
+                response = await client.get(path)
+                latencies.append((time.perf_counter() - start) * 1000)
+                response.raise_for_status()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "rps": total / elapsed,
+        "p50": statistics.median(latencies),
+        "p95": latencies[int(len(latencies) * 0.95) - 1],
+    }
+
+
+async def main(args: argparse.Namespace) -> None:
+    course_id = _seed(args.gigs, args.students)
+    stacks = {
+        "sync": _build_app(gigs.router, talents.router, courses.router),
+        "async": _build_app(gigs_async.router, talents_async.router, courses_async.router),
+    }
+    paths = {
+        "GET /api/gigs": "/api/gigs/?limit=20",
+        "GET /api/talents": "/api/talents/?limit=20",
+        "GET /api/courses/{id}": f"/api/courses/{course_id}",
+    }
+
+    print(f"database: {args.database_url}  concurrency: {args.concurrency}", file=sys.stderr)
+    print(f"{'endpoint':<28} | {'stack':<5} | {'req/s':>8} | {'p50 ms':>7} | {'p95 ms':>7}")
+    for label, path in paths.items():
+        for name, app in stacks.items():
+            result = await _drive(app, path, args.requests, args.concurrency)
+            print(f"{label:<28} | {name:<5} | {result['rps']:>8.1f} | {result['p50']:>7.2f} | {result['p95']:>7.2f}")
+    # aiosqlite connections run on non-daemon threads; close them or the interpreter never exits
+    await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(ARGS))
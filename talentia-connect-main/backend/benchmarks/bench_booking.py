@@ -0,0 +1,178 @@
+"""Mentorship booking under contention.
+
+Seeds a throwaway SQLite database with approved mentors free every day from
+09:00 to 17:00 and a pool of students. Then times
+``POST /api/mentors/{id}/sessions`` for uncontended bookings, one student
+per mentor. After that it fires bursts of concurrent requests for
+overlapping slots of a single mentor, once with the per-worker slot holds
+and once with them off (``HOLD_SECONDS = 0``), so only the database lock
+decides. For each burst it reports how long the requests took, and how many
+were booked, turned away by a hold, or turned away after the database
+check. Exactly one request per burst must succeed. Pass ``--database-url``
+to run against PostgreSQL.
+
+Run from the backend directory (needs ``httpx`` for the test client):
+
+    python -m benchmarks.bench_booking --mentors 200 --burst 32
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, time as clock, timedelta
+
+
+def _configure_env() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--mentors", type=int, default=200)
+    parser.add_argument("--burst", type=int, default=32)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.database_url is None:
+        db_file = os.path.join(tempfile.mkdtemp(prefix="talentia-bench-"), "bench.db")
+        args.database_url = f"sqlite:///{db_file}"
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+    return args
+
+
+ARGS = _configure_env() if __name__ == "__main__" else None
+
+from zoneinfo import ZoneInfo  # noqa: E402
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import insert  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+from app.core.security import create_access_token  # noqa: E402
+from app.db.migrations import upgrade_database  # noqa: E402
+from app.db.session import SessionLocal  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.mentorship import MentorAvailability, MentorProfile  # noqa: E402
+from app.models.user import User, UserRole  # noqa: E402
+from app.services import mentorship_booking  # noqa: E402
+
+
+def _seed(mentor_count: int, student_count: int) -> tuple[list[str], list[str]]:
+    """Returns the mentor profile ids and the student ids."""
+
+    upgrade_database()
+    mentors = [str(uuid.uuid4()) for _ in range(mentor_count)]
+    profiles = [str(uuid.uuid4()) for _ in range(mentor_count)]
+    students = [str(uuid.uuid4()) for _ in range(student_count)]
+    with SessionLocal() as db:
+        db.execute(
+            insert(User),
+            [
+                {
+                    "id": user_id,
+                    "email": f"bench-{user_id}@bench.talentia.cm",
+                    "password_hash": "BENCHMARK_NO_LOGIN",
+                    "first_name": role.value.title(),
+                    "last_name": str(i),
+                    "role": role,
+                }
+                for role, ids in ((UserRole.MENTOR, mentors), (UserRole.STUDENT, students))
+                for i, user_id in enumerate(ids)
+            ],
+        )
+        db.execute(
+            insert(MentorProfile),
+            [
+                {"id": profile_id, "user_id": user_id, "headline": "Mentor", "approval_status": "APPROVED"}
+                for user_id, profile_id in zip(mentors, profiles)
+            ],
+        )
+        db.execute(
+            insert(MentorAvailability),
+            [
+                {
+                    "id": str(uuid.uuid4()),
+                    "mentor_id": profile_id,
+                    "weekday": weekday,
+                    "start_time": clock(9),
+                    "end_time": clock(17),
+                }
+                for profile_id in profiles
+                for weekday in range(7)
+            ],
+        )
+        db.commit()
+    return profiles, students
+
+
+def _headers(student_id: str) -> dict:
+    token = create_access_token(student_id, UserRole.STUDENT.value, first_name="Student", last_name="Bench")
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _burst(mentor_id: str, students: list[str], day: datetime) -> tuple[float, Counter]:
+    """Every student asks for an overlapping hour of the mentor at once."""
+
+    outcomes: Counter = Counter()
+    ready = threading.Barrier(len(students))
+
+    def request(i: int, student_id: str) -> None:
+        client = TestClient(app)
+        body = {"scheduled_at": (day + timedelta(hours=10, minutes=5 * (i % 6))).isoformat()}
+        ready.wait()
+        response = client.post(f"/api/mentors/{mentor_id}/sessions", json=body, headers=_headers(student_id))
+        if response.status_code == 201:
+            outcomes["booked"] += 1
+        elif "being booked" in response.json()["detail"]:
+            outcomes["held"] += 1
+        else:
+            outcomes["rejected by db"] += 1
+
+    threads = [threading.Thread(target=request, args=(i, s)) for i, s in enumerate(students)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return (time.perf_counter() - started) * 1000, outcomes
+
+
+def main(args: argparse.Namespace) -> None:
+    started = time.perf_counter()
+    profiles, students = _seed(args.mentors, max(args.mentors, args.burst))
+    print(f"seeded {args.mentors} mentors in {time.perf_counter() - started:.1f}s ({args.database_url})", file=sys.stderr)
+
+    zone = ZoneInfo(settings.MENTORSHIP_TIMEZONE)
+    today = datetime.now(zone).date()
+    # Local midnight of a day next week, one per round so earlier bookings never collide
+    days = [datetime.combine(today + timedelta(days=7 + i), clock(), zone) for i in range(2 * args.rounds + 1)]
+
+    client = TestClient(app)
+    timings = []
+    for profile_id, student_id in zip(profiles, students):
+        body = {"scheduled_at": (days[0] + timedelta(hours=9)).isoformat()}
+        start = time.perf_counter()
+        response = client.post(f"/api/mentors/{profile_id}/sessions", json=body, headers=_headers(student_id))
+        timings.append((time.perf_counter() - start) * 1000)
+        response.raise_for_status()
+    print(f"uncontended booking: median {statistics.median(timings):.2f} ms over {len(timings)} mentors")
+
+    print(f"{'burst of ' + str(args.burst):<20} | {'median ms':>9} | outcomes (last round)")
+    hold_seconds = mentorship_booking.HOLD_SECONDS
+    for label, seconds, first_day in (("with holds", hold_seconds, 1), ("holds off", 0.0, 1 + args.rounds)):
+        mentorship_booking.HOLD_SECONDS = seconds
+        walls = []
+        for round_ in range(args.rounds):
+            wall, outcomes = _burst(profiles[round_], students[: args.burst], days[first_day + round_])
+            assert outcomes["booked"] == 1, outcomes
+            walls.append(wall)
+        print(f"{label:<20} | {statistics.median(walls):>9.2f} | {dict(outcomes)}")
+    mentorship_booking.HOLD_SECONDS = hold_seconds
+
+
+if __name__ == "__main__":
+    main(ARGS)
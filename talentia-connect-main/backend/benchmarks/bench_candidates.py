@@ -0,0 +1,189 @@
+"""Candidate shortlist latency: cold ranking vs. cached pages.
+
+Seeds a throwaway SQLite database with skill tags, a student pool with
+skills and ``talent_stats`` rows, and one gig with many applicants. Then
+times ``GET /api/gigs/{id}/candidates`` with the ranking cache cleared
+before every request (applicants only, and with the wider pool), and the
+cached page that follows. Pass ``--database-url`` to run against PostgreSQL.
+
+Run from the backend directory (needs ``httpx`` for the test client):
+
+    python -m benchmarks.bench_candidates --students 50000 --applicants 500
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+
+SKILLS = (
+    "Makossa dance, Bikutsi performance, Afrobeats vocals, Choir singing, Event photography, "
+    "Portrait photography, Video editing, Brand identity design, Illustration, Mural painting, "
+    "Guitar, Piano, Drums, Beatmaking, Sound engineering, Stage lighting, Acting, Storytelling, "
+    "Fashion design, Tailoring, Makeup, Calligraphy, Animation, Ceramics"
+).split(", ")
+
+
+def _configure_env() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--students", type=int, default=50_000)
+    parser.add_argument("--applicants", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=30)
+    args = parser.parse_args()
+
+    if args.database_url is None:
+        db_file = os.path.join(tempfile.mkdtemp(prefix="talentia-bench-"), "bench.db")
+        args.database_url = f"sqlite:///{db_file}"
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ["CACHE_BACKEND"] = "memory"
+    os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+    return args
+
+
+ARGS = _configure_env() if __name__ == "__main__" else None
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import insert  # noqa: E402
+
+from app.core.cache import cache_backend  # noqa: E402
+from app.core.security import create_access_token  # noqa: E402
+from app.db.migrations import upgrade_database  # noqa: E402
+from app.db.session import SessionLocal  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.assessment import SkillTag, UserSkill  # noqa: E402
+from app.models.marketplace import Gig, GigApplication  # noqa: E402
+from app.models.talent import TalentStats  # noqa: E402
+from app.models.user import User, UserRole  # noqa: E402
+
+
+def _seed(rng: random.Random, student_count: int, applicant_count: int) -> tuple[str, str]:
+    """Returns the company id and the gig id."""
+
+    upgrade_database()
+    company_id = str(uuid.uuid4())
+    gig_id = str(uuid.uuid4())
+    skills = [str(uuid.uuid4()) for _ in SKILLS]
+    students = [str(uuid.uuid4()) for _ in range(student_count)]
+
+    with SessionLocal() as db:
+        db.execute(
+            insert(User),
+            [
+                {
+                    "id": company_id,
+                    "email": f"bench-company-{company_id}@bench.talentia.cm",
+                    "password_hash": "BENCHMARK_NO_LOGIN",
+                    "first_name": "Bench",
+                    "last_name": "Company",
+                    "role": UserRole.COMPANY,
+                }
+            ],
+        )
+        for start in range(0, student_count, 10_000):
+            chunk = students[start : start + 10_000]
+            db.execute(
+                insert(User),
+                [
+                    {
+                        "id": student_id,
+                        "email": f"bench-{student_id}@bench.talentia.cm",
+                        "password_hash": "BENCHMARK_NO_LOGIN",
+                        "first_name": "Student",
+                        "last_name": str(start + i),
+                        "role": UserRole.STUDENT,
+                    }
+                    for i, student_id in enumerate(chunk)
+                ],
+            )
+            db.execute(
+                insert(UserSkill),
+                [
+                    {"id": str(uuid.uuid4()), "user_id": student_id, "skill_id": skill_id, "level": rng.randint(1, 100)}
+                    for student_id in chunk
+                    for skill_id in rng.sample(skills, rng.randint(1, 5))
+                ],
+            )
+            db.execute(
+                insert(TalentStats),
+                [
+                    {
+                        "user_id": student_id,
+                        "rating_total": reviews * rng.uniform(3.0, 5.0),
+                        "reviews_count": reviews,
+                        "avg_rating": 0.0,
+                        "completed_gigs": reviews,
+                    }
+                    for student_id in chunk
+                    for reviews in (rng.randint(0, 12),)
+                ],
+            )
+        db.execute(insert(SkillTag), [{"id": skill_id, "name": name} for skill_id, name in zip(skills, SKILLS)])
+        db.execute(
+            insert(Gig),
+            [
+                {
+                    "id": gig_id,
+                    "company_id": company_id,
+                    "title": "Makossa dance and Afrobeats vocals for a campus gala",
+                    "description": "Stage lighting and event photography provided; guitar or drums welcome.",
+                    "status": "OPEN",
+                }
+            ],
+        )
+        db.execute(
+            insert(GigApplication),
+            [
+                {"id": str(uuid.uuid4()), "gig_id": gig_id, "student_id": student_id}
+                for student_id in rng.sample(students, applicant_count)
+            ],
+        )
+        db.commit()
+    return company_id, gig_id
+
+
+def _time(fn, rounds: int) -> float:
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main(args: argparse.Namespace) -> None:
+    rng = random.Random(42)
+    started = time.perf_counter()
+    company_id, gig_id = _seed(rng, args.students, args.applicants)
+    print(f"seeded {args.students} students in {time.perf_counter() - started:.1f}s ({args.database_url})", file=sys.stderr)
+
+    client = TestClient(app)
+    token = create_access_token(company_id, UserRole.COMPANY.value, first_name="Bench", last_name="Company")
+    headers = {"Authorization": f"Bearer {token}"}
+
+    print(f"{'request':<32} | {'median ms':>9} | {'results':>7}")
+    for label, include_pool in (("applicants", False), ("applicants + pool", True)):
+        def page():
+            response = client.get(
+                f"/api/gigs/{gig_id}/candidates",
+                params={"limit": 20, "includePool": include_pool},
+                headers=headers,
+            )
+            response.raise_for_status()
+            return response
+
+        def cold_page():
+            cache_backend.clear()
+            return page()
+
+        results = len(page().json())
+        print(f"{label + ', cold':<32} | {_time(cold_page, args.rounds):>9.2f} | {results:>7}")
+        print(f"{label + ', cached':<32} | {_time(page, args.rounds):>9.2f} | {results:>7}")
+
+
+if __name__ == "__main__":
+    main(ARGS)
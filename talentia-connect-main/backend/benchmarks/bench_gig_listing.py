@@ -0,0 +1,143 @@
+"""Gig listing cost vs. total number of applications.
+
+Seeds a throwaway SQLite database with a fixed set of open gigs, then keeps
+adding applications and times ``GET /api/gigs`` (first page and a deep page)
+after each step. Query count and latency should stay flat as the
+applications table grows.
+
+Run from the backend directory (needs ``httpx`` for the test client):
+
+    python -m benchmarks.bench_gig_listing --gigs 2000 --steps 0,20000,100000
+"""
+
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+_DB_FILE = os.path.join(tempfile.mkdtemp(prefix="talentia-bench-"), "bench.db")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{_DB_FILE}")
+os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import event, insert  # noqa: E402
+
+from app.db.migrations import upgrade_database  # noqa: E402
+from app.db.session import SessionLocal, engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.marketplace import Gig, GigApplication  # noqa: E402
+from app.models.user import User, UserRole  # noqa: E402
+
+
+def _seed_gigs(count: int) -> list[str]:
+    upgrade_database()
+    now = datetime.now(timezone.utc)
+    company_id = str(uuid.uuid4())
+    rows = [
+        {
+            "id": str(uuid.uuid4()),
+            "company_id": company_id,
+            "title": f"Benchmark gig {i}",
+            "description": "Synthetic gig used by the listing benchmark.",
+            "budget_min": 10_000 + i,
+            "budget_max": 50_000 + i,
+            "type": "Gig",
+            "category": random.choice(["Singing", "Dance", "Painting", "Music"]),
+            "status": "OPEN",
+            "created_at": now - timedelta(minutes=i),
+        }
+        for i in range(count)
+    ]
+    with SessionLocal() as db:
+        db.execute(
+            insert(User),
+            [
+                {
+                    "id": company_id,
+                    "email": f"bench-company-{company_id}@talentia.local",
+                    "password_hash": "BENCHMARK_NO_LOGIN",
+                    "first_name": "Bench",
+                    "last_name": "Company",
+                    "role": UserRole.COMPANY,
+                }
+            ],
+        )
+        db.execute(insert(Gig), rows)
+        db.commit()
+    return [row["id"] for row in rows]
+
+
+def _add_applications(gig_ids: list[str], count: int) -> None:
+    batch = []
+    with SessionLocal() as db:
+        for _ in range(count):
+            batch.append(
+                {
+                    "id": str(uuid.uuid4()),
+                    "gig_id": random.choice(gig_ids),
+                    "student_id": str(uuid.uuid4()),
+                    "status": "APPLIED",
+                }
+            )
+            if len(batch) == 5_000:
+                db.execute(insert(GigApplication), batch)
+                batch = []
+        if batch:
+            db.execute(insert(GigApplication), batch)
+        db.commit()
+
+
+def _measure(client: TestClient, params: dict, rounds: int) -> tuple[float, float]:
+    statements = 0
+
+    def _count(*_args, **_kwargs):
+        nonlocal statements
+        statements += 1
+
+    event.listen(engine, "before_cursor_execute", _count)
+    try:
+        timings = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            response = client.get("/api/gigs/", params=params)
+            timings.append((time.perf_counter() - start) * 1000)
+            response.raise_for_status()
+    finally:
+        event.remove(engine, "before_cursor_execute", _count)
+
+    return statistics.median(timings), statements / rounds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--gigs", type=int, default=2_000)
+    parser.add_argument("--steps", default="0,20000,100000", help="total applications after each step")
+    parser.add_argument("--rounds", type=int, default=30)
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    client = TestClient(app)
+    gig_ids = _seed_gigs(args.gigs)
+
+    # Walk to a deep page once so every step measures the same keyset position.
+    deep_params = {"limit": args.limit}
+    for _ in range(min(50, args.gigs // args.limit - 1)):
+        response = client.get("/api/gigs/", params=deep_params)
+        deep_params = {"limit": args.limit, "cursor": response.headers["X-Next-Cursor"]}
+
+    print(f"{'applications':>12} | {'page 1 ms':>9} | {'deep page ms':>12} | {'queries/request':>15}")
+    total = 0
+    for target in (int(step) for step in args.steps.split(",")):
+        _add_applications(gig_ids, target - total)
+        total = target
+        first_ms, queries = _measure(client, {"limit": args.limit}, args.rounds)
+        deep_ms, _ = _measure(client, deep_params, args.rounds)
+        print(f"{total:>12} | {first_ms:>9.2f} | {deep_ms:>12.2f} | {queries:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""Gig search latency at catalogue scale.
+
+Seeds a throwaway SQLite database with synthetic open gigs (bulk insert plus
+an index rebuild, as an import would), then times ``GET /api/gigs/search``
+for common, rare, prefix, multi-word and misspelt queries, and the cost of
+keeping the index in step when a gig is created or closed through the ORM.
+Pass ``--database-url`` to run against PostgreSQL (GIN index) instead.
+
+Run from the backend directory (needs ``httpx`` for the test client):
+
+    python -m benchmarks.bench_gig_search --gigs 100000
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+WORDS = (
+    "dance makossa bikutsi choreographer singer vocalist choir painter mural portrait photographer "
+    "videographer editor designer illustrator animator drummer guitarist pianist saxophone poet "
+    "storyteller actor theatre festival wedding concert conference campus gallery studio branding "
+    "logo poster flyer album cover documentary podcast workshop tutor coach sculptor ceramics fashion "
+    "tailor model makeup stage lighting sound engineer producer beatmaker rapper comedian host"
+).split()
+CATEGORIES = ["Dance", "Singing", "Painting", "Music", "Photography", "Design", "Theatre"]
+SYLLABLES = "ba be bi bo ka ke ki ko ma me mi mo na ne ni no ra re ri ro sa se si so ta te ti to".split()
+
+
+def _vocabulary(rng: random.Random, size: int = 5_000) -> tuple[list[str], list[float]]:
+    """Domain words plus synthetic filler, Zipf-weighted like real text."""
+
+    filler = {"".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))) for _ in range(size)}
+    words = WORDS + sorted(filler - set(WORDS))
+    rng.shuffle(words)
+    return words, [1 / rank for rank in range(1, len(words) + 1)]
+
+
+def _configure_env() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--gigs", type=int, default=100_000)
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    if args.database_url is None:
+        db_file = os.path.join(tempfile.mkdtemp(prefix="talentia-bench-"), "bench.db")
+        args.database_url = f"sqlite:///{db_file}"
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+    return args
+
+
+ARGS = _configure_env() if __name__ == "__main__" else None
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import insert  # noqa: E402
+
+from app.db.migrations import upgrade_database  # noqa: E402
+from app.db.session import SessionLocal, engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.marketplace import Gig  # noqa: E402
+from app.models.user import User, UserRole  # noqa: E402
+from app.services.gig_search import rebuild_search_index  # noqa: E402
+
+
+def _phrase(rng: random.Random, vocabulary: tuple[list[str], list[float]], n: int) -> str:
+    words, weights = vocabulary
+    return " ".join(rng.choices(words, weights, k=n))
+
+
+def _seed(count: int) -> str:
+    upgrade_database()
+    rng = random.Random(42)
+    vocabulary = _vocabulary(rng)
+    now = datetime.now(timezone.utc)
+    company_id = str(uuid.uuid4())
+    with SessionLocal() as db:
+        db.execute(
+            insert(User),
+            [
+                {
+                    "id": company_id,
+                    "email": f"bench-company-{company_id}@talentia.local",
+                    "password_hash": "BENCHMARK_NO_LOGIN",
+                    "first_name": "Bench",
+                    "last_name": "Company",
+                    "role": UserRole.COMPANY,
+                }
+            ],
+        )
+        for start in range(0, count, 10_000):
+            db.execute(
+                insert(Gig),
+                [
+                    {
+                        "id": str(uuid.uuid4()),
+                        "company_id": company_id,
+                        "title": (rng.choice(WORDS) + " " + _phrase(rng, vocabulary, 3)).capitalize(),
+                        "description": _phrase(rng, vocabulary, 30),
+                        "role": rng.choice(WORDS),
+                        "category": rng.choice(CATEGORIES),
+                        "status": "OPEN" if rng.random() < 0.9 else "CLOSED",
+                        "created_at": now - timedelta(minutes=start + i),
+                    }
+                    for i in range(min(10_000, count - start))
+                ],
+            )
+        db.commit()
+    with engine.begin() as conn:
+        rebuild_search_index(conn)
+    return company_id
+
+
+def _time(fn, rounds: int) -> float:
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main(args: argparse.Namespace) -> None:
+    started = time.perf_counter()
+    company_id = _seed(args.gigs)
+    print(f"seeded {args.gigs} gigs + index in {time.perf_counter() - started:.1f}s ({args.database_url})", file=sys.stderr)
+
+    client = TestClient(app)
+    # With Zipf-distributed text some of these match a few percent of the
+    # catalogue and others far fewer, which is what ranking cost depends on.
+    queries = {
+        "common word": "dance",
+        "rare word": "sculptor ceramics",
+        "prefix": "choreo",
+        "two words": "wedding singer",
+        "typo": "phtographer",
+    }
+    print(f"{'query':<34} | {'median ms':>9} | {'results':>7}")
+    for label, q in queries.items():
+        def search():
+            response = client.get("/api/gigs/search", params={"q": q, "limit": 20})
+            response.raise_for_status()
+            return response
+
+        search()  # warm the vocabulary for the typo case
+        results = len(search().json())
+        print(f"{label + ' (' + q + ')':<34} | {_time(search, args.rounds):>9.2f} | {results:>7}")
+
+    def create_and_close():
+        with SessionLocal() as db:
+            gig = Gig(id=str(uuid.uuid4()), company_id=company_id, title="Benchmark makossa dancer", status="OPEN")
+            db.add(gig)
+            db.commit()
+            gig.status = "CLOSED"
+            db.commit()
+
+    print(f"{'create + close (ORM)':<34} | {_time(create_and_close, args.rounds):>9.2f} |")
+
+
+if __name__ == "__main__":
+    main(ARGS)
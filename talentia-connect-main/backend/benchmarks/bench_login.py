@@ -0,0 +1,148 @@
+"""Login throughput, and what a login burst does to unrelated requests.
+
+Seeds a throwaway database with users, then fires ``POST /api/auth/login``
+with the given concurrency while a probe keeps requesting ``GET /api/gigs``
+(a plain threadpool endpoint). Runs once with hashing in the threadpool
+(``PASSWORD_HASH_WORKERS=0``, how login used to work) and once per
+``--workers`` value with the process pool.
+
+Run from the backend directory (needs ``httpx``):
+
+    python -m benchmarks.bench_login --concurrency 64 --logins 400 --workers 2 4
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+
+
+def _configure_env() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--logins", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--workers", type=int, nargs="+", default=[2])
+    args = parser.parse_args()
+
+    if args.database_url is None:
+        db_file = os.path.join(tempfile.mkdtemp(prefix="talentia-bench-"), "bench.db")
+        args.database_url = f"sqlite:///{db_file}"
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+    return args
+
+
+ARGS = _configure_env() if __name__ == "__main__" else None
+
+import httpx  # noqa: E402
+from sqlalchemy import insert  # noqa: E402
+
+from app.core import security  # noqa: E402
+from app.core.config import settings  # noqa: E402
+from app.db.migrations import upgrade_database  # noqa: E402
+from app.db.session import SessionLocal  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.user import User, UserRole  # noqa: E402
+
+PASSWORD = "benchmark-password"
+
+
+def _seed(count: int) -> list[str]:
+    upgrade_database()
+    password_hash = security.get_password_hash(PASSWORD)
+    emails = [f"bench-{uuid.uuid4()}@bench.talentia.cm" for _ in range(count)]
+    with SessionLocal() as db:
+        db.execute(
+            insert(User),
+            [
+                {
+                    "id": str(uuid.uuid4()),
+                    "email": email,
+                    "password_hash": password_hash,
+                    "first_name": "Bench",
+                    "last_name": "User",
+                    "role": UserRole.STUDENT,
+                }
+                for email in emails
+            ],
+        )
+        db.commit()
+    return emails
+
+
+def _p95(values: list[float]) -> float:
+    values = sorted(values)
+    return values[max(int(len(values) * 0.95) - 1, 0)]
+
+
+async def _run(emails: list[str], logins: int, concurrency: int) -> dict:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        pending = iter(range(logins))
+        login_latencies: list[float] = []
+        probe_latencies: list[float] = []
+        done = asyncio.Event()
+
+        async def login_worker() -> None:
+            for i in pending:
+                start = time.perf_counter()
+                response = await client.post(
+                    "/api/auth/login", json={"email": emails[i % len(emails)], "password": PASSWORD}
+                )
+                login_latencies.append((time.perf_counter() - start) * 1000)
+                response.raise_for_status()
+
+        async def probe() -> None:
+            while not done.is_set():
+                start = time.perf_counter()
+                (await client.get("/api/gigs/", params={"limit": 1})).raise_for_status()
+                probe_latencies.append((time.perf_counter() - start) * 1000)
+                await asyncio.sleep(0.01)
+
+        probe_task = asyncio.create_task(probe())
+        started = time.perf_counter()
+        await asyncio.gather(*(login_worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+        done.set()
+        await probe_task
+
+    return {
+        "logins/s": logins / elapsed,
+        "login p50": statistics.median(login_latencies),
+        "login p95": _p95(login_latencies),
+        "probe p50": statistics.median(probe_latencies),
+        "probe p95": _p95(probe_latencies),
+    }
+
+
+async def main(args: argparse.Namespace) -> None:
+    emails = _seed(args.users)
+    print(
+        f"database: {args.database_url}  rounds: {settings.PASSWORD_HASH_ROUNDS}  "
+        f"concurrency: {args.concurrency}  cpus: {os.cpu_count()}",
+        file=sys.stderr,
+    )
+    print(f"{'hashing':<16} | {'logins/s':>8} | {'login p50':>9} | {'login p95':>9} | {'probe p50':>9} | {'probe p95':>9}")
+    for workers in [0, *args.workers]:
+        security.shutdown_password_hasher()
+        settings.PASSWORD_HASH_WORKERS = workers
+        if workers:
+            # Start the worker processes outside the measurement
+            await security.hash_password_async(PASSWORD)
+        result = await _run(emails, args.logins, args.concurrency)
+        label = "threadpool" if workers == 0 else f"{workers} processes"
+        print(
+            f"{label:<16} | {result['logins/s']:>8.1f} | {result['login p50']:>9.1f} | {result['login p95']:>9.1f} | "
+            f"{result['probe p50']:>9.1f} | {result['probe p95']:>9.1f}"
+        )
+    security.shutdown_password_hasher()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(ARGS))
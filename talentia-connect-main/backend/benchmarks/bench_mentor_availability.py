@@ -0,0 +1,197 @@
+"""Mentor availability latency: free slots across every mentor in a window.
+
+Seeds a throwaway SQLite database with approved mentors, each with a few
+weekly slots and the odd one-off date, and a week of booked sessions
+(some cancelled). Then times an availability index rebuild, and
+``free_mentors`` and
+``GET /api/mentors/availability`` for next week across all mentors, for a
+single day, for one mentor, and with a long ``minMinutes`` that few free
+stretches satisfy. Pass ``--database-url`` to run against PostgreSQL.
+
+Run from the backend directory (needs ``httpx`` for the test client):
+
+    python -m benchmarks.bench_mentor_availability --mentors 5000 --sessions 20000
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from datetime import date, datetime, time as clock, timedelta, timezone
+
+
+def _configure_env() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--mentors", type=int, default=5_000)
+    parser.add_argument("--sessions", type=int, default=20_000)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    if args.database_url is None:
+        db_file = os.path.join(tempfile.mkdtemp(prefix="talentia-bench-"), "bench.db")
+        args.database_url = f"sqlite:///{db_file}"
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+    return args
+
+
+ARGS = _configure_env() if __name__ == "__main__" else None
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import insert  # noqa: E402
+
+from app.core.pagination import encode_cursor  # noqa: E402
+from app.db.migrations import upgrade_database  # noqa: E402
+from app.db.session import SessionLocal  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.mentorship import MentorAvailability, MentorProfile, MentorshipSession  # noqa: E402
+from app.models.user import User, UserRole  # noqa: E402
+from app.services.mentor_availability import free_mentors, index  # noqa: E402
+
+# Monday of the benchmarked week, in UTC
+WEEK = datetime(2026, 10, 19, tzinfo=timezone.utc)
+
+
+def _seed(rng: random.Random, mentor_count: int, session_count: int) -> list[str]:
+    """Returns the mentor profile ids."""
+
+    upgrade_database()
+    users = [str(uuid.uuid4()) for _ in range(mentor_count)]
+    profiles = [str(uuid.uuid4()) for _ in range(mentor_count)]
+    student = str(uuid.uuid4())
+
+    slots = []
+    for profile_id in profiles:
+        for weekday in rng.sample(range(7), rng.randint(1, 4)):
+            start = rng.randrange(7, 20)
+            slots.append(
+                {
+                    "id": str(uuid.uuid4()),
+                    "mentor_id": profile_id,
+                    "weekday": weekday,
+                    "start_time": clock(start),
+                    "end_time": clock((start + rng.randint(1, 4)) % 24),
+                }
+            )
+        if rng.random() < 0.2:
+            slots.append(
+                {
+                    "id": str(uuid.uuid4()),
+                    "mentor_id": profile_id,
+                    "date": date(2026, 10, 19) + timedelta(days=rng.randrange(7)),
+                    "start_time": clock(18),
+                    "end_time": clock(22),
+                }
+            )
+
+    with SessionLocal() as db:
+        db.execute(
+            insert(User),
+            [
+                {
+                    "id": user_id,
+                    "email": f"bench-{user_id}@bench.talentia.cm",
+                    "password_hash": "BENCHMARK_NO_LOGIN",
+                    "first_name": "Mentor" if user_id != student else "Student",
+                    "last_name": str(i),
+                    "role": UserRole.MENTOR if user_id != student else UserRole.STUDENT,
+                }
+                for i, user_id in enumerate(users + [student])
+            ],
+        )
+        db.execute(
+            insert(MentorProfile),
+            [
+                {"id": profile_id, "user_id": user_id, "headline": "Mentor", "approval_status": "APPROVED"}
+                for user_id, profile_id in zip(users, profiles)
+            ],
+        )
+        db.execute(insert(MentorAvailability), slots)
+        db.execute(
+            insert(MentorshipSession),
+            [
+                {
+                    "id": str(uuid.uuid4()),
+                    "mentor_id": rng.choice(users),
+                    "student_id": student,
+                    "scheduled_at": scheduled_at,
+                    "duration_minutes": minutes,
+                    # Core inserts skip the model's ends_at upkeep
+                    "ends_at": scheduled_at + timedelta(minutes=minutes),
+                    "status": "CANCELLED" if rng.random() < 0.1 else "SCHEDULED",
+                }
+                for scheduled_at, minutes in (
+                    (WEEK + timedelta(minutes=30 * rng.randrange(7 * 48)), rng.choice((30, 60, 90)))
+                    for _ in range(session_count)
+                )
+            ],
+        )
+        db.commit()
+    return profiles
+
+
+def _time(fn, rounds: int) -> float:
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main(args: argparse.Namespace) -> None:
+    rng = random.Random(42)
+    started = time.perf_counter()
+    profiles = _seed(rng, args.mentors, args.sessions)
+    print(
+        f"seeded {args.mentors} mentors, {args.sessions} sessions in {time.perf_counter() - started:.1f}s "
+        f"({args.database_url})",
+        file=sys.stderr,
+    )
+
+    client = TestClient(app)
+    week_end = WEEK + timedelta(days=7)
+    # (label, offset, free_mentors arguments, endpoint params)
+    queries = [
+        ("week, all mentors", 80, {"start": WEEK, "end": week_end}, {}),
+        ("one day, all mentors", 80, {"start": WEEK, "end": WEEK + timedelta(days=1)}, {}),
+        ("week, one mentor", 0, {"start": WEEK, "end": week_end, "mentor_ids": [profiles[0]]}, {"mentorId": profiles[0]}),
+        ("week, minMinutes=180", 80, {"start": WEEK, "end": week_end, "min_minutes": 180}, {"minMinutes": 180}),
+    ]
+    print(f"{'query':<24} | {'engine ms':>9} | {'endpoint ms':>11} | {'results':>7}")
+    with SessionLocal() as db:
+        def rebuild():
+            index.invalidate()
+            index.snapshot(db)
+
+        print(f"{'index rebuild':<24} | {_time(rebuild, 5):>9.2f} |")
+        for label, offset, arguments, params in queries:
+            def direct():
+                return free_mentors(db, offset=offset, limit=20, **{"min_minutes": 60, **arguments})
+
+            def endpoint():
+                response = client.get(
+                    "/api/mentors/availability",
+                    params={
+                        "start": arguments["start"].isoformat(),
+                        "end": arguments["end"].isoformat(),
+                        "limit": 20,
+                        "cursor": encode_cursor(offset),
+                        **params,
+                    },
+                )
+                response.raise_for_status()
+                return response
+
+            results = len(endpoint().json())
+            direct_ms, endpoint_ms = _time(direct, args.rounds), _time(endpoint, args.rounds)
+            print(f"{label:<24} | {direct_ms:>9.2f} | {endpoint_ms:>11.2f} | {results:>7}")
+
+
+if __name__ == "__main__":
+    main(ARGS)
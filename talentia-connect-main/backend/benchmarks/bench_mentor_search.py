@@ -0,0 +1,184 @@
+"""Mentor search latency on the in-memory tag index.
+
+Seeds a throwaway SQLite database with mentors carrying Zipf-distributed
+expertise tags, hourly rates and approval statuses. Then times an index
+rebuild, then single-tag, AND, OR, prefix and rate/status queries: on the
+index alone and through ``GET /api/mentors`` (response cache cleared before
+each request). For comparison it also times the SQL the index replaces, a
+``LIKE`` scan of the comma-separated ``expertise_tags`` column. Pass
+``--database-url`` to run against PostgreSQL.
+
+Run from the backend directory (needs ``httpx`` for the test client):
+
+    python -m benchmarks.bench_mentor_search --mentors 20000
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+
+TAGS = (
+    "Dance, Makossa, Bikutsi, Afrobeats, Choreography, Vocals, Songwriting, Music Production, Beatmaking, "
+    "Sound Engineering, Photography, Photo Editing, Event Photography, Videography, Video Editing, Film, "
+    "Branding, Graphic Design, Illustration, Animation, UI Design, Painting, Sculpture, Ceramics, Fashion, "
+    "Tailoring, Modelling, Makeup, Theatre, Acting, Storytelling, Poetry, Public Speaking, Marketing, "
+    "Social Media, Entrepreneurship, Fundraising, Event Management, Stage Lighting, Calligraphy"
+).split(", ")
+STATUSES = ("APPROVED", "APPROVED", "APPROVED", "PENDING", "REJECTED")
+
+
+def _configure_env() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--mentors", type=int, default=20_000)
+    parser.add_argument("--rounds", type=int, default=100)
+    args = parser.parse_args()
+
+    if args.database_url is None:
+        db_file = os.path.join(tempfile.mkdtemp(prefix="talentia-bench-"), "bench.db")
+        args.database_url = f"sqlite:///{db_file}"
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+    return args
+
+
+ARGS = _configure_env() if __name__ == "__main__" else None
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import insert, select  # noqa: E402
+
+from app.core.cache import cache_backend  # noqa: E402
+from app.db.migrations import upgrade_database  # noqa: E402
+from app.db.session import SessionLocal  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.mentorship import MentorExpertiseTag, MentorProfile, parse_expertise_tags  # noqa: E402
+from app.models.user import User, UserRole  # noqa: E402
+from app.services.mentor_search import index, search_mentors  # noqa: E402
+
+
+def _seed(rng: random.Random, count: int) -> None:
+    upgrade_database()
+    weights = [1 / rank for rank in range(1, len(TAGS) + 1)]
+    users = [str(uuid.uuid4()) for _ in range(count)]
+    profiles = []
+    for user_id in users:
+        tags = ",".join(dict.fromkeys(rng.choices(TAGS, weights, k=rng.randint(1, 6))))
+        profiles.append(
+            {
+                "id": str(uuid.uuid4()),
+                "user_id": user_id,
+                "headline": "Mentor",
+                "hourly_rate": rng.choice((None, rng.randrange(2_000, 50_000, 500))),
+                "expertise_tags": tags,
+                "approval_status": rng.choice(STATUSES),
+            }
+        )
+
+    with SessionLocal() as db:
+        db.execute(
+            insert(User),
+            [
+                {
+                    "id": user_id,
+                    "email": f"bench-mentor-{user_id}@bench.talentia.cm",
+                    "password_hash": "BENCHMARK_NO_LOGIN",
+                    "first_name": "Mentor",
+                    "last_name": str(i),
+                    "role": UserRole.MENTOR,
+                }
+                for i, user_id in enumerate(users)
+            ],
+        )
+        db.execute(insert(MentorProfile), profiles)
+        # Core inserts skip the ORM's tag mirroring; write the rows like a backfill would
+        db.execute(
+            insert(MentorExpertiseTag),
+            [
+                {"tag": tag, "mentor_id": profile["id"], "name": name}
+                for profile in profiles
+                for tag, name in parse_expertise_tags(profile["expertise_tags"])
+            ],
+        )
+        db.commit()
+
+
+def _time(fn, rounds: int) -> float:
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main(args: argparse.Namespace) -> None:
+    rng = random.Random(42)
+    started = time.perf_counter()
+    _seed(rng, args.mentors)
+    print(f"seeded {args.mentors} mentors in {time.perf_counter() - started:.1f}s ({args.database_url})", file=sys.stderr)
+
+    def rebuild():
+        index.invalidate()
+        with SessionLocal() as db:
+            index.snapshot(db)
+
+    print(f"{'query':<32} | {'index ms':>8} | {'endpoint ms':>11} | {'results':>7}")
+    print(f"{'index rebuild':<32} | {_time(rebuild, 10):>8.2f} |")
+
+    client = TestClient(app)
+    # (label, endpoint params, search_mentors arguments); page 10 of each
+    queries = [
+        ("common tag", {"tags": "Dance"}, {"tags": ["Dance"]}),
+        ("rare tag", {"tags": "Calligraphy"}, {"tags": ["Calligraphy"]}),
+        ("AND of two", {"tags": "Dance,Photography"}, {"tags": ["Dance", "Photography"]}),
+        (
+            "OR of three",
+            {"tags": "Ceramics,Sculpture,Painting", "match": "any"},
+            {"tags": ["Ceramics", "Sculpture", "Painting"], "match_any": True},
+        ),
+        ("prefix", {"tags": "photo*"}, {"tags": ["photo*"]}),
+        (
+            "tag + rate range + approved",
+            {"tags": "Dance", "minRate": 5_000, "maxRate": 30_000, "approvalStatus": "APPROVED"},
+            {"tags": ["Dance"], "min_rate": 5_000, "max_rate": 30_000, "approval_status": "APPROVED"},
+        ),
+    ]
+    with SessionLocal() as db:
+        for label, params, arguments in queries:
+            def direct():
+                return search_mentors(db, offset=180, limit=20, **arguments)
+
+            def endpoint():
+                cache_backend.clear()
+                response = client.get("/api/mentors", params={"limit": 20, "cursor": "WzE4MF0", **params})
+                response.raise_for_status()
+                return response
+
+            results = len(endpoint().json())
+            direct_ms, endpoint_ms = _time(direct, args.rounds), _time(endpoint, args.rounds)
+            print(f"{label:<32} | {direct_ms:>8.3f} | {endpoint_ms:>11.2f} | {results:>7}")
+
+        def like_scan():
+            return db.execute(
+                select(MentorProfile.id)
+                .where(
+                    MentorProfile.expertise_tags.ilike("%dance%"),
+                    MentorProfile.hourly_rate.between(5_000, 30_000),
+                    MentorProfile.approval_status == "APPROVED",
+                )
+                .order_by(MentorProfile.id)
+                .offset(180)
+                .limit(20)
+            ).all()
+
+        label = "baseline: same, LIKE scan"
+        print(f"{label:<32} | {_time(like_scan, args.rounds):>8.3f} | {'':>11} | {len(like_scan()):>7}")
+
+
+if __name__ == "__main__":
+    main(ARGS)
@@ -0,0 +1,208 @@
+"""Gig recommendation feed: index build, incremental updates and request latency.
+
+Seeds a throwaway SQLite database with skill tags, assessment categories,
+open gigs whose text mentions those skills, and students with skills and an
+assessment result. Then times a full build of the in-memory skill matrix,
+keeping it in step when gigs are created, edited and closed through the ORM,
+and ``GET /api/gigs/recommended`` for students with few and many skills.
+Pass ``--database-url`` to run against PostgreSQL instead.
+
+Run from the backend directory (needs ``httpx`` for the test client):
+
+    python -m benchmarks.bench_recommendations --gigs 50000
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+ARTS = (
+    "dance makossa bikutsi choreography singing vocals choir painting mural portrait photography "
+    "videography editing design illustration animation drums guitar piano saxophone poetry "
+    "storytelling acting theatre lighting sound mixing production beatmaking rap comedy hosting "
+    "sculpture ceramics fashion tailoring modelling makeup branding calligraphy"
+).split()
+LEVELS = ("beginner", "advanced", "live", "studio", "digital", "traditional")
+CATEGORIES = ["Dance", "Singing", "Painting", "Music", "Photography", "Design", "Theatre"]
+FILLER = "need help with event for our campus next month paid weekend short project team client".split()
+
+
+def _configure_env() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--gigs", type=int, default=50_000)
+    parser.add_argument("--students", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    if args.database_url is None:
+        db_file = os.path.join(tempfile.mkdtemp(prefix="talentia-bench-"), "bench.db")
+        args.database_url = f"sqlite:///{db_file}"
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+    return args
+
+
+ARGS = _configure_env() if __name__ == "__main__" else None
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import insert  # noqa: E402
+
+from app.core.security import create_access_token  # noqa: E402
+from app.db.migrations import upgrade_database  # noqa: E402
+from app.db.session import SessionLocal  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.assessment import AssessmentAttempt, AssessmentCategory, AssessmentResult, SkillTag, UserSkill  # noqa: E402
+from app.models.marketplace import Gig  # noqa: E402
+from app.models.user import User, UserRole  # noqa: E402
+from app.services.gig_recommendations import index  # noqa: E402
+
+
+def _seed(rng: random.Random, gig_count: int, student_count: int) -> tuple[str, list[tuple[str, int]]]:
+    """Returns the company id and ``(student id, skill count)`` pairs."""
+
+    upgrade_database()
+    now = datetime.now(timezone.utc)
+    company_id = str(uuid.uuid4())
+    skills = [(str(uuid.uuid4()), f"{level.capitalize()} {art}") for art in ARTS for level in LEVELS]
+    categories = [(str(uuid.uuid4()), name) for name in CATEGORIES]
+    students = [(str(uuid.uuid4()), rng.choice((3, 10, 30))) for _ in range(student_count)]
+
+    with SessionLocal() as db:
+        db.execute(
+            insert(User),
+            [
+                {
+                    "id": company_id,
+                    "email": f"bench-company-{company_id}@bench.talentia.cm",
+                    "password_hash": "BENCHMARK_NO_LOGIN",
+                    "first_name": "Bench",
+                    "last_name": "Company",
+                    "role": UserRole.COMPANY,
+                }
+            ]
+            + [
+                {
+                    "id": student_id,
+                    "email": f"bench-{student_id}@bench.talentia.cm",
+                    "password_hash": "BENCHMARK_NO_LOGIN",
+                    "first_name": "Student",
+                    "last_name": str(i),
+                    "role": UserRole.STUDENT,
+                }
+                for i, (student_id, _) in enumerate(students)
+            ],
+        )
+        db.execute(insert(SkillTag), [{"id": skill_id, "name": name, "category": None} for skill_id, name in skills])
+        db.execute(insert(AssessmentCategory), [{"id": category_id, "name": name} for category_id, name in categories])
+        for start in range(0, gig_count, 10_000):
+            db.execute(
+                insert(Gig),
+                [
+                    {
+                        "id": str(uuid.uuid4()),
+                        "company_id": company_id,
+                        "title": f"{rng.choice(LEVELS)} {rng.choice(ARTS)} for {rng.choice(FILLER)}".capitalize(),
+                        "description": " ".join(rng.choices(ARTS + FILLER * 3, k=25)),
+                        "role": rng.choice(ARTS),
+                        "category": rng.choice(CATEGORIES),
+                        "status": "OPEN" if rng.random() < 0.9 else "CLOSED",
+                        "created_at": now - timedelta(minutes=start + i),
+                    }
+                    for i in range(min(10_000, gig_count - start))
+                ],
+            )
+        db.execute(
+            insert(UserSkill),
+            [
+                {"id": str(uuid.uuid4()), "user_id": student_id, "skill_id": skill_id, "level": rng.randint(1, 100)}
+                for student_id, skill_count in students
+                for skill_id, _ in rng.sample(skills, skill_count)
+            ],
+        )
+        attempts = [(str(uuid.uuid4()), student_id) for student_id, _ in students]
+        db.execute(
+            insert(AssessmentAttempt),
+            [{"id": attempt_id, "user_id": student_id, "completed_at": now} for attempt_id, student_id in attempts],
+        )
+        db.execute(
+            insert(AssessmentResult),
+            [
+                {
+                    "id": str(uuid.uuid4()),
+                    "attempt_id": attempt_id,
+                    "user_id": student_id,
+                    "overall_score": 70,
+                    "category_scores": {category_id: rng.randint(0, 100) for category_id, _ in categories},
+                }
+                for attempt_id, student_id in attempts
+            ],
+        )
+        db.commit()
+    return company_id, students
+
+
+def _time(fn, rounds: int) -> float:
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main(args: argparse.Namespace) -> None:
+    rng = random.Random(42)
+    started = time.perf_counter()
+    company_id, students = _seed(rng, args.gigs, args.students)
+    print(f"seeded {args.gigs} gigs in {time.perf_counter() - started:.1f}s ({args.database_url})", file=sys.stderr)
+
+    def full_build():
+        index.clear()
+        with SessionLocal() as db:
+            index.snapshot(db)
+
+    print(f"{'operation':<34} | {'median ms':>9} | {'results':>7}")
+    print(f"{'full index build':<34} | {_time(full_build, max(args.rounds // 10, 3)):>9.2f} |")
+
+    with SessionLocal() as db:
+        gig_ids = [gig.id for gig in db.query(Gig.id).filter(Gig.status == "OPEN").limit(args.rounds * 3)]
+
+    def create_edit_close():
+        with SessionLocal() as db:
+            gig = Gig(id=str(uuid.uuid4()), company_id=company_id, title="Live makossa dance night", status="OPEN")
+            db.add(gig)
+            db.commit()
+            db.get(Gig, gig_ids.pop()).description = "Studio photography and digital editing"
+            db.commit()
+            gig.status = "CLOSED"
+            db.commit()
+        with SessionLocal() as db:
+            index.snapshot(db)
+
+    print(f"{'create + edit + close, then apply':<34} | {_time(create_edit_close, args.rounds):>9.2f} |")
+
+    client = TestClient(app)
+    for skill_count in sorted({count for _, count in students}):
+        student_id = next(student_id for student_id, count in students if count == skill_count)
+        token = create_access_token(student_id, UserRole.STUDENT.value, first_name="Student", last_name="Bench")
+        headers = {"Authorization": f"Bearer {token}"}
+
+        def recommended():
+            response = client.get("/api/gigs/recommended", params={"limit": 20}, headers=headers)
+            response.raise_for_status()
+            return response
+
+        results = len(recommended().json())
+        label = f"GET /recommended ({skill_count} skills)"
+        print(f"{label:<34} | {_time(recommended, args.rounds):>9.2f} | {results:>7}")
+
+
+if __name__ == "__main__":
+    main(ARGS)
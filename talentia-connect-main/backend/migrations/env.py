@@ -0,0 +1,70 @@
+"""Alembic environment.
+
+Runs against ``DATABASE_URL``, or against the connection handed in through
+``config.attributes["connection"]`` by ``app.db.migrations``.
+"""
+
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import create_engine, pool
+
+from app import models  # noqa: F401  # ensure all models are registered on Base
+from app.core.config import settings
+from app.db.session import Base
+
+config = context.config
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+target_metadata = Base.metadata
+
+# Full-text search objects created with raw DDL outside the ORM mapping (see
+# models.marketplace); autogenerate must not try to drop them.
+_UNMAPPED_TABLE_PREFIX = "gigs_fts"
+_UNMAPPED_NAMES = {"search_document", "ix_gigs_search_document"}
+
+
+def include_object(obj, name, type_, reflected, compare_to) -> bool:
+    if type_ == "table" and name.startswith(_UNMAPPED_TABLE_PREFIX):
+        return False
+    return name not in _UNMAPPED_NAMES
+
+
+def _configure(**kwargs) -> None:
+    context.configure(
+        target_metadata=target_metadata,
+        include_object=include_object,
+        # Each revision commits on its own, so a failed index build leaves the earlier ones applied
+        transaction_per_migration=True,
+        **kwargs,
+    )
+
+
+def run_migrations_offline() -> None:
+    _configure(url=settings.DATABASE_URL, literal_binds=True, dialect_opts={"paramstyle": "named"})
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def _run_with(connection) -> None:
+    # SQLite cannot ALTER most things in place; batch mode recreates the table
+    _configure(connection=connection, render_as_batch=connection.dialect.name == "sqlite")
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        _run_with(connection)
+        return
+    engine = create_engine(settings.DATABASE_URL, poolclass=pool.NullPool)
+    with engine.connect() as connection:
+        _run_with(connection)
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,577 @@
+"""Baseline: the schema of the original models, as ``Base.metadata.create_all`` built it at startup.
+
+Databases created that way have at least these tables; stamp them
+(``alembic stamp 0001_baseline``, or ``python -m app.db.migrations``
+does it automatically) instead of running it. Tables and indexes that
+``create_all`` picked up after this point are (re)created idempotently by
+``0006_create_all_catch_up``.
+
+Revision ID: 0001_baseline
+Revises:
+Create Date: 2026-10-18 19:19:36.225234
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001_baseline'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('assessment_categories',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_assessment_categories_id'), 'assessment_categories', ['id'], unique=False)
+    op.create_table('course_categories',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_course_categories_id'), 'course_categories', ['id'], unique=False)
+    op.create_table('library_categories',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_library_categories_id'), 'library_categories', ['id'], unique=False)
+    op.create_table('library_resources',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('category_id', sa.String(), nullable=True),
+    sa.Column('title', sa.String(), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('type', sa.String(), nullable=False),
+    sa.Column('file_url', sa.String(), nullable=False),
+    sa.Column('size_label', sa.String(), nullable=True),
+    sa.Column('is_premium', sa.Boolean(), nullable=False),
+    sa.Column('allowed_roles', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_library_resources_id'), 'library_resources', ['id'], unique=False)
+    op.create_table('skill_tags',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('category', sa.String(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_skill_tags_id'), 'skill_tags', ['id'], unique=False)
+    op.create_index(op.f('ix_skill_tags_name'), 'skill_tags', ['name'], unique=True)
+    op.create_table('universities',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('slug', sa.String(), nullable=False),
+    sa.Column('logo_url', sa.String(), nullable=True),
+    sa.Column('country', sa.String(), nullable=True),
+    sa.Column('city', sa.String(), nullable=True),
+    sa.Column('subscription_plan', sa.String(), nullable=True),
+    sa.Column('subscription_status', sa.Enum('ACTIVE', 'TRIALING', 'CANCELED', name='subscriptionstatus'), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_universities_id'), 'universities', ['id'], unique=False)
+    op.create_index(op.f('ix_universities_slug'), 'universities', ['slug'], unique=True)
+    op.create_table('assessment_questions',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('category_id', sa.String(), nullable=False),
+    sa.Column('text', sa.Text(), nullable=False),
+    sa.Column('type', sa.String(), nullable=False),
+    sa.Column('options', sa.JSON(), nullable=True),
+    sa.Column('weight', sa.Float(), nullable=False),
+    sa.ForeignKeyConstraint(['category_id'], ['assessment_categories.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_assessment_questions_id'), 'assessment_questions', ['id'], unique=False)
+    op.create_table('users',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('email', sa.String(), nullable=False),
+    sa.Column('password_hash', sa.String(), nullable=False),
+    sa.Column('first_name', sa.String(), nullable=False),
+    sa.Column('last_name', sa.String(), nullable=False),
+    sa.Column('avatar_url', sa.String(), nullable=True),
+    sa.Column('bio', sa.String(), nullable=True),
+    sa.Column('role', sa.Enum('STUDENT', 'COMPANY', 'MENTOR', 'UNIVERSITY_ADMIN', 'SUPER_ADMIN', name='userrole'), nullable=False),
+    sa.Column('university_id', sa.String(), nullable=True),
+    sa.Column('department', sa.String(), nullable=True),
+    sa.Column('matric_number', sa.String(), nullable=True),
+    sa.Column('is_verified', sa.Boolean(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.ForeignKeyConstraint(['university_id'], ['universities.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_users_email'), 'users', ['email'], unique=True)
+    op.create_index(op.f('ix_users_id'), 'users', ['id'], unique=False)
+    op.create_table('activity_logs',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('user_id', sa.String(), nullable=False),
+    sa.Column('type', sa.String(), nullable=False),
+    sa.Column('metadata', sa.JSON(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_activity_logs_id'), 'activity_logs', ['id'], unique=False)
+    op.create_table('assessment_attempts',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('user_id', sa.String(), nullable=False),
+    sa.Column('started_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_assessment_attempts_id'), 'assessment_attempts', ['id'], unique=False)
+    op.create_table('courses',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('category_id', sa.String(), nullable=True),
+    sa.Column('title', sa.String(), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('level', sa.String(), nullable=True),
+    sa.Column('cover_image', sa.String(), nullable=True),
+    sa.Column('is_premium', sa.Boolean(), nullable=False),
+    sa.Column('created_by_id', sa.String(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.ForeignKeyConstraint(['category_id'], ['course_categories.id'], ),
+    sa.ForeignKeyConstraint(['created_by_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_courses_id'), 'courses', ['id'], unique=False)
+    op.create_table('gigs',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('company_id', sa.String(), nullable=False),
+    sa.Column('title', sa.String(), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('role', sa.String(), nullable=True),
+    sa.Column('budget_min', sa.Float(), nullable=True),
+    sa.Column('budget_max', sa.Float(), nullable=True),
+    sa.Column('location', sa.String(), nullable=True),
+    sa.Column('type', sa.String(), nullable=True),
+    sa.Column('category', sa.String(), nullable=True),
+    sa.Column('deadline', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('status', sa.String(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.ForeignKeyConstraint(['company_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_gigs_id'), 'gigs', ['id'], unique=False)
+    op.create_table('mentor_profiles',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('user_id', sa.String(), nullable=False),
+    sa.Column('headline', sa.String(), nullable=True),
+    sa.Column('bio', sa.Text(), nullable=True),
+    sa.Column('hourly_rate', sa.Float(), nullable=True),
+    sa.Column('expertise_tags', sa.Text(), nullable=True),
+    sa.Column('approval_status', sa.String(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_mentor_profiles_id'), 'mentor_profiles', ['id'], unique=False)
+    op.create_table('mentorship_sessions',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('mentor_id', sa.String(), nullable=False),
+    sa.Column('student_id', sa.String(), nullable=False),
+    sa.Column('scheduled_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('duration_minutes', sa.Float(), nullable=True),
+    sa.Column('meeting_link', sa.String(), nullable=True),
+    sa.Column('status', sa.String(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.ForeignKeyConstraint(['mentor_id'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['student_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_mentorship_sessions_id'), 'mentorship_sessions', ['id'], unique=False)
+    op.create_table('payouts',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('user_id', sa.String(), nullable=False),
+    sa.Column('amount', sa.Float(), nullable=False),
+    sa.Column('status', sa.String(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_payouts_id'), 'payouts', ['id'], unique=False)
+    op.create_table('portfolios',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('user_id', sa.String(), nullable=False),
+    sa.Column('headline', sa.String(), nullable=True),
+    sa.Column('bio', sa.Text(), nullable=True),
+    sa.Column('public_slug', sa.String(), nullable=True),
+    sa.Column('is_public', sa.Boolean(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_portfolios_id'), 'portfolios', ['id'], unique=False)
+    op.create_index(op.f('ix_portfolios_public_slug'), 'portfolios', ['public_slug'], unique=True)
+    op.create_table('rating_reviews',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('from_user_id', sa.String(), nullable=True),
+    sa.Column('to_user_id', sa.String(), nullable=False),
+    sa.Column('rating', sa.Float(), nullable=False),
+    sa.Column('comment', sa.Text(), nullable=True),
+    sa.Column('context', sa.String(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.ForeignKeyConstraint(['from_user_id'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['to_user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_rating_reviews_id'), 'rating_reviews', ['id'], unique=False)
+    op.create_table('university_students',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('university_id', sa.String(), nullable=False),
+    sa.Column('user_id', sa.String(), nullable=False),
+    sa.Column('faculty', sa.String(), nullable=True),
+    sa.Column('department', sa.String(), nullable=True),
+    sa.Column('cohort_year', sa.String(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.ForeignKeyConstraint(['university_id'], ['universities.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_university_students_id'), 'university_students', ['id'], unique=False)
+    op.create_table('user_skills',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('user_id', sa.String(), nullable=False),
+    sa.Column('skill_id', sa.String(), nullable=False),
+    sa.Column('level', sa.Integer(), nullable=False),
+    sa.Column('source', sa.String(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.ForeignKeyConstraint(['skill_id'], ['skill_tags.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_user_skills_id'), 'user_skills', ['id'], unique=False)
+    op.create_table('assessment_answers',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('attempt_id', sa.String(), nullable=False),
+    sa.Column('question_id', sa.String(), nullable=False),
+    sa.Column('selected_option', sa.String(), nullable=True),
+    sa.Column('score', sa.Float(), nullable=True),
+    sa.ForeignKeyConstraint(['attempt_id'], ['assessment_attempts.id'], ),
+    sa.ForeignKeyConstraint(['question_id'], ['assessment_questions.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_assessment_answers_id'), 'assessment_answers', ['id'], unique=False)
+    op.create_table('assessment_results',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('attempt_id', sa.String(), nullable=False),
+    sa.Column('user_id', sa.String(), nullable=False),
+    sa.Column('overall_score', sa.Float(), nullable=False),
+    sa.Column('category_scores', sa.JSON(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.ForeignKeyConstraint(['attempt_id'], ['assessment_attempts.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_assessment_results_id'), 'assessment_results', ['id'], unique=False)
+    op.create_table('certifications',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('portfolio_id', sa.String(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('issuer', sa.String(), nullable=True),
+    sa.Column('issue_date', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('file_url', sa.String(), nullable=True),
+    sa.ForeignKeyConstraint(['portfolio_id'], ['portfolios.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_certifications_id'), 'certifications', ['id'], unique=False)
+    op.create_table('course_enrollments',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('course_id', sa.String(), nullable=False),
+    sa.Column('user_id', sa.String(), nullable=False),
+    sa.Column('progress', sa.Float(), nullable=False),
+    sa.Column('status', sa.String(), nullable=False),
+    sa.Column('enrolled_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.ForeignKeyConstraint(['course_id'], ['courses.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_course_enrollments_id'), 'course_enrollments', ['id'], unique=False)
+    op.create_table('course_modules',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('course_id', sa.String(), nullable=False),
+    sa.Column('title', sa.String(), nullable=False),
+    sa.Column('order', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['course_id'], ['courses.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_course_modules_id'), 'course_modules', ['id'], unique=False)
+    op.create_table('gig_applications',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('gig_id', sa.String(), nullable=False),
+    sa.Column('student_id', sa.String(), nullable=False),
+    sa.Column('proposal', sa.Text(), nullable=True),
+    sa.Column('status', sa.String(), nullable=False),
+    sa.Column('applied_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.ForeignKeyConstraint(['gig_id'], ['gigs.id'], ),
+    sa.ForeignKeyConstraint(['student_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_gig_applications_id'), 'gig_applications', ['id'], unique=False)
+    op.create_table('mentor_availabilities',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('mentor_id', sa.String(), nullable=False),
+    sa.Column('weekday', sa.String(), nullable=True),
+    sa.Column('date', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('start_time', sa.String(), nullable=True),
+    sa.Column('end_time', sa.String(), nullable=True),
+    sa.ForeignKeyConstraint(['mentor_id'], ['mentor_profiles.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_mentor_availabilities_id'), 'mentor_availabilities', ['id'], unique=False)
+    op.create_table('mentorship_feedback',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('session_id', sa.String(), nullable=False),
+    sa.Column('rating', sa.Float(), nullable=False),
+    sa.Column('comments', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.ForeignKeyConstraint(['session_id'], ['mentorship_sessions.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_mentorship_feedback_id'), 'mentorship_feedback', ['id'], unique=False)
+    op.create_table('portfolio_projects',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('portfolio_id', sa.String(), nullable=False),
+    sa.Column('title', sa.String(), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('media_urls', sa.Text(), nullable=True),
+    sa.Column('tags', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.ForeignKeyConstraint(['portfolio_id'], ['portfolios.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_portfolio_projects_id'), 'portfolio_projects', ['id'], unique=False)
+    op.create_table('testimonials',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('portfolio_id', sa.String(), nullable=False),
+    sa.Column('author_name', sa.String(), nullable=False),
+    sa.Column('relation', sa.String(), nullable=True),
+    sa.Column('text', sa.Text(), nullable=False),
+    sa.ForeignKeyConstraint(['portfolio_id'], ['portfolios.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_testimonials_id'), 'testimonials', ['id'], unique=False)
+    op.create_table('contracts',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('gig_id', sa.String(), nullable=False),
+    sa.Column('application_id', sa.String(), nullable=False),
+    sa.Column('agreed_amount', sa.Float(), nullable=True),
+    sa.Column('status', sa.String(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.ForeignKeyConstraint(['application_id'], ['gig_applications.id'], ),
+    sa.ForeignKeyConstraint(['gig_id'], ['gigs.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_contracts_id'), 'contracts', ['id'], unique=False)
+    op.create_table('conversations',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('gig_id', sa.String(), nullable=False),
+    sa.Column('application_id', sa.String(), nullable=False),
+    sa.Column('company_id', sa.String(), nullable=False),
+    sa.Column('student_id', sa.String(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.ForeignKeyConstraint(['application_id'], ['gig_applications.id'], ),
+    sa.ForeignKeyConstraint(['company_id'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['gig_id'], ['gigs.id'], ),
+    sa.ForeignKeyConstraint(['student_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_conversations_id'), 'conversations', ['id'], unique=False)
+    op.create_table('course_certificates',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('enrollment_id', sa.String(), nullable=False),
+    sa.Column('certificate_url', sa.String(), nullable=False),
+    sa.Column('issued_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.ForeignKeyConstraint(['enrollment_id'], ['course_enrollments.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_course_certificates_id'), 'course_certificates', ['id'], unique=False)
+    op.create_table('lessons',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('module_id', sa.String(), nullable=False),
+    sa.Column('title', sa.String(), nullable=False),
+    sa.Column('type', sa.String(), nullable=False),
+    sa.Column('content_url', sa.String(), nullable=True),
+    sa.Column('duration_minutes', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['module_id'], ['course_modules.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_lessons_id'), 'lessons', ['id'], unique=False)
+    op.create_table('messages',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('conversation_id', sa.String(), nullable=False),
+    sa.Column('sender_id', sa.String(), nullable=False),
+    sa.Column('content', sa.Text(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.ForeignKeyConstraint(['conversation_id'], ['conversations.id'], ),
+    sa.ForeignKeyConstraint(['sender_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_messages_id'), 'messages', ['id'], unique=False)
+    op.create_table('payments',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('contract_id', sa.String(), nullable=False),
+    sa.Column('provider', sa.String(), nullable=True),
+    sa.Column('reference', sa.String(), nullable=True),
+    sa.Column('amount', sa.Float(), nullable=False),
+    sa.Column('status', sa.String(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.ForeignKeyConstraint(['contract_id'], ['contracts.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_payments_id'), 'payments', ['id'], unique=False)
+    op.create_table('quiz_questions',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('lesson_id', sa.String(), nullable=False),
+    sa.Column('text', sa.Text(), nullable=False),
+    sa.ForeignKeyConstraint(['lesson_id'], ['lessons.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_quiz_questions_id'), 'quiz_questions', ['id'], unique=False)
+    op.create_table('quiz_submissions',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('lesson_id', sa.String(), nullable=False),
+    sa.Column('user_id', sa.String(), nullable=False),
+    sa.Column('score', sa.Float(), nullable=True),
+    sa.Column('submitted_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.ForeignKeyConstraint(['lesson_id'], ['lessons.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_quiz_submissions_id'), 'quiz_submissions', ['id'], unique=False)
+    op.create_table('work_submissions',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('contract_id', sa.String(), nullable=False),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.Column('files', sa.Text(), nullable=True),
+    sa.Column('status', sa.String(), nullable=False),
+    sa.Column('submitted_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.ForeignKeyConstraint(['contract_id'], ['contracts.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_work_submissions_id'), 'work_submissions', ['id'], unique=False)
+    op.create_table('quiz_answer_options',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('question_id', sa.String(), nullable=False),
+    sa.Column('text', sa.Text(), nullable=False),
+    sa.Column('is_correct', sa.Boolean(), nullable=False),
+    sa.ForeignKeyConstraint(['question_id'], ['quiz_questions.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_quiz_answer_options_id'), 'quiz_answer_options', ['id'], unique=False)
+    op.create_table('quiz_submission_answers',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('submission_id', sa.String(), nullable=False),
+    sa.Column('question_id', sa.String(), nullable=False),
+    sa.Column('selected_option_id', sa.String(), nullable=True),
+    sa.ForeignKeyConstraint(['question_id'], ['quiz_questions.id'], ),
+    sa.ForeignKeyConstraint(['selected_option_id'], ['quiz_answer_options.id'], ),
+    sa.ForeignKeyConstraint(['submission_id'], ['quiz_submissions.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_quiz_submission_answers_id'), 'quiz_submission_answers', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_quiz_submission_answers_id'), table_name='quiz_submission_answers')
+    op.drop_table('quiz_submission_answers')
+    op.drop_index(op.f('ix_quiz_answer_options_id'), table_name='quiz_answer_options')
+    op.drop_table('quiz_answer_options')
+    op.drop_index(op.f('ix_work_submissions_id'), table_name='work_submissions')
+    op.drop_table('work_submissions')
+    op.drop_index(op.f('ix_quiz_submissions_id'), table_name='quiz_submissions')
+    op.drop_table('quiz_submissions')
+    op.drop_index(op.f('ix_quiz_questions_id'), table_name='quiz_questions')
+    op.drop_table('quiz_questions')
+    op.drop_index(op.f('ix_payments_id'), table_name='payments')
+    op.drop_table('payments')
+    op.drop_index(op.f('ix_messages_id'), table_name='messages')
+    op.drop_table('messages')
+    op.drop_index(op.f('ix_lessons_id'), table_name='lessons')
+    op.drop_table('lessons')
+    op.drop_index(op.f('ix_course_certificates_id'), table_name='course_certificates')
+    op.drop_table('course_certificates')
+    op.drop_index(op.f('ix_conversations_id'), table_name='conversations')
+    op.drop_table('conversations')
+    op.drop_index(op.f('ix_contracts_id'), table_name='contracts')
+    op.drop_table('contracts')
+    op.drop_index(op.f('ix_testimonials_id'), table_name='testimonials')
+    op.drop_table('testimonials')
+    op.drop_index(op.f('ix_portfolio_projects_id'), table_name='portfolio_projects')
+    op.drop_table('portfolio_projects')
+    op.drop_index(op.f('ix_mentorship_feedback_id'), table_name='mentorship_feedback')
+    op.drop_table('mentorship_feedback')
+    op.drop_index(op.f('ix_mentor_availabilities_id'), table_name='mentor_availabilities')
+    op.drop_table('mentor_availabilities')
+    op.drop_index(op.f('ix_gig_applications_id'), table_name='gig_applications')
+    op.drop_table('gig_applications')
+    op.drop_index(op.f('ix_course_modules_id'), table_name='course_modules')
+    op.drop_table('course_modules')
+    op.drop_index(op.f('ix_course_enrollments_id'), table_name='course_enrollments')
+    op.drop_table('course_enrollments')
+    op.drop_index(op.f('ix_certifications_id'), table_name='certifications')
+    op.drop_table('certifications')
+    op.drop_index(op.f('ix_assessment_results_id'), table_name='assessment_results')
+    op.drop_table('assessment_results')
+    op.drop_index(op.f('ix_assessment_answers_id'), table_name='assessment_answers')
+    op.drop_table('assessment_answers')
+    op.drop_index(op.f('ix_user_skills_id'), table_name='user_skills')
+    op.drop_table('user_skills')
+    op.drop_index(op.f('ix_university_students_id'), table_name='university_students')
+    op.drop_table('university_students')
+    op.drop_index(op.f('ix_rating_reviews_id'), table_name='rating_reviews')
+    op.drop_table('rating_reviews')
+    op.drop_index(op.f('ix_portfolios_public_slug'), table_name='portfolios')
+    op.drop_index(op.f('ix_portfolios_id'), table_name='portfolios')
+    op.drop_table('portfolios')
+    op.drop_index(op.f('ix_payouts_id'), table_name='payouts')
+    op.drop_table('payouts')
+    op.drop_index(op.f('ix_mentorship_sessions_id'), table_name='mentorship_sessions')
+    op.drop_table('mentorship_sessions')
+    op.drop_index(op.f('ix_mentor_profiles_id'), table_name='mentor_profiles')
+    op.drop_table('mentor_profiles')
+    op.drop_index(op.f('ix_gigs_id'), table_name='gigs')
+    op.drop_table('gigs')
+    op.drop_index(op.f('ix_courses_id'), table_name='courses')
+    op.drop_table('courses')
+    op.drop_index(op.f('ix_assessment_attempts_id'), table_name='assessment_attempts')
+    op.drop_table('assessment_attempts')
+    op.drop_index(op.f('ix_activity_logs_id'), table_name='activity_logs')
+    op.drop_table('activity_logs')
+    op.drop_index(op.f('ix_users_id'), table_name='users')
+    op.drop_index(op.f('ix_users_email'), table_name='users')
+    op.drop_table('users')
+    op.drop_index(op.f('ix_assessment_questions_id'), table_name='assessment_questions')
+    op.drop_table('assessment_questions')
+    op.drop_index(op.f('ix_universities_slug'), table_name='universities')
+    op.drop_index(op.f('ix_universities_id'), table_name='universities')
+    op.drop_table('universities')
+    op.drop_index(op.f('ix_skill_tags_name'), table_name='skill_tags')
+    op.drop_index(op.f('ix_skill_tags_id'), table_name='skill_tags')
+    op.drop_table('skill_tags')
+    op.drop_index(op.f('ix_library_resources_id'), table_name='library_resources')
+    op.drop_table('library_resources')
+    op.drop_index(op.f('ix_library_categories_id'), table_name='library_categories')
+    op.drop_table('library_categories')
+    op.drop_index(op.f('ix_course_categories_id'), table_name='course_categories')
+    op.drop_table('course_categories')
+    op.drop_index(op.f('ix_assessment_categories_id'), table_name='assessment_categories')
+    op.drop_table('assessment_categories')
+    # PostgreSQL keeps enum types after their tables are gone
+    sa.Enum(name="userrole").drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name="subscriptionstatus").drop(op.get_bind(), checkfirst=True)
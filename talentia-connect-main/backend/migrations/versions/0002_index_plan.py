@@ -0,0 +1,98 @@
+"""Index plan: the foreign keys and access paths the hot queries use.
+
+The baseline only indexed primary keys and a few listing/keyset paths, so
+joins and lookups by foreign key (an application's contract, a student's
+skills and reviews, a course's modules and lessons, ...) scanned whole
+tables. On PostgreSQL the indexes are built ``CONCURRENTLY`` so writes keep
+going while a large table is indexed; every statement is idempotent, so a
+build interrupted half way can simply be re-run.
+
+Revision ID: 0002_index_plan
+Revises: 0001_baseline
+Create Date: 2026-10-18 19:21:02.113384
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002_index_plan'
+down_revision: Union[str, None] = '0001_baseline'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, table, columns)
+INDEXES = (
+    # Marketplace: a company's gigs, a student's applications, contracts and
+    # payments of an application, payouts of a user
+    ('ix_gigs_company_id_created_at', 'gigs', ['company_id', 'created_at']),
+    ('ix_gig_applications_student_id_gig_id', 'gig_applications', ['student_id', 'gig_id']),
+    ('ix_contracts_application_id', 'contracts', ['application_id']),
+    ('ix_contracts_gig_id', 'contracts', ['gig_id']),
+    ('ix_work_submissions_contract_id', 'work_submissions', ['contract_id']),
+    ('ix_payments_contract_id', 'payments', ['contract_id']),
+    ('ix_payouts_user_id', 'payouts', ['user_id']),
+    # Talent profiles: skills (both directions), reviews received, university
+    ('ix_user_skills_user_id_skill_id', 'user_skills', ['user_id', 'skill_id']),
+    ('ix_user_skills_skill_id', 'user_skills', ['skill_id']),
+    ('ix_rating_reviews_to_user_id', 'rating_reviews', ['to_user_id']),
+    ('ix_users_university_id', 'users', ['university_id']),
+    ('ix_university_students_university_id', 'university_students', ['university_id']),
+    ('ix_university_students_user_id', 'university_students', ['user_id']),
+    ('ix_portfolios_user_id', 'portfolios', ['user_id']),
+    ('ix_portfolio_projects_portfolio_id', 'portfolio_projects', ['portfolio_id']),
+    ('ix_certifications_portfolio_id', 'certifications', ['portfolio_id']),
+    ('ix_testimonials_portfolio_id', 'testimonials', ['portfolio_id']),
+    # Courses: the course detail tree, enrollments and quizzes
+    ('ix_courses_category_id', 'courses', ['category_id']),
+    ('ix_course_modules_course_id', 'course_modules', ['course_id']),
+    ('ix_lessons_module_id', 'lessons', ['module_id']),
+    ('ix_course_enrollments_user_id_course_id', 'course_enrollments', ['user_id', 'course_id']),
+    ('ix_course_certificates_enrollment_id', 'course_certificates', ['enrollment_id']),
+    ('ix_quiz_questions_lesson_id', 'quiz_questions', ['lesson_id']),
+    ('ix_quiz_answer_options_question_id', 'quiz_answer_options', ['question_id']),
+    ('ix_quiz_submissions_user_id_lesson_id', 'quiz_submissions', ['user_id', 'lesson_id']),
+    ('ix_quiz_submission_answers_submission_id', 'quiz_submission_answers', ['submission_id']),
+    # Assessments
+    ('ix_assessment_questions_category_id', 'assessment_questions', ['category_id']),
+    ('ix_assessment_attempts_user_id', 'assessment_attempts', ['user_id']),
+    ('ix_assessment_answers_attempt_id', 'assessment_answers', ['attempt_id']),
+    ('ix_assessment_results_attempt_id', 'assessment_results', ['attempt_id']),
+    ('ix_assessment_results_user_id', 'assessment_results', ['user_id']),
+    # Mentorship
+    ('ix_mentor_profiles_user_id', 'mentor_profiles', ['user_id']),
+    ('ix_mentor_availabilities_mentor_id', 'mentor_availabilities', ['mentor_id']),
+    ('ix_mentorship_sessions_mentor_id', 'mentorship_sessions', ['mentor_id']),
+    ('ix_mentorship_sessions_student_id', 'mentorship_sessions', ['student_id']),
+    ('ix_mentorship_feedback_session_id', 'mentorship_feedback', ['session_id']),
+    # Analytics
+    ('ix_activity_logs_user_id_created_at', 'activity_logs', ['user_id', 'created_at']),
+)
+
+
+def _concurrently() -> bool:
+    return op.get_bind().dialect.name == 'postgresql'
+
+
+def upgrade() -> None:
+    if _concurrently():
+        # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+        with op.get_context().autocommit_block():
+            for name, table, columns in INDEXES:
+                op.create_index(name, table, columns, if_not_exists=True, postgresql_concurrently=True)
+        return
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, if_not_exists=True)
+
+
+def downgrade() -> None:
+    if _concurrently():
+        with op.get_context().autocommit_block():
+            for name, table, _ in reversed(INDEXES):
+                op.drop_index(name, table_name=table, if_exists=True, postgresql_concurrently=True)
+        return
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table, if_exists=True)
@@ -0,0 +1,63 @@
+"""Mentor expertise tags: one normalized row per mentor and tag.
+
+``mentor_profiles.expertise_tags`` stays the comma-separated value mentors
+edit; the ORM mirrors it into ``mentor_expertise_tags`` (see
+``MentorProfile._sync_tags``) for mentor search. Existing profiles are
+backfilled here, with the same parsing as ``parse_expertise_tags``.
+
+Revision ID: 0003_mentor_expertise_tags
+Revises: 0002_index_plan
+Create Date: 2026-10-18 19:40:12.501927
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003_mentor_expertise_tags'
+down_revision: Union[str, None] = '0002_index_plan'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _parse(value):
+    # Kept in step with app.models.mentorship.parse_expertise_tags by hand:
+    # migrations must not change when the app code does
+    tags, seen = [], set()
+    for name in (value or '').split(','):
+        name = ' '.join(name.split())
+        tag = name.lower()
+        if tag and tag not in seen:
+            seen.add(tag)
+            tags.append((tag, name))
+    return tags
+
+
+def upgrade() -> None:
+    tags = op.create_table('mentor_expertise_tags',
+    sa.Column('tag', sa.String(), nullable=False),
+    sa.Column('mentor_id', sa.String(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.ForeignKeyConstraint(['mentor_id'], ['mentor_profiles.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('tag', 'mentor_id')
+    )
+    op.create_index(op.f('ix_mentor_expertise_tags_mentor_id'), 'mentor_expertise_tags', ['mentor_id'], unique=False)
+
+    profiles = op.get_bind().execute(
+        sa.text('SELECT id, expertise_tags FROM mentor_profiles WHERE expertise_tags IS NOT NULL')
+    ).all()
+    rows = [
+        {'tag': tag, 'mentor_id': mentor_id, 'name': name}
+        for mentor_id, value in profiles
+        for tag, name in _parse(value)
+    ]
+    if rows:
+        op.bulk_insert(tags, rows)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_mentor_expertise_tags_mentor_id'), table_name='mentor_expertise_tags')
+    op.drop_table('mentor_expertise_tags')
@@ -0,0 +1,104 @@
+"""Mentor availability: typed weekday, date and time columns.
+
+``weekday`` goes from a day name (``MONDAY``) to 0 = Monday ... 6 = Sunday,
+``date`` from a timestamp to a date and ``start_time``/``end_time`` from
+``HH:MM`` strings to times, so the availability engine can expand slots
+without parsing strings. Each column is rebuilt under a temporary name,
+filled from the old one, then renamed; values that do not parse become
+NULL. ``24:00`` is stored as ``00:00`` (an end at or before the start runs
+past midnight).
+
+Revision ID: 0004_typed_mentor_availability
+Revises: 0003_mentor_expertise_tags
+Create Date: 2026-10-18 21:05:37.118204
+
+"""
+import datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004_typed_mentor_availability'
+down_revision: Union[str, None] = '0003_mentor_expertise_tags'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_DAYS = ('MONDAY', 'TUESDAY', 'WEDNESDAY', 'THURSDAY', 'FRIDAY', 'SATURDAY', 'SUNDAY')
+_COLUMNS = ('weekday', 'date', 'start_time', 'end_time')
+
+
+def _weekday(value):
+    name = (value or '').strip().upper()[:3]
+    for day, full in enumerate(_DAYS):
+        if name and full.startswith(name):
+            return day
+    return None
+
+
+def _date(value):
+    if isinstance(value, datetime.datetime):
+        return value.date()
+    try:
+        return datetime.date.fromisoformat(str(value)[:10]) if value else None
+    except ValueError:
+        return None
+
+
+def _time(value):
+    try:
+        hours, minutes = (int(part) for part in str(value).strip().split(':')[:2])
+        return datetime.time(hours % 24, minutes) if hours <= 24 else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _rebuild(types, convert) -> None:
+    """Swap every column in ``_COLUMNS`` for one of the given type, converting the values."""
+
+    with op.batch_alter_table('mentor_availabilities') as batch_op:
+        for name, type_ in zip(_COLUMNS, types):
+            batch_op.add_column(sa.Column(f'{name}_new', type_, nullable=True))
+
+    table = sa.table(
+        'mentor_availabilities',
+        sa.column('id', sa.String()),
+        *(sa.column(name) for name in _COLUMNS),
+        *(sa.column(f'{name}_new', type_) for name, type_ in zip(_COLUMNS, types)),
+    )
+    connection = op.get_bind()
+    rows = connection.execute(sa.select(table.c.id, *(table.c[name] for name in _COLUMNS))).all()
+    for row in rows:
+        connection.execute(
+            table.update()
+            .where(table.c.id == row.id)
+            .values({f'{name}_new': convert[name](row[i + 1]) for i, name in enumerate(_COLUMNS)})
+        )
+
+    with op.batch_alter_table('mentor_availabilities') as batch_op:
+        for name in _COLUMNS:
+            batch_op.drop_column(name)
+    with op.batch_alter_table('mentor_availabilities') as batch_op:
+        for name, type_ in zip(_COLUMNS, types):
+            batch_op.alter_column(f'{name}_new', new_column_name=name, existing_type=type_, existing_nullable=True)
+
+
+def upgrade() -> None:
+    _rebuild(
+        (sa.SmallInteger(), sa.Date(), sa.Time(), sa.Time()),
+        {'weekday': _weekday, 'date': _date, 'start_time': _time, 'end_time': _time},
+    )
+
+
+def downgrade() -> None:
+    _rebuild(
+        (sa.String(), sa.DateTime(timezone=True), sa.String(), sa.String()),
+        {
+            'weekday': lambda value: _DAYS[value] if value is not None else None,
+            'date': lambda value: datetime.datetime.combine(_date(value), datetime.time()) if value else None,
+            'start_time': lambda value: str(value)[:5] if value is not None else None,
+            'end_time': lambda value: str(value)[:5] if value is not None else None,
+        },
+    )
@@ -0,0 +1,69 @@
+"""Mentorship sessions: stored end time and, on PostgreSQL, no overlapping bookings.
+
+``ends_at`` (``scheduled_at`` plus the duration, 60 minutes when unset) is
+backfilled for existing sessions. On PostgreSQL the
+``mentorship_sessions_no_overlap`` exclusion constraint then rejects two
+sessions of one mentor whose times overlap, unless one is CANCELLED. It
+needs the ``btree_gist`` extension, created here (superuser or a trusted
+extension), and fails if existing sessions already overlap. SQLite has no
+equivalent; the booking service serializes bookings there instead.
+
+Revision ID: 0005_mentorship_session_overlap
+Revises: 0004_typed_mentor_availability
+Create Date: 2026-10-18 22:12:48.640915
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005_mentorship_session_overlap'
+down_revision: Union[str, None] = '0004_typed_mentor_availability'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('mentorship_sessions') as batch_op:
+        batch_op.add_column(sa.Column('ends_at', sa.DateTime(timezone=True), nullable=True))
+
+    connection = op.get_bind()
+    # One set-based statement; sessions without a duration last an hour
+    if connection.dialect.name == 'postgresql':
+        op.execute(
+            sa.text(
+                'UPDATE mentorship_sessions '
+                "SET ends_at = scheduled_at + coalesce(duration_minutes, 60) * interval '1 minute'"
+            )
+        )
+    else:
+        # SQLite keeps timestamps as text in SQLAlchemy's format; strftime's
+        # %f has milliseconds, so pad them to its six fractional digits
+        op.execute(
+            sa.text(
+                'UPDATE mentorship_sessions '
+                "SET ends_at = strftime('%Y-%m-%d %H:%M:%f', scheduled_at, "
+                "printf('%+f minutes', coalesce(duration_minutes, 60))) || '000'"
+            )
+        )
+
+    with op.batch_alter_table('mentorship_sessions') as batch_op:
+        batch_op.alter_column('ends_at', existing_type=sa.DateTime(timezone=True), nullable=False)
+
+    if connection.dialect.name == 'postgresql':
+        op.execute('CREATE EXTENSION IF NOT EXISTS btree_gist')
+        op.execute(
+            'ALTER TABLE mentorship_sessions ADD CONSTRAINT mentorship_sessions_no_overlap '
+            'EXCLUDE USING gist (mentor_id WITH =, tstzrange(scheduled_at, ends_at) WITH &&) '
+            "WHERE (status <> 'CANCELLED')"
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        op.drop_constraint('mentorship_sessions_no_overlap', 'mentorship_sessions')
+    with op.batch_alter_table('mentorship_sessions') as batch_op:
+        batch_op.drop_column('ends_at')
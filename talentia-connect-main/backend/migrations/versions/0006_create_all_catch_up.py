@@ -0,0 +1,263 @@
+"""Catch-up: what the models gained while ``create_all`` still built the schema.
+
+Before migrations the API ran ``Base.metadata.create_all`` at startup, which
+creates missing tables but never touches existing ones. Talent stats,
+refresh tokens, read markers, library role rows, the keyset and foreign key
+indexes behind paginated listings and gig full-text search all arrived
+that way, so a database has all, some or none of them depending on when it
+was created. Every step here is idempotent: missing tables and indexes are
+created, then
+
+- ``talent_stats`` is rebuilt from reviews, completed contracts and skills
+  if it is empty,
+- library resources without role rows get them from ``allowed_roles``,
+- the gig search index is created and, on SQLite, refilled.
+
+On PostgreSQL the indexes on existing tables are built ``CONCURRENTLY``,
+as in ``0002_index_plan``.
+
+Revision ID: 0006_create_all_catch_up
+Revises: 0005_mentorship_session_overlap
+Create Date: 2026-10-18 23:02:11.408517
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0006_create_all_catch_up'
+down_revision: Union[str, None] = '0005_mentorship_session_overlap'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_ROLES = ('STUDENT', 'COMPANY', 'MENTOR', 'UNIVERSITY_ADMIN', 'SUPER_ADMIN')
+# users.role already created the type on PostgreSQL
+_ROLE = postgresql.ENUM(*_ROLES, name='userrole', create_type=False)
+_TOP_SKILLS = 5
+
+# (index name, table, columns, unique) on tables created here
+_NEW_TABLE_INDEXES = (
+    ('ix_talent_stats_avg_rating_user_id', 'talent_stats', ['avg_rating', 'user_id'], False),
+    ('ix_refresh_tokens_family_id', 'refresh_tokens', ['family_id'], False),
+    ('ix_refresh_tokens_id', 'refresh_tokens', ['id'], False),
+    ('ix_refresh_tokens_token_hash', 'refresh_tokens', ['token_hash'], True),
+    ('ix_refresh_tokens_user_id', 'refresh_tokens', ['user_id'], False),
+    ('ix_library_resource_roles_resource_id', 'library_resource_roles', ['resource_id'], False),
+)
+# (index name, table, columns) on tables the baseline already had
+_INDEXES = (
+    ('ix_gigs_status_created_at_id', 'gigs', ['status', 'created_at', 'id']),
+    ('ix_gigs_status_category_created_at_id', 'gigs', ['status', 'category', 'created_at', 'id']),
+    ('ix_gigs_status_type_created_at_id', 'gigs', ['status', 'type', 'created_at', 'id']),
+    ('ix_gig_applications_gig_id', 'gig_applications', ['gig_id']),
+    ('ix_conversations_application_id', 'conversations', ['application_id']),
+    ('ix_conversations_company_id', 'conversations', ['company_id']),
+    ('ix_conversations_student_id', 'conversations', ['student_id']),
+    ('ix_messages_conversation_created_at_id', 'messages', ['conversation_id', 'created_at', 'id']),
+    ('ix_library_resources_created_at_id', 'library_resources', ['created_at', 'id']),
+    ('ix_library_resources_category_created_at_id', 'library_resources', ['category_id', 'created_at', 'id']),
+)
+
+
+def _create_tables(existing) -> None:
+    if 'talent_stats' not in existing:
+        op.create_table('talent_stats',
+        sa.Column('user_id', sa.String(), nullable=False),
+        sa.Column('rating_total', sa.Float(), nullable=False),
+        sa.Column('reviews_count', sa.Integer(), nullable=False),
+        sa.Column('avg_rating', sa.Float(), nullable=False),
+        sa.Column('completed_gigs', sa.Integer(), nullable=False),
+        sa.Column('top_skills', sa.JSON(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('user_id')
+        )
+    if 'refresh_tokens' not in existing:
+        op.create_table('refresh_tokens',
+        sa.Column('id', sa.String(), nullable=False),
+        sa.Column('user_id', sa.String(), nullable=False),
+        sa.Column('family_id', sa.String(), nullable=False),
+        sa.Column('token_hash', sa.String(length=64), nullable=False),
+        sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('revoked_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('replaced_by_id', sa.String(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+        )
+    if 'conversation_reads' not in existing:
+        op.create_table('conversation_reads',
+        sa.Column('conversation_id', sa.String(), nullable=False),
+        sa.Column('user_id', sa.String(), nullable=False),
+        sa.Column('last_read_message_id', sa.String(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.ForeignKeyConstraint(['conversation_id'], ['conversations.id'], ),
+        sa.ForeignKeyConstraint(['last_read_message_id'], ['messages.id'], ),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('conversation_id', 'user_id')
+        )
+    if 'library_resource_roles' not in existing:
+        op.create_table('library_resource_roles',
+        sa.Column('role', _ROLE, nullable=False),
+        sa.Column('resource_id', sa.String(), nullable=False),
+        sa.ForeignKeyConstraint(['resource_id'], ['library_resources.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('role', 'resource_id')
+        )
+    for name, table, columns, unique in _NEW_TABLE_INDEXES:
+        op.create_index(name, table, columns, unique=unique, if_not_exists=True)
+
+
+def _backfill_talent_stats(connection) -> None:
+    # Mirrors app.services.talent_stats.rebuild_talent_stats, kept here by
+    # hand: migrations must not change when the app code does
+    if connection.execute(sa.text('SELECT 1 FROM talent_stats LIMIT 1')).first() is not None:
+        return
+    reviews = {
+        user_id: (float(total), int(count))
+        for user_id, total, count in connection.execute(
+            sa.text(
+                'SELECT to_user_id, coalesce(sum(rating), 0), count(id) FROM rating_reviews GROUP BY to_user_id'
+            )
+        )
+    }
+    completed = dict(
+        connection.execute(
+            sa.text(
+                'SELECT gig_applications.student_id, count(contracts.id) FROM contracts '
+                'JOIN gig_applications ON gig_applications.id = contracts.application_id '
+                "WHERE contracts.status = 'COMPLETED' GROUP BY gig_applications.student_id"
+            )
+        ).all()
+    )
+    skills = {}
+    for user_id, name in connection.execute(
+        sa.text(
+            'SELECT user_skills.user_id, skill_tags.name FROM user_skills '
+            'JOIN skill_tags ON skill_tags.id = user_skills.skill_id '
+            'ORDER BY user_skills.user_id, user_skills.level DESC, skill_tags.name'
+        )
+    ):
+        top = skills.setdefault(user_id, [])
+        if len(top) < _TOP_SKILLS:
+            top.append(name)
+
+    rows = []
+    for user_id in set(reviews) | set(completed):
+        rating_total, reviews_count = reviews.get(user_id, (0.0, 0))
+        rows.append(
+            {
+                'user_id': user_id,
+                'rating_total': rating_total,
+                'reviews_count': reviews_count,
+                'avg_rating': rating_total / reviews_count if reviews_count else 0.0,
+                'completed_gigs': int(completed.get(user_id, 0)),
+                'top_skills': skills.get(user_id, []),
+            }
+        )
+    if rows:
+        stats = sa.table(
+            'talent_stats',
+            sa.column('user_id', sa.String()),
+            sa.column('rating_total', sa.Float()),
+            sa.column('reviews_count', sa.Integer()),
+            sa.column('avg_rating', sa.Float()),
+            sa.column('completed_gigs', sa.Integer()),
+            sa.column('top_skills', sa.JSON()),
+        )
+        op.bulk_insert(stats, rows)
+
+
+def _parse_roles(value):
+    # Kept in step with app.models.library.parse_allowed_roles by hand
+    if not value or not value.strip():
+        return list(_ROLES)
+    roles = []
+    for name in value.split(','):
+        role = name.strip().upper()
+        if role in _ROLES and role not in roles:
+            roles.append(role)
+    return roles
+
+
+def _backfill_library_roles(connection) -> None:
+    missing = connection.execute(
+        sa.text(
+            'SELECT id, allowed_roles FROM library_resources WHERE NOT EXISTS '
+            '(SELECT 1 FROM library_resource_roles WHERE library_resource_roles.resource_id = library_resources.id)'
+        )
+    ).all()
+    rows = [
+        {'role': role, 'resource_id': resource_id}
+        for resource_id, allowed_roles in missing
+        for role in _parse_roles(allowed_roles)
+    ]
+    if rows:
+        roles = sa.table('library_resource_roles', sa.column('role', _ROLE), sa.column('resource_id', sa.String()))
+        op.bulk_insert(roles, rows)
+
+
+def _create_search_index(dialect) -> None:
+    # Gig full-text search (see services.gig_search), created outside the ORM mapping
+    if dialect == 'postgresql':
+        op.execute(
+            'ALTER TABLE gigs ADD COLUMN IF NOT EXISTS search_document tsvector GENERATED ALWAYS AS ('
+            "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('simple', coalesce(role, '') || ' ' || coalesce(category, '')), 'B') || "
+            "setweight(to_tsvector('simple', coalesce(description, '')), 'C')) STORED"
+        )
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS ix_gigs_search_document ON gigs USING gin (search_document) WHERE status = 'OPEN'"
+        )
+    elif dialect == 'sqlite':
+        op.execute(
+            'CREATE VIRTUAL TABLE IF NOT EXISTS gigs_fts USING fts5('
+            'gig_id UNINDEXED, title, role, category, description, '
+            "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+        )
+        op.execute("CREATE VIRTUAL TABLE IF NOT EXISTS gigs_fts_vocab USING fts5vocab(gigs_fts, 'row')")
+        op.execute('DELETE FROM gigs_fts')
+        op.execute(
+            'INSERT INTO gigs_fts (gig_id, title, role, category, description) '
+            "SELECT id, coalesce(title, ''), coalesce(role, ''), coalesce(category, ''), coalesce(description, '') "
+            "FROM gigs WHERE status = 'OPEN'"
+        )
+
+
+def upgrade() -> None:
+    connection = op.get_bind()
+    dialect = connection.dialect.name
+    _create_tables(set(sa.inspect(connection).get_table_names()))
+    _backfill_talent_stats(connection)
+    _backfill_library_roles(connection)
+    _create_search_index(dialect)
+
+    if dialect == 'postgresql':
+        # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+        with op.get_context().autocommit_block():
+            for name, table, columns in _INDEXES:
+                op.create_index(name, table, columns, if_not_exists=True, postgresql_concurrently=True)
+        return
+    for name, table, columns in _INDEXES:
+        op.create_index(name, table, columns, if_not_exists=True)
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    for name, table, _ in reversed(_INDEXES):
+        op.drop_index(name, table_name=table, if_exists=True)
+    if dialect == 'postgresql':
+        op.execute('DROP INDEX IF EXISTS ix_gigs_search_document')
+        op.execute('ALTER TABLE gigs DROP COLUMN IF EXISTS search_document')
+    elif dialect == 'sqlite':
+        op.execute('DROP TABLE IF EXISTS gigs_fts_vocab')
+        op.execute('DROP TABLE IF EXISTS gigs_fts')
+    for name, table, _, _ in reversed(_NEW_TABLE_INDEXES):
+        op.drop_index(name, table_name=table, if_exists=True)
+    op.drop_table('library_resource_roles')
+    op.drop_table('conversation_reads')
+    op.drop_table('refresh_tokens')
+    op.drop_table('talent_stats')
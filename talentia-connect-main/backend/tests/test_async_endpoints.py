@@ -0,0 +1,69 @@
+import uuid
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.api.api_v1.endpoints import courses_async, gigs_async, talents_async
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.db.session import SessionLocal, build_async_engine
+from app.models.course import Course, CourseModule, Lesson
+
+from conftest import auth
+
+
+@pytest.fixture(scope="module")
+def async_client():
+    """The async routers on their own app, as ``DB_ASYNC=true`` mounts them."""
+
+    engine = build_async_engine()
+    sessions = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+
+    async def get_db():
+        async with sessions() as db:
+            yield db
+
+    app = FastAPI()
+    routers = ((gigs_async, "/api/gigs"), (courses_async, "/api/courses"), (talents_async, "/api/talents"))
+    for module, prefix in routers:
+        app.include_router(module.router, prefix=prefix)
+        app.dependency_overrides[module.get_db] = get_db
+    with TestClient(app) as client:
+        yield client
+
+
+def test_async_gig_listing_matches_sync(client, async_client, register):
+    company = register("COMPANY")["accessToken"]
+    category = f"cat-{uuid.uuid4().hex}"
+    for i in range(3):
+        client.post("/api/gigs/", json={"title": f"Gig {i}", "category": category}, headers=auth(company))
+
+    params = {"category": category, "limit": 2}
+    sync_page, async_page = client.get("/api/gigs/", params=params), async_client.get("/api/gigs/", params=params)
+    assert async_page.json() == sync_page.json()
+    cursor = async_page.headers[NEXT_CURSOR_HEADER]
+    assert cursor == sync_page.headers[NEXT_CURSOR_HEADER]
+
+    params["cursor"] = cursor
+    assert async_client.get("/api/gigs/", params=params).json() == client.get("/api/gigs/", params=params).json()
+
+
+@pytest.mark.parametrize("path", ["/api/courses/", "/api/talents/"])
+def test_async_listings_match_sync(client, async_client, path):
+    assert async_client.get(path).json() == client.get(path).json()
+
+
+def test_async_course_detail(client, async_client):
+    course_id = str(uuid.uuid4())
+    with SessionLocal() as db:
+        db.add(Course(id=course_id, title="Async course"))
+        db.add(CourseModule(id=f"{course_id}-m", course_id=course_id, title="Module", order=1))
+        db.add(Lesson(id=f"{course_id}-l", module_id=f"{course_id}-m", title="Lesson", type="VIDEO"))
+        db.commit()
+
+    path = f"/api/courses/{course_id}"
+    detail = async_client.get(path)
+    assert detail.json()["modules"][0]["lessons"][0]["title"] == "Lesson"
+    assert detail.json() == client.get(path).json()
+    assert async_client.get(f"/api/courses/{uuid.uuid4()}").status_code == 404
@@ -0,0 +1,91 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.user import RefreshToken
+from app.services.token_store import _hash, purge_expired_tokens
+
+from conftest import auth
+
+
+def _refresh(client, refresh_token: str):
+    return client.post("/api/auth/refresh", json={"refreshToken": refresh_token})
+
+
+def test_refresh_rotates_tokens(client, register):
+    session = register()
+    renewed = _refresh(client, session["refreshToken"])
+    assert renewed.status_code == 200
+    tokens = renewed.json()
+    assert tokens["refreshToken"] != session["refreshToken"]
+    assert client.get("/api/auth/me", headers=auth(tokens["accessToken"])).status_code == 200
+
+    again = _refresh(client, tokens["refreshToken"])
+    assert again.status_code == 200
+
+
+def test_reused_refresh_token_revokes_session(client, register):
+    session = register()
+    successor = _refresh(client, session["refreshToken"]).json()
+
+    assert _refresh(client, session["refreshToken"]).status_code == 401
+    # The whole family is gone, including the legitimate successor and its access token
+    assert _refresh(client, successor["refreshToken"]).status_code == 401
+    assert client.get("/api/auth/me", headers=auth(successor["accessToken"])).status_code == 401
+
+
+def test_sessions_are_independent(client, register):
+    first = register()
+    email = client.get("/api/auth/me", headers=auth(first["accessToken"])).json()["email"]
+    second = client.post("/api/auth/login", json={"email": email, "password": "pw123456"})
+    assert second.status_code == 200
+
+    _refresh(client, first["refreshToken"])
+    _refresh(client, first["refreshToken"])
+    assert _refresh(client, second.json()["refreshToken"]).status_code == 200
+
+
+def test_logout_ends_session(client, register):
+    session = register()
+    assert client.post("/api/auth/logout", json={"refreshToken": session["refreshToken"]}).status_code == 204
+    assert _refresh(client, session["refreshToken"]).status_code == 401
+    assert client.get("/api/auth/me", headers=auth(session["accessToken"])).status_code == 401
+    # Unknown tokens are ignored
+    assert client.post("/api/auth/logout", json={"refreshToken": "unknown"}).status_code == 204
+
+
+def _set_token_times(refresh_token: str, **times) -> str:
+    with SessionLocal() as db:
+        record = db.execute(select(RefreshToken).where(RefreshToken.token_hash == _hash(refresh_token))).scalar_one()
+        for name, value in times.items():
+            setattr(record, name, value)
+        db.commit()
+        return record.id
+
+
+def test_expired_refresh_token_is_rejected(client, register):
+    session = register()
+    _set_token_times(session["refreshToken"], expires_at=datetime.now(timezone.utc) - timedelta(minutes=1))
+    assert _refresh(client, session["refreshToken"]).status_code == 401
+
+
+def test_purge_removes_only_stale_tokens(client, register):
+    now = datetime.now(timezone.utc)
+    live = _set_token_times(register()["refreshToken"])
+    expired = _set_token_times(register()["refreshToken"], expires_at=now - timedelta(minutes=1))
+    long_revoked = _set_token_times(
+        register()["refreshToken"], revoked_at=now - timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS + 1)
+    )
+    recently_revoked = _set_token_times(register()["refreshToken"], revoked_at=now - timedelta(minutes=1))
+
+    with SessionLocal() as db:
+        assert purge_expired_tokens(db) >= 2
+        remaining = set(
+            db.execute(
+                select(RefreshToken.id).where(RefreshToken.id.in_([live, expired, long_revoked, recently_revoked]))
+            ).scalars()
+        )
+    # Recently revoked tokens are kept so their reuse is still detected
+    assert remaining == {live, recently_revoked}
@@ -0,0 +1,109 @@
+import uuid
+from datetime import datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.mentorship import MentorAvailability, MentorProfile
+from app.models.user import User, UserRole
+from app.services import mentorship_booking
+from app.services.mentorship_booking import _SlotHolds
+
+from conftest import auth
+
+
+def _create_mentor() -> str:
+    """An approved mentor free on Mondays from 09:00 to 17:00."""
+
+    with SessionLocal() as db:
+        user = User(
+            id=str(uuid.uuid4()),
+            email=f"{uuid.uuid4().hex}@example.com",
+            password_hash="x",
+            first_name="Ada",
+            last_name="Mentor",
+            role=UserRole.MENTOR,
+        )
+        db.add(user)
+        db.flush()
+        profile = MentorProfile(id=str(uuid.uuid4()), user_id=user.id, approval_status="APPROVED")
+        db.add(profile)
+        db.flush()
+        db.add(
+            MentorAvailability(
+                id=str(uuid.uuid4()), mentor_id=profile.id, weekday=0, start_time=time(9), end_time=time(17)
+            )
+        )
+        db.commit()
+        return profile.id
+
+
+@pytest.fixture
+def mentor_id() -> str:
+    return _create_mentor()
+
+
+def _next_monday_at(hour: int, minute: int = 0) -> str:
+    zone = ZoneInfo(settings.MENTORSHIP_TIMEZONE)
+    today = datetime.now(zone).date()
+    monday = today + timedelta(days=(7 - today.weekday()) or 7)
+    return datetime.combine(monday, time(hour, minute), zone).isoformat()
+
+
+def _book(client, mentor_id: str, token: str, **body):
+    return client.post(f"/api/mentors/{mentor_id}/sessions", json=body, headers=auth(token))
+
+
+def test_overlapping_booking_conflicts(client, register, mentor_id):
+    first, second = register()["accessToken"], register()["accessToken"]
+
+    booked = _book(client, mentor_id, first, scheduled_at=_next_monday_at(10), duration_minutes=60)
+    assert booked.status_code == 201, booked.text
+
+    assert _book(client, mentor_id, second, scheduled_at=_next_monday_at(10, 30)).status_code == 409
+    # Back-to-back sessions do not overlap
+    assert _book(client, mentor_id, second, scheduled_at=_next_monday_at(11), duration_minutes=30).status_code == 201
+
+
+def test_booking_outside_availability_conflicts(client, register, mentor_id):
+    student = register()["accessToken"]
+    assert _book(client, mentor_id, student, scheduled_at=_next_monday_at(18)).status_code == 409
+
+
+def test_student_cannot_double_book(client, register, mentor_id):
+    student = register()["accessToken"]
+    assert _book(client, mentor_id, student, scheduled_at=_next_monday_at(14)).status_code == 201
+    assert _book(client, _create_mentor(), student, scheduled_at=_next_monday_at(14, 15)).status_code == 409
+
+
+def test_only_students_book(client, register, mentor_id):
+    company = register("COMPANY")["accessToken"]
+    assert _book(client, mentor_id, company, scheduled_at=_next_monday_at(15)).status_code == 403
+
+
+def test_failed_booking_releases_its_hold(client, register, mentor_id):
+    busy, other = register()["accessToken"], register()["accessToken"]
+    assert _book(client, _create_mentor(), busy, scheduled_at=_next_monday_at(10)).status_code == 201
+
+    # Turned away for the student's own clash, after holding this mentor's slot
+    assert _book(client, mentor_id, busy, scheduled_at=_next_monday_at(10)).status_code == 409
+    assert _book(client, mentor_id, other, scheduled_at=_next_monday_at(10)).status_code == 201
+
+
+def test_slot_holds(monkeypatch):
+    holds = _SlotHolds()
+    hold = holds.acquire("mentor", 100, 200)
+    assert hold is not None
+    assert holds.acquire("mentor", 150, 250) is None
+    assert holds.acquire("mentor", 200, 300) is not None
+    assert holds.acquire("other mentor", 100, 200) is not None
+
+    holds.release("mentor", hold)
+    assert holds.acquire("mentor", 150, 160) is not None
+
+    monkeypatch.setattr(mentorship_booking, "HOLD_SECONDS", -1.0)
+    expired = _SlotHolds()
+    expired.acquire("mentor", 100, 200)
+    assert expired.acquire("mentor", 100, 200) is not None
@@ -0,0 +1,112 @@
+import csv
+import json
+import uuid
+from typing import List
+
+import pytest
+from sqlalchemy import func, select
+
+from app.db import bulk_import
+from app.db.bulk_import import IMPORTERS, Importer, run_import
+from app.db.session import SessionLocal
+from app.models.assessment import SkillTag
+from app.models.university import University
+from app.models.user import User
+
+
+def _write_csv(path, rows: List[dict]) -> str:
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+    return str(path)
+
+
+def _slugs(count: int) -> List[str]:
+    prefix = uuid.uuid4().hex[:8]
+    return [f"{prefix}-{i}" for i in range(count)]
+
+
+def _count(model, column, values) -> int:
+    with SessionLocal() as db:
+        return db.scalar(select(func.count()).select_from(model).where(column.in_(values)))
+
+
+def test_rerun_inserts_nothing_new(tmp_path):
+    names = [f"skill-{uuid.uuid4().hex}" for _ in range(3)]
+    path = _write_csv(tmp_path / "skills.csv", [{"name": name, "category": "Design"} for name in names])
+
+    first = run_import("skill_tags", path, batch_size=2, workers=1)
+    assert first == {"records": 3, "inserted": 3, "skipped": 0, "rejected": 0}
+    second = run_import("skill_tags", path, batch_size=2, workers=1)
+    assert second == {"records": 3, "inserted": 0, "skipped": 3, "rejected": 0}
+    assert _count(SkillTag, SkillTag.name, names) == 3
+
+
+def test_users_are_matched_by_email(tmp_path, client):
+    email = f"{uuid.uuid4().hex}@example.com"
+    # Signed up through the app first, so its id is not the importer's derived one
+    client.post(
+        "/api/auth/register",
+        json={"email": email, "password": "pw123456", "firstName": "A", "lastName": "B", "role": "STUDENT"},
+    )
+    path = _write_csv(
+        tmp_path / "users.csv",
+        [
+            {"email": email.upper(), "first_name": "A", "last_name": "B", "university": ""},
+            {"email": f"{uuid.uuid4().hex}@example.com", "first_name": "C", "last_name": "D", "university": ""},
+            {"email": f"{uuid.uuid4().hex}@example.com", "first_name": "E", "last_name": "F", "university": "nowhere"},
+        ],
+    )
+
+    totals = run_import("users", path, workers=1)
+    assert totals == {"records": 3, "inserted": 1, "skipped": 1, "rejected": 1}
+    assert _count(User, User.email, [email]) == 1
+
+
+def test_interrupted_import_resumes_from_checkpoint(tmp_path, monkeypatch):
+    slugs = _slugs(5)
+    path = _write_csv(tmp_path / "universities.csv", [{"slug": slug, "name": slug.upper()} for slug in slugs])
+
+    built: List[int] = []
+    resumed = False
+    importer = IMPORTERS["universities"]
+
+    def build_rows(ctx, records):
+        built.extend(position for position, _ in records)
+        if len(built) > 4 and not resumed:
+            raise RuntimeError("connection lost")
+        return importer.build_rows(ctx, records)
+
+    monkeypatch.setitem(IMPORTERS, "universities", Importer(importer.table, importer.conflict_columns, build_rows))
+    with pytest.raises(RuntimeError):
+        run_import("universities", path, batch_size=2, workers=1)
+    with open(path + ".checkpoint", encoding="utf-8") as f:
+        assert json.load(f) == {"entity": "universities", "done": 4}
+    # The third chunk rolled back; the two before it are committed
+    assert _count(University, University.slug, slugs) == 4
+
+    resumed = True
+    built.clear()
+    totals = run_import("universities", path, batch_size=2, workers=1)
+    assert built == [5]
+    assert totals == {"records": 5, "inserted": 1, "skipped": 0, "rejected": 0}
+    assert _count(University, University.slug, slugs) == 5
+    assert not (tmp_path / "universities.csv.checkpoint").exists()
+
+
+def test_restart_ignores_checkpoint(tmp_path):
+    slugs = _slugs(3)
+    path = _write_csv(tmp_path / "universities.csv", [{"slug": slug, "name": slug} for slug in slugs])
+    bulk_import._write_checkpoint(path + ".checkpoint", "universities", 3)
+
+    assert run_import("universities", path, workers=1)["inserted"] == 0
+    bulk_import._write_checkpoint(path + ".checkpoint", "universities", 3)
+    assert run_import("universities", path, workers=1, restart=True)["inserted"] == 3
+
+
+def test_checkpoint_of_another_entity_is_refused(tmp_path):
+    path = _write_csv(tmp_path / "skills.csv", [{"name": f"skill-{uuid.uuid4().hex}"}])
+    bulk_import._write_checkpoint(path + ".checkpoint", "users", 1)
+    with pytest.raises(SystemExit, match="pass --restart"):
+        run_import("skill_tags", path, workers=1)
@@ -0,0 +1,159 @@
+import uuid
+from typing import Any, Dict, List, Optional
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.cache import CacheBackend, MemoryCache
+from app.core.response_cache import CachedRoute, ResponseCache, ResponseCacheMiddleware
+from app.db.session import SessionLocal
+from app.models.course import Course, CourseCategory
+from app.services.catalog_cache import response_cache
+
+from conftest import auth
+
+
+class FakeCache(CacheBackend):
+    """Dict-backed stand-in for an out-of-process backend such as Redis."""
+
+    is_local = False
+
+    def __init__(self):
+        self.entries: Dict[str, Any] = {}
+
+    def get(self, key: str) -> Optional[Any]:
+        return self.entries.get(key)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        self.entries[key] = value
+
+    def delete(self, key: str) -> None:
+        self.entries.pop(key, None)
+
+    def delete_prefix(self, prefix: str) -> None:
+        for key in [key for key in self.entries if key.startswith(prefix)]:
+            del self.entries[key]
+
+
+@pytest.fixture(params=[MemoryCache, FakeCache])
+def backend(request) -> CacheBackend:
+    return request.param()
+
+
+def test_backend_set_get_delete(backend):
+    assert backend.get("a") is None
+    backend.set("a", b"1")
+    assert backend.get("a") == b"1"
+    backend.delete("a")
+    assert backend.get("a") is None
+    backend.delete("a")
+
+
+def test_backend_delete_prefix_and_clear(backend):
+    backend.set("gigs:/a", b"1")
+    backend.set("gigs:/b", b"2")
+    backend.set("mentors:/a", b"3")
+    backend.delete_prefix("gigs:")
+    assert backend.get("gigs:/a") is None and backend.get("gigs:/b") is None
+    assert backend.get("mentors:/a") == b"3"
+    backend.clear()
+    assert backend.get("mentors:/a") is None
+
+
+def test_memory_cache_evicts_least_recently_used():
+    cache = MemoryCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_memory_cache_expires_entries():
+    cache = MemoryCache(ttl=300)
+    cache.set("stale", 1, ttl=-1)
+    cache.set("fresh", 2)
+    assert cache.get("stale") is None
+    assert cache.get("fresh") == 2
+
+
+def _stored(backend: FakeCache, namespace: str) -> List[str]:
+    return [key for key in backend.entries if key.startswith(f"{namespace}:")]
+
+
+@pytest.fixture
+def fake_backend(monkeypatch) -> FakeCache:
+    fake = FakeCache()
+    monkeypatch.setattr(response_cache, "backend", fake)
+    return fake
+
+
+def test_cached_route_hit_and_not_modified(client, fake_backend):
+    first = client.get("/api/courses")
+    assert first.status_code == 200
+    assert first.headers["x-cache"] == "MISS"
+    etag = first.headers["etag"]
+    assert _stored(fake_backend, "courses")
+
+    second = client.get("/api/courses")
+    assert second.headers["x-cache"] == "HIT"
+    assert second.headers["etag"] == etag
+    assert second.json() == first.json()
+
+    revalidated = client.get("/api/courses", headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+
+    changed = client.get("/api/courses", headers={"If-None-Match": '"stale"'})
+    assert changed.status_code == 200
+
+
+def test_cached_route_invalidated_on_commit(client, fake_backend):
+    etag = client.get("/api/courses").headers["etag"]
+
+    course_id = str(uuid.uuid4())
+    with SessionLocal() as db:
+        db.add(Course(id=course_id, title="Cached course"))
+        db.commit()
+    assert not _stored(fake_backend, "courses")
+
+    response = client.get("/api/courses")
+    assert response.headers["x-cache"] == "MISS"
+    assert response.headers["etag"] != etag
+    assert course_id in [course["id"] for course in response.json()]
+
+
+def test_authenticated_requests_bypass_cache(client, fake_backend, register):
+    token = register()["accessToken"]
+    response = client.get("/api/courses", headers=auth(token))
+    assert response.status_code == 200
+    assert "x-cache" not in response.headers
+    assert not _stored(fake_backend, "courses")
+
+
+def test_course_category_changes_invalidate_courses(client, fake_backend):
+    client.get("/api/courses")
+    with SessionLocal() as db:
+        db.add(CourseCategory(id=str(uuid.uuid4()), name="Design"))
+        db.commit()
+    assert client.get("/api/courses").headers["x-cache"] == "MISS"
+
+
+def test_response_read_before_an_invalidation_is_not_stored():
+    cache = ResponseCache(FakeCache(), {"/things": CachedRoute(namespace="things", ttl=300)})
+    reads = []
+
+    async def app(scope, receive, send):
+        reads.append(scope["path"])
+        # A write commits while this response is being built
+        cache.invalidate("things")
+        await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"text/plain")]})
+        await send({"type": "http.response.body", "body": f"read {len(reads)}".encode()})
+
+    client = TestClient(ResponseCacheMiddleware(app, cache))
+    assert client.get("/things").text == "read 1"
+    second = client.get("/things")
+    assert second.headers["x-cache"] == "MISS"
+    assert second.text == "read 2"
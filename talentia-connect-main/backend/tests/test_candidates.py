@@ -0,0 +1,127 @@
+import uuid
+from typing import List
+
+from app.core.cache import cache_backend
+from app.db.session import SessionLocal
+from app.models.assessment import SkillTag, UserSkill
+from app.models.talent import TalentStats
+
+from conftest import auth
+
+
+def _word() -> str:
+    return "".join(chr(ord("a") + int(c, 16)) for c in uuid.uuid4().hex[:10]) + "x"
+
+
+def _skills(*names: str) -> List[str]:
+    ids = [str(uuid.uuid4()) for _ in names]
+    with SessionLocal() as db:
+        db.add_all(SkillTag(id=skill_id, name=name) for skill_id, name in zip(ids, names))
+        db.commit()
+    return ids
+
+
+def _student(register, skill_levels: dict, reviews: int = 0, rating: float = 0.0) -> dict:
+    student = register("STUDENT")
+    with SessionLocal() as db:
+        for skill_id, level in skill_levels.items():
+            db.add(UserSkill(id=str(uuid.uuid4()), user_id=student["user"]["id"], skill_id=skill_id, level=level))
+        if reviews:
+            db.add(
+                TalentStats(
+                    user_id=student["user"]["id"],
+                    rating_total=rating * reviews,
+                    reviews_count=reviews,
+                    avg_rating=rating,
+                    completed_gigs=reviews,
+                )
+            )
+        db.commit()
+    return student
+
+
+def _apply(client, gig_id: str, student: dict) -> None:
+    response = client.post(f"/api/gigs/{gig_id}/apply", json={"proposal": "me"}, headers=auth(student["accessToken"]))
+    assert response.status_code == 201, response.text
+
+
+def _candidates(client, gig_id: str, company: str, **params) -> list:
+    response = client.get(f"/api/gigs/{gig_id}/candidates", params=params, headers=auth(company))
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def _ids(candidates: list) -> List[str]:
+    return [candidate["studentId"] for candidate in candidates]
+
+
+def test_applicants_are_ranked_best_first(client, register):
+    company = register("COMPANY")["accessToken"]
+    first_skill, second_skill = _word(), _word()
+    first_id, second_id = _skills(first_skill, second_skill)
+    gig = client.post(
+        "/api/gigs/", json={"title": f"{first_skill} and {second_skill}"}, headers=auth(company)
+    ).json()
+
+    no_skills = _student(register, {})
+    one_skill = _student(register, {first_id: 80})
+    both_skills = _student(register, {first_id: 80, second_id: 80})
+    # Same skills as one_skill, but a strong track record
+    one_skill_reviewed = _student(register, {first_id: 80}, reviews=5, rating=5.0)
+    for student in (no_skills, one_skill, both_skills, one_skill_reviewed):
+        _apply(client, gig["id"], student)
+
+    candidates = _candidates(client, gig["id"], company)
+    assert _ids(candidates) == [
+        both_skills["user"]["id"],
+        one_skill_reviewed["user"]["id"],
+        one_skill["user"]["id"],
+        no_skills["user"]["id"],
+    ]
+    scores = [candidate["score"] for candidate in candidates]
+    assert scores == sorted(scores, reverse=True)
+    best, reviewed, _, unskilled = candidates
+    assert sorted(best["matchedSkills"]) == sorted([first_skill, second_skill])
+    assert best["breakdown"]["skills"] == 1.0
+    assert unskilled["breakdown"]["skills"] == 0.0 and unskilled["matchedSkills"] == []
+    assert reviewed["reviewsCount"] == 5 and reviewed["avgRating"] == 5.0
+    assert all(candidate["applicationId"] for candidate in candidates)
+
+
+def test_pool_adds_students_who_have_not_applied(client, register):
+    company = register("COMPANY")["accessToken"]
+    skill = _word()
+    (skill_id,) = _skills(skill)
+    gig = client.post("/api/gigs/", json={"title": f"{skill} wanted"}, headers=auth(company)).json()
+    applicant = _student(register, {skill_id: 50})
+    holder = _student(register, {skill_id: 90})
+    _apply(client, gig["id"], applicant)
+
+    assert _ids(_candidates(client, gig["id"], company)) == [applicant["user"]["id"]]
+    pool = _candidates(client, gig["id"], company, includePool=True)
+    assert set(_ids(pool)) == {applicant["user"]["id"], holder["user"]["id"]}
+    outsider = next(candidate for candidate in pool if candidate["studentId"] == holder["user"]["id"])
+    assert outsider["applicationId"] is None
+
+
+def test_new_application_invalidates_the_ranking(client, register):
+    company = register("COMPANY")["accessToken"]
+    skill = _word()
+    (skill_id,) = _skills(skill)
+    gig = client.post("/api/gigs/", json={"title": f"{skill} wanted"}, headers=auth(company)).json()
+    first = _student(register, {skill_id: 50})
+    _apply(client, gig["id"], first)
+
+    assert _ids(_candidates(client, gig["id"], company)) == [first["user"]["id"]]
+    assert cache_backend.get(f"gig_candidates:{gig['id']}:applicants") is not None
+
+    stronger = _student(register, {skill_id: 50}, reviews=5, rating=5.0)
+    _apply(client, gig["id"], stronger)
+    assert _ids(_candidates(client, gig["id"], company)) == [stronger["user"]["id"], first["user"]["id"]]
+
+
+def test_other_companies_cannot_see_candidates(client, register):
+    company = register("COMPANY")["accessToken"]
+    gig = client.post("/api/gigs/", json={"title": "Private"}, headers=auth(company)).json()
+    other = register("COMPANY")["accessToken"]
+    assert client.get(f"/api/gigs/{gig['id']}/candidates", headers=auth(other)).status_code == 403
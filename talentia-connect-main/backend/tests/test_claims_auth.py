@@ -0,0 +1,33 @@
+import uuid
+
+from app.core.security import create_access_token
+from app.db.session import SessionLocal
+from app.models.user import User
+
+from conftest import auth, query_count
+
+
+def test_role_checks_trust_token_claims(client):
+    # No such user row: the claims alone decide
+    token = create_access_token(str(uuid.uuid4()), "STUDENT", first_name="Ghost", last_name="Student")
+    response = client.get("/api/gigs/my", headers=auth(token))
+    assert response.status_code == 403
+    assert query_count(response) == 0
+
+
+def test_invalid_tokens_are_rejected(client):
+    assert client.get("/api/gigs/my", headers=auth("not-a-token")).status_code == 401
+    assert client.get("/api/auth/me").status_code == 401
+
+
+def test_loaded_users_are_cached_until_changed(client, register):
+    session = register(first_name="Ada")
+    client.get("/api/auth/me", headers=auth(session["accessToken"]))
+    cached = client.get("/api/auth/me", headers=auth(session["accessToken"]))
+    assert cached.json()["firstName"] == "Ada"
+    assert query_count(cached) == 0
+
+    with SessionLocal() as db:
+        db.get(User, session["user"]["id"]).first_name = "Grace"
+        db.commit()
+    assert client.get("/api/auth/me", headers=auth(session["accessToken"])).json()["firstName"] == "Grace"
@@ -0,0 +1,61 @@
+import uuid
+
+import pytest
+
+from app.db.session import SessionLocal
+from app.models.course import Course, CourseModule, Lesson
+from app.services.catalog_cache import get_course_detail
+
+from conftest import query_count
+
+
+def _add_module(db, course_id: str, order: int, lessons: int) -> CourseModule:
+    module = CourseModule(id=str(uuid.uuid4()), course_id=course_id, title=f"Module {order}", order=order)
+    db.add(module)
+    db.flush()
+    for i in range(lessons):
+        db.add(Lesson(id=f"{module.id}-{i}", module_id=module.id, title=f"Lesson {i}", type="VIDEO"))
+    return module
+
+
+@pytest.fixture
+def course_id() -> str:
+    with SessionLocal() as db:
+        course = Course(id=str(uuid.uuid4()), title="Makossa basics")
+        db.add(course)
+        db.flush()
+        for order in (2, 1):
+            _add_module(db, course.id, order, lessons=3)
+        db.commit()
+        return course.id
+
+
+def test_course_tree_loads_in_fixed_queries(client, course_id):
+    response = client.get(f"/api/courses/{course_id}")
+    assert response.status_code == 200
+    modules = response.json()["modules"]
+    assert [module["order"] for module in modules] == [1, 2]
+    assert [len(module["lessons"]) for module in modules] == [3, 3]
+    # Course, modules and lessons, however many modules there are
+    assert query_count(response) == 3
+
+
+def test_course_detail_is_cached_until_its_tree_changes(client, course_id):
+    first = client.get(f"/api/courses/{course_id}")
+    assert get_course_detail(course_id) == first.content
+    cached = client.get(f"/api/courses/{course_id}")
+    assert cached.content == first.content
+    assert query_count(cached) == 0
+
+    with SessionLocal() as db:
+        module = db.query(CourseModule).filter(CourseModule.course_id == course_id).first()
+        db.add(Lesson(id=str(uuid.uuid4()), module_id=module.id, title="Extra", type="PDF"))
+        db.commit()
+    assert get_course_detail(course_id) is None
+
+    modules = client.get(f"/api/courses/{course_id}").json()["modules"]
+    assert "Extra" in [lesson["title"] for module in modules for lesson in module["lessons"]]
+
+
+def test_unknown_course(client):
+    assert client.get(f"/api/courses/{uuid.uuid4()}").status_code == 404
@@ -0,0 +1,81 @@
+import uuid
+
+import pytest
+
+from conftest import MALFORMED_CURSORS, auth, walk_pages
+
+
+def _post_gig(client, token: str, **fields) -> dict:
+    response = client.post("/api/gigs/", json={"title": "Gig", **fields}, headers=auth(token))
+    assert response.status_code == 201, response.text
+    return response.json()
+
+
+def test_open_gigs_keyset_pages(client, register):
+    company = register("COMPANY")["accessToken"]
+    category = f"cat-{uuid.uuid4().hex}"
+    created = [_post_gig(client, company, title=f"Gig {i}", category=category)["id"] for i in range(5)]
+
+    pages = walk_pages(client, "/api/gigs/", {"category": category, "limit": 2})
+    assert [len(page) for page in pages] == [2, 2, 1]
+    seen = [gig["id"] for page in pages for gig in page]
+    # Each gig exactly once (created_at ties within a second are ordered by id)
+    assert sorted(seen) == sorted(created)
+
+
+def test_open_gigs_filters(client, register):
+    company = register("COMPANY")["accessToken"]
+    category = f"cat-{uuid.uuid4().hex}"
+    remote = _post_gig(client, company, category=category, type="PROJECT", location="Remote (Douala)")
+    cheap = _post_gig(client, company, category=category, type="GIG", budgetMin=50, budgetMax=100)
+    pricey = _post_gig(client, company, category=category, type="GIG", budgetMin=800, budgetMax=1200)
+
+    def listed(**params):
+        response = client.get("/api/gigs/", params={"category": category, **params})
+        assert response.status_code == 200, response.text
+        return {gig["id"] for gig in response.json()}
+
+    assert listed() == {remote["id"], cheap["id"], pricey["id"]}
+    assert listed(type="GIG") == {cheap["id"], pricey["id"]}
+    assert listed(location="douala") == {remote["id"]}
+    # Budget filters match overlapping ranges
+    assert listed(minBudget=90) == {cheap["id"], pricey["id"]}
+    assert listed(minBudget=90, maxBudget=500) == {cheap["id"]}
+
+
+def test_closed_gigs_are_not_listed(client, register):
+    company = register("COMPANY")["accessToken"]
+    student = register("STUDENT")["accessToken"]
+    category = f"cat-{uuid.uuid4().hex}"
+    gig = _post_gig(client, company, category=category)
+    application = client.post(f"/api/gigs/{gig['id']}/apply", json={"proposal": "hi"}, headers=auth(student)).json()
+    client.post(f"/api/gigs/applications/{application['id']}/approve", headers=auth(company))
+    contract = client.post(
+        f"/api/gigs/applications/{application['id']}/contracts", json={"agreedAmount": 100}, headers=auth(company)
+    ).json()
+    client.post(f"/api/gigs/contracts/{contract['id']}/release", json={}, headers=auth(company))
+
+    assert client.get("/api/gigs/", params={"category": category}).json() == []
+
+
+def test_listings_count_applicants(client, register):
+    company = register("COMPANY")["accessToken"]
+    category = f"cat-{uuid.uuid4().hex}"
+    popular = _post_gig(client, company, category=category)
+    quiet = _post_gig(client, company, category=category)
+    for _ in range(3):
+        student = register("STUDENT")["accessToken"]
+        client.post(f"/api/gigs/{popular['id']}/apply", json={"proposal": "hi"}, headers=auth(student))
+
+    expected = {popular["id"]: 3, quiet["id"]: 0}
+    listed = client.get("/api/gigs/", params={"category": category}).json()
+    assert {gig["id"]: gig["applicants"] for gig in listed} == expected
+    mine = client.get("/api/gigs/my", headers=auth(company)).json()
+    assert {gig["id"]: gig["applicants"] for gig in mine} == expected
+
+
+@pytest.mark.parametrize("cursor", MALFORMED_CURSORS)
+def test_malformed_cursor_is_rejected(client, cursor):
+    response = client.get("/api/gigs/", params={"cursor": cursor})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
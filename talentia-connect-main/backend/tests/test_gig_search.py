@@ -0,0 +1,104 @@
+import uuid
+
+import pytest
+from sqlalchemy import text
+
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.db.session import engine
+from app.models.marketplace import GIG_FTS_TABLE
+from app.services import gig_search
+from app.services.gig_search import CORRECTED_QUERY_HEADER, vocabulary
+
+from conftest import MALFORMED_CURSORS, auth
+
+
+def _word() -> str:
+    # Letters only: the tokenizer splits on digits
+    return "".join(chr(ord("a") + int(c, 16)) for c in uuid.uuid4().hex[:10])
+
+
+def _post_gig(client, token: str, **fields) -> dict:
+    response = client.post("/api/gigs/", json=fields, headers=auth(token))
+    assert response.status_code == 201, response.text
+    return response.json()
+
+
+def _search(client, q: str, **params):
+    response = client.get("/api/gigs/search", params={"q": q, **params})
+    assert response.status_code == 200, response.text
+    return response
+
+
+def test_search_ranks_title_matches_first(client, register):
+    company = register("COMPANY")["accessToken"]
+    word = _word()
+    in_description = _post_gig(client, company, title="Weekend job", description=f"{word} wanted")
+    in_title = _post_gig(client, company, title=f"{word} needed")
+
+    results = _search(client, word).json()
+    assert [gig["id"] for gig in results] == [in_title["id"], in_description["id"]]
+    # Words match as prefixes
+    assert len(_search(client, word[:6]).json()) == 2
+
+
+def test_search_pages(client, register):
+    company = register("COMPANY")["accessToken"]
+    word = _word()
+    for i in range(3):
+        _post_gig(client, company, title=f"{word} {i}")
+
+    first = _search(client, word, limit=2)
+    assert len(first.json()) == 2
+    rest = _search(client, word, limit=2, cursor=first.headers[NEXT_CURSOR_HEADER])
+    assert len(rest.json()) == 1
+    assert NEXT_CURSOR_HEADER not in rest.headers
+
+
+def test_search_corrects_typos(client, register):
+    company = register("COMPANY")["accessToken"]
+    word = _word()
+    gig = _post_gig(client, company, title=f"{word} session")
+    vocabulary.clear()
+
+    typo = word[:4] + word[5:]
+    response = _search(client, typo)
+    assert response.headers[CORRECTED_QUERY_HEADER] == word
+    assert [result["id"] for result in response.json()] == [gig["id"]]
+
+
+def test_vocabulary_loads_outside_the_lock(client, register, monkeypatch):
+    load = vocabulary._load
+
+    def checked_load(db):
+        assert not vocabulary._lock.locked()
+        return load(db)
+
+    monkeypatch.setattr(vocabulary, "_load", checked_load)
+    vocabulary.clear()
+    _search(client, _word())
+
+
+def test_missing_index_is_rebuilt_without_duplicates(client, register, monkeypatch):
+    company = register("COMPANY")["accessToken"]
+    word = _word()
+    existing = _post_gig(client, company, title=f"{word} existing")
+
+    with engine.begin() as connection:
+        connection.execute(text(f"DROP TABLE {GIG_FTS_TABLE}_vocab"))
+        connection.execute(text(f"DROP TABLE {GIG_FTS_TABLE}"))
+    monkeypatch.setattr(gig_search, "_checked_databases", set())
+
+    created = _post_gig(client, company, title=f"{word} created")
+    assert sorted(gig["id"] for gig in _search(client, word).json()) == sorted([existing["id"], created["id"]])
+    with engine.connect() as connection:
+        rows = connection.execute(
+            text(f"SELECT count(*) FROM {GIG_FTS_TABLE} WHERE gig_id = :id"), {"id": created["id"]}
+        ).scalar_one()
+    assert rows == 1
+
+
+@pytest.mark.parametrize("cursor", MALFORMED_CURSORS)
+def test_malformed_cursor_is_rejected(client, cursor):
+    response = client.get("/api/gigs/search", params={"q": "design", "cursor": cursor})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
@@ -0,0 +1,54 @@
+import json
+import logging
+import uuid
+
+from app.core.config import settings
+from app.core.instrumentation import fingerprint, normalize_statement
+
+from conftest import query_count
+
+
+def test_statements_are_normalized():
+    assert normalize_statement("SELECT * FROM users WHERE email = 'a@b.c' AND age > 30") == (
+        "SELECT * FROM users WHERE email = ? AND age > ?"
+    )
+    assert normalize_statement("SELECT *\n  FROM gigs WHERE id IN (?, ?, ?)") == "SELECT * FROM gigs WHERE id IN (?+)"
+    assert normalize_statement("SELECT * FROM t WHERE a = %(a_1)s AND b = $2 AND c = :c") == (
+        "SELECT * FROM t WHERE a = ? AND b = ? AND c = ?"
+    )
+    # One fingerprint per statement shape, whatever the values
+    assert fingerprint("SELECT 1 FROM t WHERE id IN (?, ?)") == fingerprint("SELECT 2 FROM t WHERE id IN (?, ?, ?)")
+    assert fingerprint("SELECT a FROM t") != fingerprint("SELECT b FROM t")
+
+
+def test_responses_carry_server_timing(client):
+    response = client.get(f"/api/courses/{uuid.uuid4()}")
+    assert response.status_code == 404
+    timing = response.headers["server-timing"]
+    assert timing.startswith("app;dur=")
+    assert query_count(response) >= 1
+
+
+def test_server_timing_can_be_disabled(client, monkeypatch):
+    monkeypatch.setattr(settings, "SERVER_TIMING", False)
+    assert "server-timing" not in client.get("/api/courses").headers
+
+
+def test_metrics_are_labelled_by_route_template(client):
+    client.get(f"/api/courses/{uuid.uuid4()}")
+    metrics = client.get("/api/metrics").text
+    assert 'http_request_duration_seconds_count{method="GET",route="/api/courses/{course_id}",status="404"}' in metrics
+    assert 'http_request_db_queries_bucket{method="GET",route="/api/courses/{course_id}",le="+Inf"}' in metrics
+    assert "db_pool" in metrics
+
+
+def test_slow_queries_are_logged_without_parameters(client, monkeypatch, caplog):
+    monkeypatch.setattr(settings, "SLOW_QUERY_MS", 0)
+    secret = uuid.uuid4().hex
+    with caplog.at_level(logging.WARNING, logger="app.sql.slow"):
+        client.get(f"/api/courses/{secret}")
+    entries = [json.loads(record.getMessage()) for record in caplog.records if record.name == "app.sql.slow"]
+    assert entries
+    assert entries[0]["route"] == "/api/courses/{course_id}"
+    assert len(entries[0]["fingerprint"]) == 12
+    assert all(secret not in entry["statement"] for entry in entries)
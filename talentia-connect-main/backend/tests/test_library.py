@@ -0,0 +1,79 @@
+import uuid
+from typing import List, Optional
+
+import pytest
+from sqlalchemy import delete, select
+
+from app.db.session import SessionLocal, engine
+from app.models.library import LibraryResource, LibraryResourceRole
+from app.services.library_roles import backfill_resource_roles
+
+from conftest import MALFORMED_CURSORS, auth, walk_pages
+
+RESOURCES = "/api/library/resources"
+
+
+def _add_resources(category: str, allowed_roles: List[Optional[str]]) -> List[str]:
+    ids = []
+    with SessionLocal() as db:
+        for i, roles in enumerate(allowed_roles):
+            resource = LibraryResource(
+                id=str(uuid.uuid4()),
+                category_id=category,
+                title=f"Resource {i}",
+                type="PDF",
+                file_url="https://example.com/resource.pdf",
+                allowed_roles=roles,
+            )
+            db.add(resource)
+            ids.append(resource.id)
+        db.commit()
+    return ids
+
+
+def _listed(client, category: str, headers: Optional[dict] = None, **params) -> set:
+    pages = walk_pages(client, RESOURCES, {"category": category, "limit": 2, **params}, headers=headers)
+    return {resource["id"] for page in pages for resource in page}
+
+
+def test_resources_are_filtered_by_role(client, register):
+    category = str(uuid.uuid4())
+    for_students, for_mentors, for_everyone = _add_resources(category, ["STUDENT", "mentor, COMPANY", None])
+
+    student = auth(register("STUDENT")["accessToken"])
+    mentor = auth(register("MENTOR")["accessToken"])
+    assert _listed(client, category, student) == {for_students, for_everyone}
+    assert _listed(client, category, mentor) == {for_mentors, for_everyone}
+    # Signed-in users cannot ask for another role's view
+    assert _listed(client, category, student, role="MENTOR") == {for_students, for_everyone}
+    assert _listed(client, category) == {for_students, for_mentors, for_everyone}
+    assert _listed(client, category, role="COMPANY") == {for_mentors, for_everyone}
+
+
+def test_resources_page_newest_first(client):
+    category = str(uuid.uuid4())
+    ids = _add_resources(category, [None] * 5)
+
+    pages = walk_pages(client, RESOURCES, {"category": category, "limit": 2})
+    assert [len(page) for page in pages] == [2, 2, 1]
+    listed = [resource["id"] for page in pages for resource in page]
+    assert sorted(listed) == sorted(ids)
+
+
+def test_backfill_fills_resources_without_roles(client):
+    category = str(uuid.uuid4())
+    (resource_id,) = _add_resources(category, ["STUDENT"])
+    with engine.begin() as connection:
+        connection.execute(delete(LibraryResourceRole).where(LibraryResourceRole.resource_id == resource_id))
+        assert backfill_resource_roles(connection) >= 1
+        roles = connection.execute(
+            select(LibraryResourceRole.role).where(LibraryResourceRole.resource_id == resource_id)
+        ).scalars()
+        assert [role.value for role in roles] == ["STUDENT"]
+
+
+@pytest.mark.parametrize("cursor", MALFORMED_CURSORS)
+def test_malformed_cursor_is_rejected(client, cursor):
+    response = client.get(RESOURCES, params={"cursor": cursor})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
@@ -0,0 +1,167 @@
+import uuid
+from datetime import date, datetime, time, timedelta, timezone
+from typing import List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from app.core.config import settings
+from app.core.intervals import IntervalTree, subtract
+from app.db.session import SessionLocal
+from app.models.mentorship import MentorAvailability, MentorProfile, MentorshipSession
+from app.models.user import User, UserRole
+
+ZONE = ZoneInfo(settings.MENTORSHIP_TIMEZONE)
+
+
+def _next_monday() -> date:
+    today = datetime.now(ZONE).date()
+    return today + timedelta(days=(7 - today.weekday()) or 7)
+
+
+MONDAY = _next_monday()
+
+
+def _at(hour: int, minute: int = 0, day: date = MONDAY) -> datetime:
+    return datetime.combine(day, time(hour, minute), ZONE).astimezone(timezone.utc)
+
+
+def _mentor(*slots: Tuple[time, time], on_date: Optional[date] = None) -> Tuple[str, str]:
+    """An approved mentor free in ``slots`` every Monday (or only ``on_date``); returns (profile id, user id)."""
+
+    with SessionLocal() as db:
+        user = User(
+            id=str(uuid.uuid4()),
+            email=f"{uuid.uuid4().hex}@example.com",
+            password_hash="x",
+            first_name="Free",
+            last_name="Mentor",
+            role=UserRole.MENTOR,
+        )
+        db.add(user)
+        db.flush()
+        profile = MentorProfile(id=str(uuid.uuid4()), user_id=user.id, approval_status="APPROVED")
+        db.add(profile)
+        db.flush()
+        for start_time, end_time in slots:
+            db.add(
+                MentorAvailability(
+                    id=str(uuid.uuid4()),
+                    mentor_id=profile.id,
+                    weekday=None if on_date else 0,
+                    date=on_date,
+                    start_time=start_time,
+                    end_time=end_time,
+                )
+            )
+        db.commit()
+        return profile.id, user.id
+
+
+def _session(mentor_user_id: str, start: datetime, minutes: int, status: str = "SCHEDULED") -> None:
+    with SessionLocal() as db:
+        student = User(
+            id=str(uuid.uuid4()),
+            email=f"{uuid.uuid4().hex}@example.com",
+            password_hash="x",
+            first_name="Booked",
+            last_name="Student",
+            role=UserRole.STUDENT,
+        )
+        db.add(student)
+        db.flush()
+        db.add(
+            MentorshipSession(
+                id=str(uuid.uuid4()),
+                mentor_id=mentor_user_id,
+                student_id=student.id,
+                scheduled_at=start,
+                duration_minutes=minutes,
+                status=status,
+            )
+        )
+        db.commit()
+
+
+def _free(client, mentor_id: str, **params) -> List[Tuple[datetime, datetime]]:
+    response = client.get(
+        "/api/mentors/availability",
+        params={"start": _at(0).isoformat(), "end": _at(23, 59).isoformat(), "mentorId": mentor_id, **params},
+    )
+    assert response.status_code == 200, response.text
+    if not response.json():
+        return []
+    (mentor,) = response.json()
+    return [(datetime.fromisoformat(slot["start"]), datetime.fromisoformat(slot["end"])) for slot in mentor["free"]]
+
+
+def test_booked_sessions_are_cut_out(client):
+    mentor_id, user_id = _mentor((time(9), time(17)))
+    _session(user_id, _at(10), 60)
+    _session(user_id, _at(13), 30)
+    _session(user_id, _at(15), 60, status="CANCELLED")
+
+    assert _free(client, mentor_id, minMinutes=30) == [
+        (_at(9), _at(10)),
+        (_at(11), _at(13)),
+        (_at(13, 30), _at(17)),
+    ]
+    # Stretches shorter than minMinutes are left out
+    assert _free(client, mentor_id, minMinutes=90) == [(_at(11), _at(13)), (_at(13, 30), _at(17))]
+
+
+def test_sessions_straddling_a_slot_edge_are_cut(client):
+    mentor_id, user_id = _mentor((time(9), time(12)))
+    _session(user_id, _at(8, 30), 60)
+    _session(user_id, _at(11, 30), 60)
+    assert _free(client, mentor_id, minMinutes=30) == [(_at(9, 30), _at(11, 30))]
+
+
+def test_overlapping_slots_are_joined(client):
+    mentor_id, _ = _mentor((time(9), time(12)), (time(11), time(14)))
+    assert _free(client, mentor_id) == [(_at(9), _at(14))]
+    one_off_id, _ = _mentor((time(18), time(20)), on_date=MONDAY)
+    assert _free(client, one_off_id) == [(_at(18), _at(20))]
+    # ...and only on that date
+    week_later = MONDAY + timedelta(days=7)
+    window = {"start": _at(0, day=week_later).isoformat(), "end": _at(23, day=week_later).isoformat()}
+    assert _free(client, one_off_id, **window) == []
+
+
+def test_fully_booked_mentor_is_not_listed(client):
+    mentor_id, user_id = _mentor((time(9), time(10)))
+    _session(user_id, _at(9), 60)
+    assert _free(client, mentor_id) == []
+
+
+def test_new_session_shows_up_at_once(client):
+    mentor_id, user_id = _mentor((time(9), time(12)))
+    assert _free(client, mentor_id) == [(_at(9), _at(12))]
+    _session(user_id, _at(9), 120)
+    assert _free(client, mentor_id) == [(_at(11), _at(12))]
+    assert _free(client, mentor_id, minMinutes=61) == []
+
+
+@pytest.mark.parametrize(
+    "start, end",
+    [(_at(10), _at(9)), (_at(9), _at(9)), (_at(9), _at(9) + timedelta(days=32))],
+)
+def test_invalid_windows_are_rejected(client, start, end):
+    response = client.get("/api/mentors/availability", params={"start": start.isoformat(), "end": end.isoformat()})
+    assert response.status_code == 400
+
+
+def test_subtract():
+    assert subtract(0, 10, []) == [(0, 10)]
+    assert subtract(0, 10, [(2, 4), (6, 8)]) == [(0, 2), (4, 6), (8, 10)]
+    assert subtract(0, 10, [(-5, 3), (3, 5), (9, 20)]) == [(5, 9)]
+    assert subtract(0, 10, [(4, 7), (2, 5)]) == [(0, 2), (7, 10)]
+    assert subtract(0, 10, [(-1, 11)]) == []
+
+
+def test_interval_tree_finds_overlaps():
+    intervals = [(start, start + length) for start, length in [(0, 5), (3, 2), (10, 30), (12, 1), (20, 5), (41, 2)]]
+    tree = IntervalTree(intervals)
+    for query in [(0, 1), (4, 11), (13, 20), (25, 41), (40, 50), (100, 200)]:
+        expected = {i for i, (start, end) in enumerate(intervals) if start < query[1] and end > query[0]}
+        assert set(tree.overlapping(*query)) == expected
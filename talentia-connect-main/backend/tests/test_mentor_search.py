@@ -0,0 +1,109 @@
+import uuid
+from typing import Optional
+
+import pytest
+
+from app.db.session import SessionLocal
+from app.models.mentorship import MentorProfile
+from app.models.user import User, UserRole
+
+from conftest import MALFORMED_CURSORS, walk_pages
+
+
+def _tag() -> str:
+    return f"tag{uuid.uuid4().hex[:12]}"
+
+
+def _mentor(tags: str, hourly_rate: Optional[float] = None, approval_status: str = "APPROVED") -> str:
+    with SessionLocal() as db:
+        user = User(
+            id=str(uuid.uuid4()),
+            email=f"{uuid.uuid4().hex}@example.com",
+            password_hash="x",
+            first_name="Mentor",
+            last_name="Searched",
+            role=UserRole.MENTOR,
+        )
+        db.add(user)
+        db.flush()
+        profile = MentorProfile(
+            id=str(uuid.uuid4()),
+            user_id=user.id,
+            expertise_tags=tags,
+            hourly_rate=hourly_rate,
+            approval_status=approval_status,
+        )
+        db.add(profile)
+        db.commit()
+        return profile.id
+
+
+def _found(client, **params) -> set:
+    pages = walk_pages(client, "/api/mentors", {"limit": 50, **params})
+    return {mentor["id"] for page in pages for mentor in page}
+
+
+def test_tags_match_all_or_any(client):
+    design, video = _tag(), _tag()
+    both = _mentor(f"{design}, {video}")
+    design_only = _mentor(design)
+    video_only = _mentor(video)
+
+    assert _found(client, tags=f"{design},{video}") == {both}
+    assert _found(client, tags=f"{design},{video}", match="any") == {both, design_only, video_only}
+    # Tags are matched case- and space-insensitively
+    assert _found(client, tags=f"  {design.upper()} ") == {both, design_only}
+
+
+def test_tags_match_by_prefix(client):
+    stem = _tag()
+    photography = _mentor(f"{stem} photography")
+    editing = _mentor(f"{stem} photo editing")
+    _mentor(f"{_tag()} photography")
+
+    assert _found(client, tags=f"{stem} photo*") == {photography, editing}
+    assert _found(client, tags=f"{stem} photog*") == {photography}
+    assert _found(client, tags=f"{stem} photo*,{stem} photo editing") == {editing}
+
+
+def test_rate_and_status_filters(client):
+    tag = _tag()
+    cheap = _mentor(tag, hourly_rate=20)
+    pricey = _mentor(tag, hourly_rate=80)
+    unrated = _mentor(tag)
+    pending = _mentor(tag, hourly_rate=20, approval_status="PENDING")
+
+    assert _found(client, tags=tag) == {cheap, pricey, unrated, pending}
+    assert _found(client, tags=tag, maxRate=50) == {cheap, pending}
+    assert _found(client, tags=tag, minRate=50) == {pricey}
+    assert _found(client, tags=tag, maxRate=50, approvalStatus="APPROVED") == {cheap}
+
+
+def test_tag_edits_are_searchable_after_commit(client):
+    old, new = _tag(), _tag()
+    mentor_id = _mentor(old)
+    assert _found(client, tags=old) == {mentor_id}
+
+    with SessionLocal() as db:
+        db.get(MentorProfile, mentor_id).expertise_tags = new
+        db.commit()
+    assert _found(client, tags=old) == set()
+    assert _found(client, tags=new) == {mentor_id}
+
+
+def test_mentor_offset_pages(client):
+    tag = _tag()
+    for _ in range(3):
+        _mentor(tag)
+
+    pages = walk_pages(client, "/api/mentors", {"tags": tag, "limit": 2})
+    assert [len(page) for page in pages] == [2, 1]
+    ids = [mentor["id"] for page in pages for mentor in page]
+    assert len(set(ids)) == 3
+
+
+@pytest.mark.parametrize("cursor", MALFORMED_CURSORS)
+def test_malformed_cursor_is_rejected(client, cursor):
+    response = client.get("/api/mentors", params={"cursor": cursor})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
@@ -0,0 +1,174 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+import pytest
+from fastapi import WebSocketDisconnect
+
+from app.core.pagination import BEFORE_CURSOR_HEADER, SINCE_CURSOR_HEADER, encode_cursor
+from app.db.session import SessionLocal
+from app.models.marketplace import Message
+
+from conftest import MALFORMED_CURSORS, auth
+
+
+@pytest.fixture
+def chat(client, register) -> dict:
+    """An approved application's conversation; returns ids and both participants' tokens."""
+
+    company = register("COMPANY")
+    student = register("STUDENT")
+    gig = client.post("/api/gigs/", json={"title": "Chat gig"}, headers=auth(company["accessToken"])).json()
+    application = client.post(
+        f"/api/gigs/{gig['id']}/apply", json={"proposal": "hi"}, headers=auth(student["accessToken"])
+    ).json()
+    conversation = client.post(
+        f"/api/gigs/applications/{application['id']}/approve", headers=auth(company["accessToken"])
+    ).json()
+    return {
+        "id": conversation["id"],
+        "application_id": application["id"],
+        "company_id": company["user"]["id"],
+        "company": company["accessToken"],
+        "student": student["accessToken"],
+        "url": f"/api/gigs/conversations/{conversation['id']}/messages",
+    }
+
+
+def _add_messages(chat: dict, contents: List[str], start: datetime) -> None:
+    # Explicit, distinct timestamps keep the order independent of clock resolution
+    with SessionLocal() as db:
+        for i, content in enumerate(contents):
+            db.add(
+                Message(
+                    id=str(uuid.uuid4()),
+                    conversation_id=chat["id"],
+                    sender_id=chat["company_id"],
+                    content=content,
+                    created_at=start + timedelta(seconds=i),
+                )
+            )
+        db.commit()
+
+
+def _contents(response) -> List[str]:
+    assert response.status_code == 200, response.text
+    return [message["content"] for message in response.json()]
+
+
+def test_history_pages_backwards(client, chat):
+    _add_messages(chat, [f"m{i}" for i in range(5)], datetime.now(timezone.utc) - timedelta(hours=1))
+    headers = auth(chat["student"])
+
+    newest = client.get(chat["url"], params={"limit": 2}, headers=headers)
+    assert _contents(newest) == ["m3", "m4"]
+    older = client.get(
+        chat["url"], params={"limit": 2, "before": newest.headers[BEFORE_CURSOR_HEADER]}, headers=headers
+    )
+    assert _contents(older) == ["m1", "m2"]
+    oldest = client.get(
+        chat["url"], params={"limit": 2, "before": older.headers[BEFORE_CURSOR_HEADER]}, headers=headers
+    )
+    assert _contents(oldest) == ["m0"]
+    assert BEFORE_CURSOR_HEADER not in oldest.headers
+
+
+def test_since_returns_newer_messages(client, chat):
+    start = datetime.now(timezone.utc) - timedelta(hours=1)
+    _add_messages(chat, ["m0", "m1"], start)
+    headers = auth(chat["student"])
+    since = client.get(chat["url"], headers=headers).headers[SINCE_CURSOR_HEADER]
+
+    _add_messages(chat, ["m2", "m3", "m4"], start + timedelta(minutes=5))
+    page = client.get(chat["url"], params={"since": since, "limit": 2}, headers=headers)
+    # m0 is in the overlap re-sent before the cursor's message
+    assert _contents(page) == ["m0", "m2", "m3"]
+    rest = client.get(chat["url"], params={"since": page.headers[SINCE_CURSOR_HEADER]}, headers=headers)
+    # m2 and m3 are re-sent as the overlap before m3
+    assert _contents(rest) == ["m2", "m4"]
+
+
+def test_since_returns_late_commits(client, chat):
+    client.post(
+        f"/api/gigs/applications/{chat['application_id']}/messages",
+        json={"content": "hello"},
+        headers=auth(chat["company"]),
+    )
+    since = client.get(chat["url"], headers=auth(chat["student"])).headers[SINCE_CURSOR_HEADER]
+
+    # Stamped before the cursor's message but committed after the client synced
+    _add_messages(chat, ["late"], datetime.now(timezone.utc) - timedelta(seconds=1))
+
+    synced = client.get(chat["url"], params={"since": since}, headers=auth(chat["student"]))
+    assert "late" in _contents(synced)
+    # Nothing newer than the cursor arrived, so it stays put
+    assert synced.headers[SINCE_CURSOR_HEADER] == since
+
+
+def test_summaries_count_unread_messages(client, chat):
+    _add_messages(chat, ["m0", "m1", "m2"], datetime.now(timezone.utc) - timedelta(hours=1))
+
+    def summary():
+        summaries = client.get("/api/gigs/conversations/summaries", headers=auth(chat["student"])).json()
+        return next(item for item in summaries if item["id"] == chat["id"])
+
+    assert summary()["unreadCount"] == 3
+    assert summary()["lastMessage"]["content"] == "m2"
+    # The sender has nothing to read
+    company_view = client.get("/api/gigs/conversations/summaries", headers=auth(chat["company"])).json()
+    assert next(item for item in company_view if item["id"] == chat["id"])["unreadCount"] == 0
+
+    assert client.post(f"/api/gigs/conversations/{chat['id']}/read", headers=auth(chat["student"])).status_code == 204
+    assert summary()["unreadCount"] == 0
+
+
+def test_outsiders_cannot_read(client, chat, register):
+    outsider = register("STUDENT")["accessToken"]
+    assert client.get(chat["url"], headers=auth(outsider)).status_code in (403, 404)
+
+
+@pytest.mark.parametrize("cursor", MALFORMED_CURSORS)
+@pytest.mark.parametrize("key", ["since", "before"])
+def test_malformed_cursor_is_rejected(client, chat, key, cursor):
+    assert client.get(chat["url"], params={key: cursor}, headers=auth(chat["student"])).status_code == 400
+
+
+def test_since_and_before_are_exclusive(client, chat):
+    cursor = encode_cursor(str(uuid.uuid4()))
+    response = client.get(chat["url"], params={"since": cursor, "before": cursor}, headers=auth(chat["student"]))
+    assert response.status_code == 400
+
+
+def _socket_url(chat: dict, token: str, **params) -> str:
+    query = "&".join(f"{key}={value}" for key, value in {"token": token, **params}.items())
+    return f"/api/gigs/applications/{chat['application_id']}/conversation/ws?{query}"
+
+
+def test_socket_pushes_committed_messages(client, chat):
+    with client.websocket_connect(_socket_url(chat, chat["student"])) as ws:
+        client.post(
+            f"/api/gigs/applications/{chat['application_id']}/messages",
+            json={"content": "pushed"},
+            headers=auth(chat["company"]),
+        )
+        event = ws.receive_json()
+    assert event["type"] == "message"
+    assert event["message"]["content"] == "pushed"
+
+
+def test_socket_replays_messages_since_cursor(client, chat):
+    start = datetime.now(timezone.utc) - timedelta(hours=1)
+    _add_messages(chat, ["m0"], start)
+    since = client.get(chat["url"], headers=auth(chat["student"])).headers[SINCE_CURSOR_HEADER]
+    _add_messages(chat, ["m1", "m2"], start + timedelta(minutes=5))
+
+    with client.websocket_connect(_socket_url(chat, chat["student"], since=since)) as ws:
+        assert [ws.receive_json()["message"]["content"] for _ in range(2)] == ["m1", "m2"]
+
+
+def test_socket_rejects_outsiders(client, chat, register):
+    outsider = register("STUDENT")["accessToken"]
+    with pytest.raises(WebSocketDisconnect) as closed:
+        with client.websocket_connect(_socket_url(chat, outsider)) as ws:
+            ws.receive_json()
+    assert closed.value.code == 1008
@@ -0,0 +1,87 @@
+from datetime import datetime
+
+import pytest
+from alembic.script import ScriptDirectory
+from sqlalchemy import create_engine, inspect, select, text
+
+from app.db import migrations
+from app.db.session import SessionLocal
+from app.models.mentorship import MentorshipSession
+
+SERIES_TABLES = {"talent_stats", "refresh_tokens", "conversation_reads", "library_resource_roles"}
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    """A separate, empty SQLite database that ``upgrade_database`` runs against."""
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    monkeypatch.setattr(migrations, "engine", engine)
+    yield engine
+    engine.dispose()
+
+
+def _head() -> str:
+    return ScriptDirectory.from_config(migrations.alembic_config()).get_current_head()
+
+
+def _version(engine) -> str:
+    with engine.connect() as connection:
+        return connection.execute(text("SELECT version_num FROM alembic_version")).scalar_one()
+
+
+def test_fresh_database_reaches_head(engine):
+    migrations.upgrade_database()
+    assert _version(engine) == _head()
+    assert SERIES_TABLES <= set(inspect(engine).get_table_names())
+
+
+def test_create_all_database_is_stamped_and_caught_up(engine):
+    # What the old startup create_all left behind: the original tables, no alembic_version
+    migrations.upgrade_database(migrations.BASELINE_REVISION)
+    with engine.begin() as connection:
+        connection.execute(text("DROP TABLE alembic_version"))
+        connection.execute(
+            text(
+                "INSERT INTO library_resources (id, title, type, file_url, is_premium, allowed_roles) "
+                "VALUES ('guide', 'Guide', 'PDF', 'https://example.com/guide.pdf', 0, 'STUDENT,MENTOR')"
+            )
+        )
+    assert not SERIES_TABLES & set(inspect(engine).get_table_names())
+
+    migrations.upgrade_database()
+
+    assert _version(engine) == _head()
+    assert SERIES_TABLES <= set(inspect(engine).get_table_names())
+    with engine.connect() as connection:
+        roles = connection.execute(
+            text("SELECT role FROM library_resource_roles WHERE resource_id = 'guide' ORDER BY role")
+        ).scalars()
+        assert list(roles) == ["MENTOR", "STUDENT"]
+
+
+def test_partial_database_is_not_stamped(engine):
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE users (id VARCHAR PRIMARY KEY)"))
+
+    with pytest.raises(RuntimeError, match="lacks baseline tables"):
+        migrations.upgrade_database()
+    assert "alembic_version" not in inspect(engine).get_table_names()
+
+
+def test_session_end_times_are_backfilled(engine):
+    migrations.upgrade_database("0004_typed_mentor_availability")
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                "INSERT INTO mentorship_sessions (id, mentor_id, student_id, scheduled_at, duration_minutes, status) "
+                "VALUES ('timed', 'm', 's', '2026-11-02 10:00:00.000000', 90, 'SCHEDULED'), "
+                "('untimed', 'm', 's', '2026-11-02 23:30:00.000000', NULL, 'SCHEDULED')"
+            )
+        )
+
+    migrations.upgrade_database()
+
+    with SessionLocal(bind=engine) as db:
+        ends = dict(db.execute(select(MentorshipSession.id, MentorshipSession.ends_at)).all())
+    assert ends == {"timed": datetime(2026, 11, 2, 11, 30), "untimed": datetime(2026, 11, 3, 0, 30)}
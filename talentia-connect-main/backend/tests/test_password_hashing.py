@@ -0,0 +1,67 @@
+import asyncio
+
+from passlib.hash import pbkdf2_sha256
+
+from app.core import security
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.user import User
+
+from conftest import PASSWORD
+
+
+def _stored_hash(user_id: str) -> str:
+    with SessionLocal() as db:
+        return db.get(User, user_id).password_hash
+
+
+def _set_hash(user_id: str, password_hash: str) -> None:
+    with SessionLocal() as db:
+        db.get(User, user_id).password_hash = password_hash
+        db.commit()
+
+
+def _login(client, user_id: str, password: str = PASSWORD):
+    with SessionLocal() as db:
+        email = db.get(User, user_id).email
+    return client.post("/api/auth/login", json={"email": email, "password": password})
+
+
+def test_new_hashes_use_configured_rounds(register):
+    user_id = register()["user"]["id"]
+    assert pbkdf2_sha256.from_string(_stored_hash(user_id)).rounds == settings.PASSWORD_HASH_ROUNDS
+
+
+def test_outdated_hash_is_upgraded_on_login(client, register):
+    user_id = register()["user"]["id"]
+    outdated = pbkdf2_sha256.using(rounds=settings.PASSWORD_HASH_ROUNDS + 1000).hash(PASSWORD)
+    _set_hash(user_id, outdated)
+
+    assert _login(client, user_id).status_code == 200
+    upgraded = _stored_hash(user_id)
+    assert upgraded != outdated
+    assert pbkdf2_sha256.from_string(upgraded).rounds == settings.PASSWORD_HASH_ROUNDS
+
+    # Current hashes are left alone, and the upgraded one still verifies
+    assert _login(client, user_id).status_code == 200
+    assert _stored_hash(user_id) == upgraded
+
+
+def test_failed_login_does_not_rehash(client, register):
+    user_id = register()["user"]["id"]
+    outdated = pbkdf2_sha256.using(rounds=settings.PASSWORD_HASH_ROUNDS + 1000).hash(PASSWORD)
+    _set_hash(user_id, outdated)
+
+    assert _login(client, user_id, "wrong-password").status_code == 401
+    assert _stored_hash(user_id) == outdated
+
+
+def test_hashing_runs_in_worker_pool(monkeypatch):
+    monkeypatch.setattr(settings, "PASSWORD_HASH_WORKERS", 1)
+    try:
+        password_hash = asyncio.run(security.hash_password_async(PASSWORD))
+        assert security._hasher is not None
+        assert asyncio.run(security.verify_and_update_password_async(PASSWORD, password_hash)) == (True, None)
+    finally:
+        security.shutdown_password_hasher()
+    assert security._hasher is None
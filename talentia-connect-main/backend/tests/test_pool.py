@@ -0,0 +1,66 @@
+import pytest
+from sqlalchemy import create_engine, exc
+
+from app.core.config import settings
+from app.db import pool as pool_module
+from app.db.pool import InstrumentedQueuePool, instrument_engine, pool_options, pool_snapshot
+
+
+@pytest.fixture
+def small_pool(tmp_path, monkeypatch):
+    """A one-connection instrumented pool that gives up on a checkout after 50ms."""
+
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", 1)
+    monkeypatch.setattr(settings, "DB_MAX_OVERFLOW", 0)
+    monkeypatch.setattr(settings, "DB_POOL_TIMEOUT", 0.05)
+    monkeypatch.setattr(pool_module, "_instrumented", {})
+    url = f"sqlite:///{tmp_path / 'pool.db'}"
+    engine = create_engine(url, **pool_options(url))
+    metrics = instrument_engine("test", engine)
+    yield engine, metrics
+    engine.dispose()
+
+
+def test_pool_options_follow_settings(monkeypatch):
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", 7)
+    monkeypatch.setattr(settings, "DB_POOL_PRE_PING", "always")
+    options = pool_options("postgresql://db/talentia")
+    assert options["poolclass"] is InstrumentedQueuePool
+    assert (options["pool_size"], options["pool_pre_ping"]) == (7, True)
+    # In-memory SQLite keeps its single shared connection
+    assert pool_options("sqlite://") == {"pool_pre_ping": True}
+
+
+def test_pool_reports_checkouts_and_timeouts(small_pool):
+    engine, metrics = small_pool
+    with engine.connect():
+        snapshot = pool_snapshot("test", engine, metrics)
+        assert (snapshot["size"], snapshot["checkedOut"]) == (1, 1)
+        with pytest.raises(exc.TimeoutError):
+            engine.connect()
+
+    snapshot = pool_snapshot("test", engine, metrics)
+    assert (snapshot["checkouts"], snapshot["timeouts"], snapshot["checkedOut"]) == (1, 1, 0)
+    assert snapshot["checkoutWaitMs"]["max"] >= 50
+    assert [pool["name"] for pool in pool_module.pool_stats()["pools"]] == ["test"]
+
+
+def test_idle_connections_are_pinged(small_pool, monkeypatch):
+    engine, metrics = small_pool
+    with engine.connect():
+        pass
+    with engine.connect():
+        pass
+    assert metrics.pings == 0
+
+    monkeypatch.setattr(settings, "DB_POOL_PRE_PING_IDLE_SECONDS", 0.0)
+    with engine.connect():
+        pass
+    assert metrics.pings == 1
+
+
+def test_metrics_endpoints(client):
+    pools = client.get("/api/metrics/pool").json()["pools"]
+    assert "sync" in [pool["name"] for pool in pools]
+    body = client.get("/api/metrics").text
+    assert 'db_pool_checkouts_total{pool="sync"}' in body
@@ -0,0 +1,100 @@
+import uuid
+
+import pytest
+
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.db.session import SessionLocal
+from app.models.assessment import SkillTag, UserSkill
+
+from conftest import MALFORMED_CURSORS, auth, walk_pages
+
+
+def _word() -> str:
+    # Letters only, and ending in a letter no suffix strips, so the skill name is its own stem
+    return "".join(chr(ord("a") + int(c, 16)) for c in uuid.uuid4().hex[:10]) + "x"
+
+
+def _give_skill(user_id: str, name: str, level: int = 80) -> None:
+    with SessionLocal() as db:
+        skill = SkillTag(id=str(uuid.uuid4()), name=name)
+        db.add(skill)
+        db.flush()
+        db.add(UserSkill(id=str(uuid.uuid4()), user_id=user_id, skill_id=skill.id, level=level))
+        db.commit()
+
+
+def _post_gig(client, token: str, **fields) -> dict:
+    response = client.post("/api/gigs/", json=fields, headers=auth(token))
+    assert response.status_code == 201, response.text
+    return response.json()
+
+
+def _recommended(client, token: str) -> list:
+    pages = walk_pages(client, "/api/gigs/recommended", {"limit": 50}, headers=auth(token))
+    return [gig for page in pages for gig in page]
+
+
+def test_gigs_are_ranked_by_skill_match(client, register):
+    company = register("COMPANY")["accessToken"]
+    student = register("STUDENT")
+    first_skill, second_skill = _word(), _word()
+    _give_skill(student["user"]["id"], first_skill)
+    _give_skill(student["user"]["id"], second_skill)
+    partial = _post_gig(client, company, title=f"{first_skill} wanted")
+    full = _post_gig(client, company, title=f"{first_skill} wanted", description=f"Bonus: {second_skill}")
+    unrelated = _post_gig(client, company, title=f"{_word()} wanted")
+
+    recommended = {gig["id"]: gig for gig in _recommended(client, student["accessToken"])}
+    assert unrelated["id"] not in recommended
+    assert sorted(recommended[full["id"]]["skills"]) == sorted([first_skill, second_skill])
+    assert recommended[partial["id"]]["skills"] == [first_skill]
+    assert 1 >= recommended[full["id"]]["matchScore"] > recommended[partial["id"]]["matchScore"] > 0
+    ranked = [gig_id for gig_id in recommended if gig_id in (full["id"], partial["id"])]
+    assert ranked == [full["id"], partial["id"]]
+
+
+def test_applied_gigs_are_left_out(client, register):
+    company = register("COMPANY")["accessToken"]
+    student = register("STUDENT")
+    skill = _word()
+    _give_skill(student["user"]["id"], skill)
+    gig = _post_gig(client, company, title=f"{skill} wanted")
+    assert gig["id"] in [g["id"] for g in _recommended(client, student["accessToken"])]
+
+    client.post(f"/api/gigs/{gig['id']}/apply", json={"proposal": "me"}, headers=auth(student["accessToken"]))
+    assert gig["id"] not in [g["id"] for g in _recommended(client, student["accessToken"])]
+
+
+def test_recommendations_page(client, register):
+    company = register("COMPANY")["accessToken"]
+    student = register("STUDENT")
+    skill = _word()
+    _give_skill(student["user"]["id"], skill)
+    for i in range(3):
+        _post_gig(client, company, title=f"{skill} {'extra ' * i}wanted")
+
+    first = client.get("/api/gigs/recommended", params={"limit": 2}, headers=auth(student["accessToken"]))
+    assert len(first.json()) == 2
+    rest = client.get(
+        "/api/gigs/recommended",
+        params={"limit": 2, "cursor": first.headers[NEXT_CURSOR_HEADER]},
+        headers=auth(student["accessToken"]),
+    )
+    assert not {gig["id"] for gig in first.json()} & {gig["id"] for gig in rest.json()}
+
+
+def test_students_without_skills_get_nothing(client, register):
+    student = register("STUDENT")["accessToken"]
+    assert client.get("/api/gigs/recommended", headers=auth(student)).json() == []
+
+
+def test_only_students_get_recommendations(client, register):
+    company = register("COMPANY")["accessToken"]
+    assert client.get("/api/gigs/recommended", headers=auth(company)).status_code == 403
+
+
+@pytest.mark.parametrize("cursor", MALFORMED_CURSORS)
+def test_malformed_cursor_is_rejected(client, register, cursor):
+    student = register("STUDENT")["accessToken"]
+    response = client.get("/api/gigs/recommended", params={"cursor": cursor}, headers=auth(student))
+    assert response.status_code == 400
@@ -0,0 +1,44 @@
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+
+from app.db import migrations, seed
+from app.models.library import LibraryCategory, LibraryResource
+from app.models.marketplace import Gig
+from app.models.user import User
+
+from conftest import query_count
+
+SEEDED = (User, Gig, LibraryCategory, LibraryResource)
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    """A separate, empty SQLite database for the bootstrap to fill."""
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'seed.db'}")
+    monkeypatch.setattr(migrations, "engine", engine)
+    monkeypatch.setattr(seed, "engine", engine)
+    monkeypatch.setattr(seed, "SessionLocal", sessionmaker(autocommit=False, autoflush=False, bind=engine))
+    yield engine
+    engine.dispose()
+
+
+def _counts(engine) -> dict:
+    with engine.connect() as connection:
+        return {model: connection.execute(select(func.count()).select_from(model)).scalar_one() for model in SEEDED}
+
+
+def test_seed_is_idempotent(engine):
+    seed.run_seed()
+    counts = _counts(engine)
+    assert all(counts.values())
+
+    seed.run_seed()
+    assert _counts(engine) == counts
+
+
+def test_read_endpoints_do_not_seed(client):
+    # One query for the listing itself, none probing for seed data
+    assert query_count(client.get("/api/library/categories")) == 1
+    assert query_count(client.get("/api/library/resources", params={"category": "none"})) == 1
@@ -0,0 +1,99 @@
+import uuid
+
+from app.db.session import SessionLocal
+from app.models.assessment import SkillTag, UserSkill
+from app.models.talent import TalentStats
+from app.services.talent_stats import _upsert_first_stats, rebuild_talent_stats
+
+from conftest import auth
+
+
+def _release(client, company: str, student: str, rating: float) -> None:
+    gig = client.post("/api/gigs/", json={"title": "Logo design"}, headers=auth(company)).json()
+    application = client.post(f"/api/gigs/{gig['id']}/apply", json={"proposal": "hi"}, headers=auth(student)).json()
+    client.post(f"/api/gigs/applications/{application['id']}/approve", headers=auth(company))
+    contract = client.post(
+        f"/api/gigs/applications/{application['id']}/contracts", json={"agreedAmount": 1000}, headers=auth(company)
+    ).json()
+    response = client.post(
+        f"/api/gigs/contracts/{contract['id']}/release", json={"rating": rating}, headers=auth(company)
+    )
+    assert response.status_code == 200, response.text
+
+
+def _stats(user_id: str) -> TalentStats:
+    with SessionLocal() as db:
+        return db.get(TalentStats, user_id)
+
+
+def test_releases_update_stats(client, register):
+    company = register("COMPANY")["accessToken"]
+    student = register("STUDENT")
+
+    _release(client, company, student["accessToken"], 4.0)
+    stats = _stats(student["user"]["id"])
+    assert (stats.reviews_count, stats.avg_rating, stats.completed_gigs) == (1, 4.0, 1)
+
+    _release(client, company, student["accessToken"], 5.0)
+    stats = _stats(student["user"]["id"])
+    assert (stats.reviews_count, stats.avg_rating, stats.completed_gigs) == (2, 4.5, 2)
+
+
+def test_first_release_folds_into_a_concurrently_inserted_row(register):
+    user_id = register("STUDENT")["user"]["id"]
+    # Another release for the same new student committed its row first
+    with SessionLocal() as db:
+        db.add(TalentStats(user_id=user_id, rating_total=5.0, reviews_count=1, avg_rating=5.0, completed_gigs=1))
+        db.commit()
+
+    with SessionLocal() as db:
+        _upsert_first_stats(db, user_id, 3.0, True)
+        db.commit()
+
+    stats = _stats(user_id)
+    assert (stats.rating_total, stats.reviews_count, stats.avg_rating, stats.completed_gigs) == (8.0, 2, 4.0, 2)
+
+
+def test_top_skills_follow_user_skills(client, register):
+    company = register("COMPANY")["accessToken"]
+    student = register("STUDENT")
+    user_id = student["user"]["id"]
+    _release(client, company, student["accessToken"], 4.0)
+
+    names = [f"skill-{uuid.uuid4().hex}" for _ in range(2)]
+    with SessionLocal() as db:
+        tags = [SkillTag(id=str(uuid.uuid4()), name=name) for name in names]
+        db.add_all(tags)
+        db.flush()
+        skills = [
+            UserSkill(id=str(uuid.uuid4()), user_id=user_id, skill_id=tag.id, level=level)
+            for tag, level in zip(tags, (2, 5))
+        ]
+        db.add_all(skills)
+        db.commit()
+        assert _stats(user_id).top_skills == [names[1], names[0]]
+
+        skills[1].level = 1
+        db.commit()
+        assert _stats(user_id).top_skills == [names[0], names[1]]
+
+        db.delete(skills[0])
+        db.commit()
+        assert _stats(user_id).top_skills == [names[1]]
+
+
+def test_rebuild_recomputes_from_source_tables(client, register):
+    company = register("COMPANY")["accessToken"]
+    student = register("STUDENT")
+    user_id = student["user"]["id"]
+    _release(client, company, student["accessToken"], 2.0)
+    _release(client, company, student["accessToken"], 4.0)
+
+    with SessionLocal() as db:
+        db.get(TalentStats, user_id).reviews_count = 7
+        db.commit()
+        rebuild_talent_stats(db)
+        db.commit()
+
+    stats = _stats(user_id)
+    assert (stats.rating_total, stats.reviews_count, stats.avg_rating, stats.completed_gigs) == (6.0, 2, 3.0, 2)
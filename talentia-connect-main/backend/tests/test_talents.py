@@ -0,0 +1,52 @@
+import uuid
+
+import pytest
+
+from app.core.pagination import encode_cursor
+from app.db.session import SessionLocal
+from app.models.assessment import SkillTag, UserSkill
+from app.models.talent import TalentStats
+
+from conftest import MALFORMED_CURSORS, walk_pages
+
+
+@pytest.fixture
+def skill(register) -> str:
+    """A skill held by three reviewed students, rated 3, 4 and 5."""
+
+    name = f"skill-{uuid.uuid4().hex}"
+    with SessionLocal() as db:
+        tag = SkillTag(id=str(uuid.uuid4()), name=name)
+        db.add(tag)
+        for rating in (3.0, 4.0, 5.0):
+            user_id = register("STUDENT")["user"]["id"]
+            db.add(
+                TalentStats(
+                    user_id=user_id, rating_total=rating, reviews_count=1, avg_rating=rating, completed_gigs=1
+                )
+            )
+            db.add(UserSkill(id=str(uuid.uuid4()), user_id=user_id, skill_id=tag.id, level=3))
+        db.commit()
+    return name
+
+
+def test_talents_page_by_rating(client, skill):
+    pages = walk_pages(client, "/api/talents/", {"skill": skill, "limit": 2})
+    assert [[talent["rating"] for talent in page] for page in pages] == [[5.0, 4.0], [3.0]]
+    assert all(talent["skills"] == [skill] for page in pages for talent in page)
+
+
+def test_talents_min_rating(client, skill):
+    talents = client.get("/api/talents/", params={"skill": skill, "minRating": 4}).json()
+    assert [talent["rating"] for talent in talents] == [5.0, 4.0]
+
+
+@pytest.mark.parametrize("cursor", MALFORMED_CURSORS + [encode_cursor(float("nan"), "id")])
+def test_malformed_cursor_is_rejected(client, cursor):
+    response = client.get("/api/talents/", params={"cursor": cursor})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+
+def test_valid_cursor(client):
+    assert client.get("/api/talents/", params={"cursor": encode_cursor(4.5, "some-id")}).status_code == 200